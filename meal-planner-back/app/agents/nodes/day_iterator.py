@@ -142,6 +142,7 @@ def day_iterator(state: MealPlanState) -> dict | Literal["__end__"]:
             "nutritionist_recommendation": None,
             "chef_recommendation": None,
             "budget_recommendation": None,
+            "recommendation_cache_keys": {"nutritionist": None, "chef": None, "budget": None},
             "current_menu": None,
             "events": [{
                 "type": "progress",
@@ -191,6 +192,7 @@ def day_iterator(state: MealPlanState) -> dict | Literal["__end__"]:
             "nutritionist_recommendation": None,
             "chef_recommendation": None,
             "budget_recommendation": None,
+            "recommendation_cache_keys": {"nutritionist": None, "chef": None, "budget": None},
             "current_menu": None,
             "events": [{
                 "type": "progress",
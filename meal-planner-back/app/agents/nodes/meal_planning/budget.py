@@ -5,8 +5,10 @@ from json import JSONDecodeError
 from pydantic import ValidationError
 
 from app.models.state import MealPlanState, MealRecommendation
-from app.services.llm_service import get_llm_service, parse_json_response
+from app.services.llm_service import get_llm_service, parse_json_response, response_validator
+from app.services.llm_streaming import partial_progress_writer
 from app.services.ingredient_pricing import get_pricing_service
+from app.services.recommendation_cache import get_recommendation_cache, recommendation_cache_key
 from app.utils.logging import get_logger
 from app.utils.prompt_safety import escape_for_llm
 
@@ -42,6 +44,37 @@ def _parse_amount_to_grams(amount_str: str) -> float:
     return 100.0
 
 
+def _completed_update(
+    state: MealPlanState,
+    recommendation: MealRecommendation,
+    cached: bool = False,
+    cache_key: tuple | None = None,
+) -> dict:
+    """추천 완료 상태 업데이트 (LLM 응답/캐시 적중 공용)
+
+    cache_key가 있으면 끼니가 검증을 모두 통과한 뒤 validation_aggregator가 추천 풀에 추가
+    """
+    ingredient_prices = recommendation.ingredient_prices or []
+    return {
+        "budget_recommendation": recommendation,
+        "recommendation_cache_keys": {"budget": cache_key},
+        "events": [{
+            "type": "progress",
+            "node": "budget",
+            "status": "completed",
+            "data": {
+                "menu": recommendation.menu_name,
+                "price_search_count": len(ingredient_prices),
+                "total_estimated_cost": sum(p.get("total_price", 0) for p in ingredient_prices),
+                "day": state.get("current_day"),
+                "meal": state.get("current_meal_index", 0) + 1,
+                "meal_type": state.get("current_meal_type"),
+                "cached": cached,
+            }
+        }],
+    }
+
+
 async def budget_agent(state: MealPlanState) -> dict:
     """예산 관리 에이전트: 비용 효율 관점에서 메뉴 추천 (Tavily 가격 검색)
 
@@ -81,6 +114,25 @@ async def budget_agent(state: MealPlanState) -> dict:
         ingredients = chef_recommendation.ingredients or []
         logger.info("chef_ingredients_received", count=len(ingredients))
 
+    # 같은 셰프 메뉴 + 구간화된 조건의 이전 추천 재사용 (적중 시 재료 가격 검색도 생략)
+    llm_service = get_llm_service()
+    recommendation_cache = None if llm_service.mock_mode or retry_count > 0 else get_recommendation_cache()
+    cache_key = None
+    if recommendation_cache is not None:
+        cache_key = recommendation_cache_key(
+            "budget",
+            current_meal_type,
+            profile,
+            targets,
+            budget=budget,
+            base_menu=chef_recommendation.menu_name if chef_recommendation else None,
+        )
+        used_menus = [meal.menu_name for meal in state.get("completed_meals", [])]
+        cached = recommendation_cache.get(cache_key, used_menus)
+        if cached is not None:
+            logger.info("budget_cache_hit", menu=cached.menu_name)
+            return _completed_update(state, cached, cached=True)
+
     # Tavily로 각 재료 가격 검색
     pricing_service = get_pricing_service()
     ingredient_prices = []
@@ -194,9 +246,14 @@ async def budget_agent(state: MealPlanState) -> dict:
 **필수 필드**: menu_name, ingredients, estimated_calories, estimated_cost, cooking_time_minutes, reasoning
 """
 
-    llm_service = get_llm_service()
     try:
-        response = await llm_service.ainvoke(prompt)
+        # 재시도는 이전에 거부된 응답을 다시 받지 않도록 LLM 응답 캐시를 쓰지 않음
+        response = await llm_service.ainvoke(
+            prompt,
+            on_partial=partial_progress_writer("budget", state),
+            use_cache=retry_count == 0,
+            validate=response_validator(MealRecommendation),
+        )
         logger.debug("budget_llm_response", response=response)
         recommendation_data = parse_json_response(response)
         logger.debug("budget_parsed_data", data=recommendation_data)
@@ -212,23 +269,8 @@ async def budget_agent(state: MealPlanState) -> dict:
             cost=recommendation.estimated_cost,
             price_search_count=len(ingredient_prices),
         )
-
-        return {
-            "budget_recommendation": recommendation,
-            "events": [{
-                "type": "progress",
-                "node": "budget",
-                "status": "completed",
-                "data": {
-                    "menu": recommendation.menu_name,
-                    "price_search_count": len(ingredient_prices),
-                    "total_estimated_cost": total_estimated_cost,
-                    "day": state.get("current_day"),
-                    "meal": state.get("current_meal_index", 0) + 1,
-                    "meal_type": state.get("current_meal_type"),
-                }
-            }],
-        }
+        # 풀에는 검증 통과 후 추가 (검증에서 거부될 추천을 다른 사용자에게 반환하지 않도록)
+        return _completed_update(state, recommendation, cache_key=cache_key)
 
     except JSONDecodeError as e:
         # EC-020: Malformed JSON from LLM - return None for graceful retry
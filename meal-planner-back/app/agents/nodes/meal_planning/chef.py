@@ -4,8 +4,10 @@ from json import JSONDecodeError
 from pydantic import ValidationError
 
 from app.models.state import MealPlanState, MealRecommendation
-from app.services.llm_service import get_llm_service, parse_json_response
+from app.services.llm_service import get_llm_service, parse_json_response, response_validator
+from app.services.llm_streaming import partial_progress_writer
 from app.services.recipe_search import get_recipe_search_service
+from app.services.recommendation_cache import get_recommendation_cache, recommendation_cache_key
 from app.utils.constants import COOKING_TIME_LIMITS, ENABLE_RECIPE_SEARCH
 from app.utils.logging import get_logger
 from app.utils.prompt_safety import escape_for_llm
@@ -13,6 +15,34 @@ from app.utils.prompt_safety import escape_for_llm
 logger = get_logger(__name__)
 
 
+def _completed_update(
+    state: MealPlanState,
+    recommendation: MealRecommendation,
+    cached: bool = False,
+    cache_key: tuple | None = None,
+) -> dict:
+    """추천 완료 상태 업데이트 (LLM 응답/캐시 적중 공용)
+
+    cache_key가 있으면 끼니가 검증을 모두 통과한 뒤 validation_aggregator가 추천 풀에 추가
+    """
+    return {
+        "chef_recommendation": recommendation,
+        "recommendation_cache_keys": {"chef": cache_key},
+        "events": [{
+            "type": "progress",
+            "node": "chef",
+            "status": "completed",
+            "data": {
+                "menu": recommendation.menu_name,
+                "day": state.get("current_day"),
+                "meal": state.get("current_meal_index", 0) + 1,
+                "meal_type": state.get("current_meal_type"),
+                "cached": cached,
+            }
+        }],
+    }
+
+
 async def chef_agent(state: MealPlanState) -> dict:
     """셰프 에이전트: 맛과 조리 용이성 관점에서 메뉴 추천
 
@@ -38,6 +68,18 @@ async def chef_agent(state: MealPlanState) -> dict:
         skill_level=profile.skill_level,
     )
 
+    # 구간화된 조건이 같은 이전 추천 재사용 (재시도는 피드백 반영이 필요하므로 항상 LLM 호출)
+    llm_service = get_llm_service()
+    recommendation_cache = None if llm_service.mock_mode or retry_count > 0 else get_recommendation_cache()
+    cache_key = None
+    if recommendation_cache is not None:
+        cache_key = recommendation_cache_key("chef", state["current_meal_type"], profile, targets)
+        used_menus = [meal.menu_name for meal in state.get("completed_meals", [])]
+        cached = recommendation_cache.get(cache_key, used_menus)
+        if cached is not None:
+            logger.info("chef_cache_hit", menu=cached.menu_name)
+            return _completed_update(state, cached, cached=True)
+
     # Recipe search enhancement
     recipe_context = ""
     if ENABLE_RECIPE_SEARCH:
@@ -157,9 +199,14 @@ async def chef_agent(state: MealPlanState) -> dict:
 **필수 필드**: menu_name, ingredients, estimated_calories, estimated_cost, cooking_time_minutes, reasoning
 """
 
-    llm_service = get_llm_service()
     try:
-        response = await llm_service.ainvoke(prompt)
+        # 재시도는 이전에 거부된 응답을 다시 받지 않도록 LLM 응답 캐시를 쓰지 않음
+        response = await llm_service.ainvoke(
+            prompt,
+            on_partial=partial_progress_writer("chef", state),
+            use_cache=retry_count == 0,
+            validate=response_validator(MealRecommendation),
+        )
         logger.debug("chef_llm_response", response=response)
         recommendation_data = parse_json_response(response)
         logger.debug("chef_parsed_data", data=recommendation_data)
@@ -170,21 +217,8 @@ async def chef_agent(state: MealPlanState) -> dict:
             menu=recommendation.menu_name,
             cooking_time=recommendation.cooking_time_minutes,
         )
-
-        return {
-            "chef_recommendation": recommendation,
-            "events": [{
-                "type": "progress",
-                "node": "chef",
-                "status": "completed",
-                "data": {
-                    "menu": recommendation.menu_name,
-                    "day": state.get("current_day"),
-                    "meal": state.get("current_meal_index", 0) + 1,
-                    "meal_type": state.get("current_meal_type"),
-                }
-            }],
-        }
+        # 풀에는 검증 통과 후 추가 (검증에서 거부될 추천을 다른 사용자에게 반환하지 않도록)
+        return _completed_update(state, recommendation, cache_key=cache_key)
 
     except JSONDecodeError as e:
         # EC-020: Malformed JSON from LLM - return None for graceful retry
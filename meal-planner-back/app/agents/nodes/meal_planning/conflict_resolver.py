@@ -1,6 +1,7 @@
 """Conflict Resolver (3명 의견 통합)"""
 from app.models.state import MealPlanState, Menu
-from app.services.llm_service import get_llm_service, parse_json_response
+from app.services.llm_service import get_llm_service, parse_json_response, response_validator
+from app.services.llm_streaming import partial_progress_writer
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -196,7 +197,13 @@ async def conflict_resolver(state: MealPlanState) -> dict:
 
     llm_service = get_llm_service()
     try:
-        response = await llm_service.ainvoke(prompt)
+        # 재시도는 전문가 추천이 그대로여도 이전에 거부된 메뉴를 다시 받지 않도록 LLM 응답 캐시를 쓰지 않음
+        response = await llm_service.ainvoke(
+            prompt,
+            on_partial=partial_progress_writer("conflict_resolver", state),
+            use_cache=state.get("retry_count", 0) == 0,
+            validate=response_validator(Menu, meal_type=state["current_meal_type"]),
+        )
         logger.debug("conflict_resolver_llm_response", response=response)
         menu_data = parse_json_response(response)
         logger.debug("conflict_resolver_parsed_data", data=menu_data)
@@ -4,8 +4,10 @@ from json import JSONDecodeError
 from pydantic import ValidationError
 
 from app.models.state import MealPlanState, MealRecommendation
-from app.services.llm_service import get_llm_service, parse_json_response
+from app.services.llm_service import get_llm_service, parse_json_response, response_validator
+from app.services.llm_streaming import partial_progress_writer
 from app.services.recipe_search import get_recipe_search_service
+from app.services.recommendation_cache import get_recommendation_cache, recommendation_cache_key
 from app.utils.constants import ENABLE_RECIPE_SEARCH
 from app.utils.logging import get_logger
 from app.utils.prompt_safety import escape_for_llm
@@ -13,6 +15,34 @@ from app.utils.prompt_safety import escape_for_llm
 logger = get_logger(__name__)
 
 
+def _completed_update(
+    state: MealPlanState,
+    recommendation: MealRecommendation,
+    cached: bool = False,
+    cache_key: tuple | None = None,
+) -> dict:
+    """추천 완료 상태 업데이트 (LLM 응답/캐시 적중 공용)
+
+    cache_key가 있으면 끼니가 검증을 모두 통과한 뒤 validation_aggregator가 추천 풀에 추가
+    """
+    return {
+        "nutritionist_recommendation": recommendation,
+        "recommendation_cache_keys": {"nutritionist": cache_key},
+        "events": [{
+            "type": "progress",
+            "node": "nutritionist",
+            "status": "completed",
+            "data": {
+                "menu": recommendation.menu_name,
+                "day": state.get("current_day"),
+                "meal": state.get("current_meal_index", 0) + 1,
+                "meal_type": state.get("current_meal_type"),
+                "cached": cached,
+            }
+        }],
+    }
+
+
 async def nutritionist_agent(state: MealPlanState) -> dict:
     """영양사 에이전트: 영양 균형 관점에서 메뉴 추천
 
@@ -36,22 +66,31 @@ async def nutritionist_agent(state: MealPlanState) -> dict:
         target_calories=targets.calories,
     )
 
+    # 구간화된 조건이 같은 이전 추천 재사용 (재시도는 피드백 반영이 필요하므로 항상 LLM 호출)
+    llm_service = get_llm_service()
+    recommendation_cache = None if llm_service.mock_mode or retry_count > 0 else get_recommendation_cache()
+    cache_key = None
+    if recommendation_cache is not None:
+        cache_key = recommendation_cache_key("nutritionist", state["current_meal_type"], profile, targets)
+        used_menus = [meal.menu_name for meal in state.get("completed_meals", [])]
+        cached = recommendation_cache.get(cache_key, used_menus)
+        if cached is not None:
+            logger.info("nutritionist_cache_hit", menu=cached.menu_name)
+            return _completed_update(state, cached, cached=True)
+
     # Recipe search enhancement - provide real nutrition data as reference
+    # 끼니 영양 목표(칼로리 + 탄단지)와 가장 가까운 로컬 레시피 (영양 공간 k-NN)
     recipe_context = ""
     if ENABLE_RECIPE_SEARCH:
         search_service = get_recipe_search_service()
         try:
-            search_query = f"{state['current_meal_type']} {profile.goal}"
-            if profile.restrictions:
-                search_query += f" exclude:{','.join(profile.restrictions[:2])}"
-
-            recipes = await search_service.search_recipes(
-                query=search_query,
-                filters={
-                    "target_calories": targets.calories,
-                    "calorie_tolerance": 0.3,
-                    "exclude_ingredients": profile.restrictions,
-                },
+            recipes = await search_service.search_similar_recipes(
+                target_calories=targets.calories,
+                target_carb_g=targets.carb_g,
+                target_protein_g=targets.protein_g,
+                target_fat_g=targets.fat_g,
+                exclude_ingredients=profile.restrictions,
+                calorie_tolerance=0.3,
             )
 
             if recipes:
@@ -149,9 +188,14 @@ async def nutritionist_agent(state: MealPlanState) -> dict:
 **필수 필드**: menu_name, ingredients, estimated_calories, estimated_cost, cooking_time_minutes, reasoning
 """
 
-    llm_service = get_llm_service()
     try:
-        response = await llm_service.ainvoke(prompt)
+        # 재시도는 이전에 거부된 응답을 다시 받지 않도록 LLM 응답 캐시를 쓰지 않음
+        response = await llm_service.ainvoke(
+            prompt,
+            on_partial=partial_progress_writer("nutritionist", state),
+            use_cache=retry_count == 0,
+            validate=response_validator(MealRecommendation),
+        )
         logger.debug("nutritionist_llm_response", response=response)
         recommendation_data = parse_json_response(response)
         logger.debug("nutritionist_parsed_data", data=recommendation_data)
@@ -162,21 +206,8 @@ async def nutritionist_agent(state: MealPlanState) -> dict:
             menu=recommendation.menu_name,
             calories=recommendation.estimated_calories,
         )
-
-        return {
-            "nutritionist_recommendation": recommendation,
-            "events": [{
-                "type": "progress",
-                "node": "nutritionist",
-                "status": "completed",
-                "data": {
-                    "menu": recommendation.menu_name,
-                    "day": state.get("current_day"),
-                    "meal": state.get("current_meal_index", 0) + 1,
-                    "meal_type": state.get("current_meal_type"),
-                }
-            }],
-        }
+        # 풀에는 검증 통과 후 추가 (검증에서 거부될 추천을 다른 사용자에게 반환하지 않도록)
+        return _completed_update(state, recommendation, cache_key=cache_key)
 
     except JSONDecodeError as e:
         # EC-020: Malformed JSON from LLM - return None for graceful retry
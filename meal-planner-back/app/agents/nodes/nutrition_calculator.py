@@ -1,6 +1,17 @@
 """영양 계산 노드"""
+from app.models.responses import FeasibilityResponse
 from app.models.state import MealPlanState, MacroTargets
-from app.utils.constants import ACTIVITY_MULTIPLIERS, CALORIE_ADJUSTMENTS, MACRO_RATIOS, MEAL_TYPES, BUDGET_RATIOS
+from app.services.recipe_feasibility import estimate_feasibility
+from app.services.recipe_store import peek_recipe_store
+from app.services.search_executor import get_search_executor
+from app.utils.constants import (
+    ACTIVITY_MULTIPLIERS,
+    CALORIE_ADJUSTMENTS,
+    COOKING_TIME_LIMITS,
+    MACRO_RATIOS,
+    MEAL_TYPES,
+    BUDGET_RATIOS,
+)
 from app.utils.nutrition import calculate_bmr, calculate_tdee, get_strictest_ratios
 from app.utils.logging import get_logger
 
@@ -117,6 +128,38 @@ def calculate_per_meal_budgets(
     return per_meal_budget, per_meal_budgets
 
 
+async def check_plan_feasibility(
+    profile,
+    per_meal_targets: MacroTargets,
+    per_meal_budget: int
+) -> FeasibilityResponse | None:
+    """레시피 색인으로 제약 조건 충족 가능성 사전 점검
+
+    레시피 데이터가 아직 로드되지 않았거나 점검이 실패하면 None (식단 생성은 그대로 진행)
+
+    Returns:
+        FeasibilityResponse 또는 None
+    """
+    store = peek_recipe_store()
+    if store is None:
+        return None
+
+    try:
+        return await get_search_executor().run(
+            estimate_feasibility,
+            store,
+            per_meal_targets,
+            per_meal_budget=per_meal_budget,
+            max_cooking_time=COOKING_TIME_LIMITS.get(profile.cooking_time),
+            skill_level=profile.skill_level,
+            restrictions=profile.restrictions,
+            health_conditions=profile.health_conditions,
+        )
+    except Exception as e:
+        logger.warning("plan_feasibility_check_failed", error=str(e))
+        return None
+
+
 async def nutrition_calculator(state: MealPlanState) -> dict:
     """BMR/TDEE/매크로 목표 계산
 
@@ -158,10 +201,32 @@ async def nutrition_calculator(state: MealPlanState) -> dict:
         per_meal_budgets=per_meal_budgets,
     )
 
+    # 제약 조건 사전 점검: 조건이 좁으면 경고 + 영양/예산 검증을 처음부터 완화 (재시도 낭비 방지)
+    feasibility = await check_plan_feasibility(profile, per_meal_targets, per_meal_budget)
+    relaxed_validators = feasibility.relaxed_validators if feasibility else []
+    if feasibility is not None and not feasibility.feasible:
+        logger.warning(
+            "plan_feasibility_low",
+            matching_all=feasibility.matching_all,
+            bottleneck=feasibility.bottleneck,
+            relaxed_validators=relaxed_validators,
+        )
+
     # 첫 끼니 타입 결정
     meal_types = get_meal_types_for_day(profile.meals_per_day)
     first_meal_type = meal_types[0]
 
+    progress_data = {
+        "daily_calories": daily_targets.calories,
+        "per_meal_calories": per_meal_targets.calories,
+        "budget_distribution": profile.budget_distribution,
+        "day": 1,
+        "meal": 1,
+        "meal_type": first_meal_type,
+    }
+    if feasibility is not None:
+        progress_data["feasibility"] = feasibility.model_dump()
+
     return {
         "daily_targets": daily_targets,
         "per_meal_targets": per_meal_targets,
@@ -171,19 +236,13 @@ async def nutrition_calculator(state: MealPlanState) -> dict:
         "current_meal_index": 0,
         "current_meal_type": first_meal_type,
         "retry_count": 0,
+        "relaxed_validators": relaxed_validators,
         "completed_meals": [],
         "weekly_plan": [],
         "events": [{
             "type": "progress",
             "node": "nutrition_calculator",
             "status": "completed",
-            "data": {
-                "daily_calories": daily_targets.calories,
-                "per_meal_calories": per_meal_targets.calories,
-                "budget_distribution": profile.budget_distribution,
-                "day": 1,
-                "meal": 1,
-                "meal_type": first_meal_type,
-            }
+            "data": progress_data,
         }],
     }
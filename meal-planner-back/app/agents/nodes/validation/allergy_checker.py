@@ -1,9 +1,30 @@
 """알레르기 및 제외 성분 검증 노드"""
+import re
+from typing import List
+
 from app.models.state import MealPlanState, ValidationResult
+from app.services.recipe_ingredients import normalize_ingredient_name
+from app.services.restriction_bitmaps import expand_restrictions
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 재료명 토큰 구분자 (예: "양상추, 로메인", "우유(저지방)")
+_TOKEN_SEPARATORS = re.compile(r"[\s,/()·]+")
+
+
+def _matches_keyword(ingredient: str, keywords: List[str]) -> bool:
+    """
+    동의어 키워드 매칭 (재료명 전체 또는 토큰 단위 일치)
+
+    동의어 사전에는 "밀", "크림", "굴"처럼 짧은 키워드가 있어 부분 문자열로 비교하면
+    밀감, 아이스크림, 굴비까지 걸림 → 검증에서는 정확히 일치하는 경우만 위반으로 봄
+    (레시피 검색 사전 필터는 짧은 키워드만 토큰 일치, 나머지는 부분 문자열 → restriction_bitmaps.matches_keywords)
+    """
+    tokens = {normalize_ingredient_name(token) for token in _TOKEN_SEPARATORS.split(ingredient) if token}
+    tokens.add(normalize_ingredient_name(ingredient))
+    return any(keyword in tokens for keyword in keywords)
+
 
 async def allergy_checker(state: MealPlanState) -> dict:
     """알레르기 및 제외 식품 검증
@@ -46,6 +67,9 @@ async def allergy_checker(state: MealPlanState) -> dict:
             }],
         }
 
+    # 제한 항목 → 재료 키워드 (레시피 검색 비트맵과 같은 동의어 사전, 예: 계란 → 달걀, 마요네즈)
+    keywords = expand_restrictions(restrictions)
+
     # 각 재료를 제한 사항과 비교
     for ingredient in menu.ingredients:
         ingredient_name = ingredient["name"].lower()
@@ -53,8 +77,12 @@ async def allergy_checker(state: MealPlanState) -> dict:
         for restriction in restrictions:
             restriction_lower = restriction.lower()
 
-            # 포함 여부 체크 (부분 문자열 매칭)
-            if restriction_lower in ingredient_name or ingredient_name in restriction_lower:
+            # 포함 여부 체크 (제한 항목은 부분 문자열, 동의어는 재료명/토큰 일치)
+            if (
+                restriction_lower in ingredient_name
+                or ingredient_name in restriction_lower
+                or _matches_keyword(ingredient["name"], keywords[restriction])
+            ):
                 issues.append(
                     f"제한 식품 포함: '{ingredient['name']}' (제한: {restriction})"
                 )
@@ -7,6 +7,10 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 예산 초과 허용 비율 (기본 / 점진적 완화)
+BUDGET_TOLERANCE = 0.10          # 10% 초과 허용
+RELAXED_BUDGET_TOLERANCE = 0.15  # 15% 초과 허용
+
 
 async def budget_checker(state: MealPlanState) -> dict:
     """예산 초과 검증 (Progressive Relaxation 적용)
@@ -35,12 +39,12 @@ async def budget_checker(state: MealPlanState) -> dict:
 
     issues = []
 
-    # Progressive relaxation: Retry count에 따라 점진적으로 완화
-    if retry_count >= 3:
-        over_budget_tolerance = 0.15  # 15% 초과 허용
-        logger.info("progressive_relaxation_applied", retry_count=retry_count, tolerance="15%")
+    # Progressive relaxation: Retry count에 따라 점진적으로 완화 (사전 점검에서 조건이 좁으면 처음부터)
+    if retry_count >= 3 or "budget_checker" in state.get("relaxed_validators", []):
+        over_budget_tolerance = RELAXED_BUDGET_TOLERANCE
+        logger.info("progressive_relaxation_applied", retry_count=retry_count, tolerance=f"{RELAXED_BUDGET_TOLERANCE:.0%}")
     else:
-        over_budget_tolerance = 0.10  # 10% 초과 허용
+        over_budget_tolerance = BUDGET_TOLERANCE
 
     # 예산 상한선 계산
     budget_upper_limit = budget * (1 + over_budget_tolerance)
@@ -7,6 +7,10 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 영양 정보에 없는 값의 추정 비율 (당류 = 탄수화물의 30%, 포화지방 = 지방의 30%)
+SUGAR_RATIO_OF_CARB = 0.3
+SATURATED_FAT_RATIO_OF_FAT = 0.3
+
 # 건강 조건별 기준값
 HEALTH_CONSTRAINTS = {
     "당뇨": {
@@ -81,13 +85,13 @@ async def health_checker(state: MealPlanState) -> dict:
 
         # 당뇨: 당류 제한 (현재는 탄수화물의 30%로 추정)
         if condition == "당뇨" and menu.carb_g is not None:
-            estimated_sugar_g = menu.carb_g * 0.3  # 탄수화물의 30%를 당류로 추정
+            estimated_sugar_g = menu.carb_g * SUGAR_RATIO_OF_CARB
             max_sugar = constraint["sugar_g_max"]
 
             if estimated_sugar_g > max_sugar:
                 issues.append(
                     f"당뇨 제약: 추정 당류 {estimated_sugar_g:.1f}g "
-                    f"(탄수화물 {menu.carb_g}g의 30%) > 기준 {max_sugar}g"
+                    f"(탄수화물 {menu.carb_g}g의 {SUGAR_RATIO_OF_CARB:.0%}) > 기준 {max_sugar}g"
                 )
                 logger.debug(
                     "diabetes_constraint_violated",
@@ -111,13 +115,13 @@ async def health_checker(state: MealPlanState) -> dict:
 
         # 고지혈증: 포화지방 제한 (전체 지방의 30%로 추정)
         if condition == "고지혈증" and menu.fat_g is not None:
-            estimated_saturated_fat_g = menu.fat_g * 0.3  # 지방의 30%를 포화지방으로 추정
+            estimated_saturated_fat_g = menu.fat_g * SATURATED_FAT_RATIO_OF_FAT
             max_saturated_fat = constraint["saturated_fat_g_max"]
 
             if estimated_saturated_fat_g > max_saturated_fat:
                 issues.append(
                     f"고지혈증 제약: 추정 포화지방 {estimated_saturated_fat_g:.1f}g "
-                    f"(지방 {menu.fat_g}g의 30%) > 기준 {max_saturated_fat}g"
+                    f"(지방 {menu.fat_g}g의 {SATURATED_FAT_RATIO_OF_FAT:.0%}) > 기준 {max_saturated_fat}g"
                 )
                 logger.debug(
                     "hyperlipidemia_constraint_violated",
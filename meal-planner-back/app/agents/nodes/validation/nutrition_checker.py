@@ -1,9 +1,16 @@
 """영양 목표 검증 노드"""
 from app.models.state import MealPlanState, ValidationResult
+from app.utils.constants import VALIDATION_TOLERANCE
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 허용 범위 (기본 / 점진적 완화)
+CALORIE_TOLERANCE = VALIDATION_TOLERANCE  # ±20%
+MACRO_TOLERANCE = 0.3                     # ±30%
+RELAXED_CALORIE_TOLERANCE = 0.25          # ±25%
+RELAXED_MACRO_TOLERANCE = 0.35            # ±35%
+
 
 async def nutrition_checker(state: MealPlanState) -> dict:
     """영양 목표 충족 검증 (칼로리 ±20% 허용)
@@ -38,13 +45,13 @@ async def nutrition_checker(state: MealPlanState) -> dict:
     retry_count = state.get("retry_count", 0)
 
     # Base tolerance
-    calorie_tolerance = 0.2  # ±20%
-    macro_tolerance = 0.3    # ±30%
+    calorie_tolerance = CALORIE_TOLERANCE
+    macro_tolerance = MACRO_TOLERANCE
 
-    # Progressive relaxation (retry 3회 이상 시)
-    if retry_count >= 3:
-        calorie_tolerance = 0.25  # ±25%
-        macro_tolerance = 0.35    # ±35%
+    # Progressive relaxation (retry 3회 이상 시, 또는 사전 점검에서 조건이 좁다고 판단된 프로필)
+    if retry_count >= 3 or "nutrition_checker" in state.get("relaxed_validators", []):
+        calorie_tolerance = RELAXED_CALORIE_TOLERANCE
+        macro_tolerance = RELAXED_MACRO_TOLERANCE
         logger.info("progressive_relaxation_applied", retry_count=retry_count)
 
     # 칼로리 검증
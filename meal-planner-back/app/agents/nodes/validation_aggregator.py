@@ -1,5 +1,6 @@
 """Validation Aggregator Node"""
 from app.models.state import MealPlanState
+from app.services.recommendation_cache import get_recommendation_cache
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +25,31 @@ def calculate_total_completed_meals(state: MealPlanState) -> int:
     return total_from_weekly_plan + current_day_completed
 
 
+def pool_validated_recommendations(state: MealPlanState) -> int:
+    """검증을 모두 통과한 끼니의 전문가 추천을 추천 캐시 풀에 추가
+
+    전문가 노드는 추천과 캐시 키만 상태에 남기고, 풀에는 여기서만 추가
+    → 알레르기/예산/건강 검증에서 거부된 추천은 다른 사용자에게 캐시 적중으로 반환되지 않음
+
+    Args:
+        state: 현재 그래프 상태
+
+    Returns:
+        풀에 추가한 추천 수
+    """
+    cache = get_recommendation_cache()
+    if cache is None:
+        return 0
+
+    pooled = 0
+    for expert, cache_key in (state.get("recommendation_cache_keys") or {}).items():
+        recommendation = state.get(f"{expert}_recommendation")
+        if cache_key is not None and recommendation is not None:
+            cache.put(cache_key, recommendation)
+            pooled += 1
+    return pooled
+
+
 async def validation_aggregator(state: MealPlanState) -> dict:
     """검증 결과 집계 노드
 
@@ -80,6 +106,11 @@ async def validation_aggregator(state: MealPlanState) -> dict:
 
     current_menu = state.get("current_menu")
 
+    if all_passed:
+        pooled = pool_validated_recommendations(state)
+        if pooled:
+            logger.info("recommendations_pooled", count=pooled)
+
     # Calculate progress: include current meal if validation passed
     total_completed = calculate_total_completed_meals(state)
     if all_passed:
@@ -87,6 +118,8 @@ async def validation_aggregator(state: MealPlanState) -> dict:
 
     return {
         "previous_validation_failures": failed_validations,
+        # 검증이 끝난 키는 소비 (통과 시에만 풀에 추가, 한 번 거부된 시도의 추천은 재시도가 통과해도 추가하지 않음)
+        "recommendation_cache_keys": {expert: None for expert in state.get("recommendation_cache_keys") or {}},
         "events": [{
             "type": "meal_complete" if all_passed else "progress",
             "node": "validation_aggregator",
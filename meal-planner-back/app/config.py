@@ -20,11 +20,62 @@ class Settings(BaseSettings):
     LLM_MODEL: str = "claude-3-5-haiku-latest"
     LLM_TEMPERATURE: float = 0.7
     LLM_MAX_TOKENS: int = 2000
+    # 전문가/충돌 해결 노드 응답을 스트리밍으로 받아 메뉴명/재료가 완성되는 즉시 SSE 진행 이벤트 전송
+    LLM_STREAMING_ENABLED: bool = True
+
+    # LLM Response Cache (같은 모델/설정/프롬프트 응답 재사용)
+    LLM_CACHE_ENABLED: bool = True
+    # 메모리 LRU 최대 항목 수 (0이면 메모리 계층 없음)
+    LLM_CACHE_MAX_ENTRIES: int = 512
+    LLM_CACHE_TTL_SECONDS: float = 24 * 60 * 60
+    # SQLite 디스크 계층 경로 (빈 값이면 디스크 계층 없음, 워커/재시작 간 공유)
+    LLM_CACHE_PATH: str = ""
+    LLM_CACHE_MAX_DISK_MB: float = 64
+
+    # LLM Concurrency Governor (프로세스 전역 동시 호출/속도 조절, AIMD)
+    LLM_GOVERNOR_ENABLED: bool = True
+    # 동시 호출 상한 범위와 시작값 (429/느린 응답이면 감소, 정상 응답이면 증가)
+    LLM_MAX_CONCURRENCY: int = 8
+    LLM_MIN_CONCURRENCY: int = 1
+    LLM_INITIAL_CONCURRENCY: int = 4
+    # 분당 요청 수 / 분당 토큰 수 한도 (계정 rate limit보다 약간 낮게, 0이면 제한 없음)
+    LLM_REQUESTS_PER_MINUTE: float = 50
+    LLM_TOKENS_PER_MINUTE: float = 80000
+    # 이보다 느린 응답은 혼잡으로 보고 상한 감소 (초)
+    LLM_LATENCY_TARGET_SECONDS: float = 12
+
+    # Expert Recommendation Cache (구간화된 목표값 기준 영양사/셰프/예산 추천 재사용)
+    RECOMMENDATION_CACHE_ENABLED: bool = True
+    # 최대 키 수 (0이면 저장 안 함)
+    RECOMMENDATION_CACHE_MAX_KEYS: int = 2048
+    # 키당 최대 추천 수 / 재사용을 시작하는 최소 추천 수 (다양성)
+    RECOMMENDATION_CACHE_POOL_SIZE: int = 6
+    RECOMMENDATION_CACHE_MIN_POOL: int = 3
+    # 구간 크기 (칼로리 kcal, 단백질 g, 1끼니 예산 원)
+    RECOMMENDATION_CACHE_CALORIE_BUCKET: float = 50
+    RECOMMENDATION_CACHE_PROTEIN_BUCKET: float = 5
+    RECOMMENDATION_CACHE_BUDGET_BUCKET: float = 1000
 
     # Server
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     DEBUG: bool = False
+    # uvicorn 워커 프로세스 수 (2 이상이면 레시피 스냅샷을 부모에서 준비 후 워커가 mmap 공유)
+    WORKERS: int = 1
+
+    # Recipe Data Reload
+    # 관리자 엔드포인트 토큰 (X-Admin-Token 헤더, 미설정 시 /api/admin/* 비활성화)
+    ADMIN_TOKEN: str | None = None
+    # 레시피 CSV/스냅샷 변경 감시 주기 (초, 0이면 감시 안 함)
+    RECIPE_RELOAD_WATCH_SECONDS: float = 0
+
+    # Alternative Recipe Cache
+    # /api/alternative-recipes 결과 LRU 최대 항목 수 (0이면 캐시 안 함, ETag는 계속 사용)
+    ALTERNATIVE_CACHE_MAX_ENTRIES: int = 1024
+
+    # Recipe Search Executor
+    # 레시피 검색/점수 계산 스레드 수 (이벤트 루프 밖에서 실행, 0이면 이벤트 루프에서 바로 실행)
+    SEARCH_EXECUTOR_WORKERS: int = 2
 
     # CORS (환경변수에서 쉼표로 구분된 문자열로 설정)
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:5173,http://localhost:5174"
@@ -4,6 +4,6 @@ Controllers 패키지
 API 엔드포인트 정의
 """
 
-from app.controllers import meal_plan
+from app.controllers import admin, meal_plan
 
-__all__ = ["meal_plan"]
+__all__ = ["admin", "meal_plan"]
@@ -0,0 +1,84 @@
+"""
+관리자 API 컨트롤러
+
+레시피 데이터 핫 리로드, 캐시 통계 (ADMIN_TOKEN 설정 시에만 활성화)
+"""
+
+import hmac
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException
+from app.config import settings
+from app.models.responses import RecipeReloadResponse
+from app.services.alternative_cache import get_alternative_cache
+from app.services.llm_cache import get_llm_cache
+from app.services.recipe_reload import reload_recipes
+from app.services.recipe_store import RecipeReloadInProgressError, peek_recipe_store
+from app.services.recommendation_cache import get_recommendation_cache
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+def verify_admin_token(token: Optional[str]) -> None:
+    """
+    관리자 토큰 확인
+
+    Raises:
+        HTTPException: 토큰 미설정(404) 또는 불일치(403)
+    """
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not token or not hmac.compare_digest(token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+@router.post("/reload-recipes", response_model=RecipeReloadResponse)
+async def reload_recipe_data(x_admin_token: Optional[str] = Header(default=None)):
+    """
+    레시피 데이터 리로드 (새 버전 구축 후 원자적 교체)
+
+    구축 중에도 기존 버전이 요청을 계속 처리하며, 진행 중인 SSE 식단 생성은
+    끊기지 않고 시작할 때의 버전으로 끝까지 진행
+
+    Returns:
+        새 데이터 버전 정보 (기본 경로 저장소 기준)
+    """
+    verify_admin_token(x_admin_token)
+    previous = peek_recipe_store()
+    logger.info("recipe_reload_requested", current_version=previous.version if previous else None)
+
+    try:
+        stores = await reload_recipes()
+    except RecipeReloadInProgressError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        logger.error("recipe_reload_failed", error=str(e), exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    store = peek_recipe_store() or stores[0]
+    return RecipeReloadResponse(
+        recipe_data_version=store.version,
+        previous_version=previous.version if previous else None,
+        recipe_count=len(store),
+        source=store.source,
+    )
+
+
+@router.get("/cache-stats")
+async def cache_stats(x_admin_token: Optional[str] = Header(default=None)):
+    """
+    캐시 적중률 통계
+
+    Returns:
+        {"llm": LLM 응답 캐시 통계, "alternative_recipes": 대체 레시피 결과 캐시 통계,
+         "recommendations": 전문가 추천 캐시 통계 (비활성화 시 null)}
+    """
+    verify_admin_token(x_admin_token)
+    recommendation_cache = get_recommendation_cache()
+    return {
+        "llm": get_llm_cache().stats(),
+        "alternative_recipes": get_alternative_cache().stats(),
+        "recommendations": recommendation_cache.stats() if recommendation_cache is not None else None,
+    }
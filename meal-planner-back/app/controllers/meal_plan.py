@@ -6,14 +6,33 @@ SSE 스트리밍 엔드포인트 + Health Check
 
 import asyncio
 from hashlib import sha256
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse, JSONResponse
-from app.models.requests import MealPlanRequest, RegenerateMealRequest
-from app.models.responses import HealthCheckResponse
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse, JSONResponse, Response
+from app.models.requests import MealPlanRequest, RegenerateMealRequest, AlternativeRecipesBatchRequest
+from app.models.responses import FeasibilityResponse, HealthCheckResponse
+from app.models.state import UserProfile
+from app.agents.nodes.nutrition_calculator import (
+    calculate_daily_targets,
+    calculate_per_meal_budgets,
+    calculate_per_meal_targets,
+)
 from app.services.stream_service import stream_meal_plan, stream_meal_regeneration
 from app.services.regeneration_service import build_regeneration_state
 from app.services.recipe_search_service import get_alternative_recipe_service
 from app.services.csv_recipe_search_service import get_csv_recipe_service
+from app.services.alternative_cache import (
+    alternative_cache_key,
+    etag_for,
+    etag_matches,
+    get_alternative_cache,
+    normalize_names,
+)
+from app.services.recipe_feasibility import estimate_feasibility
+from app.services.recipe_store import get_recipe_store, peek_recipe_store
+from app.services.llm_governor import get_llm_governor
+from app.services.search_executor import get_search_executor
+from app.utils.constants import COOKING_TIME_LIMITS
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -41,10 +60,29 @@ async def health_check():
     """
     헬스 체크 엔드포인트
 
-    서버가 정상 작동 중인지 확인
+    서버가 정상 작동 중인지 확인 (+ 현재 서비스 중인 레시피 데이터 버전, 검색 실행기/LLM 호출 대기 작업 수)
     """
     logger.info("health_check_requested")
-    return HealthCheckResponse(status="ok", version="1.0.0")
+    store = peek_recipe_store()
+    search_executor = get_search_executor()
+    llm_governor = get_llm_governor()
+    queue_stats = dict(
+        search_queue_depth=search_executor.queue_depth,
+        search_active=search_executor.active,
+        llm_concurrency_limit=round(llm_governor.limit, 2),
+        llm_in_flight=llm_governor.in_flight,
+        llm_queue_depth=llm_governor.queue_depth,
+    )
+    if store is None:
+        return HealthCheckResponse(status="ok", version="1.0.0", **queue_stats)
+    return HealthCheckResponse(
+        status="ok",
+        version="1.0.0",
+        recipe_data_version=store.version,
+        recipe_count=len(store),
+        recipe_loaded_at=store.loaded_at,
+        **queue_stats,
+    )
 
 
 @router.post("/generate")
@@ -184,11 +222,15 @@ async def get_alternative_recipes(
     exclude_recipes: str = "",
     target_carb_g: float = None,
     target_protein_g: float = None,
-    target_fat_g: float = None
+    target_fat_g: float = None,
+    if_none_match: Optional[str] = Header(default=None)
 ):
     """
     대체 레시피 검색
 
+    같은 조건(정규화된 키 + 레시피 데이터 버전)은 LRU 캐시에서 반환하고,
+    If-None-Match가 현재 ETag와 같으면 검색 없이 304 반환
+
     Args:
         current_menu: 현재 메뉴 이름
         target_calories: 목표 칼로리
@@ -200,9 +242,10 @@ async def get_alternative_recipes(
         target_carb_g: 목표 탄수화물(g) - 선택사항
         target_protein_g: 목표 단백질(g) - 선택사항
         target_fat_g: 목표 지방(g) - 선택사항
+        if_none_match: 이전 응답의 ETag
 
     Returns:
-        JSON: {"alternatives": [Recipe, Recipe, Recipe]}
+        JSON: {"alternatives": [Recipe, Recipe, Recipe]} (ETag 헤더 포함) 또는 304
     """
     logger.info(
         "alternative_recipes_request",
@@ -212,37 +255,170 @@ async def get_alternative_recipes(
     )
 
     try:
-        # 쉼표로 구분된 문자열 → 리스트 변환
-        restrictions_list = [r.strip() for r in restrictions.split(",") if r.strip()]
-        exclude_list = [e.strip() for e in exclude_recipes.split(",") if e.strip()]
+        # 쉼표로 구분된 문자열 → 정규화된 리스트 (순서/중복과 무관하게 같은 캐시 키)
+        current_menu = current_menu.strip()
+        restrictions_list = normalize_names(restrictions.split(","))
+        exclude_list = normalize_names(exclude_recipes.split(","))
 
         # 대체 레시피 검색 서비스 가져오기 (CSV 기반)
+        # 캐시 키/ETag와 검색이 같은 데이터 버전을 쓰도록 store를 한 번만 조회 (도중 리로드 대비)
         search_service = get_csv_recipe_service()
+        store = search_service.store
 
-        # 대체 레시피 검색 (상위 3개)
-        alternatives = await search_service.search_alternative_recipes(
-            current_menu_name=current_menu,
+        cache_key = alternative_cache_key(
+            store,
+            current_menu=current_menu,
             target_calories=target_calories,
-            target_cost=target_cost,
             calorie_tolerance=calorie_tolerance,
-            cost_tolerance=cost_tolerance,
             restrictions=restrictions_list,
             exclude_recipes=exclude_list,
             target_carb_g=target_carb_g,
             target_protein_g=target_protein_g,
             target_fat_g=target_fat_g
         )
+        etag = etag_for(cache_key)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+        if etag_matches(if_none_match, etag):
+            logger.info("alternative_recipes_not_modified", current_menu=current_menu)
+            return Response(status_code=304, headers=headers)
+
+        cache = get_alternative_cache()
+        alternatives = cache.get(cache_key)
+        if alternatives is None:
+            # 대체 레시피 검색 (상위 3개)
+            alternatives = await search_service.search_alternative_recipes(
+                current_menu_name=current_menu,
+                target_calories=target_calories,
+                target_cost=target_cost,
+                calorie_tolerance=calorie_tolerance,
+                cost_tolerance=cost_tolerance,
+                restrictions=list(restrictions_list),
+                exclude_recipes=list(exclude_list),
+                target_carb_g=target_carb_g,
+                target_protein_g=target_protein_g,
+                target_fat_g=target_fat_g,
+                store=store
+            )
+            cache.put(cache_key, alternatives)
 
         logger.info(
             "alternative_recipes_found",
             current_menu=current_menu,
-            alternatives_count=len(alternatives)
+            alternatives_count=len(alternatives),
+            cache=cache.stats()
         )
 
         return JSONResponse(
-            content={"alternatives": alternatives}
+            content={"alternatives": alternatives},
+            headers=headers
         )
 
     except Exception as e:
         logger.error("alternative_recipes_failed", error=str(e), exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/alternative-recipes/batch")
+async def get_alternative_recipes_batch(request: AlternativeRecipesBatchRequest):
+    """
+    식단 전체 끼니 대체 레시피 일괄 검색
+
+    제한 재료 마스크와 후보 스캔을 끼니 간에 공유하고,
+    같은 대체 레시피를 두 끼니 이상에 추천하지 않음
+
+    Args:
+        request: 끼니 목록 + 공통 필터
+
+    Returns:
+        JSON: {"results": [{"current_menu": str, "alternatives": [Recipe, ...]}, ...]}
+    """
+    logger.info(
+        "alternative_recipes_batch_request",
+        meals=len(request.meals),
+        limit=request.limit
+    )
+
+    try:
+        search_service = get_csv_recipe_service()
+        batches = await search_service.search_alternative_recipes_batch(
+            meals=[meal.model_dump() for meal in request.meals],
+            calorie_tolerance=request.calorie_tolerance,
+            restrictions=[r.strip() for r in request.restrictions if r.strip()],
+            exclude_recipes=[e.strip() for e in request.exclude_recipes if e.strip()],
+            limit=request.limit
+        )
+
+        logger.info(
+            "alternative_recipes_batch_found",
+            meals=len(request.meals),
+            alternatives_count=sum(len(alternatives) for alternatives in batches)
+        )
+
+        return JSONResponse(
+            content={
+                "results": [
+                    {"current_menu": meal.current_menu, "alternatives": alternatives}
+                    for meal, alternatives in zip(request.meals, batches)
+                ]
+            }
+        )
+
+    except Exception as e:
+        logger.error("alternative_recipes_batch_failed", error=str(e), exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/feasibility", response_model=FeasibilityResponse)
+async def check_feasibility(profile: UserProfile):
+    """
+    식단 제약 조건 충족 가능성 사전 점검 (입력 마법사용, LLM 호출 없음)
+
+    끼니당 영양 목표/예산을 식단 생성과 같은 방식으로 계산한 뒤
+    조건별/조합별 만족 레시피 수와 병목 조건을 반환
+
+    Args:
+        profile: 사용자 프로필
+
+    Returns:
+        FeasibilityResponse
+    """
+    logger.info("feasibility_check_requested", goal=profile.goal, restrictions=profile.restrictions)
+
+    try:
+        daily_targets = calculate_daily_targets(profile)
+        per_meal_targets = calculate_per_meal_targets(daily_targets, profile.meals_per_day)
+        per_meal_budget, _ = calculate_per_meal_budgets(
+            budget=profile.budget,
+            budget_type=profile.budget_type,
+            budget_distribution=profile.budget_distribution,
+            meals_per_day=profile.meals_per_day,
+            days=profile.days
+        )
+
+        store = peek_recipe_store()
+        if store is None:
+            store = await asyncio.get_running_loop().run_in_executor(None, get_recipe_store)
+
+        report = await get_search_executor().run(
+            estimate_feasibility,
+            store,
+            per_meal_targets,
+            per_meal_budget=per_meal_budget,
+            max_cooking_time=COOKING_TIME_LIMITS.get(profile.cooking_time),
+            skill_level=profile.skill_level,
+            restrictions=profile.restrictions,
+            health_conditions=profile.health_conditions,
+        )
+
+        logger.info(
+            "feasibility_check_completed",
+            matching_all=report.matching_all,
+            feasible=report.feasible,
+            bottleneck=report.bottleneck
+        )
+        return report
+
+    except Exception as e:
+        logger.error("feasibility_check_failed", error=str(e), exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
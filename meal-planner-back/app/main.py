@@ -4,10 +4,14 @@ FastAPI 애플리케이션 팩토리
 SSE를 통한 실시간 식단 계획 생성 API
 """
 
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
-from app.controllers import meal_plan
+from app.controllers import admin, meal_plan
+from app.services.recipe_reload import watch_recipe_files
+from app.services.recipe_store import get_recipe_store
+from app.services.search_executor import shutdown_search_executor
 from app.utils.logging import setup_logging, get_logger
 
 # 로깅 설정
@@ -42,6 +46,7 @@ def create_app() -> FastAPI:
 
     # 라우터 등록
     app.include_router(meal_plan.router)
+    app.include_router(admin.router)
 
     # Startup 이벤트
     @app.on_event("startup")
@@ -54,11 +59,31 @@ def create_app() -> FastAPI:
             mock_mode=settings.MOCK_MODE,
         )
 
+        # 레시피 데이터 사전 로드 (두 검색 서비스가 공유, 실패해도 서버는 기동)
+        try:
+            loop = asyncio.get_running_loop()
+            store = await loop.run_in_executor(None, get_recipe_store)
+            logger.info("recipe_store_preloaded", total_recipes=len(store), source=store.source)
+        except Exception as e:
+            logger.warning("recipe_store_preload_failed", error=str(e))
+
+        # 레시피 파일 변경 감시 (새 CSV/스냅샷 → 무중단 리로드)
+        if settings.RECIPE_RELOAD_WATCH_SECONDS > 0:
+            app.state.recipe_watch_task = asyncio.create_task(
+                watch_recipe_files(settings.RECIPE_RELOAD_WATCH_SECONDS)
+            )
+
     # Shutdown 이벤트
     @app.on_event("shutdown")
     async def shutdown_event():
         logger.info("server_shutting_down")
 
+        watch_task = getattr(app.state, "recipe_watch_task", None)
+        if watch_task is not None:
+            watch_task.cancel()
+
+        shutdown_search_executor()
+
     return app
 
 
@@ -8,6 +8,7 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 from typing import Literal, List, Optional
 from app.utils.prompt_safety import sanitize_string_list
 from app.models.state import UserProfile
+from app.utils.constants import ALTERNATIVE_BATCH_MAX_MEALS
 
 
 class MealPlanRequest(BaseModel):
@@ -209,3 +210,41 @@ class RegenerateMealRequest(BaseModel):
                 ]
             }
         }
+
+
+class AlternativeMealQuery(BaseModel):
+    """일괄 대체 레시피 검색의 끼니 1건"""
+
+    current_menu: str = Field(description="현재 메뉴 이름")
+    target_calories: int = Field(gt=0, description="목표 칼로리")
+    target_carb_g: Optional[float] = Field(default=None, ge=0, description="목표 탄수화물(g)")
+    target_protein_g: Optional[float] = Field(default=None, ge=0, description="목표 단백질(g)")
+    target_fat_g: Optional[float] = Field(default=None, ge=0, description="목표 지방(g)")
+
+
+class AlternativeRecipesBatchRequest(BaseModel):
+    """식단 전체 끼니 대체 레시피 일괄 검색 요청 모델"""
+
+    meals: List[AlternativeMealQuery] = Field(
+        min_length=1,
+        max_length=ALTERNATIVE_BATCH_MAX_MEALS,
+        description=f"대체 레시피를 찾을 끼니 목록 (최대 {ALTERNATIVE_BATCH_MAX_MEALS}개)"
+    )
+    calorie_tolerance: int = Field(default=50, ge=0, description="칼로리 허용 범위 (±kcal)")
+    restrictions: List[str] = Field(default_factory=list, description="제외 재료")
+    exclude_recipes: List[str] = Field(default_factory=list, description="제외 레시피 이름")
+    limit: int = Field(default=3, ge=1, le=10, description="끼니별 대체 레시피 수")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "meals": [
+                    {"current_menu": "닭가슴살 샐러드", "target_calories": 450},
+                    {"current_menu": "두부조림", "target_calories": 600, "target_protein_g": 35}
+                ],
+                "calorie_tolerance": 50,
+                "restrictions": ["견과류"],
+                "exclude_recipes": [],
+                "limit": 3
+            }
+        }
@@ -62,3 +62,48 @@ class HealthCheckResponse(BaseModel):
 
     status: str = "ok"
     version: str = "1.0.0"
+    # 현재 서비스 중인 레시피 데이터 버전 (로드 전이면 None, 리로드마다 1씩 증가)
+    recipe_data_version: Optional[int] = None
+    recipe_count: Optional[int] = None
+    recipe_loaded_at: Optional[str] = None
+    # 레시피 검색 실행기 대기/실행 중인 작업 수
+    search_queue_depth: Optional[int] = None
+    search_active: Optional[int] = None
+    # LLM 호출 조절기 현재 상한/실행/대기 수
+    llm_concurrency_limit: Optional[float] = None
+    llm_in_flight: Optional[int] = None
+    llm_queue_depth: Optional[int] = None
+
+
+class RecipeReloadResponse(BaseModel):
+    """레시피 데이터 리로드 응답"""
+
+    status: str = "ok"
+    recipe_data_version: int
+    previous_version: Optional[int] = None
+    recipe_count: int
+    source: str
+
+
+class FeasibilityConstraint(BaseModel):
+    """제약 조건 1개의 만족 레시피 수"""
+
+    name: str  # calories | macros | cooking_time | difficulty | restrictions | health | budget
+    label: str
+    matching: int  # 이 조건만 적용했을 때
+    cumulative: int  # 앞 조건들과 함께 적용했을 때
+    without: int  # 이 조건(같은 검증기 조건 묶음)만 빼고 나머지를 모두 적용했을 때
+
+
+class FeasibilityResponse(BaseModel):
+    """식단 제약 조건 충족 가능성 사전 점검 결과"""
+
+    total_recipes: int
+    matching_all: int
+    feasible: bool
+    constraints: List[FeasibilityConstraint]
+    # 조건을 모두 만족하는 레시피가 가장 많이 늘어나는 (가장 좁은) 조건
+    bottleneck: Optional[str] = None
+    # 처음부터 완화된 허용 범위로 검증할 검증기 (nutrition_checker, budget_checker)
+    relaxed_validators: List[str] = []
+    warnings: List[str] = []
@@ -38,6 +38,17 @@ def limit_events(
     return combined
 
 
+def merge_recommendation_cache_keys(
+    existing: dict[str, tuple | None],
+    new: dict[str, tuple | None]
+) -> dict[str, tuple | None]:
+    """Recommendation cache keys reducer
+
+    병렬로 실행되는 전문가 노드가 각자 자기 키만 갱신
+    """
+    return {**(existing or {}), **(new or {})}
+
+
 # ============================================================================
 # Pydantic 모델 (데이터 검증용)
 # ============================================================================
@@ -155,6 +166,9 @@ class MealPlanState(TypedDict):
     nutritionist_recommendation: MealRecommendation | None
     chef_recommendation: MealRecommendation | None
     budget_recommendation: MealRecommendation | None
+    # 전문가별 추천 캐시 키 (LLM으로 만든 추천만, 캐시 적중/재시도/비활성화는 None)
+    # → 검증을 모두 통과한 끼니의 추천만 validation_aggregator가 풀에 추가
+    recommendation_cache_keys: Annotated[dict[str, tuple | None], merge_recommendation_cache_keys]
 
     # 통합된 현재 메뉴
     current_menu: Menu | None
@@ -170,6 +184,8 @@ class MealPlanState(TypedDict):
     retry_count: int
     max_retries: int  # 5
     error_message: str | None
+    # 사전 점검(recipe_feasibility)에서 조건이 좁다고 판단되어 처음부터 완화된 허용 범위로 검증할 검증기
+    relaxed_validators: list[str]
 
     # 스트리밍용 이벤트 (SSE 통합용) - 최대 20개만 유지
     events: Annotated[list[dict], limit_events]
@@ -0,0 +1,145 @@
+"""
+대체 레시피 검색 결과 캐시 (LRU + ETag)
+
+/api/alternative-recipes 결과는 (현재 메뉴, 목표 칼로리/탄단지, 칼로리 허용 범위,
+제한 재료, 제외 레시피, 레시피 데이터 버전)의 순수 함수이므로 같은 조건은 다시 계산하지 않음
+- 제한 재료/제외 레시피는 공백 제거 + 중복 제거 + 정렬 후 키에 사용 (순서가 달라도 같은 키)
+- 데이터 버전(리로드 버전 + 원본 파일 상태)이 키에 포함되어 리로드 후에는 자연스럽게 새로 계산
+- ETag는 키의 해시 → If-None-Match가 일치하면 캐시 조회/검색 없이 304
+"""
+
+import threading
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from app.config import settings
+from app.services.recipe_store import RecipeStore
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def normalize_names(names: List[str]) -> Tuple[str, ...]:
+    """쉼표 구분 목록 정규화 (공백 제거, 빈 값/중복 제거, 정렬)"""
+    return tuple(sorted({name.strip() for name in names if name and name.strip()}))
+
+
+def alternative_cache_key(
+    store: RecipeStore,
+    current_menu: str,
+    target_calories: int,
+    calorie_tolerance: int,
+    restrictions: Tuple[str, ...],
+    exclude_recipes: Tuple[str, ...],
+    target_carb_g: Optional[float],
+    target_protein_g: Optional[float],
+    target_fat_g: Optional[float]
+) -> Tuple:
+    """
+    대체 레시피 검색 캐시 키
+
+    비용 인자(target_cost, cost_tolerance)는 검색에 쓰이지 않으므로 키에서 제외
+
+    Args:
+        store: 현재 서비스 중인 RecipeStore (데이터 버전)
+        restrictions: normalize_names로 정규화된 제한 재료
+        exclude_recipes: normalize_names로 정규화된 제외 레시피
+
+    Returns:
+        해시 가능한 키 튜플
+    """
+    return (
+        store.version,
+        store.fingerprint,
+        current_menu,
+        target_calories,
+        calorie_tolerance,
+        restrictions,
+        exclude_recipes,
+        target_carb_g,
+        target_protein_g,
+        target_fat_g,
+    )
+
+
+def etag_for(key: Hashable) -> str:
+    """캐시 키 → 강한 ETag (따옴표 포함)"""
+    return '"' + sha256(repr(key).encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(쉼표 구분, W/ 약한 비교, *)가 ETag와 일치하는지"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class AlternativeRecipeCache:
+    """크기 제한 LRU 캐시 (스레드 안전, 적중/미스 통계)"""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Args:
+            max_entries: 최대 항목 수 (None이면 settings.ALTERNATIVE_CACHE_MAX_ENTRIES, 0이면 비활성화)
+        """
+        self.max_entries = settings.ALTERNATIVE_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self._entries: "OrderedDict[Hashable, List[Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[List[Dict]]:
+        """캐시 조회 (적중 시 가장 최근 사용으로 이동)"""
+        with self._lock:
+            alternatives = self._entries.get(key)
+            if alternatives is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return alternatives
+
+    def put(self, key: Hashable, alternatives: List[Dict]):
+        """결과 저장 (가득 차면 가장 오래 사용하지 않은 항목 제거)"""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = alternatives
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """적중/미스/항목 수"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+# 싱글톤 인스턴스
+_alternative_cache: Optional[AlternativeRecipeCache] = None
+
+
+def get_alternative_cache() -> AlternativeRecipeCache:
+    """AlternativeRecipeCache 싱글톤 인스턴스 반환"""
+    global _alternative_cache
+
+    if _alternative_cache is None:
+        _alternative_cache = AlternativeRecipeCache()
+
+    return _alternative_cache
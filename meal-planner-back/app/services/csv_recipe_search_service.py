@@ -4,242 +4,207 @@ CSV 기반 레시피 검색 서비스
 로컬 레시피 CSV 파일에서 유사한 레시피 검색
 """
 
-import json
+import numpy as np
 import pandas as pd
-from pathlib import Path
 from typing import List, Dict, Optional
+from app.services.recipe_scoring import similarity_scores, top_k
+from app.services.recipe_store import RecipeStore, get_recipe_store
+from app.services.search_executor import get_search_executor
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-# CSV 파일 경로
-CSV_PATH = Path(__file__).parent.parent.parent / "data" / "recipes_with_nutrition.csv"
+# 대체 레시피 dict로 옮기는 df 컬럼
+ALTERNATIVE_COLUMNS = ["name", "category", "main_ingredient", "calories", "cooking_time", "difficulty"]
+
+# 칼로리 범위 후보가 이보다 많으면 KD-tree k-NN 사용
+NEIGHBOR_SEARCH_MIN_CANDIDATES = 2000
+
+# KD-tree 탐색에서 확인할 최대 레시피 수 (제한 재료 등으로 후보가 드물면 전체 계산이 더 빠름)
+NEIGHBOR_SEARCH_MAX_VISITS = 20000
 
 
 class CSVRecipeSearchService:
     """CSV 기반 레시피 검색 서비스"""
 
-    def __init__(self):
-        """서비스 초기화 및 CSV 로드"""
-        self.recipes_df = None
-        self._load_csv()
-
-    def _load_csv(self):
-        """CSV 파일 로드"""
-        try:
-            if not CSV_PATH.exists():
-                logger.error(
-                    "csv_file_not_found",
-                    path=str(CSV_PATH)
-                )
-                raise FileNotFoundError(f"Recipe CSV not found: {CSV_PATH}")
+    def __init__(self, store: Optional[RecipeStore] = None):
+        """
+        서비스 초기화 및 레시피 데이터 로드
 
-            # CSV 로드 (encoding 자동 감지)
-            self.recipes_df = pd.read_csv(CSV_PATH, encoding='utf-8-sig')
+        Args:
+            store: 사용할 RecipeStore (None이면 프로세스 공유 인스턴스, 리로드 시 새 버전 사용)
+        """
+        self._store = store
+        self._load_csv()
 
-            # 필수 컬럼 확인
-            required_cols = ['name', 'calories', 'difficulty', 'cooking_time', 'ingredients_parsed']
-            missing_cols = [col for col in required_cols if col not in self.recipes_df.columns]
+    @property
+    def store(self) -> RecipeStore:
+        """현재 RecipeStore (공유 인스턴스면 리로드 후 새 버전)"""
+        return self._store if self._store is not None else get_recipe_store()
 
-            if missing_cols:
-                raise ValueError(f"Missing required columns: {missing_cols}")
+    @property
+    def recipes_df(self) -> pd.DataFrame:
+        """현재 레시피 DataFrame"""
+        return self.store.df
 
-            # 결측값 처리
-            self.recipes_df['calories'] = pd.to_numeric(self.recipes_df['calories'], errors='coerce').fillna(0)
-            self.recipes_df['cooking_time'] = pd.to_numeric(self.recipes_df['cooking_time'], errors='coerce').fillna(30)
-            self.recipes_df['difficulty'] = self.recipes_df['difficulty'].fillna('중급')
+    def _load_csv(self):
+        """공유 RecipeStore에서 레시피 데이터 가져오기 (스냅샷 우선, 없으면 CSV 폴백)"""
+        try:
+            store = self.store
 
             logger.info(
                 "csv_loaded_successfully",
-                total_recipes=len(self.recipes_df),
-                path=str(CSV_PATH)
+                total_recipes=len(store),
+                source=store.source,
+                path=store.path,
+                version=store.version
             )
 
         except Exception as e:
             logger.error("csv_load_failed", error=str(e))
             raise
 
-    def _parse_ingredients(self, ingredients_str: str) -> List[str]:
-        """
-        재료 문자열을 파싱하여 재료명 리스트 반환
-
-        Args:
-            ingredients_str: JSON 형식의 재료 문자열
-
-        Returns:
-            재료명 리스트
-        """
-        try:
-            if pd.isna(ingredients_str) or not ingredients_str:
-                return []
-
-            ingredients_data = json.loads(ingredients_str)
-            return [ing.get('name', '') for ing in ingredients_data if ing.get('name')]
-        except (json.JSONDecodeError, TypeError) as e:
-            logger.warning("ingredient_parse_failed", error=str(e))
-            return []
-
-    def _has_restricted_ingredients(
+    def _candidates(
         self,
-        recipe_ingredients: List[str],
-        restrictions: List[str]
-    ) -> bool:
+        store: RecipeStore,
+        min_cal: float,
+        max_cal: float,
+        exclude_names: set,
+        restricted: Optional[np.ndarray],
+        max_cooking_time: Optional[int]
+    ) -> np.ndarray:
         """
-        레시피에 제한 재료가 포함되어 있는지 확인
+        칼로리 범위 + 조리 시간 + 제외 레시피 + 제한 재료 필터링 (레시피 위치 배열, 데이터 순서)
 
         Args:
-            recipe_ingredients: 레시피 재료 리스트
-            restrictions: 제외 재료 리스트
+            store: 조회 1건 동안 사용하는 RecipeStore 버전
 
         Returns:
-            제한 재료 포함 여부
+            후보 레시피 위치 배열
         """
-        if not restrictions:
-            return False
+        df = store.df
+        logger.info("csv_initial_count", count=len(df))
 
-        # 재료명 정규화 (소문자, 공백 제거)
-        normalized_ingredients = [ing.lower().replace(' ', '') for ing in recipe_ingredients]
-        normalized_restrictions = [r.lower().replace(' ', '') for r in restrictions]
+        # 1. 칼로리 범위 + 조리 시간 필터링 (후보 파티션 또는 정렬 색인 중 좁은 쪽)
+        candidates = store.candidate_positions(calorie_range=(min_cal, max_cal), max_cooking_time=max_cooking_time)
+        logger.info(
+            "csv_after_range_filter",
+            count=len(candidates),
+            min_cal=min_cal,
+            max_cal=max_cal,
+            max_time=max_cooking_time
+        )
+
+        # 2. 현재 레시피 + 제외 레시피 필터링 (후보 위치의 이름만 확인)
+        if exclude_names:
+            names = pd.Series(df['name'].to_numpy()[candidates])
+            candidates = candidates[~names.isin(exclude_names).to_numpy()]
+            logger.info("csv_after_exclude_recipes", count=len(candidates), excluded_count=len(exclude_names))
 
-        # 부분 매칭 (예: "계란" in "계란말이")
-        for restriction in normalized_restrictions:
-            for ingredient in normalized_ingredients:
-                if restriction in ingredient or ingredient in restriction:
-                    return True
+        # 3. 재료 제한 필터링
+        if restricted is not None:
+            candidates = candidates[~restricted[candidates]]
+            logger.info("csv_after_restrictions_filter", count=len(candidates))
 
-        return False
+        logger.info(
+            "csv_search_after_filtering",
+            total_candidates=len(candidates)
+        )
+        return candidates
 
-    def _calculate_macro_ratio_score(
+    def _score_candidates(
         self,
-        recipe_carb_g: float,
-        recipe_protein_g: float,
-        recipe_fat_g: float,
-        target_carb_g: float,
-        target_protein_g: float,
-        target_fat_g: float
-    ) -> float:
+        store: RecipeStore,
+        candidates: np.ndarray,
+        target_calories: int,
+        difficulty: Optional[str],
+        max_cooking_time: Optional[int],
+        target_carb_g: Optional[float],
+        target_protein_g: Optional[float],
+        target_fat_g: Optional[float]
+    ) -> np.ndarray:
         """
-        탄단지 비율 유사도 점수 계산 (0-100, 낮을수록 유사)
-
-        Args:
-            recipe_carb_g: 레시피 탄수화물(g)
-            recipe_protein_g: 레시피 단백질(g)
-            recipe_fat_g: 레시피 지방(g)
-            target_carb_g: 목표 탄수화물(g)
-            target_protein_g: 목표 단백질(g)
-            target_fat_g: 목표 지방(g)
+        후보 유사도 점수 (후보 배열 전체를 벡터 연산으로, 낮을수록 유사)
 
         Returns:
-            탄단지 비율 차이 점수 (낮을수록 유사, 0-100 범위)
+            candidates와 같은 길이의 점수 배열
         """
-        # 레시피 비율 계산 (%)
-        recipe_total = recipe_carb_g + recipe_protein_g + recipe_fat_g
-        if recipe_total == 0:
-            return 100.0  # 영양정보 없음 = 최악의 점수
-
-        recipe_ratios = {
-            'carb': (recipe_carb_g / recipe_total) * 100,
-            'protein': (recipe_protein_g / recipe_total) * 100,
-            'fat': (recipe_fat_g / recipe_total) * 100,
-        }
+        df = store.df
+        macro_columns = all(col in df.columns for col in ('carb_g', 'protein_g', 'fat_g'))
 
-        # 목표 비율 계산 (%)
-        target_total = target_carb_g + target_protein_g + target_fat_g
-        if target_total == 0:
-            return 0.0  # 목표가 없으면 비율 고려 안함
-
-        target_ratios = {
-            'carb': (target_carb_g / target_total) * 100,
-            'protein': (target_protein_g / target_total) * 100,
-            'fat': (target_fat_g / target_total) * 100,
-        }
+        def column(name: str) -> Optional[np.ndarray]:
+            return df[name].to_numpy()[candidates] if macro_columns else None
 
-        # 각 영양소 비율 차이의 합 (퍼센트 포인트)
-        total_diff = sum(
-            abs(recipe_ratios[k] - target_ratios[k])
-            for k in ['carb', 'protein', 'fat']
+        return similarity_scores(
+            calories=df['calories'].to_numpy()[candidates],
+            cooking_time=df['cooking_time'].to_numpy()[candidates],
+            difficulty_level=store.difficulty_levels[candidates],
+            target_calories=target_calories,
+            target_time=max_cooking_time or 30,
+            target_difficulty=difficulty,
+            carb_g=column('carb_g'),
+            protein_g=column('protein_g'),
+            fat_g=column('fat_g'),
+            target_carb_g=target_carb_g,
+            target_protein_g=target_protein_g,
+            target_fat_g=target_fat_g
         )
 
-        # 0-100 범위로 제한 (최대 차이 = 각 영양소 100%씩 차이 = 300%, 하지만 실제로는 100 이하)
-        return min(total_diff, 100.0)
-
-    def _calculate_similarity_score(
+    def _filter_and_rank(
         self,
-        recipe_calories: float,
+        store: RecipeStore,
         target_calories: int,
-        recipe_difficulty: str,
-        target_difficulty: str,
-        recipe_time: int,
-        target_time: int,
-        recipe_carb_g: Optional[float] = None,
-        recipe_protein_g: Optional[float] = None,
-        recipe_fat_g: Optional[float] = None,
-        target_carb_g: Optional[float] = None,
-        target_protein_g: Optional[float] = None,
-        target_fat_g: Optional[float] = None
-    ) -> float:
+        min_cal: float,
+        max_cal: float,
+        exclude_names: set,
+        restricted: Optional[np.ndarray],
+        difficulty: Optional[str],
+        max_cooking_time: Optional[int],
+        target_carb_g: Optional[float],
+        target_protein_g: Optional[float],
+        target_fat_g: Optional[float]
+    ) -> np.ndarray:
         """
-        유사도 점수 계산 (낮을수록 유사)
+        필터링 후 전체 후보 점수 계산 (후보가 적거나 필터가 좁을 때)
+
+        후보는 레시피 위치 배열로만 다룸 (전체 DataFrame 복사/마스크 없음)
 
         Args:
-            recipe_calories: 레시피 칼로리
-            target_calories: 목표 칼로리
-            recipe_difficulty: 레시피 난이도
-            target_difficulty: 목표 난이도 (선택사항)
-            recipe_time: 조리 시간
-            target_time: 목표 조리 시간 (선택사항)
-            recipe_carb_g: 레시피 탄수화물(g) - 선택사항
-            recipe_protein_g: 레시피 단백질(g) - 선택사항
-            recipe_fat_g: 레시피 지방(g) - 선택사항
-            target_carb_g: 목표 탄수화물(g) - 선택사항
-            target_protein_g: 목표 단백질(g) - 선택사항
-            target_fat_g: 목표 지방(g) - 선택사항
+            store: 조회 1건 동안 사용하는 RecipeStore 버전
 
         Returns:
-            유사도 점수 (낮을수록 좋음)
+            상위 3개 레시피 위치 배열
         """
-        # 칼로리 차이 점수 (정규화: 0-100 스케일)
-        calorie_diff = abs(recipe_calories - target_calories)
-        calorie_score = min(calorie_diff / 10, 100)  # 1000kcal 차이 = 100점
-
-        # 조리 시간 차이 점수 (정규화: 0-100 스케일)
-        time_score = 0
-        if target_time:
-            time_diff = abs(recipe_time - target_time)
-            time_score = min(time_diff / 2, 100)  # 200분 차이 = 100점
-
-        # 난이도 페널티 (0-50 스케일)
-        difficulty_penalty = 0
-        difficulty_map = {'초급': 0, '중급': 10, '고급': 20}
-        if target_difficulty:
-            target_level = difficulty_map.get(target_difficulty, 10)
-            recipe_level = difficulty_map.get(recipe_difficulty, 10)
-            if recipe_level > target_level:
-                difficulty_penalty = 50  # 더 어려운 난이도에 페널티
-
-        # 탄단지 비율 점수 (0-100 스케일)
-        macro_score = 0
-        use_macro_scoring = all([
-            recipe_carb_g is not None,
-            recipe_protein_g is not None,
-            recipe_fat_g is not None,
-            target_carb_g is not None,
-            target_protein_g is not None,
-            target_fat_g is not None
-        ])
-
-        if use_macro_scoring:
-            macro_score = self._calculate_macro_ratio_score(
-                recipe_carb_g, recipe_protein_g, recipe_fat_g,
-                target_carb_g, target_protein_g, target_fat_g
-            )
-            # 가중치 적용: 칼로리 40%, 탄단지 50%, 시간 10%
-            score = (calorie_score * 0.4) + (macro_score * 0.5) + (time_score * 0.1) + difficulty_penalty
-        else:
-            # 탄단지 정보 없을 때: 기존 로직 (칼로리 위주)
-            score = calorie_score + (time_score * 0.5) + difficulty_penalty
+        candidates = self._candidates(store, min_cal, max_cal, exclude_names, restricted, max_cooking_time)
+        if len(candidates) == 0:
+            logger.warning("no_recipes_found_after_filtering")
+            return candidates
 
-        return score
+        # 4. 유사도 점수 계산
+        scores = self._score_candidates(
+            store, candidates, target_calories, difficulty, max_cooking_time,
+            target_carb_g, target_protein_g, target_fat_g
+        )
+
+        # 5. 상위 3개 선택 (낮은 점수 = 더 유사, 전체 정렬 없음)
+        return candidates[top_k(scores, 3)]
+
+    def _format_alternatives(self, store: RecipeStore, positions: np.ndarray) -> List[Dict]:
+        """레시피 위치 배열 → 대체 레시피 dict 리스트 (컬럼 단위 조회, 행마다 iloc 없음)"""
+        rows = store.records(positions, ALTERNATIVE_COLUMNS)
+        return [
+            {
+                "name": row['name'],
+                "url": "",  # CSV에는 URL 정보 없음
+                "content_preview": f"{row.get('category') or ''} - {row.get('main_ingredient') or ''}",
+                "calories": int(row['calories']) if row['calories'] is not None else None,
+                "cost": None,  # CSV에 비용 정보 없음
+                "cooking_time": int(row['cooking_time']) if row['cooking_time'] is not None else None,
+                "difficulty": row['difficulty'],
+                "ingredients": store.ingredient_names(position)[:5]  # 처음 5개 재료만
+            }
+            for position, row in zip(np.asarray(positions).tolist(), rows)
+        ]
 
     async def search_alternative_recipes(
         self,
@@ -254,7 +219,8 @@ class CSVRecipeSearchService:
         max_cooking_time: Optional[int] = None,
         target_carb_g: Optional[float] = None,
         target_protein_g: Optional[float] = None,
-        target_fat_g: Optional[float] = None
+        target_fat_g: Optional[float] = None,
+        store: Optional[RecipeStore] = None
     ) -> List[Dict]:
         """
         CSV에서 대체 레시피 검색
@@ -272,10 +238,45 @@ class CSVRecipeSearchService:
             target_carb_g: 목표 탄수화물(g) - 선택사항
             target_protein_g: 목표 단백질(g) - 선택사항
             target_fat_g: 목표 지방(g) - 선택사항
+            store: 검색할 RecipeStore (None이면 현재 버전, 캐시 키/ETag를 만든 버전과 맞출 때 전달)
 
         Returns:
             상위 3개 대체 레시피 리스트
         """
+        return await get_search_executor().run(
+            self._search_alternatives,
+            current_menu_name=current_menu_name,
+            target_calories=target_calories,
+            target_cost=target_cost,
+            calorie_tolerance=calorie_tolerance,
+            cost_tolerance=cost_tolerance,
+            restrictions=restrictions,
+            exclude_recipes=exclude_recipes,
+            difficulty=difficulty,
+            max_cooking_time=max_cooking_time,
+            target_carb_g=target_carb_g,
+            target_protein_g=target_protein_g,
+            target_fat_g=target_fat_g,
+            store=store
+        )
+
+    def _search_alternatives(
+        self,
+        current_menu_name: str,
+        target_calories: int,
+        target_cost: int = 0,  # CSV에 비용 정보 없으므로 사용 안함
+        calorie_tolerance: int = 100,
+        cost_tolerance: int = 2000,  # 사용 안함
+        restrictions: Optional[List[str]] = None,
+        exclude_recipes: Optional[List[str]] = None,
+        difficulty: Optional[str] = None,
+        max_cooking_time: Optional[int] = None,
+        target_carb_g: Optional[float] = None,
+        target_protein_g: Optional[float] = None,
+        target_fat_g: Optional[float] = None,
+        store: Optional[RecipeStore] = None
+    ) -> List[Dict]:
+        """search_alternative_recipes 본체 (검색 실행기 스레드에서 실행)"""
         restrictions = restrictions or []
         exclude_recipes = exclude_recipes or []
 
@@ -287,105 +288,183 @@ class CSVRecipeSearchService:
             calorie_tolerance=calorie_tolerance
         )
 
-        # 데이터프레임 복사
-        df = self.recipes_df.copy()
-        logger.info("csv_initial_count", count=len(df))
+        min_cal = target_calories - calorie_tolerance
+        max_cal = target_calories + calorie_tolerance
+        exclude_names = set(exclude_recipes) | ({current_menu_name} if current_menu_name else set())
+
+        # 조회 1건 동안 같은 버전 사용 (도중에 리로드되어도 이 요청은 이전 버전으로 끝까지 처리)
+        store = store or self.store
+        with store.lease():
+            # 알레르기/식이 선호 항목은 사전 계산 비트셋 OR (예: "계란" → 달걀, 마요네즈 포함)
+            # 그 외 재료는 n-gram 역색인 부분 매칭 (예: "파" in "대파")
+            restricted = store.restriction_bitmaps.excluded_rows(restrictions) if restrictions else None
+
+            # 칼로리 범위 후보가 많으면 영양 공간 k-NN (KD-tree), 적거나 필터가 너무 좁으면 전체 계산
+            top_positions = None
+            start, end = store.range_index.columns['calories'].bounds(min_cal, max_cal)
+            if end - start > NEIGHBOR_SEARCH_MIN_CANDIDATES:
+                top_positions = store.neighbor_index.nearest(
+                    k=3,
+                    target_calories=target_calories,
+                    target_time=max_cooking_time or 30,
+                    target_difficulty=difficulty,
+                    target_carb_g=target_carb_g,
+                    target_protein_g=target_protein_g,
+                    target_fat_g=target_fat_g,
+                    calorie_range=(min_cal, max_cal),
+                    max_cooking_time=max_cooking_time,
+                    excluded=restricted,
+                    exclude_names=exclude_names,
+                    max_visits=NEIGHBOR_SEARCH_MAX_VISITS
+                )
+                logger.info(
+                    "csv_neighbor_search",
+                    calorie_candidates=end - start,
+                    found=len(top_positions) if top_positions is not None else None
+                )
 
-        # 1. 현재 레시피 제외
-        if current_menu_name:
-            df = df[df['name'] != current_menu_name]
-            logger.info("csv_after_exclude_current", count=len(df), excluded=current_menu_name)
+            if top_positions is None:
+                top_positions = self._filter_and_rank(
+                    store,
+                    target_calories=target_calories,
+                    min_cal=min_cal,
+                    max_cal=max_cal,
+                    exclude_names=exclude_names,
+                    restricted=restricted,
+                    difficulty=difficulty,
+                    max_cooking_time=max_cooking_time,
+                    target_carb_g=target_carb_g,
+                    target_protein_g=target_protein_g,
+                    target_fat_g=target_fat_g
+                )
 
-        # 2. 제외 레시피 필터링
-        if exclude_recipes:
-            df = df[~df['name'].isin(exclude_recipes)]
-            logger.info("csv_after_exclude_list", count=len(df), excluded_count=len(exclude_recipes))
+            # 결과 포맷팅
+            results = self._format_alternatives(store, top_positions)
 
-        # 3. 칼로리 범위 필터링
-        min_cal = target_calories - calorie_tolerance
-        max_cal = target_calories + calorie_tolerance
-        df = df[(df['calories'] >= min_cal) & (df['calories'] <= max_cal)]
         logger.info(
-            "csv_after_calorie_filter",
-            count=len(df),
-            min_cal=min_cal,
-            max_cal=max_cal
+            "csv_search_completed",
+            current_menu=current_menu_name,
+            alternatives_count=len(results)
         )
 
-        # 4. 조리 시간 필터링
-        if max_cooking_time:
-            df = df[df['cooking_time'] <= max_cooking_time]
-            logger.info("csv_after_time_filter", count=len(df), max_time=max_cooking_time)
+        return results
 
-        # 5. 재료 제한 필터링
-        if restrictions:
-            def filter_by_restrictions(row):
-                ingredients = self._parse_ingredients(row['ingredients_parsed'])
-                return not self._has_restricted_ingredients(ingredients, restrictions)
 
-            df = df[df.apply(filter_by_restrictions, axis=1)]
-            logger.info("csv_after_restrictions_filter", count=len(df))
+    async def search_alternative_recipes_batch(
+        self,
+        meals: List[Dict],
+        calorie_tolerance: int = 100,
+        restrictions: Optional[List[str]] = None,
+        exclude_recipes: Optional[List[str]] = None,
+        difficulty: Optional[str] = None,
+        max_cooking_time: Optional[int] = None,
+        limit: int = 3
+    ) -> List[List[Dict]]:
+        """
+        식단 전체 끼니의 대체 레시피 일괄 검색
 
-        logger.info(
-            "csv_search_after_filtering",
-            total_candidates=len(df)
-        )
+        제한 재료 마스크와 후보 스캔은 모든 끼니가 공유하고 (칼로리 범위 합집합 1회 조회),
+        끼니별로는 후보 배열에 칼로리 창만 다시 적용해 점수를 계산함.
+        앞 끼니에서 추천한 레시피는 뒤 끼니에서 다시 추천하지 않음.
 
-        if len(df) == 0:
-            logger.warning("no_recipes_found_after_filtering")
-            return []
+        Args:
+            meals: 끼니 목록 (current_menu, target_calories, target_carb_g/protein_g/fat_g 선택)
+            calorie_tolerance: 칼로리 허용 범위
+            restrictions: 제외 재료 리스트
+            exclude_recipes: 제외 레시피 이름 리스트
+            difficulty: 난이도 제한 (초급/중급/고급)
+            max_cooking_time: 최대 조리 시간
+            limit: 끼니별 대체 레시피 수
 
-        # 6. 유사도 점수 계산
-        df['similarity_score'] = df.apply(
-            lambda row: self._calculate_similarity_score(
-                recipe_calories=row['calories'],
-                target_calories=target_calories,
-                recipe_difficulty=row['difficulty'],
-                target_difficulty=difficulty,
-                recipe_time=row['cooking_time'],
-                target_time=max_cooking_time or 30,
-                recipe_carb_g=row.get('carb_g'),
-                recipe_protein_g=row.get('protein_g'),
-                recipe_fat_g=row.get('fat_g'),
-                target_carb_g=target_carb_g,
-                target_protein_g=target_protein_g,
-                target_fat_g=target_fat_g
-            ),
-            axis=1
+        Returns:
+            meals 순서대로 끼니별 대체 레시피 리스트
+        """
+        return await get_search_executor().run(
+            self._search_alternatives_batch,
+            meals,
+            calorie_tolerance=calorie_tolerance,
+            restrictions=restrictions,
+            exclude_recipes=exclude_recipes,
+            difficulty=difficulty,
+            max_cooking_time=max_cooking_time,
+            limit=limit
         )
 
-        # 7. 점수로 정렬 (낮은 점수 = 더 유사)
-        df = df.sort_values('similarity_score')
+    def _search_alternatives_batch(
+        self,
+        meals: List[Dict],
+        calorie_tolerance: int = 100,
+        restrictions: Optional[List[str]] = None,
+        exclude_recipes: Optional[List[str]] = None,
+        difficulty: Optional[str] = None,
+        max_cooking_time: Optional[int] = None,
+        limit: int = 3
+    ) -> List[List[Dict]]:
+        """search_alternative_recipes_batch 본체 (검색 실행기 스레드에서 실행)"""
+        restrictions = restrictions or []
+        if not meals:
+            return []
 
-        # 8. 상위 3개 선택
-        top_recipes = df.head(3)
+        # 식단에 이미 있는 메뉴는 어느 끼니의 대체로도 추천하지 않음
+        exclude_names = set(exclude_recipes or []) | {
+            meal["current_menu"] for meal in meals if meal.get("current_menu")
+        }
+        windows = [
+            (meal["target_calories"] - calorie_tolerance, meal["target_calories"] + calorie_tolerance)
+            for meal in meals
+        ]
 
-        # 9. 결과 포맷팅
-        results = []
-        for _, row in top_recipes.iterrows():
-            ingredients = self._parse_ingredients(row['ingredients_parsed'])
+        logger.info(
+            "csv_batch_search_started",
+            meals=len(meals),
+            restrictions=restrictions,
+            calorie_tolerance=calorie_tolerance
+        )
 
-            recipe = {
-                "name": row['name'],
-                "url": "",  # CSV에는 URL 정보 없음
-                "content_preview": f"{row.get('category', '')} - {row.get('main_ingredient', '')}",
-                "calories": int(row['calories']) if pd.notna(row['calories']) else None,
-                "cost": None,  # CSV에 비용 정보 없음
-                "cooking_time": int(row['cooking_time']) if pd.notna(row['cooking_time']) else None,
-                "difficulty": row['difficulty'],
-                "ingredients": ingredients[:5]  # 처음 5개 재료만
-            }
-            results.append(recipe)
+        results: List[List[Dict]] = []
+        store = self.store
+        with store.lease():
+            restricted = store.restriction_bitmaps.excluded_rows(restrictions) if restrictions else None
+            candidates = self._candidates(
+                store,
+                min_cal=min(low for low, _ in windows),
+                max_cal=max(high for _, high in windows),
+                exclude_names=exclude_names,
+                restricted=restricted,
+                max_cooking_time=max_cooking_time
+            )
+            calories = store.df['calories'].to_numpy()[candidates]
+            names = store.df['name'].to_numpy()
+            used: set = set()
+
+            for meal, (min_cal, max_cal) in zip(meals, windows):
+                # 칼로리 창 마스크는 데이터 순서를 유지하므로 동점 처리가 단건 검색과 같음
+                window = candidates[(calories >= min_cal) & (calories <= max_cal)]
+                picked: List[int] = []
+                if len(window) > 0:
+                    scores = self._score_candidates(
+                        store, window, meal["target_calories"], difficulty, max_cooking_time,
+                        meal.get("target_carb_g"), meal.get("target_protein_g"), meal.get("target_fat_g")
+                    )
+                    # 이미 추천한 레시피 수만큼 여유 있게 뽑은 뒤 중복 제외
+                    for position in window[top_k(scores, limit + len(used))]:
+                        if names[position] in used:
+                            continue
+                        picked.append(position)
+                        if len(picked) == limit:
+                            break
+                used.update(names[position] for position in picked)
+                results.append(self._format_alternatives(store, np.asarray(picked, dtype=np.int64)))
 
         logger.info(
-            "csv_search_completed",
-            current_menu=current_menu_name,
-            alternatives_count=len(results)
+            "csv_batch_search_completed",
+            meals=len(meals),
+            shared_candidates=len(candidates),
+            alternatives_count=sum(len(r) for r in results)
         )
 
         return results
 
-
 # 싱글톤 인스턴스
 _csv_search_service: Optional[CSVRecipeSearchService] = None
 
@@ -0,0 +1,234 @@
+"""
+LLM 응답 캐시 (내용 주소 기반)
+
+같은 프로필 재생성, 테스트 재실행, 비슷한 프로필의 사용자 등으로 바이트 단위까지 같은 프롬프트가 자주 반복됨
+→ (모델, temperature, max_tokens, 프롬프트 해시) 키로 응답을 저장해 LLM 왕복(2-10초)을 생략
+- 메모리 LRU 계층 (프로세스 내, 항목 수 제한)
+- 선택적 디스크 계층 (SQLite, 워커/재시작 간 공유) - TTL + 전체 크기 제한 (오래 사용하지 않은 항목부터 제거)
+- 계층별 적중/미스 통계
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from app.config import settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def llm_cache_key(model: str, temperature: float, max_tokens: int, prompt: str) -> str:
+    """
+    LLM 응답 캐시 키
+
+    Args:
+        model: 모델 이름
+        temperature: 샘플링 온도
+        max_tokens: 최대 출력 토큰 수
+        prompt: 프롬프트 문자열
+
+    Returns:
+        SHA-256 hex 문자열
+    """
+    digest = sha256()
+    digest.update(f"{model}\0{temperature!r}\0{max_tokens}\0".encode("utf-8"))
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SQLiteResponseStore:
+    """디스크 계층 (SQLite 한 파일, 스레드 안전)"""
+
+    def __init__(self, path: str, max_bytes: int):
+        """
+        Args:
+            path: SQLite 파일 경로 (상위 디렉토리는 자동 생성)
+            max_bytes: 저장할 응답 전체 크기 상한 (바이트)
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+
+    def get(self, key: str, ttl_seconds: float) -> Optional[str]:
+        """저장된 응답 (없거나 TTL이 지났으면 None, 지난 항목은 삭제)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if now - created_at > ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            return value
+
+    def put(self, key: str, value: str, ttl_seconds: float):
+        """응답 저장 후 TTL 지난 항목 + 크기 상한 초과분(오래 사용하지 않은 순) 제거"""
+        now = time.time()
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now, now),
+            )
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - ttl_seconds,))
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                evicted = 0
+                for old_key, old_size in self._conn.execute(
+                    "SELECT key, size FROM responses ORDER BY accessed_at"
+                ).fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (old_key,))
+                    total -= old_size
+                    evicted += 1
+                logger.info("llm_cache_disk_evicted", evicted=evicted, total_bytes=total)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"disk_entries": count, "disk_bytes": total}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class LLMResponseCache:
+    """LLM 응답 2계층 캐시 (메모리 LRU → SQLite)"""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        disk_path: Optional[str] = None,
+        max_disk_bytes: Optional[int] = None,
+    ):
+        """
+        Args:
+            max_entries: 메모리 계층 최대 항목 수 (None이면 settings.LLM_CACHE_MAX_ENTRIES, 0이면 메모리 계층 없음)
+            ttl_seconds: 응답 유효 시간 (None이면 settings.LLM_CACHE_TTL_SECONDS)
+            disk_path: SQLite 파일 경로 (None이면 settings.LLM_CACHE_PATH, 빈 값이면 디스크 계층 없음)
+            max_disk_bytes: 디스크 계층 전체 크기 상한 (None이면 settings.LLM_CACHE_MAX_DISK_MB)
+        """
+        self.max_entries = settings.LLM_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self.ttl_seconds = settings.LLM_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        disk_path = settings.LLM_CACHE_PATH if disk_path is None else disk_path
+        if max_disk_bytes is None:
+            max_disk_bytes = int(settings.LLM_CACHE_MAX_DISK_MB * 1024 * 1024)
+        self.disk = SQLiteResponseStore(disk_path, max_disk_bytes) if disk_path else None
+
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _get_memory(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            if time.time() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _put_memory(self, key: str, value: str, stored_at: float):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, stored_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        캐시 조회 (메모리 → 디스크, 디스크 적중은 메모리로 올림)
+
+        Returns:
+            저장된 응답 또는 None
+        """
+        value = self._get_memory(key)
+        if value is not None:
+            self.memory_hits += 1
+            return value
+
+        if self.disk is not None:
+            try:
+                value = await asyncio.to_thread(self.disk.get, key, self.ttl_seconds)
+            except sqlite3.Error as e:
+                logger.warning("llm_cache_disk_read_failed", error=str(e))
+                value = None
+            if value is not None:
+                self.disk_hits += 1
+                self._put_memory(key, value, time.time())
+                return value
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, value: str):
+        """응답 저장 (두 계층 모두, 디스크 오류는 경고만)"""
+        self._put_memory(key, value, time.time())
+        if self.disk is not None:
+            try:
+                await asyncio.to_thread(self.disk.put, key, value, self.ttl_seconds)
+            except sqlite3.Error as e:
+                logger.warning("llm_cache_disk_write_failed", error=str(e))
+
+    def clear_memory(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """계층별 적중/미스, 적중률, 항목 수"""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        stats = {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._entries),
+        }
+        if self.disk is not None:
+            stats.update(self.disk.stats())
+        return stats
+
+
+# 싱글톤 인스턴스
+_llm_cache: Optional[LLMResponseCache] = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """LLMResponseCache 싱글톤 인스턴스 반환"""
+    global _llm_cache
+
+    if _llm_cache is None:
+        _llm_cache = LLMResponseCache()
+
+    return _llm_cache
@@ -0,0 +1,280 @@
+"""
+LLM 동시 호출 조절기 (프로세스 전역, AIMD + 토큰 버킷)
+
+식단 1끼니마다 전문가 3명 + 충돌 해결 호출이 나가고, /api/generate 스트림이 여러 개 동시에 돌면
+Anthropic rate limit을 순간적으로 넘음 → 고정 재시도 간격(1, 2, 4초)이라 재시도도 한꺼번에 몰림
+- 동시 호출 수 상한(슬롯)을 AIMD로 조절: 정상 응답마다 조금씩 증가, 429는 절반, 느린 응답은 10% 감소
+  (감소 이전에 시작된 호출의 신호는 무시 → 한꺼번에 실패한 호출들이 상한을 바닥까지 떨어뜨리지 않음)
+- 분당 요청 수 / 분당 토큰 수 토큰 버킷 (토큰은 추정치로 예약 후 실제 사용량으로 정산)
+- 429 발생 시 재시도 대기 시간 동안 새 호출 전체를 멈춤 → 다른 요청이 곧바로 다시 몰리지 않음
+- 대기 순서는 선착순, 호출마다 대기 시간(queue wait)을 기록
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional
+
+from app.config import settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# AIMD 조절 계수
+ADDITIVE_INCREASE = 1.0  # 상한만큼 정상 응답이 오면 +1 슬롯
+RATE_LIMIT_DECREASE = 0.5  # 429
+LATENCY_DECREASE = 0.9  # 목표 지연 초과
+
+# 토큰 추정 (한국어 프롬프트 기준 대략 2자당 1토큰)
+CHARS_PER_TOKEN = 2
+
+
+def estimate_tokens(prompt: str, max_output_tokens: int) -> int:
+    """호출 1회 토큰 예약량 (입력 추정 + 최대 출력)"""
+    return math.ceil(len(prompt) / CHARS_PER_TOKEN) + max_output_tokens
+
+
+class TokenBucket:
+    """분당 한도 토큰 버킷 (용량 = 분당 한도, 연속 충전)"""
+
+    def __init__(self, per_minute: float):
+        """
+        Args:
+            per_minute: 분당 한도 (0 이하면 제한 없음)
+        """
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.tokens = per_minute
+        self.updated_at = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def delay_for(self, amount: float, now: float) -> float:
+        """amount만큼 꺼낼 수 있을 때까지 남은 시간 (초, 용량보다 큰 요청은 가득 찰 때까지)"""
+        if self.unlimited:
+            return 0.0
+        self._refill(now)
+        needed = min(amount, self.capacity) - self.tokens
+        return max(needed / self.rate, 0.0)
+
+    def consume(self, amount: float, now: float):
+        if self.unlimited:
+            return
+        self._refill(now)
+        self.tokens -= min(amount, self.capacity)
+
+    def refund(self, amount: float):
+        """예약량 정산 (음수면 추가 차감)"""
+        if self.unlimited:
+            return
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class _Waiter:
+    """대기 중인 호출 (깨우기용 Future는 대기할 때마다 새로 만듦)"""
+
+    __slots__ = ("wakeup",)
+
+    def __init__(self):
+        self.wakeup: Optional[asyncio.Future] = None
+
+
+@dataclass
+class GovernorPermit:
+    """호출 1회의 슬롯 점유 정보"""
+
+    admitted_at: float
+    reserved_tokens: int
+    queue_wait_seconds: float
+
+
+class LLMConcurrencyGovernor:
+    """LLM 호출 슬롯/속도 조절기 (단일 이벤트 루프에서 사용)"""
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        min_concurrency: Optional[int] = None,
+        initial_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        latency_target_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            max_concurrency: 동시 호출 상한의 최댓값 (None이면 settings.LLM_MAX_CONCURRENCY)
+            min_concurrency: 동시 호출 상한의 최솟값 (None이면 settings.LLM_MIN_CONCURRENCY)
+            initial_concurrency: 시작 상한 (None이면 settings.LLM_INITIAL_CONCURRENCY)
+            requests_per_minute: 분당 요청 수 한도 (None이면 settings.LLM_REQUESTS_PER_MINUTE, 0이면 제한 없음)
+            tokens_per_minute: 분당 토큰 한도 (None이면 settings.LLM_TOKENS_PER_MINUTE, 0이면 제한 없음)
+            latency_target_seconds: 이보다 느린 응답은 혼잡 신호 (None이면 settings.LLM_LATENCY_TARGET_SECONDS)
+        """
+        self.max_concurrency = settings.LLM_MAX_CONCURRENCY if max_concurrency is None else max_concurrency
+        self.min_concurrency = settings.LLM_MIN_CONCURRENCY if min_concurrency is None else min_concurrency
+        self.min_concurrency = max(1, min(self.min_concurrency, self.max_concurrency))
+        initial = settings.LLM_INITIAL_CONCURRENCY if initial_concurrency is None else initial_concurrency
+        self.limit = float(min(max(initial, self.min_concurrency), self.max_concurrency))
+        self.latency_target_seconds = (
+            settings.LLM_LATENCY_TARGET_SECONDS if latency_target_seconds is None else latency_target_seconds
+        )
+        self.requests = TokenBucket(
+            settings.LLM_REQUESTS_PER_MINUTE if requests_per_minute is None else requests_per_minute
+        )
+        self.tokens = TokenBucket(
+            settings.LLM_TOKENS_PER_MINUTE if tokens_per_minute is None else tokens_per_minute
+        )
+
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._last_decrease_at = 0.0
+        self._queue: Deque[_Waiter] = deque()
+        self.admitted = 0
+        self.rate_limited = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """슬롯을 기다리는 호출 수"""
+        return len(self._queue)
+
+    def _admission_delay(self, reserved_tokens: int, now: float) -> Optional[float]:
+        """지금 시작할 수 있으면 0, 시간이 지나면 가능하면 남은 초, 슬롯이 비어야 하면 None"""
+        if self.in_flight >= int(self.limit):
+            return None
+        return max(
+            self.paused_until - now,
+            self.requests.delay_for(1, now),
+            self.tokens.delay_for(reserved_tokens, now),
+            0.0,
+        )
+
+    def _wake_head(self):
+        """맨 앞 대기자에게 다시 확인하도록 알림"""
+        if self._queue:
+            wakeup = self._queue[0].wakeup
+            if wakeup is not None and not wakeup.done():
+                wakeup.set_result(None)
+
+    async def acquire(self, reserved_tokens: int = 0) -> GovernorPermit:
+        """
+        슬롯 획득 (선착순, 동시 호출 상한 + 토큰 버킷 + 429 일시 정지 모두 통과할 때까지 대기)
+
+        Args:
+            reserved_tokens: 분당 토큰 버킷에서 예약할 토큰 수 (estimate_tokens)
+
+        Returns:
+            GovernorPermit (release에 그대로 전달)
+        """
+        loop = asyncio.get_running_loop()
+        started_at = time.monotonic()
+        waiter = _Waiter()
+        self._queue.append(waiter)
+        try:
+            while True:
+                delay = (
+                    self._admission_delay(reserved_tokens, time.monotonic())
+                    if self._queue[0] is waiter else None
+                )
+                if delay == 0.0:
+                    break
+                # 슬롯 반환/앞 대기자 시작 시 깨어나거나, 버킷 충전/일시 정지가 끝날 때까지 대기
+                waiter.wakeup = loop.create_future()
+                await asyncio.wait([waiter.wakeup], timeout=delay)
+        finally:
+            self._queue.remove(waiter)
+            self._wake_head()
+
+        now = time.monotonic()
+        self.in_flight += 1
+        self.requests.consume(1, now)
+        self.tokens.consume(reserved_tokens, now)
+        self.admitted += 1
+        wait = now - started_at
+        self.total_wait_seconds += wait
+        self.max_wait_seconds = max(self.max_wait_seconds, wait)
+        return GovernorPermit(admitted_at=now, reserved_tokens=reserved_tokens, queue_wait_seconds=wait)
+
+    def release(
+        self,
+        permit: GovernorPermit,
+        rate_limited: bool = False,
+        backoff_seconds: float = 0.0,
+        used_tokens: Optional[int] = None,
+    ):
+        """
+        슬롯 반환 + AIMD 상한 조절
+
+        Args:
+            permit: acquire 결과
+            rate_limited: 429/rate limit 오류로 끝났는지
+            backoff_seconds: 429일 때 새 호출 전체를 멈출 시간 (재시도 대기 시간)
+            used_tokens: 실제 사용 토큰 (알면 예약량과 차이를 정산)
+        """
+        now = time.monotonic()
+        self.in_flight -= 1
+        if used_tokens is not None:
+            self.tokens.refund(permit.reserved_tokens - used_tokens)
+
+        latency = now - permit.admitted_at
+        # 마지막 감소 이후 시작된 호출의 신호만 반영 (같은 혼잡으로 여러 번 줄이지 않음)
+        fresh_signal = permit.admitted_at >= self._last_decrease_at
+        if rate_limited:
+            self.rate_limited += 1
+            self.paused_until = max(self.paused_until, now + backoff_seconds)
+            if fresh_signal:
+                self._decrease(RATE_LIMIT_DECREASE, now, reason="rate_limited")
+        elif latency > self.latency_target_seconds:
+            if fresh_signal:
+                self._decrease(LATENCY_DECREASE, now, reason="slow_response")
+        else:
+            self.limit = min(self.max_concurrency, self.limit + ADDITIVE_INCREASE / self.limit)
+
+        self._wake_head()
+
+    def _decrease(self, factor: float, now: float, reason: str):
+        previous = self.limit
+        self.limit = max(self.min_concurrency, self.limit * factor)
+        self._last_decrease_at = now
+        logger.warning(
+            "llm_concurrency_decreased",
+            reason=reason,
+            previous_limit=round(previous, 2),
+            limit=round(self.limit, 2),
+            in_flight=self.in_flight,
+            queued=self.queue_depth,
+        )
+
+    def stats(self) -> Dict[str, float]:
+        """현재 상한/실행/대기 수, 누적 허용/429 수, 평균/최대 대기 시간"""
+        return {
+            "concurrency_limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "queued": self.queue_depth,
+            "admitted": self.admitted,
+            "rate_limited": self.rate_limited,
+            "avg_queue_wait_ms": round(self.total_wait_seconds / self.admitted * 1000, 1) if self.admitted else 0.0,
+            "max_queue_wait_ms": round(self.max_wait_seconds * 1000, 1),
+        }
+
+
+# 싱글톤 인스턴스
+_llm_governor: Optional[LLMConcurrencyGovernor] = None
+
+
+def get_llm_governor() -> LLMConcurrencyGovernor:
+    """LLMConcurrencyGovernor 싱글톤 인스턴스 반환"""
+    global _llm_governor
+
+    if _llm_governor is None:
+        _llm_governor = LLMConcurrencyGovernor()
+
+    return _llm_governor
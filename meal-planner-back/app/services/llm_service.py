@@ -2,12 +2,17 @@
 import asyncio
 import json
 import os
-from typing import Any
+import time
+from typing import Any, Callable
 
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage
 
 from app.config import settings
+from app.services.llm_cache import LLMResponseCache, get_llm_cache, llm_cache_key
+from app.services.llm_governor import LLMConcurrencyGovernor, estimate_tokens, get_llm_governor
+from app.services.llm_streaming import STREAMED_FIELDS, IncrementalJSONParser, PartialCallback
+from app.services.single_flight import SingleFlight
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -16,12 +21,27 @@ logger = get_logger(__name__)
 class LLMService:
     """LLM 서비스 (Claude API Wrapper)"""
 
-    def __init__(self, mock_mode: bool = False):
+    def __init__(
+        self,
+        mock_mode: bool = False,
+        cache: LLMResponseCache | None = None,
+        governor: LLMConcurrencyGovernor | None = None,
+    ):
         """
         Args:
             mock_mode: True면 실제 API 호출 없이 더미 응답 반환
+            cache: 응답 캐시 (None이면 settings.LLM_CACHE_ENABLED일 때 공유 캐시 사용, Mock 모드는 캐시 안 함)
+            governor: 동시 호출 조절기 (None이면 settings.LLM_GOVERNOR_ENABLED일 때 프로세스 공유 조절기 사용)
         """
         self.mock_mode = mock_mode
+        self.cache = cache
+        if cache is None and not mock_mode and settings.LLM_CACHE_ENABLED:
+            self.cache = get_llm_cache()
+        self.governor = governor
+        if governor is None and not mock_mode and settings.LLM_GOVERNOR_ENABLED:
+            self.governor = get_llm_governor()
+        # 같은 캐시 키의 동시 호출은 업스트림 호출 1회를 공유
+        self.flights = SingleFlight()
 
         if not mock_mode:
             # Use settings from Pydantic, not os.getenv()
@@ -39,11 +59,23 @@ class LLMService:
             self.llm = None
             logger.info("llm_service_initialized", mode="mock")
 
-    async def ainvoke(self, prompt: str) -> str:
+    async def ainvoke(
+        self,
+        prompt: str,
+        on_partial: PartialCallback | None = None,
+        use_cache: bool = True,
+        validate: Callable[[str], Any] | None = None,
+    ) -> str:
         """비동기 LLM 호출
 
         Args:
             prompt: 프롬프트 문자열
+            on_partial: 응답을 스트리밍으로 받으며 menu_name/ingredients 항목이 완성될 때마다 호출할 콜백
+                (None이면 전체 응답을 한 번에 받음, 캐시 적중 시에는 호출되지 않음, 진행 중인 스트리밍 호출에
+                합류하면 이미 나온 항목부터 받고 먼저 시작한 호출자가 떠나도 계속 받음)
+            use_cache: False면 응답 캐시/진행 중인 호출 공유 없이 새로 호출하고 저장하지 않음
+                (검증 실패 후 재시도: 같은 프롬프트라도 이전에 거부된 응답을 다시 받지 않도록)
+            validate: 응답 사용 가능 여부 확인 함수 (예외 없이 끝난 응답만 캐시에 저장, None이면 모든 성공 응답 저장)
 
         Returns:
             LLM 응답 문자열
@@ -55,23 +87,76 @@ class LLMService:
         if self.mock_mode:
             return self._get_mock_response(prompt)
 
+        if not use_cache:
+            logger.info("llm_cache_bypassed", prompt_length=len(prompt))
+            return await self._invoke_upstream(prompt, on_partial)
+
+        # 같은 모델/설정/프롬프트의 응답은 캐시에서 반환 (검증을 통과한 응답만 저장)
+        cache_key = llm_cache_key(self.llm.model, self.llm.temperature, self.llm.max_tokens, prompt)
+        if self.cache is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("llm_cache_hit", prompt_length=len(prompt), **self.cache.stats())
+                return cached
+
+        # 캐시 저장 전에 같은 프롬프트가 동시에 들어오면 진행 중인 호출 결과를 함께 기다림
+        # (스트리밍 항목은 특정 호출자의 콜백이 아니라 지금 기다리는 모든 호출자에게 전달)
+        return await self.flights.do_with_events(
+            cache_key,
+            lambda emit: self._invoke_and_store(
+                cache_key, prompt, emit if on_partial is not None else None, validate
+            ),
+            listener=on_partial,
+        )
+
+    async def _invoke_and_store(
+        self,
+        cache_key: str,
+        prompt: str,
+        on_partial: PartialCallback | None,
+        validate: Callable[[str], Any] | None,
+    ) -> str:
+        """업스트림 호출 후 사용 가능한 응답만 캐시 저장 (single-flight 공유 작업)"""
+        response = await self._invoke_upstream(prompt, on_partial)
+        if self.cache is not None and _is_usable(response, validate):
+            await self.cache.put(cache_key, response)
+        return response
+
+    async def _invoke_upstream(self, prompt: str, on_partial: PartialCallback | None = None) -> str:
+        """Claude API 호출 (동시 호출 조절 + timeout + rate limit 재시도, on_partial이 있으면 스트리밍)"""
         # EC-019: Rate limit retry with exponential backoff
         max_retries = 3
         retry_delays = [1, 2, 4]  # seconds
 
         for attempt in range(max_retries + 1):
+            # 시도마다 슬롯 획득 (429 후 재시도도 다시 줄을 섬, 대기 시간은 timeout에 포함하지 않음)
+            permit = None
+            if self.governor is not None:
+                permit = await self.governor.acquire(estimate_tokens(prompt, settings.LLM_MAX_TOKENS))
+            queue_wait_ms = round(permit.queue_wait_seconds * 1000, 1) if permit is not None else 0.0
+
             try:
                 # EC-018: Timeout wrapper (25s < FastAPI 30s default)
                 async with asyncio.timeout(25):
                     messages = [HumanMessage(content=prompt)]
-                    response = await self.llm.ainvoke(messages)
+                    if on_partial is None:
+                        response = await self.llm.ainvoke(messages)
+                        content, used_tokens = response.content, _used_tokens(response)
+                    else:
+                        content, used_tokens = await self._astream_content(messages, on_partial)
+                    if permit is not None:
+                        self.governor.release(permit, used_tokens=used_tokens)
+                        permit = None
                     logger.info(
                         "llm_invoked",
                         prompt_length=len(prompt),
-                        response_length=len(response.content),
-                        attempt=attempt + 1
+                        response_length=len(content),
+                        attempt=attempt + 1,
+                        queue_wait_ms=queue_wait_ms,
+                        used_tokens=used_tokens,
+                        streamed=on_partial is not None,
                     )
-                    return response.content
+                    return content
 
             except asyncio.TimeoutError:
                 logger.error(
@@ -103,11 +188,20 @@ class LLMService:
                         attempt=attempt + 1,
                         max_retries=max_retries,
                         retry_delay_seconds=delay,
+                        queue_wait_ms=queue_wait_ms,
                         error=str(e)
                     )
+                    # 슬롯 반환 + 상한 감소 + 대기 시간 동안 새 호출 전체 일시 정지 (재시도가 한꺼번에 몰리지 않음)
+                    if permit is not None:
+                        self.governor.release(permit, rate_limited=True, backoff_seconds=delay)
+                        permit = None
                     await asyncio.sleep(delay)
                     continue  # Retry
 
+                if permit is not None:
+                    self.governor.release(permit, rate_limited=is_rate_limit)
+                    permit = None
+
                 # Not rate limit or max retries reached
                 logger.error(
                     "llm_invocation_failed",
@@ -118,9 +212,44 @@ class LLMService:
                 )
                 raise
 
+            finally:
+                # timeout/취소 등 위에서 반환하지 않은 경우
+                if permit is not None:
+                    self.governor.release(permit)
+
         # Should never reach here due to raise in loop
         raise RuntimeError("LLM invocation failed after all retries")
 
+    async def _astream_content(self, messages: list, on_partial: PartialCallback) -> tuple[str, int | None]:
+        """
+        llm.astream으로 응답을 받으며 완성된 필드를 on_partial로 전달
+
+        Returns:
+            (전체 응답 텍스트, 실제 사용 토큰 또는 None)
+        """
+        parser = IncrementalJSONParser(STREAMED_FIELDS)
+        message = None
+        started_at = time.monotonic()
+        first_field_ms = None
+
+        async for chunk in self.llm.astream(messages):
+            message = chunk if message is None else message + chunk
+            fields = parser.feed(chunk.text)
+            if fields and first_field_ms is None:
+                first_field_ms = round((time.monotonic() - started_at) * 1000, 1)
+                logger.info("llm_stream_first_field", field=fields[0][0], elapsed_ms=first_field_ms)
+            for field, value in fields:
+                if on_partial is None:
+                    break
+                try:
+                    on_partial(field, value)
+                except Exception as e:
+                    # 부분 이벤트 전송 실패(스트림 종료 등)는 응답 수신에 영향 없음
+                    logger.warning("llm_stream_partial_failed", error=str(e))
+                    on_partial = None
+
+        return parser.buffer, _used_tokens(message)
+
     def _get_mock_response(self, prompt: str) -> str:
         """Mock 응답 생성 (프롬프트 키워드 기반)"""
         # 노드 타입 감지 (구체적인 것부터 체크)
@@ -251,6 +380,26 @@ class LLMService:
         }, ensure_ascii=False)
 
 
+def _is_usable(response: str, validate: Callable[[str], Any] | None) -> bool:
+    """validate를 통과한 응답인지 (파싱/필드 검증 실패 응답은 캐시하지 않음)"""
+    if validate is None:
+        return True
+    try:
+        validate(response)
+        return True
+    except Exception as e:
+        logger.warning("llm_cache_skipped_invalid_response", error=str(e), response_length=len(response))
+        return False
+
+
+def _used_tokens(response: Any) -> int | None:
+    """응답의 실제 사용 토큰 (usage_metadata가 없으면 None)"""
+    usage = getattr(response, "usage_metadata", None)
+    if isinstance(usage, dict) and "total_tokens" in usage:
+        return int(usage["total_tokens"])
+    return None
+
+
 def parse_json_response(response: str) -> dict[str, Any]:
     """LLM 응답에서 JSON 파싱
 
@@ -289,6 +438,22 @@ def parse_json_response(response: str) -> dict[str, Any]:
         raise
 
 
+def response_validator(model: type, **fields: Any) -> Callable[[str], Any]:
+    """LLMService.ainvoke의 validate 함수 (parse_json_response + 모델 검증, 노드와 같은 파싱 경로)
+
+    Args:
+        model: 응답 JSON을 검증할 pydantic 모델 (예: MealRecommendation)
+        fields: 응답 외에 노드가 채우는 필드 (예: Menu의 meal_type)
+
+    Returns:
+        응답 문자열을 받아 검증 실패 시 예외를 던지는 함수
+    """
+    def validate(response: str) -> Any:
+        return model(**{**parse_json_response(response), **fields})
+
+    return validate
+
+
 # 싱글톤 인스턴스
 _llm_service: LLMService | None = None
 
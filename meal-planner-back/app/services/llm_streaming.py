@@ -0,0 +1,199 @@
+"""
+LLM 스트리밍 응답 → 부분 진행 이벤트
+
+노드는 LLM 응답이 끝까지 와야 parse_json_response를 실행해서 끼니마다 몇 초씩 아무 이벤트도 없음
+→ llm.astream으로 받은 텍스트를 증분 JSON 파서에 넣어 menu_name, ingredients 항목이 완성되는 즉시
+  LangGraph custom 스트림(get_stream_writer)으로 "streaming" 진행 이벤트를 보냄 → stream_service가 SSE로 전달
+- 최종 결과는 기존과 같이 전체 응답을 parse_json_response로 파싱 (부분 이벤트는 미리보기)
+- 파서는 최상위 객체의 필드만 추적 (코드 블록/앞뒤 설명 문장은 첫 '{' 전까지 무시)
+- Mock 모드나 LLM_STREAMING_ENABLED=false면 스트리밍 없이 기존 방식 그대로
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from langgraph.config import get_stream_writer
+
+from app.config import settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 부분 이벤트로 보낼 필드 (값 전체가 완성되면 전송, 배열은 항목별로 전송)
+STREAMED_FIELDS = ("menu_name", "ingredients")
+
+PartialCallback = Callable[[str, Any], None]
+
+
+def partial_streaming_enabled() -> bool:
+    """실제 LLM 스트리밍 + 부분 이벤트 전달 여부 (Mock 모드는 항상 비활성)"""
+    return settings.LLM_STREAMING_ENABLED and not settings.MOCK_MODE
+
+
+class IncrementalJSONParser:
+    """
+    최상위 JSON 객체 증분 파서
+
+    feed()로 텍스트 조각을 넣을 때마다 새로 완성된 (필드, 값)을 반환
+    - 스칼라/객체 값: 값이 끝나면 (필드, 값)
+    - 배열 값: 항목이 끝날 때마다 (필드, 항목) → 배열이 끝나도 따로 알리지 않음
+    """
+
+    def __init__(self, fields: Optional[Sequence[str]] = None):
+        """
+        Args:
+            fields: 추적할 필드 (None이면 모든 필드)
+        """
+        self.fields = set(fields) if fields is not None else None
+        self.buffer = ""
+        self._pos = 0
+        self._started = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_string: Tuple[int, int] = (-1, -1)
+        self._key: Optional[str] = None
+        self._value_start = -1
+        self._array_key: Optional[str] = None
+        self._item_start = -1
+
+    def _tracked(self, key: Optional[str]) -> bool:
+        return key is not None and (self.fields is None or key in self.fields)
+
+    def _decode(self, start: int, end: int) -> Tuple[bool, Any]:
+        text = self.buffer[start:end].strip()
+        if not text:
+            return False, None
+        try:
+            return True, json.loads(text)
+        except json.JSONDecodeError:
+            return False, None
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """
+        텍스트 조각 추가
+
+        Args:
+            text: 새로 받은 응답 조각
+
+        Returns:
+            새로 완성된 (필드, 값) 목록 (배열 필드는 (필드, 항목))
+        """
+        self.buffer += text
+        completed: List[Tuple[str, Any]] = []
+        if self._done:
+            return completed
+        buffer = self.buffer
+
+        for i in range(self._pos, len(buffer)):
+            char = buffer[i]
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = (self._string_start, i + 1)
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char == ":" and self._depth == 1:
+                ok, key = self._decode(*self._last_string)
+                self._key = key if ok and isinstance(key, str) else None
+                self._value_start = i + 1
+            elif char in "{[":
+                if char == "[" and self._depth == 1 and self._tracked(self._key):
+                    self._array_key = self._key
+                    self._item_start = i + 1
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 2 and char == "]" and self._array_key is not None:
+                    self._emit_item(i, completed)
+                    self._array_key = None
+                self._depth -= 1
+                if self._depth == 0:
+                    # 최상위 객체 끝 → 마지막 필드 처리 후 이후 텍스트 무시
+                    self._emit_value(i, completed)
+                    self._done = True
+                    return completed
+            elif char == ",":
+                if self._depth == 1:
+                    self._emit_value(i, completed)
+                elif self._depth == 2 and self._array_key is not None:
+                    self._emit_item(i, completed)
+                    self._item_start = i + 1
+
+        self._pos = len(buffer)
+        return completed
+
+    def _emit_value(self, end: int, completed: List[Tuple[str, Any]]):
+        """depth 1에서 값이 끝남 (배열 필드는 항목 단위로 이미 전송)"""
+        key, self._key = self._key, None
+        if not self._tracked(key) or self._value_start < 0:
+            return
+        ok, value = self._decode(self._value_start, end)
+        self._value_start = -1
+        if ok and not isinstance(value, list):
+            completed.append((key, value))
+
+    def _emit_item(self, end: int, completed: List[Tuple[str, Any]]):
+        ok, item = self._decode(self._item_start, end)
+        if ok:
+            completed.append((self._array_key, item))
+
+
+def partial_progress_writer(node: str, state: Dict[str, Any]) -> Optional[PartialCallback]:
+    """
+    노드의 부분 진행 이벤트 전송 함수 (LLMService.ainvoke의 on_partial로 전달)
+
+    이벤트 data는 지금까지 받은 메뉴명/재료 누적값 (클라이언트는 마지막 이벤트만 그리면 됨)
+
+    Args:
+        node: 노드 이름 (nutritionist, chef, budget, conflict_resolver)
+        state: 현재 그래프 상태 (day/meal/meal_type 표시용)
+
+    Returns:
+        (필드, 값) 콜백 또는 None (스트리밍 비활성화, 그래프 밖에서 호출)
+    """
+    if not partial_streaming_enabled():
+        return None
+    try:
+        writer = get_stream_writer()
+    except RuntimeError:
+        return None
+
+    snapshot: Dict[str, Any] = {"menu": None, "ingredients": []}
+
+    def on_partial(field: str, value: Any):
+        if field == "menu_name":
+            snapshot["menu"] = value
+        elif field == "ingredients":
+            snapshot["ingredients"].append(value)
+        else:
+            return
+        writer({
+            "type": "progress",
+            "node": node,
+            "status": "streaming",
+            "data": {
+                "menu": snapshot["menu"],
+                "ingredients": list(snapshot["ingredients"]),
+                "day": state.get("current_day"),
+                "meal": state.get("current_meal_index", 0) + 1,
+                "meal_type": state.get("current_meal_type"),
+            },
+        })
+
+    return on_partial
@@ -0,0 +1,86 @@
+"""
+문자열 사전 n-gram 역색인
+
+정규화된 문자열 사전(재료명, 레시피명 등)에서 부분 문자열 검색
+- 포스팅: 문자(unigram) + 연속 두 글자(bigram) → 문자열 ID (오름차순)
+- 검색: 검색어 bigram 포스팅 교집합 → 후보만 실제 부분 문자열 확인
+  (1~2글자 검색어는 unigram/bigram 포스팅이 곧 정답)
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.utils.packed_arrays import decode_string_table, encode_string_table
+
+
+class NgramIndex:
+    """문자열 사전 n-gram 역색인 (읽기 전용)"""
+
+    def __init__(self, strings: Sequence[str], arrays: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Args:
+            strings: 정규화된 문자열 사전 (ID → 문자열, 스냅샷에서는 지연 디코딩 StringTable)
+            arrays: to_arrays()로 저장한 포스팅 배열 (스냅샷, None이면 계산)
+        """
+        self.strings = strings
+        if arrays is not None:
+            # 포스팅은 공유 배열의 슬라이스 (복사 없음)
+            keys = decode_string_table(arrays["keys_offsets"], arrays["keys_data"])
+            offsets = arrays["offsets"].tolist()
+            ids = np.asarray(arrays["ids"])
+            self.grams = {key: ids[offsets[i]:offsets[i + 1]] for i, key in enumerate(keys)}
+            return
+
+        grams: Dict[str, List[int]] = {}
+        for string_id, string in enumerate(strings):
+            keys = set(string) | {string[k:k + 2] for k in range(len(string) - 1)}
+            for key in keys:
+                grams.setdefault(key, []).append(string_id)
+        # 포스팅은 ID 오름차순 (교집합 연산용)
+        self.grams: Dict[str, np.ndarray] = {
+            key: np.asarray(ids, dtype=np.int32) for key, ids in grams.items()
+        }
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """포스팅을 CSR 배열로 변환 (스냅샷 저장용)"""
+        keys = list(self.grams)
+        keys_offsets, keys_data = encode_string_table(keys)
+        offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(self.grams[key]) for key in keys])
+        ids = np.concatenate([self.grams[key] for key in keys]) if keys else np.empty(0, dtype=np.int32)
+        return {"keys_offsets": keys_offsets, "keys_data": keys_data, "offsets": offsets, "ids": ids}
+
+    def containing(self, term: str) -> np.ndarray:
+        """
+        term을 부분 문자열로 포함하는 문자열 ID
+
+        Args:
+            term: 정규화된 검색어
+
+        Returns:
+            문자열 ID 배열 (오름차순)
+        """
+        if not term:
+            return np.arange(len(self.strings), dtype=np.int32)
+        if len(term) <= 2:
+            # 1~2글자 검색어는 n-gram 포스팅이 곧 정답 (확인 불필요)
+            return self.grams.get(term, np.empty(0, dtype=np.int32))
+
+        postings = []
+        for key in {term[k:k + 2] for k in range(len(term) - 1)}:
+            posting = self.grams.get(key)
+            if posting is None:
+                return np.empty(0, dtype=np.int32)
+            postings.append(posting)
+
+        postings.sort(key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+            if len(candidates) == 0:
+                return candidates
+
+        # bigram 집합 포함 ≠ 부분 문자열 → 후보만 실제 확인
+        strings = self.strings
+        return np.asarray([i for i in candidates.tolist() if term in strings[i]], dtype=np.int32)
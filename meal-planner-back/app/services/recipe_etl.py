@@ -0,0 +1,473 @@
+"""
+레시피 ETL (오프라인 정제 + 중복 제거 → 런타임 스냅샷)
+
+수작업으로 관리하는 recipes_with_nutrition.csv를 청크 단위로 스트리밍하여 정제
+- 재료명 정규화: 괄호 설명/특수문자 제거, 레시피 내 중복 재료 제거
+- 영양 컬럼 검증: 숫자 강제 변환, 범위 밖 값은 결측 처리, 칼로리 누락 시 탄단지로 계산
+- 중복 제거: 레시피명 문자 bigram MinHash + LSH 밴딩으로 후보를 찾고, 유지된 레시피와의
+  실제 bigram Jaccard가 NEAR_DUPLICATE_JACCARD 이상일 때만 제외 (먼저 나온 레시피 유지)
+- 파생 컬럼: 탄단지 에너지 비율, 레시피 예상 재료비, 알레르기 비트마스크
+- 청크 변환은 여러 프로세스에서, 중복 판정/기록은 부모 프로세스에서 CSV 순서대로
+  → 메모리 사용량은 청크 크기 × 동시 청크 수 + 유지된 레시피의 정규화 이름/LSH 버킷
+
+실행: python scripts/etl_recipes.py
+"""
+
+import json
+import os
+import re
+import unicodedata
+import zlib
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Deque, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.services.recipe_ingredients import normalize_ingredient_name, parse_ingredient_names
+from app.services.restriction_bitmaps import matches_keywords
+from app.utils.constants import ALLERGEN_KEYWORDS
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 정제 CSV 기본 경로 (스냅샷의 입력)
+CLEAN_CSV_PATH = Path(__file__).parent.parent.parent / "data" / "recipes_clean.csv"
+
+# 기본 재료 가격표 (IngredientPricingService와 같은 파일)
+PRICES_PATH = Path(__file__).parent.parent.parent / "data" / "default_ingredient_prices.json"
+
+# 청크 크기 (행)
+ETL_CHUNK_ROWS = 50_000
+
+# MinHash 순열 수 = 밴드 수 × 밴드당 행 수
+# 밴드 8 × 4행 → 유사도 약 0.59 이상부터 후보 ((1/8)^(1/4)), 0.9 이상이면 후보가 될 확률 99.9% 이상
+# 후보는 실제 Jaccard로 다시 판정하므로 밴딩은 재현율 쪽으로 설정
+MINHASH_BANDS = 8
+MINHASH_ROWS_PER_BAND = 4
+
+# 근사 중복 판정 기준 (정규화 레시피명 bigram 다중집합 Jaccard)
+# 레시피명은 한 글자 차이로도 다른 요리 ("콩나물국"/"콩나물국수" 0.75, "메추리알볶음"/"메추리알볶음밥" 0.83,
+# "다이어트다진소고기국"/"다이어트다진소고기국수" 0.9) → 태그/공백/특수문자만 다른 이름(정규화 후 동일)과
+# 20자 이상 긴 이름의 한 글자 변형만 중복으로 봄
+NEAR_DUPLICATE_JACCARD = 0.95
+
+# 영양 컬럼 허용 범위 (1인분 기준, 범위 밖은 입력 오류로 보고 결측 처리)
+NUTRITION_LIMITS: Dict[str, Tuple[float, float]] = {
+    "calories": (0, 5000),
+    "carb_g": (0, 1000),
+    "protein_g": (0, 500),
+    "fat_g": (0, 500),
+    "sugar_g": (0, 500),
+    "sodium_mg": (0, 20000),
+    "cholesterol_mg": (0, 5000),
+    "saturated_fat_g": (0, 300),
+    "nutrition_match_rate": (0, 1),
+    "cooking_time": (0, 24 * 60),
+}
+
+# 탄단지 g당 열량 (kcal)
+MACRO_KCAL = {"carb_g": 4.0, "protein_g": 4.0, "fat_g": 9.0}
+
+# 재료 수량 단위 → g (ml은 밀도 1로 가정)
+UNIT_GRAMS = {
+    "kg": 1000.0,
+    "g": 1.0,
+    "l": 1000.0,
+    "ml": 1.0,
+    "큰술": 15.0,
+    "T": 15.0,
+    "작은술": 5.0,
+    "t": 5.0,
+    "컵": 200.0,
+}
+
+# 수량을 알 수 없는 재료의 기본 사용량 (g)
+DEFAULT_INGREDIENT_GRAMS = 50.0
+
+# 가격표 price_per_gram 값의 단위 (1,000원, 예: 닭가슴살 0.035 = "100g당 3,500원" = 35원/g)
+PRICE_TABLE_UNIT_WON = 1000.0
+
+# 가격표에 없는 재료의 그램당 가격 (원, IngredientPricingService 폴백 "기본 20원/g")
+FALLBACK_PRICE_PER_GRAM = 20.0
+
+# 알레르기 비트마스크 비트 순서 (bit i = ALLERGEN_MASK_NAMES[i])
+ALLERGEN_MASK_NAMES: List[str] = list(ALLERGEN_KEYWORDS)
+
+# 파생 컬럼
+DERIVED_COLUMNS = ["carb_ratio", "protein_ratio", "fat_ratio", "est_cost", "allergen_mask"]
+
+_BRACKETS = re.compile(r"\[[^\]]*\]|\([^)]*\)|<[^>]*>|\{[^}]*\}")
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+_SPACES = re.compile(r"\s+")
+_INGREDIENT_PUNCT = re.compile(r"[*·ㆍ•\-_~!?\"'`/\\]+")
+_AMOUNT = re.compile(r"(\d+(?:\.\d+)?)(?:\s*/\s*(\d+))?\s*(kg|g|ml|l|큰술|작은술|컵|T|t)(?![a-z])", re.IGNORECASE)
+
+# MinHash 해시 계수 (프로세스와 실행에 무관하게 고정 → 같은 이름은 항상 같은 서명)
+_RNG = np.random.default_rng(20240601)
+_HASH_A = _RNG.integers(1, 2**63, MINHASH_BANDS * MINHASH_ROWS_PER_BAND, dtype=np.uint64) | np.uint64(1)
+_HASH_B = _RNG.integers(0, 2**63, MINHASH_BANDS * MINHASH_ROWS_PER_BAND, dtype=np.uint64)
+
+
+def normalize_recipe_name(name: str) -> str:
+    """
+    중복 판정용 레시피명 정규화 (괄호 태그, 공백, 특수문자 제거)
+
+    예: "[초간단] 김치 찌개!!" → "김치찌개"
+    """
+    name = unicodedata.normalize("NFKC", name).lower()
+    stripped = _NON_WORD.sub("", _BRACKETS.sub("", name))
+    # 괄호 안 내용만 있는 이름은 괄호만 제거
+    return stripped or _NON_WORD.sub("", name)
+
+
+def clean_ingredient_name(name: str) -> str:
+    """
+    재료명 정규화 (표시용: 괄호 설명, 특수문자, 중복 공백 제거)
+
+    예: "대파(흰 부분)" → "대파", "*간장 " → "간장"
+    """
+    name = unicodedata.normalize("NFKC", name)
+    name = _INGREDIENT_PUNCT.sub(" ", _BRACKETS.sub("", name))
+    return _SPACES.sub(" ", name).strip()
+
+
+def parse_amount_grams(amount) -> Optional[float]:
+    """
+    재료 수량 문자열 → g (예: "150g", "1/2컵", "2큰술")
+
+    Returns:
+        그램 수량 (단위를 알 수 없으면 None)
+    """
+    if not isinstance(amount, str):
+        return None
+    match = _AMOUNT.search(amount)
+    if not match:
+        return None
+    value = float(match.group(1))
+    if match.group(2):
+        value /= float(match.group(2)) or 1.0
+    unit = match.group(3)
+    grams = UNIT_GRAMS.get(unit, UNIT_GRAMS.get(unit.lower()))
+    return value * grams if grams is not None else None
+
+
+def load_ingredient_prices(path: Path = PRICES_PATH) -> Dict[str, float]:
+    """
+    기본 재료 가격표 로드
+
+    Returns:
+        {정규화 재료명: 그램당 가격 (원)}
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            prices = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("etl_prices_load_failed", error=str(e), path=str(path))
+        return {}
+    return {
+        normalize_ingredient_name(name): float(info["price_per_gram"]) * PRICE_TABLE_UNIT_WON
+        for name, info in prices.items()
+        if isinstance(info, dict) and "price_per_gram" in info
+    }
+
+
+def name_bigrams(name: str) -> FrozenSet[str]:
+    """정규화 레시피명의 문자 bigram 집합 (1글자 이름은 이름 자체)"""
+    return frozenset(name[j:j + 2] for j in range(len(name) - 1)) or frozenset((name,))
+
+
+def bigram_jaccard(a: str, b: str) -> float:
+    """
+    정규화 레시피명 bigram 다중집합 Jaccard 유사도
+
+    반복 bigram도 셈 ("두부순두부찌개"/"순두부순두부찌개"는 집합으로는 1.0, 다중집합으로는 0.86)
+    """
+    if a == b:
+        return 1.0
+    x = Counter(a[j:j + 2] for j in range(len(a) - 1)) or Counter((a,))
+    y = Counter(b[j:j + 2] for j in range(len(b) - 1)) or Counter((b,))
+    return sum((x & y).values()) / sum((x | y).values())
+
+
+def minhash_signatures(names: Sequence[str]) -> np.ndarray:
+    """
+    레시피명 MinHash 서명 (정규화 이름의 문자 bigram 집합)
+
+    Args:
+        names: 정규화된 레시피명 리스트
+
+    Returns:
+        (레시피 수, 순열 수) uint32 서명
+    """
+    shingle_hashes: List[int] = []
+    counts = np.empty(len(names), dtype=np.int64)
+    for i, name in enumerate(names):
+        shingles = name_bigrams(name)
+        counts[i] = len(shingles)
+        shingle_hashes.extend(zlib.crc32(s.encode("utf-8")) for s in shingles)
+
+    if not len(names):
+        return np.empty((0, len(_HASH_A)), dtype=np.uint32)
+
+    # 곱셈-시프트 해시: 상위 32비트 (uint64 곱셈 오버플로는 의도된 동작)
+    x = np.asarray(shingle_hashes, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        hashed = ((_HASH_A[:, None] * x[None, :] + _HASH_B[:, None]) >> np.uint64(32)).astype(np.uint32)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    return np.minimum.reduceat(hashed, starts, axis=1).T
+
+
+def band_keys(signatures: np.ndarray) -> np.ndarray:
+    """
+    LSH 밴드 키 (밴드별 서명 조각 해시, 하나라도 같으면 중복 후보)
+
+    Args:
+        signatures: minhash_signatures() 결과
+
+    Returns:
+        (레시피 수, 밴드 수) uint64
+    """
+    bands = signatures.reshape(len(signatures), MINHASH_BANDS, MINHASH_ROWS_PER_BAND).astype(np.uint64)
+    keys = np.zeros((len(signatures), MINHASH_BANDS), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for j in range(MINHASH_ROWS_PER_BAND):
+            keys = (keys * np.uint64(0x100000001B3)) ^ bands[:, :, j]
+    return keys
+
+
+class NearDuplicateFilter:
+    """
+    레시피명 근사 중복 필터 (CSV 순서대로 먼저 나온 레시피 유지)
+
+    LSH 밴드 키가 같은 유지 레시피만 후보로 보고, 실제 bigram Jaccard가 threshold 이상이면 제외
+    유지된 레시피의 정규화 이름과 밴드 키만 기록 (제외된 레시피를 거친 연쇄 제외 없음)
+    """
+
+    def __init__(self, bands: int = MINHASH_BANDS, threshold: float = NEAR_DUPLICATE_JACCARD):
+        self.threshold = threshold
+        self.buckets: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self.kept: List[str] = []
+
+    def keep_mask(self, keys: np.ndarray, names: Sequence[str]) -> np.ndarray:
+        """
+        청크 하나의 유지 마스크 (이전 청크 + 청크 내 앞서 유지된 레시피와 중복이면 제외)
+
+        Args:
+            keys: band_keys() 결과 (CSV 순서)
+            names: keys와 같은 순서의 정규화 레시피명
+
+        Returns:
+            bool 배열 (True = 유지)
+        """
+        keep = np.zeros(len(keys), dtype=bool)
+        for i, (row, name) in enumerate(zip(keys.tolist(), names)):
+            candidates = set()
+            for bucket, key in zip(self.buckets, row):
+                candidates.update(bucket.get(key, ()))
+            if any(bigram_jaccard(name, self.kept[c]) >= self.threshold for c in candidates):
+                continue
+
+            keep[i] = True
+            for bucket, key in zip(self.buckets, row):
+                bucket.setdefault(key, []).append(len(self.kept))
+            self.kept.append(name)
+        return keep
+
+
+def _validate_nutrition(chunk: pd.DataFrame, stats: Dict[str, int]) -> None:
+    """영양/조리시간 컬럼 숫자 변환 + 범위 검증 (범위 밖 = 결측), 칼로리 누락 시 탄단지로 계산"""
+    for col, (low, high) in NUTRITION_LIMITS.items():
+        if col not in chunk.columns:
+            continue
+        values = pd.to_numeric(chunk[col], errors="coerce")
+        invalid = values.notna() & ((values < low) | (values > high))
+        stats["invalid_values"] += int(invalid.sum())
+        chunk[col] = values.mask(invalid)
+
+    if all(col in chunk.columns for col in ["calories", *MACRO_KCAL]):
+        macro_kcal = sum(chunk[col] * kcal for col, kcal in MACRO_KCAL.items())
+        fill = chunk["calories"].isna() & macro_kcal.notna() & (macro_kcal > 0)
+        stats["calories_derived"] += int(fill.sum())
+        chunk.loc[fill, "calories"] = macro_kcal[fill].round()
+
+
+def _ingredient_columns(
+    chunk: pd.DataFrame,
+    prices: Dict[str, float],
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """정규화 재료 JSON, 레시피 예상 재료비 (원), 알레르기 비트마스크"""
+    raw = chunk["ingredients_raw"] if "ingredients_raw" in chunk.columns else pd.Series(None, index=chunk.index)
+    parsed_column = chunk["ingredients_parsed"] if "ingredients_parsed" in chunk.columns else raw
+    allergen_keywords = [
+        [normalize_ingredient_name(k) for k in ALLERGEN_KEYWORDS[name]] for name in ALLERGEN_MASK_NAMES
+    ]
+
+    # 재료명은 레시피 간에 반복되므로 재료명별 정규화/마스크/가격을 청크 안에서 1회만 계산
+    names: Dict[str, Tuple[str, str]] = {}
+    info: Dict[str, Tuple[int, float]] = {}
+
+    ingredients_json = []
+    costs = np.zeros(len(chunk), dtype=np.float64)
+    masks = np.zeros(len(chunk), dtype=np.int64)
+    for i, (parsed, raw_value) in enumerate(zip(parsed_column.tolist(), raw.tolist())):
+        try:
+            loaded = json.loads(parsed) if isinstance(parsed, str) and parsed.startswith("[") else None
+        except json.JSONDecodeError:
+            loaded = None
+        if isinstance(loaded, list):
+            items = [item if isinstance(item, dict) else {"name": item} for item in loaded]
+        else:
+            items = [{"name": name} for name in parse_ingredient_names(None, raw_value)]
+
+        cleaned = []
+        seen = set()
+        for item in items:
+            raw_name = str(item.get("name") or "")
+            if raw_name not in names:
+                name = clean_ingredient_name(raw_name)
+                names[raw_name] = (name, normalize_ingredient_name(name))
+            name, key = names[raw_name]
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            amount = item.get("amount")
+            cleaned.append({"name": name, "amount": amount} if amount is not None else {"name": name})
+
+            if key not in info:
+                mask = 0
+                for bit, keywords in enumerate(allergen_keywords):
+                    if matches_keywords(name, keywords):
+                        mask |= 1 << bit
+                info[key] = (mask, prices.get(key, FALLBACK_PRICE_PER_GRAM))
+            mask, price_per_gram = info[key]
+            masks[i] |= mask
+            costs[i] += (parse_amount_grams(amount) or DEFAULT_INGREDIENT_GRAMS) * price_per_gram
+
+        ingredients_json.append(json.dumps(cleaned, ensure_ascii=False))
+    return ingredients_json, costs, masks
+
+
+def transform_chunk(
+    chunk: pd.DataFrame,
+    prices: Dict[str, float],
+) -> Tuple[pd.DataFrame, np.ndarray, List[str], Dict[str, int]]:
+    """
+    청크 1개 정제 (워커 프로세스에서 실행)
+
+    Args:
+        chunk: 원본 CSV 청크
+        prices: load_ingredient_prices() 결과
+
+    Returns:
+        (정제된 청크, LSH 밴드 키, 정규화 레시피명, 통계)
+    """
+    stats = {"rows_in": len(chunk), "missing_name": 0, "invalid_values": 0, "calories_derived": 0}
+
+    names = chunk["name"].astype("string").str.strip()
+    normalized = [normalize_recipe_name(name) if isinstance(name, str) else "" for name in names.tolist()]
+    has_name = np.array([bool(name) for name in normalized])
+    stats["missing_name"] = int((~has_name).sum())
+    chunk = chunk.loc[has_name].copy()
+    chunk["name"] = names[has_name]
+    normalized = [name for name, ok in zip(normalized, has_name) if ok]
+
+    _validate_nutrition(chunk, stats)
+
+    # 탄단지 에너지 비율 (탄단지 열량 합 대비)
+    if all(col in chunk.columns for col in MACRO_KCAL):
+        energy = {col: chunk[col] * kcal for col, kcal in MACRO_KCAL.items()}
+        total = sum(energy.values())
+        total = total.where(total > 0)
+        for col, ratio_col in zip(MACRO_KCAL, ["carb_ratio", "protein_ratio", "fat_ratio"]):
+            chunk[ratio_col] = (energy[col] / total).round(4)
+
+    ingredients_json, costs, masks = _ingredient_columns(chunk, prices)
+    if "ingredients_parsed" in chunk.columns or "ingredients_raw" in chunk.columns:
+        chunk["ingredients_parsed"] = ingredients_json
+        chunk["est_cost"] = np.round(costs, -1)
+        chunk["allergen_mask"] = masks
+
+    return chunk, band_keys(minhash_signatures(normalized)), normalized, stats
+
+
+def _read_chunks(csv_path: Path, chunk_rows: int):
+    """원본 CSV 청크 스트리밍"""
+    return pd.read_csv(csv_path, encoding="utf-8-sig", chunksize=chunk_rows, low_memory=False)
+
+
+def run_recipe_etl(
+    csv_path: Path,
+    out_csv: Path = CLEAN_CSV_PATH,
+    workers: Optional[int] = None,
+    chunk_rows: int = ETL_CHUNK_ROWS,
+    dedup: bool = True,
+    prices_path: Path = PRICES_PATH,
+) -> Dict[str, int]:
+    """
+    원본 CSV → 정제 CSV (청크 스트리밍, 멀티 프로세스)
+
+    정제 CSV는 임시 파일에 기록한 뒤 교체 (실패해도 기존 파일 유지)
+
+    Args:
+        csv_path: 원본 레시피 CSV
+        out_csv: 정제 CSV 출력 경로
+        workers: 변환 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 실행)
+        chunk_rows: 청크 크기 (행)
+        dedup: 레시피명 근사 중복 제거 여부
+        prices_path: 기본 재료 가격표
+
+    Returns:
+        통계 {rows_in, rows_out, duplicates, missing_name, invalid_values, calories_derived, chunks}
+    """
+    csv_path = Path(csv_path)
+    out_csv = Path(out_csv)
+    workers = workers or os.cpu_count() or 1
+    prices = load_ingredient_prices(prices_path)
+
+    totals = {"rows_in": 0, "rows_out": 0, "duplicates": 0, "missing_name": 0,
+              "invalid_values": 0, "calories_derived": 0, "chunks": 0}
+    duplicates = NearDuplicateFilter()
+    tmp_csv = out_csv.with_name(f"{out_csv.name}.tmp-{os.getpid()}")
+    tmp_csv.parent.mkdir(parents=True, exist_ok=True)
+
+    def write(result: Tuple[pd.DataFrame, np.ndarray, List[str], Dict[str, int]]) -> None:
+        chunk, keys, normalized, stats = result
+        for key, value in stats.items():
+            totals[key] += value
+        if dedup:
+            keep = duplicates.keep_mask(keys, normalized)
+            totals["duplicates"] += int((~keep).sum())
+            chunk = chunk.loc[keep]
+        chunk.to_csv(tmp_csv, mode="a", header=totals["chunks"] == 0, index=False, encoding="utf-8")
+        totals["rows_out"] += len(chunk)
+        totals["chunks"] += 1
+        logger.info("etl_chunk_written", chunk=totals["chunks"], rows_in=totals["rows_in"], rows_out=totals["rows_out"])
+
+    logger.info("etl_started", csv_path=str(csv_path), workers=workers, chunk_rows=chunk_rows, dedup=dedup)
+    try:
+        if workers == 1:
+            for chunk in _read_chunks(csv_path, chunk_rows):
+                write(transform_chunk(chunk, prices))
+        else:
+            # 동시 청크 수 제한 (메모리 상한), 결과는 CSV 순서대로 기록
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending: Deque[Future] = deque()
+                for chunk in _read_chunks(csv_path, chunk_rows):
+                    pending.append(pool.submit(transform_chunk, chunk, prices))
+                    if len(pending) >= workers * 2:
+                        write(pending.popleft().result())
+                while pending:
+                    write(pending.popleft().result())
+
+        if totals["chunks"] == 0:
+            raise ValueError(f"Recipe CSV is empty: {csv_path}")
+        os.replace(tmp_csv, out_csv)
+    finally:
+        if tmp_csv.exists():
+            tmp_csv.unlink()
+
+    logger.info("etl_completed", out_csv=str(out_csv), **totals)
+    return totals
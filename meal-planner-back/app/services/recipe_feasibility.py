@@ -0,0 +1,237 @@
+"""
+식단 제약 조건 충족 가능성 사전 점검
+
+예산/조리시간/제한 재료/영양 목표/건강 상태가 겹치는 범위가 좁은 프로필은
+LLM 재시도(끼니당 최대 5회)를 반복해도 검증을 통과하기 어려움
+→ LLM 호출 전에 레시피 색인으로 조건별/조합별 만족 레시피 수를 세어 미리 경고하거나 허용 범위를 완화
+- 조건별 마스크는 레시피 수 크기의 불리언 배열 (전체 계산 1회 수 ms)
+- 허용 범위/건강 상태 기준은 검증 노드의 상수를 그대로 사용 (nutrition_checker, budget_checker, health_checker)
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.agents.nodes.validation.budget_checker import BUDGET_TOLERANCE
+from app.agents.nodes.validation.health_checker import (
+    HEALTH_CONSTRAINTS,
+    SATURATED_FAT_RATIO_OF_FAT,
+    SUGAR_RATIO_OF_CARB,
+)
+from app.agents.nodes.validation.nutrition_checker import CALORIE_TOLERANCE, MACRO_TOLERANCE
+from app.models.responses import FeasibilityConstraint, FeasibilityResponse
+from app.models.state import MacroTargets
+from app.services.recipe_store import RecipeStore
+from app.utils.constants import SKILL_LEVEL_DIFFICULTIES
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 조건을 모두 만족하는 레시피가 이보다 적으면 충족 어려움으로 판단
+FEASIBILITY_MIN_RECIPES = 30
+
+# 조건 → 검증 그룹 (같은 검증기가 함께 보는 조건은 묶어서 뺌: 칼로리와 탄단지는 서로 연관됨)
+CONSTRAINT_GROUPS = {
+    "calories": "nutrition_checker",
+    "macros": "nutrition_checker",
+    "cooking_time": "time_checker",
+    "difficulty": "difficulty",
+    "restrictions": "allergy_checker",
+    "health": "health_checker",
+    "budget": "budget_checker",
+}
+
+# 완화 가능한 검증기 (조리시간/난이도/제한 재료/건강 상태는 완화하지 않음)
+RELAXABLE_VALIDATORS = ["nutrition_checker", "budget_checker"]
+
+CONSTRAINT_LABELS = {
+    "calories": "칼로리",
+    "macros": "탄단지 비율",
+    "cooking_time": "조리 시간",
+    "difficulty": "난이도",
+    "restrictions": "제한 재료",
+    "health": "건강 상태",
+    "budget": "예산",
+}
+
+
+def _within(values: np.ndarray, target: float, tolerance: float) -> np.ndarray:
+    """target ±tolerance 범위 안 (결측 = False)"""
+    with np.errstate(invalid="ignore"):
+        return (values >= target * (1 - tolerance)) & (values <= target * (1 + tolerance))
+
+
+def health_mask(store: RecipeStore, health_conditions: Sequence[str]) -> Optional[np.ndarray]:
+    """
+    건강 상태 기준을 만족하는 레시피 마스크 (health_checker와 같은 기준)
+
+    - 당뇨: 추정 당류(탄수화물 × SUGAR_RATIO_OF_CARB) ≤ sugar_g_max
+    - 고혈압: 나트륨 ≤ sodium_mg_max (나트륨 컬럼이 있는 스냅샷에서만 점검)
+    - 고지혈증: 추정 포화지방(지방 × SATURATED_FAT_RATIO_OF_FAT) ≤ saturated_fat_g_max
+
+    Args:
+        store: 점검에 사용할 RecipeStore
+        health_conditions: 건강 상태 리스트
+
+    Returns:
+        레시피 수 크기 불리언 배열 (점검할 수 있는 건강 상태가 없으면 None)
+    """
+    df = store.df
+    sodium = store.lazy_columns.get("sodium_mg")
+    masks: List[np.ndarray] = []
+    with np.errstate(invalid="ignore"):
+        if "당뇨" in health_conditions and "carb_g" in df.columns:
+            max_sugar = HEALTH_CONSTRAINTS["당뇨"]["sugar_g_max"]
+            masks.append(df["carb_g"].to_numpy(dtype=np.float64) * SUGAR_RATIO_OF_CARB <= max_sugar)
+        if "고혈압" in health_conditions and sodium is not None:
+            masks.append(np.asarray(sodium, dtype=np.float64) <= HEALTH_CONSTRAINTS["고혈압"]["sodium_mg_max"])
+        if "고지혈증" in health_conditions and "fat_g" in df.columns:
+            max_saturated_fat = HEALTH_CONSTRAINTS["고지혈증"]["saturated_fat_g_max"]
+            masks.append(df["fat_g"].to_numpy(dtype=np.float64) * SATURATED_FAT_RATIO_OF_FAT <= max_saturated_fat)
+    return np.logical_and.reduce(masks) if masks else None
+
+
+def constraint_masks(
+    store: RecipeStore,
+    targets: MacroTargets,
+    per_meal_budget: Optional[int],
+    max_cooking_time: Optional[int],
+    skill_level: Optional[str],
+    restrictions: Sequence[str],
+    health_conditions: Sequence[str] = (),
+) -> Dict[str, np.ndarray]:
+    """
+    조건별 만족 레시피 마스크
+
+    Args:
+        store: 점검에 사용할 RecipeStore
+        targets: 끼니당 영양 목표
+        per_meal_budget: 끼니당 예산 (원, 레시피 예상 비용 컬럼이 없으면 점검 생략)
+        max_cooking_time: 최대 조리 시간 (분)
+        skill_level: 조리 실력 (초급/중급/고급)
+        restrictions: 알레르기 + 식이 선호
+        health_conditions: 건강 상태 (당뇨/고혈압/고지혈증)
+
+    Returns:
+        {조건 이름: 레시피 수 크기 불리언 배열} (데이터에 없는 조건은 제외)
+    """
+    df = store.df
+    masks: Dict[str, np.ndarray] = {
+        "calories": _within(df["calories"].to_numpy(), targets.calories, CALORIE_TOLERANCE),
+    }
+
+    if all(col in df.columns for col in ("carb_g", "protein_g", "fat_g")):
+        masks["macros"] = (
+            _within(df["carb_g"].to_numpy(), targets.carb_g, MACRO_TOLERANCE)
+            & _within(df["protein_g"].to_numpy(), targets.protein_g, MACRO_TOLERANCE)
+            & _within(df["fat_g"].to_numpy(), targets.fat_g, MACRO_TOLERANCE)
+        )
+
+    if max_cooking_time:
+        masks["cooking_time"] = df["cooking_time"].to_numpy() <= max_cooking_time
+
+    if skill_level:
+        allowed = store.difficulty_codes(SKILL_LEVEL_DIFFICULTIES.get(skill_level, SKILL_LEVEL_DIFFICULTIES["고급"]))
+        masks["difficulty"] = np.isin(df["difficulty"].cat.codes.to_numpy(), allowed)
+
+    if restrictions:
+        masks["restrictions"] = ~store.restriction_bitmaps.excluded_rows(list(restrictions))
+
+    if health_conditions:
+        health = health_mask(store, health_conditions)
+        if health is not None:
+            masks["health"] = health
+
+    # 예상 비용은 ETL 산출물로 만든 스냅샷에만 있음 (지연 조회 컬럼)
+    cost = store.lazy_columns.get("est_cost")
+    if per_meal_budget and cost is not None:
+        cost = np.asarray(cost, dtype=np.float64)
+        with np.errstate(invalid="ignore"):
+            masks["budget"] = cost <= per_meal_budget * (1 + BUDGET_TOLERANCE)
+
+    return masks
+
+
+def estimate_feasibility(
+    store: RecipeStore,
+    targets: MacroTargets,
+    per_meal_budget: Optional[int] = None,
+    max_cooking_time: Optional[int] = None,
+    skill_level: Optional[str] = None,
+    restrictions: Optional[Sequence[str]] = None,
+    health_conditions: Optional[Sequence[str]] = None,
+    min_recipes: int = FEASIBILITY_MIN_RECIPES,
+) -> FeasibilityResponse:
+    """
+    제약 조건 조합별 만족 레시피 수 집계
+
+    Args:
+        store: 점검에 사용할 RecipeStore
+        targets: 끼니당 영양 목표
+        per_meal_budget: 끼니당 예산 (원)
+        max_cooking_time: 최대 조리 시간 (분)
+        skill_level: 조리 실력
+        restrictions: 알레르기 + 식이 선호
+        health_conditions: 건강 상태 (health_checker 기준)
+        min_recipes: 충족 가능으로 판단할 최소 레시피 수
+
+    Returns:
+        FeasibilityResponse (조건별/누적/한 조건 제외 레시피 수, 병목 조건, 완화할 검증기)
+    """
+    with store.lease():
+        masks = constraint_masks(
+            store, targets, per_meal_budget, max_cooking_time, skill_level, restrictions or [], health_conditions or []
+        )
+    total = len(store)
+    names = list(masks)
+
+    constraints: List[FeasibilityConstraint] = []
+    cumulative = np.ones(total, dtype=bool)
+    for name in names:
+        cumulative &= masks[name]
+        without = np.ones(total, dtype=bool)
+        for other in names:
+            if CONSTRAINT_GROUPS[other] != CONSTRAINT_GROUPS[name]:
+                without &= masks[other]
+        constraints.append(FeasibilityConstraint(
+            name=name,
+            label=CONSTRAINT_LABELS[name],
+            matching=int(np.count_nonzero(masks[name])),
+            cumulative=int(np.count_nonzero(cumulative)),
+            without=int(np.count_nonzero(without)),
+        ))
+
+    matching_all = int(np.count_nonzero(cumulative))
+    feasible = matching_all >= min_recipes
+
+    bottleneck = None
+    relaxed_validators: List[str] = []
+    warnings: List[str] = []
+    if not feasible and constraints:
+        best = max(constraints, key=lambda c: c.without)
+        if best.without > matching_all:
+            bottleneck = best.name
+        # 결과를 좁히는(빼면 늘어나는) 완화 가능 조건의 검증기는 처음부터 완화된 허용 범위 사용
+        relaxed_validators = sorted({
+            CONSTRAINT_GROUPS[c.name]
+            for c in constraints
+            if CONSTRAINT_GROUPS[c.name] in RELAXABLE_VALIDATORS and c.without > matching_all
+        })
+        warnings.append(
+            f"조건을 모두 만족하는 레시피가 {matching_all}개로 적습니다 (기준 {min_recipes}개)."
+        )
+        if bottleneck:
+            constraint = next(c for c in constraints if c.name == bottleneck)
+            warnings.append(
+                f"{constraint.label} 조건을 완화하면 만족 레시피가 {constraint.without}개로 늘어납니다."
+            )
+
+    return FeasibilityResponse(
+        total_recipes=total,
+        matching_all=matching_all,
+        feasible=feasible,
+        constraints=constraints,
+        bottleneck=bottleneck,
+        relaxed_validators=relaxed_validators,
+        warnings=warnings,
+    )
@@ -0,0 +1,265 @@
+"""
+레시피 재료 테이블
+
+레시피별 재료명을 로드 시 1회만 파싱하여 CSR 배열로 보관
+- vocab: 재료명 사전 (재료명 문자열은 한 번만 저장)
+- offsets: 레시피 i의 재료 ID는 ids[offsets[i]:offsets[i + 1]]
+- ids: 재료 ID (int32)
+
+IngredientIndex: 재료명 n-gram 역색인 (제한 재료 목록 → 제외 레시피 마스크)
+"""
+
+import json
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from app.services.ngram_index import NgramIndex
+from app.utils.packed_arrays import prefix_arrays, sub_arrays
+
+
+def parse_ingredient_names(ingredients_parsed, ingredients_raw=None) -> List[str]:
+    """
+    ingredients_parsed(JSON) 값을 재료명 리스트로 변환
+
+    Args:
+        ingredients_parsed: JSON 형식의 재료 문자열 ([{"name": ...}, ...])
+        ingredients_raw: 파싱 실패 시 사용할 쉼표 구분 원본 문자열
+
+    Returns:
+        재료명 리스트
+    """
+    if isinstance(ingredients_parsed, str) and ingredients_parsed:
+        try:
+            parsed = json.loads(ingredients_parsed)
+            if isinstance(parsed, list):
+                names = []
+                for item in parsed:
+                    name = item.get("name") if isinstance(item, dict) else item
+                    if name:
+                        names.append(str(name))
+                return names
+        except (json.JSONDecodeError, TypeError):
+            pass
+
+    # 파싱 실패 시 raw 사용
+    if isinstance(ingredients_raw, str) and ingredients_raw:
+        return [s.strip() for s in ingredients_raw.split(",")[:10] if s.strip()]
+
+    return []
+
+
+def normalize_ingredient_name(name: str) -> str:
+    """재료명 정규화 (소문자, 공백 제거)"""
+    return name.lower().replace(" ", "")
+
+
+def matches_restriction(normalized_ingredient: str, normalized_restriction: str) -> bool:
+    """
+    제한 재료 매칭 규칙 (부분 문자열, 양방향)
+
+    예: "계란" in "계란말이", "파" in "대파"
+    """
+    return normalized_restriction in normalized_ingredient or normalized_ingredient in normalized_restriction
+
+
+class IngredientTable:
+    """레시피별 재료 테이블 (CSR, 읽기 전용)"""
+
+    def __init__(
+        self,
+        vocab: List[str],
+        offsets: np.ndarray,
+        ids: np.ndarray,
+        entry_rows: Optional[np.ndarray] = None,
+    ):
+        """
+        Args:
+            vocab: 재료명 사전 (ID → 재료명)
+            offsets: 레시피별 시작 위치 (int64, 길이 = 레시피 수 + 1)
+            ids: 재료 ID 배열 (int32)
+            entry_rows: 재료 항목별 레시피 번호 (스냅샷, None이면 계산)
+        """
+        self.vocab = vocab
+        self.offsets = offsets
+        self.ids = ids
+        self.normalized_vocab = [normalize_ingredient_name(v) for v in vocab]
+
+        # 각 재료 항목이 속한 레시피 번호 (재료 ID 마스크 → 레시피 마스크 변환용)
+        if entry_rows is None:
+            entry_rows = np.repeat(np.arange(len(offsets) - 1, dtype=np.int32), np.diff(offsets))
+        self.entry_rows = entry_rows
+
+    @classmethod
+    def from_lists(cls, ingredient_lists: Iterable[List[str]]) -> "IngredientTable":
+        """재료명 리스트들로 테이블 생성 (재료명 → ID 인터닝)"""
+        vocab: dict[str, int] = {}
+        ids: List[int] = []
+        lengths: List[int] = []
+        for names in ingredient_lists:
+            for name in names:
+                ids.append(vocab.setdefault(name, len(vocab)))
+            lengths.append(len(names))
+
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(lengths)
+        return cls(list(vocab), offsets, np.asarray(ids, dtype=np.int32))
+
+    @classmethod
+    def from_columns(cls, ingredients_parsed: Iterable, ingredients_raw: Optional[Iterable] = None) -> "IngredientTable":
+        """ingredients_parsed(JSON) / ingredients_raw 컬럼을 파싱하여 테이블 생성"""
+        if ingredients_raw is None:
+            return cls.from_lists(parse_ingredient_names(p) for p in ingredients_parsed)
+        return cls.from_lists(
+            parse_ingredient_names(p, r) for p, r in zip(ingredients_parsed, ingredients_raw)
+        )
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def names(self, row: int) -> List[str]:
+        """레시피 row의 재료명 리스트"""
+        start, end = self.offsets[row], self.offsets[row + 1]
+        return [self.vocab[i] for i in self.ids[start:end]]
+
+    def rows_containing(self, vocab_mask: np.ndarray) -> np.ndarray:
+        """
+        재료 ID 마스크 → 레시피 마스크
+
+        Args:
+            vocab_mask: 재료 ID별 bool 배열
+
+        Returns:
+            해당 재료를 하나라도 포함한 레시피의 bool 배열
+        """
+        rows = np.zeros(len(self), dtype=bool)
+        rows[self.entry_rows[vocab_mask[self.ids]]] = True
+        return rows
+
+
+class IngredientIndex:
+    """
+    재료명 n-gram 역색인 (matches_restriction과 동일한 매칭 규칙)
+
+    - restriction in ingredient: 제한 재료의 bigram 포스팅 교집합 → 후보 재료만 실제 부분 문자열 확인
+      (1~2글자 제한 재료는 unigram/bigram 포스팅이 곧 정답)
+    - ingredient in restriction: 제한 재료의 모든 부분 문자열을 정규화 재료명 사전에서 조회
+    - 재료 ID → 레시피: CSR 재료 테이블의 전치 (재료별 레시피 목록)
+    """
+
+    def __init__(self, table: IngredientTable, arrays: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Args:
+            table: 레시피별 재료 테이블
+            arrays: to_arrays()로 저장한 색인 배열 (스냅샷, None이면 계산)
+        """
+        self.table = table
+        self.normalized_vocab = table.normalized_vocab
+
+        # 정규화 재료명 → 재료 ID (대소문자/공백만 다른 재료는 같은 키)
+        self.by_name: Dict[str, List[int]] = {}
+        for vocab_id, name in enumerate(self.normalized_vocab):
+            self.by_name.setdefault(name, []).append(vocab_id)
+        if arrays is not None:
+            self.ngrams = NgramIndex(self.normalized_vocab, sub_arrays(arrays, "ngrams"))
+            self.recipe_rows = arrays["recipe_rows"]
+            self.recipe_offsets = arrays["recipe_offsets"]
+            return
+        self.ngrams = NgramIndex(self.normalized_vocab)
+
+        # 재료 ID → 레시피 번호 (CSC)
+        order = np.argsort(table.ids, kind="stable")
+        self.recipe_rows = table.entry_rows[order]
+        self.recipe_offsets = np.zeros(len(table.vocab) + 1, dtype=np.int64)
+        self.recipe_offsets[1:] = np.cumsum(np.bincount(table.ids, minlength=len(table.vocab)))
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """색인 배열 (스냅샷 저장용)"""
+        return {
+            "recipe_rows": self.recipe_rows,
+            "recipe_offsets": self.recipe_offsets,
+            **prefix_arrays("ngrams", self.ngrams.to_arrays()),
+        }
+
+    def _containing(self, restriction: str) -> np.ndarray:
+        """restriction을 부분 문자열로 포함하는 재료 ID"""
+        return self.ngrams.containing(restriction)
+
+    def _contained_in(self, restriction: str) -> List[int]:
+        """restriction의 부분 문자열인 재료 ID (빈 재료명 포함)"""
+        ids: List[int] = list(self.by_name.get("", []))
+        substrings = {
+            restriction[start:end]
+            for start in range(len(restriction))
+            for end in range(start + 1, len(restriction) + 1)
+        }
+        for substring in substrings:
+            ids.extend(self.by_name.get(substring, []))
+        return ids
+
+    def matching_ingredients(self, restrictions: List[str], bidirectional: bool = True) -> np.ndarray:
+        """
+        제한 재료와 매칭되는 재료 ID
+
+        Args:
+            restrictions: 제외 재료 리스트
+            bidirectional: False면 "restriction in ingredient" 방향만 매칭
+
+        Returns:
+            재료 ID 배열 (중복 제거)
+        """
+        parts = []
+        for restriction in restrictions:
+            normalized = normalize_ingredient_name(restriction)
+            parts.append(self._containing(normalized))
+            if bidirectional:
+                parts.append(np.asarray(self._contained_in(normalized), dtype=np.int32))
+        if not parts:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(np.concatenate(parts))
+
+    def contained_in_rows(self, restrictions: List[str]) -> np.ndarray:
+        """
+        재료명이 제한 재료의 부분 문자열인 레시피 마스크 ("ingredient in restriction" 방향만)
+
+        Args:
+            restrictions: 제외 재료 리스트
+
+        Returns:
+            레시피별 bool 배열
+        """
+        ids = [i for restriction in restrictions for i in self._contained_in(normalize_ingredient_name(restriction))]
+        return self.rows_with(np.unique(np.asarray(ids, dtype=np.int64)))
+
+    def excluded_rows(self, restrictions: List[str], bidirectional: bool = True) -> np.ndarray:
+        """
+        제한 재료를 포함한 레시피 마스크
+
+        Args:
+            restrictions: 제외 재료 리스트
+            bidirectional: False면 "restriction in ingredient" 방향만 매칭
+
+        Returns:
+            레시피별 bool 배열 (True = 제한 재료 포함 → 제외)
+        """
+        return self.rows_with(self.matching_ingredients(restrictions, bidirectional))
+
+    def rows_with(self, vocab_ids: np.ndarray) -> np.ndarray:
+        """
+        재료 ID 중 하나라도 포함한 레시피 마스크
+
+        Args:
+            vocab_ids: 재료 ID 배열
+
+        Returns:
+            레시피별 bool 배열
+        """
+        rows = np.zeros(len(self.table), dtype=bool)
+        vocab_ids = np.asarray(vocab_ids, dtype=np.int64)
+        if len(vocab_ids) == 0:
+            return rows
+
+        starts = self.recipe_offsets[vocab_ids]
+        ends = self.recipe_offsets[vocab_ids + 1]
+        rows[np.concatenate([self.recipe_rows[a:b] for a, b in zip(starts.tolist(), ends.tolist())])] = True
+        return rows
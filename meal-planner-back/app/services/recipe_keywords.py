@@ -0,0 +1,161 @@
+"""
+레시피 키워드 색인
+
+RecipeSearchService 키워드 검색(name, category, main_ingredient 부분 문자열 매칭)용 역색인
+- 컬럼별로 값을 사전 인코딩 (같은 카테고리/주재료 문자열은 한 번만 색인)
+- 사전 문자열의 n-gram 역색인으로 키워드를 포함하는 값 ID 조회
+- 값 ID → 레시피: 값별 레시피 목록 (CSC), 일치 값이 많으면 레시피별 값 코드로 한 번에 조회
+- 키워드 여러 개 / 컬럼 여러 개 = 레시피 목록 합집합
+- 키워드별 결과는 packed 비트셋으로 캐시 (레시피 8개 = 1바이트)
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.services.ngram_index import NgramIndex
+from app.utils.packed_arrays import (
+    StringTable,
+    encode_string_table,
+    prefix_arrays,
+    sub_arrays,
+)
+
+# 키워드 검색 대상 컬럼
+KEYWORD_COLUMNS = ["name", "category", "main_ingredient"]
+
+# 일치하는 값이 이보다 많으면 값별 목록 대신 레시피 코드 배열로 조회
+DIRECT_LOOKUP_MAX_VALUES = 256
+
+# 키워드별 결과 캐시 크기 (에이전트 검색어는 "아침 초급 30분"처럼 키워드 종류가 적음)
+KEYWORD_CACHE_SIZE = 256
+
+
+def _lower(value: str) -> str:
+    """소문자 변환 (바뀌는 글자가 없으면 원래 문자열 객체를 그대로 사용 → 한글 레시피명은 복사 없음)"""
+    lowered = value.lower()
+    return value if lowered == value else lowered
+
+
+class _ColumnIndex:
+    """문자열 컬럼 하나의 키워드 색인"""
+
+    def __init__(self, values: pd.Series, arrays: Optional[Dict[str, np.ndarray]] = None):
+        if arrays is not None:
+            # 값 문자열은 후보 확인 때만 디코딩 (레시피명처럼 값이 많은 컬럼도 문자열 객체를 만들지 않음)
+            strings = StringTable(arrays["values_offsets"], arrays["values_data"])
+            self.ngrams = NgramIndex(strings, sub_arrays(arrays, "ngrams"))
+            self.codes = arrays["codes"]
+            self.value_count = len(strings)
+            self.rows = arrays["rows"]
+            self.offsets = arrays["offsets"]
+            return
+
+        codes, uniques = pd.factorize(values.astype("object"), use_na_sentinel=True)
+        self.ngrams = NgramIndex([_lower(str(u)) for u in uniques])
+
+        # 결측값(-1)은 마지막 값 ID로 보내 값 마스크 조회 시 항상 False
+        self.codes = np.where(codes >= 0, codes, len(uniques)).astype(np.int32)
+        self.value_count = len(uniques)
+
+        # 값 ID → 레시피 번호 (CSC, 결측값 제외)
+        present = np.flatnonzero(codes >= 0)
+        order = np.argsort(codes[present], kind="stable")
+        self.rows = present[order]
+        self.offsets = np.zeros(len(uniques) + 1, dtype=np.int64)
+        self.offsets[1:] = np.cumsum(np.bincount(codes[present], minlength=len(uniques)))
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """색인 배열 (스냅샷 저장용)"""
+        values_offsets, values_data = encode_string_table(
+            [self.ngrams.strings[i] for i in range(len(self.ngrams.strings))]
+        )
+        return {
+            "values_offsets": values_offsets,
+            "values_data": values_data,
+            "codes": self.codes,
+            "rows": self.rows,
+            "offsets": self.offsets,
+            **prefix_arrays("ngrams", self.ngrams.to_arrays()),
+        }
+
+    def mark_rows(self, keyword: str, matched: np.ndarray) -> None:
+        """keyword를 포함하는 값을 가진 레시피를 matched에 표시"""
+        value_ids = self.ngrams.containing(keyword)
+        if len(value_ids) == 0:
+            return
+
+        if len(value_ids) <= DIRECT_LOOKUP_MAX_VALUES:
+            # 일치하는 값이 적으면 값별 레시피 목록만 모음
+            starts = self.offsets[value_ids].tolist()
+            ends = self.offsets[value_ids + 1].tolist()
+            matched[np.concatenate([self.rows[a:b] for a, b in zip(starts, ends)])] = True
+        else:
+            # 많으면 값 마스크를 레시피 코드로 한 번에 조회
+            value_mask = np.zeros(self.value_count + 1, dtype=bool)
+            value_mask[value_ids] = True
+            matched |= value_mask[self.codes]
+
+
+class KeywordIndex:
+    """레시피 키워드 색인 (읽기 전용)"""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        columns: List[str] = KEYWORD_COLUMNS,
+        arrays: Optional[Dict[str, np.ndarray]] = None,
+    ):
+        """
+        Args:
+            df: 레시피 DataFrame (RangeIndex)
+            columns: 색인할 문자열 컬럼 (없는 컬럼은 건너뜀)
+            arrays: to_arrays()로 저장한 색인 배열 (스냅샷, None이면 계산)
+        """
+        self.row_count = len(df)
+        self.columns: Dict[str, _ColumnIndex] = {
+            col: _ColumnIndex(df[col], sub_arrays(arrays, col) if arrays is not None else None)
+            for col in columns
+            if col in df.columns
+        }
+        # 키워드 → 일치 레시피 (packed), 가득 차면 오래된 것부터 제거
+        self._cache: Dict[str, np.ndarray] = {}
+        self._cache_lock = threading.Lock()
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """컬럼별 색인 배열 (스냅샷 저장용)"""
+        arrays = {}
+        for col, column in self.columns.items():
+            arrays.update(prefix_arrays(col, column.to_arrays()))
+        return arrays
+
+    def _keyword_rows(self, keyword: str) -> np.ndarray:
+        """키워드 하나와 일치하는 레시피 마스크 (캐시 사용)"""
+        packed = self._cache.get(keyword)
+        if packed is None:
+            matched = np.zeros(self.row_count, dtype=bool)
+            for column in self.columns.values():
+                column.mark_rows(keyword, matched)
+            packed = np.packbits(matched)
+            with self._cache_lock:
+                if len(self._cache) >= KEYWORD_CACHE_SIZE:
+                    self._cache.pop(next(iter(self._cache)), None)
+                self._cache[keyword] = packed
+        return np.unpackbits(packed, count=self.row_count).view(bool)
+
+    def matching_rows(self, keywords: List[str]) -> np.ndarray:
+        """
+        키워드 중 하나라도 컬럼 값에 포함된 레시피 마스크 (대소문자 무시)
+
+        Args:
+            keywords: 검색 키워드 리스트
+
+        Returns:
+            레시피별 bool 배열
+        """
+        matched = np.zeros(self.row_count, dtype=bool)
+        for keyword in keywords:
+            matched |= self._keyword_rows(keyword.lower())
+        return matched
@@ -0,0 +1,295 @@
+"""
+레시피 영양 공간 최근접 이웃 색인 (KD-tree)
+
+대체 레시피 검색 = (칼로리, 탄수화물%, 단백질%, 지방%, 조리시간) 공간의 k-NN
+- 로드 시 1회 KD-tree 구축 (노드별 bounding box, 리프는 연속 구간 → 리프 단위 벡터 연산)
+- 조회: 노드 box로 계산한 유사도 점수 하한 순으로 best-first 탐색
+  · 하한은 recipe_scoring.similarity_scores와 같은 식(상한 클리핑 포함)에 box 거리를 넣은 값
+    → 남은 노드의 하한이 현재 k번째 점수보다 크면 종료 (전체 필터링+점수 계산과 같은 결과)
+  · 하드 필터: 칼로리 범위/최대 조리시간은 box로 노드 단위 가지치기,
+    제한 재료/제외 레시피는 리프에서 마스킹 (필요한 만큼 더 탐색)
+- 필터가 너무 좁아 방문 레시피 수가 max_visits를 넘으면 None → 호출부에서 전체 계산 경로 사용
+"""
+
+import heapq
+from bisect import insort
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.services.recipe_scoring import similarity_scores
+
+# 리프 크기 (리프 하나 = 벡터 연산 한 번)
+LEAF_SIZE = 64
+
+# 특징 차원: 칼로리, 탄수화물%, 단백질%, 지방%, 조리시간
+CALORIES, CARB, PROTEIN, FAT, TIME = range(5)
+
+# 분할 차원 선택용 가중치 (유사도 점수에서 단위 차이 1의 기여도)
+_SPLIT_WEIGHTS = np.array([0.04, 0.5, 0.5, 0.5, 0.05])
+
+
+class RecipeNeighborIndex:
+    """레시피 영양 공간 KD-tree (읽기 전용)"""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        difficulty_level: np.ndarray,
+        arrays: Optional[Dict[str, np.ndarray]] = None,
+    ):
+        """
+        Args:
+            df: 정규화된 레시피 DataFrame (RangeIndex)
+            difficulty_level: 레시피별 난이도 레벨
+            arrays: to_arrays()로 저장한 트리 배열 (스냅샷, None이면 구축)
+        """
+        n = len(df)
+        self.row_count = n
+        self.difficulty_level = difficulty_level
+        self.calories = df["calories"].to_numpy(dtype=np.float64)
+        self.cooking_time = df["cooking_time"].to_numpy(dtype=np.float64)
+        self.names = df["name"].to_numpy()
+
+        self.has_macros = all(col in df.columns for col in ("carb_g", "protein_g", "fat_g"))
+        if self.has_macros:
+            self.carb_g = df["carb_g"].to_numpy(dtype=np.float64)
+            self.protein_g = df["protein_g"].to_numpy(dtype=np.float64)
+            self.fat_g = df["fat_g"].to_numpy(dtype=np.float64)
+        else:
+            self.carb_g = self.protein_g = self.fat_g = None
+
+        if arrays is not None:
+            self._attach(arrays)
+            return
+
+        if self.has_macros:
+            total = self.carb_g + self.protein_g + self.fat_g
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratios = [(values / total) * 100 for values in (self.carb_g, self.protein_g, self.fat_g)]
+        else:
+            ratios = [np.zeros(n)] * 3
+
+        # 탄단지 결측/합계 0 레시피는 비율 좌표 0으로 둠
+        # (점수가 NaN 또는 탄단지 항 최대값이라 어떤 하한보다도 크거나 같음 → 하한 유효)
+        features = np.column_stack([self.calories, *ratios, self.cooking_time])
+        features[:, CARB:FAT + 1] = np.nan_to_num(features[:, CARB:FAT + 1], nan=0.0, posinf=0.0, neginf=0.0)
+
+        # 칼로리/조리시간 결측 레시피는 어떤 범위 조건에도 걸리지 않으므로 색인에서 제외
+        valid = ~np.isnan(features[:, CALORIES]) & ~np.isnan(features[:, TIME])
+        self.rows = np.flatnonzero(valid)
+        self._build(features)
+
+    def _build(self, features: np.ndarray) -> None:
+        """KD-tree 구축 (self.rows를 리프 구간이 연속되도록 재배열)"""
+        rows = self.rows
+        lows: List[np.ndarray] = []
+        highs: List[np.ndarray] = []
+        starts: List[int] = []
+        ends: List[int] = []
+        children: List[List[int]] = []
+
+        def add_node(start: int, end: int) -> int:
+            points = features[rows[start:end]]
+            lows.append(points.min(axis=0) if end > start else np.full(5, np.inf))
+            highs.append(points.max(axis=0) if end > start else np.full(5, -np.inf))
+            starts.append(start)
+            ends.append(end)
+            children.append([-1, -1])
+            return len(starts) - 1
+
+        stack = [add_node(0, len(rows))]
+        while stack:
+            node = stack.pop()
+            start, end = starts[node], ends[node]
+            if end - start <= LEAF_SIZE:
+                continue
+
+            # 점수 기여도 기준으로 가장 넓게 퍼진 차원을 중앙값으로 분할
+            dim = int(np.argmax((highs[node] - lows[node]) * _SPLIT_WEIGHTS))
+            middle = (end - start) // 2
+            block = rows[start:end]
+            order = np.argpartition(features[block, dim], middle)
+            rows[start:end] = block[order]
+
+            left = add_node(start, start + middle)
+            right = add_node(start + middle, end)
+            children[node] = [left, right]
+            stack.extend([left, right])
+
+        self._attach({
+            "rows": rows,
+            "node_low": np.vstack(lows),
+            "node_high": np.vstack(highs),
+            "node_start": np.asarray(starts, dtype=np.int64),
+            "node_end": np.asarray(ends, dtype=np.int64),
+            "node_children": np.asarray(children, dtype=np.int64),
+        })
+
+    def _attach(self, arrays: Dict[str, np.ndarray]) -> None:
+        """트리 배열 연결 (구축 결과 또는 스냅샷의 공유 배열)"""
+        self.rows = arrays["rows"]
+        self.node_low = arrays["node_low"]
+        self.node_high = arrays["node_high"]
+        self.node_start = arrays["node_start"]
+        self.node_end = arrays["node_end"]
+        self.node_children = arrays["node_children"]
+
+        # 탐색 루프용 Python 리스트 (조회마다 변환하지 않도록, 노드 수 ≈ 레시피 수 / LEAF_SIZE * 2)
+        self._children = self.node_children.tolist()
+        self._ranges = list(zip(self.node_start.tolist(), self.node_end.tolist()))
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """트리 배열 (스냅샷 저장용)"""
+        return {
+            "rows": self.rows,
+            "node_low": self.node_low,
+            "node_high": self.node_high,
+            "node_start": self.node_start,
+            "node_end": self.node_end,
+            "node_children": self.node_children,
+        }
+
+    def _lower_bounds(
+        self,
+        target_calories: float,
+        target_time: Optional[float],
+        target_ratios: Optional[Tuple[float, float, float]],
+        use_macro_scoring: bool,
+    ) -> np.ndarray:
+        """노드별 유사도 점수 하한 (box까지의 차원별 최소 거리를 점수 식에 대입)"""
+        low, high = self.node_low, self.node_high
+
+        def gap(dim: int, target: float) -> np.ndarray:
+            return np.maximum(np.maximum(low[:, dim] - target, target - high[:, dim]), 0)
+
+        calorie_score = np.minimum(gap(CALORIES, target_calories) / 10, 100)
+        if target_time:
+            time_score = np.minimum(gap(TIME, target_time) / 2, 100)
+        else:
+            time_score = np.zeros(len(low))
+
+        if not use_macro_scoring:
+            return calorie_score + (time_score * 0.5)
+
+        if target_ratios is None:
+            macro_score = np.zeros(len(low))
+        else:
+            macro_score = np.minimum(
+                gap(CARB, target_ratios[0]) + gap(PROTEIN, target_ratios[1]) + gap(FAT, target_ratios[2]),
+                100.0,
+            )
+        return (calorie_score * 0.4) + (macro_score * 0.5) + (time_score * 0.1)
+
+    def nearest(
+        self,
+        k: int,
+        target_calories: float,
+        target_time: Optional[float],
+        target_difficulty: Optional[str] = None,
+        target_carb_g: Optional[float] = None,
+        target_protein_g: Optional[float] = None,
+        target_fat_g: Optional[float] = None,
+        calorie_range: Optional[Tuple[float, float]] = None,
+        max_cooking_time: Optional[float] = None,
+        excluded: Optional[np.ndarray] = None,
+        exclude_names: Optional[Set[str]] = None,
+        max_visits: Optional[int] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        하드 필터를 만족하는 유사도 점수 상위 k개 레시피
+
+        Args:
+            k: 결과 개수
+            target_calories / target_time / target_difficulty: 목표값 (similarity_scores 참고)
+            target_carb_g / target_protein_g / target_fat_g: 목표 탄단지(g) - 선택사항
+            calorie_range: 칼로리 범위 (하한, 상한) - 양 끝 포함
+            max_cooking_time: 최대 조리 시간
+            excluded: 레시피별 제외 마스크 (제한 재료 등)
+            exclude_names: 제외 레시피 이름
+            max_visits: 방문 레시피 수 상한 (초과 시 None 반환)
+
+        Returns:
+            레시피 위치 배열 (점수 오름차순, 동점은 데이터 순서) 또는 None
+        """
+        use_macro_scoring = self.has_macros and all(
+            value is not None for value in (target_carb_g, target_protein_g, target_fat_g)
+        )
+        target_ratios = None
+        if use_macro_scoring:
+            target_total = target_carb_g + target_protein_g + target_fat_g
+            if target_total != 0:
+                target_ratios = tuple(
+                    (value / target_total) * 100 for value in (target_carb_g, target_protein_g, target_fat_g)
+                )
+
+        bounds = self._lower_bounds(target_calories, target_time, target_ratios, use_macro_scoring)
+
+        # box가 하드 필터와 겹치지 않는 노드는 하한을 무한대로 (방문하지 않음)
+        if calorie_range is not None:
+            bounds[(self.node_high[:, CALORIES] < calorie_range[0]) | (self.node_low[:, CALORIES] > calorie_range[1])] = np.inf
+        if max_cooking_time:
+            bounds[self.node_low[:, TIME] > max_cooking_time] = np.inf
+        bounds = bounds.tolist()
+        children = self._children
+
+        best: List[Tuple[float, int]] = []  # (점수, 위치) 오름차순, NaN 점수 = inf
+        visited = 0
+        heap = [(bounds[0], 0)]
+        while heap:
+            bound, node = heapq.heappop(heap)
+            if bound == np.inf or (len(best) == k and bound > best[-1][0]):
+                break
+
+            left, right = children[node]
+            if left >= 0:
+                heapq.heappush(heap, (bounds[left], left))
+                heapq.heappush(heap, (bounds[right], right))
+                continue
+
+            start, end = self._ranges[node]
+            rows = self.rows[start:end]
+            visited += len(rows)
+            if max_visits is not None and visited > max_visits:
+                return None
+
+            keep = np.ones(len(rows), dtype=bool)
+            if calorie_range is not None:
+                calories = self.calories[rows]
+                keep &= (calories >= calorie_range[0]) & (calories <= calorie_range[1])
+            if max_cooking_time:
+                keep &= self.cooking_time[rows] <= max_cooking_time
+            if excluded is not None:
+                keep &= ~excluded[rows]
+            if exclude_names:
+                keep &= np.fromiter((name not in exclude_names for name in self.names[rows]), dtype=bool, count=len(rows))
+            rows = rows[keep]
+            if len(rows) == 0:
+                continue
+
+            scores = similarity_scores(
+                calories=self.calories[rows],
+                cooking_time=self.cooking_time[rows],
+                difficulty_level=self.difficulty_level[rows],
+                target_calories=target_calories,
+                target_time=target_time,
+                target_difficulty=target_difficulty,
+                carb_g=self.carb_g[rows] if use_macro_scoring else None,
+                protein_g=self.protein_g[rows] if use_macro_scoring else None,
+                fat_g=self.fat_g[rows] if use_macro_scoring else None,
+                target_carb_g=target_carb_g,
+                target_protein_g=target_protein_g,
+                target_fat_g=target_fat_g,
+            )
+            scores = np.where(np.isnan(scores), np.inf, scores)
+            if len(best) == k:
+                candidates = scores <= best[-1][0]
+                rows, scores = rows[candidates], scores[candidates]
+            for score, position in zip(scores.tolist(), rows.tolist()):
+                if len(best) < k or (score, position) < best[-1]:
+                    insort(best, (score, position))
+                    del best[k:]
+
+        return np.asarray([position for _, position in best], dtype=np.int64)
+
@@ -0,0 +1,176 @@
+"""
+레시피 후보 파티션 (난이도 × 조리시간 구간 × 칼로리 10분위)
+
+영양사/셰프 검색은 매번 "아침 초급 30분"처럼 같은 몇십 가지 조건으로 전체 테이블을 다시 필터링함
+→ 로드 시 레시피를 (난이도, 조리시간 구간, 칼로리 10분위) 셀로 나눠 셀별 위치 배열을 1회 계산
+- 레시피는 정확히 한 셀에 속함 (위치 배열 전체 = 레시피 수 × 4바이트)
+- 조회: 조건에 걸리는 셀만 모아서 경계 셀(조리시간/칼로리 구간이 조건과 일부만 겹침)만 실제 값 확인
+- 셀 크기는 offsets 차이로 바로 계산 → 정렬 색인과 비교해 더 작은 쪽에서 후보 조회 시작
+- 식사 타입(아침/점심/저녁) 컬럼은 데이터에 없음 → 쿼리 단어는 기존 키워드 역색인으로 처리
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.utils.constants import COOKING_TIME_LIMITS
+
+# 조리시간 구간 상한 (분, 사용자 조리시간 선택지 기준) - 마지막 상한보다 긴 레시피는 별도 구간
+COOKING_TIME_BUCKETS = sorted(set(COOKING_TIME_LIMITS.values()))
+
+# 칼로리 분위 수 (결측 칼로리는 별도 구간, 칼로리 조건이 있으면 항상 제외)
+CALORIE_BUCKETS = 10
+
+
+class CandidatePartitions:
+    """(난이도 코드, 조리시간 구간, 칼로리 분위) 셀별 레시피 위치 (읽기 전용)"""
+
+    def __init__(self, df: pd.DataFrame, arrays: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Args:
+            df: 정규화된 레시피 DataFrame (difficulty는 Categorical, cooking_time 결측 없음)
+            arrays: to_arrays()로 저장한 셀 배열 (스냅샷, None이면 계산)
+        """
+        self.calories = df["calories"].to_numpy(dtype=np.float64)
+        self.cooking_time = df["cooking_time"].to_numpy(dtype=np.float64)
+        self.difficulty_count = max(len(df["difficulty"].cat.categories), 1)
+        self.time_edges = np.asarray(COOKING_TIME_BUCKETS, dtype=np.float64)
+        self.time_count = len(self.time_edges) + 1
+        self.calorie_count = CALORIE_BUCKETS + 1
+
+        if arrays is not None:
+            self.calorie_edges = arrays["calorie_edges"]
+            self.order = arrays["order"]
+            self.offsets = arrays["offsets"]
+            return
+
+        valid = self.calories[~np.isnan(self.calories)]
+        quantiles = np.linspace(0, 1, CALORIE_BUCKETS + 1)[1:-1]
+        self.calorie_edges = np.quantile(valid, quantiles) if len(valid) else np.zeros(CALORIE_BUCKETS - 1)
+
+        cells = self._cell_ids(
+            df["difficulty"].cat.codes.to_numpy().astype(np.int64),
+            self._time_buckets(self.cooking_time),
+            self._calorie_buckets(self.calories),
+        )
+        # 셀 순서로 안정 정렬 → 셀 안에서는 데이터 순서 유지
+        self.order = np.argsort(cells, kind="stable").astype(np.int32)
+        self.offsets = np.zeros(self._cell_total() + 1, dtype=np.int64)
+        self.offsets[1:] = np.cumsum(np.bincount(cells, minlength=self._cell_total()))
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """셀 배열 (스냅샷 저장용)"""
+        return {"calorie_edges": self.calorie_edges, "order": self.order, "offsets": self.offsets}
+
+    def _cell_total(self) -> int:
+        return self.difficulty_count * self.time_count * self.calorie_count
+
+    def _cell_ids(self, difficulty: np.ndarray, time: np.ndarray, calorie: np.ndarray) -> np.ndarray:
+        return (difficulty * self.time_count + time) * self.calorie_count + calorie
+
+    def _time_buckets(self, cooking_time: np.ndarray) -> np.ndarray:
+        """조리시간 → 구간 (상한 이하인 첫 구간, 모든 상한보다 길면 마지막 구간)"""
+        return np.searchsorted(self.time_edges, cooking_time, side="left")
+
+    def _calorie_buckets(self, calories: np.ndarray) -> np.ndarray:
+        """칼로리 → 분위 (결측은 마지막 구간)"""
+        buckets = np.searchsorted(self.calorie_edges, calories, side="right")
+        buckets[np.isnan(calories)] = CALORIE_BUCKETS
+        return buckets
+
+    def _select(
+        self,
+        difficulty_codes: Optional[Sequence[int]],
+        max_cooking_time: Optional[float],
+        calorie_range: Optional[Tuple[Optional[float], Optional[float]]],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        조건에 걸리는 셀 번호와 경계 셀 여부
+
+        Returns:
+            (셀 번호 배열, 값 확인이 필요한 경계 셀인지 여부 배열)
+        """
+        codes = np.arange(self.difficulty_count) if difficulty_codes is None else np.asarray(
+            [code for code in difficulty_codes if 0 <= code < self.difficulty_count], dtype=np.int64
+        )
+
+        times = np.arange(self.time_count)
+        time_boundary = np.zeros(self.time_count, dtype=bool)
+        if max_cooking_time is not None:
+            last = int(np.searchsorted(self.time_edges, max_cooking_time, side="left"))
+            times = times[:last + 1]
+            time_boundary = time_boundary[:last + 1]
+            # 조건이 구간 상한과 정확히 같으면 마지막 구간도 전부 포함 (확인 불필요)
+            time_boundary[last] = last >= len(self.time_edges) or self.time_edges[last] != max_cooking_time
+
+        calories = np.arange(self.calorie_count)
+        calorie_boundary = np.zeros(self.calorie_count, dtype=bool)
+        if calorie_range is not None and calorie_range != (None, None):
+            low, high = calorie_range
+            first = 0 if low is None else int(np.searchsorted(self.calorie_edges, low, side="right"))
+            last = CALORIE_BUCKETS - 1 if high is None else int(np.searchsorted(self.calorie_edges, high, side="right"))
+            # 결측 구간 제외, 양 끝 분위만 조건과 일부 겹침
+            calories = np.arange(first, last + 1)
+            calorie_boundary = np.zeros(len(calories), dtype=bool)
+            if len(calories):
+                calorie_boundary[0] = low is not None
+                calorie_boundary[-1] |= high is not None
+
+        code_grid, time_grid, calorie_grid = np.meshgrid(codes, times, calories, indexing="ij")
+        boundary = time_boundary[:, None] | calorie_boundary[None, :]
+        boundary = np.broadcast_to(boundary, code_grid.shape)
+        return self._cell_ids(code_grid, time_grid, calorie_grid).ravel(), boundary.ravel()
+
+    def count(
+        self,
+        difficulty_codes: Optional[Sequence[int]] = None,
+        max_cooking_time: Optional[float] = None,
+        calorie_range: Optional[Tuple[Optional[float], Optional[float]]] = None,
+    ) -> int:
+        """조건에 걸리는 셀의 레시피 수 (경계 셀 확인 전 상한, 배열 복사 없음)"""
+        cells, _ = self._select(difficulty_codes, max_cooking_time, calorie_range)
+        return int(np.sum(self.offsets[cells + 1] - self.offsets[cells]))
+
+    def query(
+        self,
+        difficulty_codes: Optional[Sequence[int]] = None,
+        max_cooking_time: Optional[float] = None,
+        calorie_range: Optional[Tuple[Optional[float], Optional[float]]] = None,
+    ) -> np.ndarray:
+        """
+        조건을 모두 만족하는 레시피 위치
+
+        Args:
+            difficulty_codes: 허용 난이도 Categorical 코드 (None이면 제한 없음)
+            max_cooking_time: 최대 조리 시간 (분, None이면 제한 없음)
+            calorie_range: 칼로리 (하한, 상한) - 양 끝 포함 (None이면 제한 없음)
+
+        Returns:
+            레시피 위치 배열 (오름차순 = 원래 데이터 순서, RecipeRangeIndex.query와 같은 결과)
+        """
+        cells, boundary = self._select(difficulty_codes, max_cooking_time, calorie_range)
+        starts = self.offsets[cells]
+        ends = self.offsets[cells + 1]
+        nonempty = ends > starts
+        if not nonempty.any():
+            return np.zeros(0, dtype=np.int64)
+
+        # 셀 안쪽은 조건을 이미 만족 → 경계 셀의 레시피만 실제 값 확인
+        inner = [self.order[start:end] for start, end in zip(starts[nonempty & ~boundary], ends[nonempty & ~boundary])]
+        edge = [self.order[start:end] for start, end in zip(starts[nonempty & boundary], ends[nonempty & boundary])]
+        if edge:
+            edge_positions = np.concatenate(edge)
+            keep = np.ones(len(edge_positions), dtype=bool)
+            if max_cooking_time is not None:
+                keep &= self.cooking_time[edge_positions] <= max_cooking_time
+            if calorie_range is not None:
+                low, high = calorie_range
+                values = self.calories[edge_positions]
+                if low is not None:
+                    keep &= values >= low
+                if high is not None:
+                    keep &= values <= high
+            inner.append(edge_positions[keep])
+
+        return np.sort(np.concatenate(inner).astype(np.int64))
@@ -0,0 +1,121 @@
+"""
+레시피 숫자 컬럼 정렬 색인
+
+칼로리(기본 정렬 순서), 조리시간, 탄단지 컬럼별로 정렬 순열을 로드 시 1회 계산
+- 범위 조건: 이진 탐색(np.searchsorted)으로 정렬 순열의 구간만 잘라냄
+- 여러 범위 조건: 가장 좁은 구간을 후보로 잡고 나머지 조건은 후보 위치의 값만 확인 (교집합)
+- 전체 DataFrame 복사/불리언 마스크 없음 → 조회 비용은 후보 수에 비례
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.utils.packed_arrays import prefix_arrays, sub_arrays
+
+# (하한, 상한) - 양 끝 포함, None이면 제한 없음
+Range = Tuple[Optional[float], Optional[float]]
+
+
+class SortedColumn:
+    """숫자 컬럼 하나의 정렬 순열 (NaN은 끝으로 밀려나 어떤 범위에도 포함되지 않음)"""
+
+    def __init__(self, values: np.ndarray, arrays: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Args:
+            values: 레시피 위치 순서의 컬럼 값 (float64)
+            arrays: to_arrays()로 저장한 정렬 순열 (스냅샷, None이면 계산)
+        """
+        self.values = values
+        if arrays is not None:
+            self.order = arrays["order"]
+            self.sorted_values = arrays["sorted_values"]
+        else:
+            self.order = np.argsort(values, kind="stable")
+            self.sorted_values = values[self.order]
+        self.valid_count = int(np.count_nonzero(~np.isnan(values)))
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """정렬 순열 배열 (스냅샷 저장용)"""
+        return {"order": self.order, "sorted_values": self.sorted_values}
+
+    def bounds(self, low: Optional[float], high: Optional[float]) -> Tuple[int, int]:
+        """범위 [low, high]에 해당하는 정렬 순열 구간 (start, end)"""
+        values = self.sorted_values[:self.valid_count]
+        start = 0 if low is None else int(np.searchsorted(values, low, side="left"))
+        end = self.valid_count if high is None else int(np.searchsorted(values, high, side="right"))
+        return start, max(start, end)
+
+    def positions(self, low: Optional[float], high: Optional[float]) -> np.ndarray:
+        """범위 [low, high]에 해당하는 레시피 위치 (값 순서)"""
+        start, end = self.bounds(low, high)
+        return self.order[start:end]
+
+
+class RecipeRangeIndex:
+    """레시피 숫자 컬럼 정렬 색인 (읽기 전용)"""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        columns: List[str],
+        arrays: Optional[Dict[str, np.ndarray]] = None,
+    ):
+        """
+        Args:
+            df: 정규화된 레시피 DataFrame (RangeIndex)
+            columns: 색인할 숫자 컬럼
+            arrays: to_arrays()로 저장한 정렬 순열 (스냅샷, None이면 계산)
+        """
+        self.row_count = len(df)
+        self.columns: Dict[str, SortedColumn] = {
+            col: SortedColumn(
+                df[col].to_numpy(dtype=np.float64),
+                sub_arrays(arrays, col) if arrays is not None else None,
+            )
+            for col in columns
+            if col in df.columns
+        }
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """컬럼별 정렬 순열 배열 (스냅샷 저장용)"""
+        arrays = {}
+        for col, column in self.columns.items():
+            arrays.update(prefix_arrays(col, column.to_arrays()))
+        return arrays
+
+    def query(self, ranges: Dict[str, Range]) -> np.ndarray:
+        """
+        범위 조건을 모두 만족하는 레시피 위치
+
+        Args:
+            ranges: {컬럼: (하한, 상한)}
+
+        Returns:
+            레시피 위치 배열 (오름차순 = 원래 데이터 순서)
+        """
+        ranges = {col: bounds for col, bounds in ranges.items() if bounds != (None, None)}
+        if not ranges:
+            return np.arange(self.row_count)
+
+        # 이진 탐색만으로 구간 크기를 구해 가장 좁은 조건을 후보 집합으로 사용
+        spans = {}
+        for col, (low, high) in ranges.items():
+            start, end = self.columns[col].bounds(low, high)
+            spans[col] = end - start
+        driver = min(spans, key=spans.get)
+        candidates = self.columns[driver].positions(*ranges[driver])
+
+        for col, (low, high) in ranges.items():
+            if col == driver or len(candidates) == 0:
+                continue
+            values = self.columns[col].values[candidates]
+            keep = ~np.isnan(values)
+            if low is not None:
+                keep &= values >= low
+            if high is not None:
+                keep &= values <= high
+            candidates = candidates[keep]
+
+        return np.sort(candidates)
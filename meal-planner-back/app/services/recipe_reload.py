@@ -0,0 +1,75 @@
+"""
+레시피 데이터 핫 리로드
+
+관리자 엔드포인트 또는 파일 변경 감시로 공유 RecipeStore를 새 버전으로 교체
+- 스냅샷 빌드/색인 구축은 executor 스레드에서 (이벤트 루프 블로킹 없음)
+- 교체는 원자적: 진행 중인 조회(SSE 식단 생성 포함)는 시작할 때 잡은 버전으로 끝까지 처리
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from app.services.recipe_store import (
+    RecipeReloadInProgressError,
+    RecipeStore,
+    changed_recipe_stores,
+    reload_recipe_store,
+    reload_recipe_stores,
+)
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+async def reload_recipes() -> List[RecipeStore]:
+    """
+    로드된 모든 레시피 저장소 리로드 (executor에서 구축 후 교체)
+
+    Returns:
+        새 버전 RecipeStore 리스트
+
+    Raises:
+        RecipeReloadInProgressError: 다른 리로드가 진행 중일 때
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, reload_recipe_stores)
+
+
+async def watch_recipe_files(interval: float) -> None:
+    """
+    레시피 CSV/스냅샷 변경 감시 후 자동 리로드 (취소될 때까지 실행)
+
+    기록 중인 파일을 읽지 않도록 연속 두 번의 확인에서 같은 상태일 때만 리로드
+
+    Args:
+        interval: 확인 주기 (초)
+    """
+    loop = asyncio.get_running_loop()
+    pending: Dict[Tuple[str, str], Tuple] = {}
+    logger.info("recipe_watch_started", interval=interval)
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            changed = await loop.run_in_executor(None, changed_recipe_stores)
+        except Exception as e:
+            logger.warning("recipe_watch_failed", error=str(e))
+            continue
+
+        for key, fingerprint in changed.items():
+            if pending.get(key) != fingerprint:
+                # 변경 감지 → 다음 확인까지 파일 상태가 그대로면 리로드
+                pending[key] = fingerprint
+                continue
+            pending.pop(key, None)
+            try:
+                await loop.run_in_executor(None, reload_recipe_store, Path(key[0]), Path(key[1]))
+            except RecipeReloadInProgressError:
+                logger.info("recipe_watch_reload_skipped", path=key[1])
+            except Exception as e:
+                # 이전 버전 유지, 파일 상태가 그대로면 다음 확인 주기에 다시 시도
+                logger.warning("recipe_watch_reload_failed", error=str(e), path=key[1])
+
+        for key in [key for key in pending if key not in changed]:
+            pending.pop(key)
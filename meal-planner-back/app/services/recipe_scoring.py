@@ -0,0 +1,163 @@
+"""
+레시피 유사도 점수 (벡터화)
+
+대체 레시피 유사도 점수(낮을수록 유사)를 후보 배열 전체에 한 번에 계산
+- 칼로리/조리시간/난이도/탄단지 비율 항을 NumPy 배열 연산으로 계산 (행 단위 Python 호출 없음)
+- 상위 k개 선택: np.partition으로 k번째 점수만 구한 뒤 그 이하 후보만 정렬 (전체 정렬 없음)
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# 난이도 레벨 (사전에 없는 난이도 = 10)
+DIFFICULTY_LEVELS = {"초급": 0, "중급": 10, "고급": 20}
+DEFAULT_DIFFICULTY_LEVEL = 10
+
+
+def macro_ratio_scores(
+    carb_g: np.ndarray,
+    protein_g: np.ndarray,
+    fat_g: np.ndarray,
+    target_carb_g: float,
+    target_protein_g: float,
+    target_fat_g: float,
+) -> np.ndarray:
+    """
+    탄단지 비율 차이 점수 (0-100, 낮을수록 유사)
+
+    Args:
+        carb_g: 레시피별 탄수화물(g)
+        protein_g: 레시피별 단백질(g)
+        fat_g: 레시피별 지방(g)
+        target_carb_g: 목표 탄수화물(g)
+        target_protein_g: 목표 단백질(g)
+        target_fat_g: 목표 지방(g)
+
+    Returns:
+        레시피별 점수 (영양정보가 결측이면 NaN)
+    """
+    recipe_total = carb_g + protein_g + fat_g
+    target_total = target_carb_g + target_protein_g + target_fat_g
+    if target_total == 0:
+        scores = np.zeros(len(carb_g))  # 목표가 없으면 비율 고려 안함
+    else:
+        target_carb = (target_carb_g / target_total) * 100
+        target_protein = (target_protein_g / target_total) * 100
+        target_fat = (target_fat_g / target_total) * 100
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            total_diff = (
+                np.abs((carb_g / recipe_total) * 100 - target_carb)
+                + np.abs((protein_g / recipe_total) * 100 - target_protein)
+                + np.abs((fat_g / recipe_total) * 100 - target_fat)
+            )
+        scores = np.minimum(total_diff, 100.0)
+
+    scores[recipe_total == 0] = 100.0  # 영양정보 없음 = 최악의 점수
+    return scores
+
+
+def difficulty_levels(difficulty) -> np.ndarray:
+    """
+    난이도 문자열 → 레벨 배열
+
+    Args:
+        difficulty: 레시피별 난이도 문자열
+
+    Returns:
+        레벨 배열 (float64, 사전에 없는 난이도 = 10)
+    """
+    return (
+        pd.Series(difficulty, dtype=object)
+        .map(DIFFICULTY_LEVELS)
+        .fillna(DEFAULT_DIFFICULTY_LEVEL)
+        .to_numpy(dtype=np.float64)
+    )
+
+
+def similarity_scores(
+    calories: np.ndarray,
+    cooking_time: np.ndarray,
+    difficulty_level: np.ndarray,
+    target_calories: float,
+    target_time: Optional[float],
+    target_difficulty: Optional[str] = None,
+    carb_g: Optional[np.ndarray] = None,
+    protein_g: Optional[np.ndarray] = None,
+    fat_g: Optional[np.ndarray] = None,
+    target_carb_g: Optional[float] = None,
+    target_protein_g: Optional[float] = None,
+    target_fat_g: Optional[float] = None,
+) -> np.ndarray:
+    """
+    유사도 점수 계산 (낮을수록 유사)
+
+    Args:
+        calories: 레시피별 칼로리
+        cooking_time: 레시피별 조리 시간
+        difficulty_level: 레시피별 난이도 레벨 (difficulty_levels 결과)
+        target_calories: 목표 칼로리
+        target_time: 목표 조리 시간 (선택사항)
+        target_difficulty: 목표 난이도 (선택사항)
+        carb_g / protein_g / fat_g: 레시피별 탄단지(g) - 선택사항
+        target_carb_g / target_protein_g / target_fat_g: 목표 탄단지(g) - 선택사항
+
+    Returns:
+        레시피별 점수 (NaN = 영양정보 결측, 정렬 시 맨 뒤)
+    """
+    # 칼로리 차이 점수 (1000kcal 차이 = 100점)
+    calorie_score = np.minimum(np.abs(calories - target_calories) / 10, 100)
+
+    # 조리 시간 차이 점수 (200분 차이 = 100점)
+    if target_time:
+        time_score = np.minimum(np.abs(cooking_time - target_time) / 2, 100)
+    else:
+        time_score = np.zeros(len(calories))
+
+    # 난이도 페널티 (더 어려운 난이도 = 50)
+    difficulty_penalty = np.zeros(len(calories))
+    if target_difficulty:
+        target_level = DIFFICULTY_LEVELS.get(target_difficulty, DEFAULT_DIFFICULTY_LEVEL)
+        difficulty_penalty[difficulty_level > target_level] = 50
+
+    use_macro_scoring = all(
+        value is not None
+        for value in (carb_g, protein_g, fat_g, target_carb_g, target_protein_g, target_fat_g)
+    )
+    if use_macro_scoring:
+        macro_score = macro_ratio_scores(
+            carb_g, protein_g, fat_g, target_carb_g, target_protein_g, target_fat_g
+        )
+        # 가중치: 칼로리 40%, 탄단지 50%, 시간 10%
+        return (calorie_score * 0.4) + (macro_score * 0.5) + (time_score * 0.1) + difficulty_penalty
+
+    # 탄단지 정보 없을 때: 칼로리 위주
+    return calorie_score + (time_score * 0.5) + difficulty_penalty
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    점수가 낮은 상위 k개 인덱스 (점수 오름차순, 동점은 입력 순서, NaN은 맨 뒤)
+
+    Args:
+        scores: 점수 배열
+        k: 선택 개수
+
+    Returns:
+        scores의 인덱스 배열 (길이 ≤ k)
+    """
+    if k <= 0 or len(scores) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    keys = np.where(np.isnan(scores), np.inf, scores)
+    if k < len(keys):
+        # k번째 점수 이하인 원소만 남긴 뒤 정렬 (동점이 경계에 걸려도 입력 순서 유지)
+        kth = np.partition(keys, k - 1)[k - 1]
+        selected = np.flatnonzero(keys <= kth)
+    else:
+        selected = np.arange(len(keys))
+
+    order = np.lexsort((selected, keys[selected]))
+    return selected[order][:k]
@@ -6,13 +6,23 @@ import os
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
-import pandas as pd
+import numpy as np
 
-from app.utils.constants import RECIPE_CACHE_TTL_SECONDS, RECIPE_SEARCH_LIMIT
+from app.services.recipe_ingredients import normalize_ingredient_name
+from app.services.recipe_store import RecipeStore, get_recipe_store, peek_recipe_store
+from app.services.restriction_bitmaps import canonical_restriction, keyword_mask, substring_mask, synonym_keywords
+from app.services.search_executor import get_search_executor
+from app.utils.constants import RECIPE_CACHE_TTL_SECONDS, RECIPE_SEARCH_LIMIT, SKILL_LEVEL_DIFFICULTIES
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 검색 결과 dict로 옮기는 df 컬럼
+RESULT_COLUMNS = ["name", "cooking_time", "calories", "difficulty", "category", "carb_g", "protein_g", "fat_g"]
+
+# 제외 재료 원문 확인 배치 최소 크기 (상위 N개가 찰 때까지 후보를 배치 단위로 확인)
+RAW_CHECK_BATCH = 256
+
 
 class RecipeSearchService:
     """레시피 검색 서비스 (Tavily API + 로컬 CSV Fallback)"""
@@ -23,16 +33,21 @@ class RecipeSearchService:
         tavily_api_key: Optional[str] = None,
         csv_path: str = "data/recipes_with_nutrition.csv",
         enable_web_search: bool = True,
+        snapshot_path: str = "data/recipes_snapshot",
+        store: Optional[RecipeStore] = None,
     ):
         """
         Args:
             mock_mode: True면 mock 데이터 반환
             tavily_api_key: Tavily API 키 (웹 검색용)
-            csv_path: 로컬 CSV 파일 경로
+            csv_path: 로컬 CSV 파일 경로 (스냅샷이 없을 때 폴백)
             enable_web_search: 웹 검색 활성화 여부
+            snapshot_path: 컴파일된 레시피 스냅샷 디렉토리
+            store: 사용할 RecipeStore (None이면 경로별 공유 인스턴스, 리로드 시 새 버전 사용)
         """
         self.mock_mode = mock_mode
         self.csv_path = csv_path
+        self.snapshot_path = snapshot_path
         self.enable_web_search = enable_web_search
 
         # Tavily client 초기화
@@ -48,8 +63,9 @@ class RecipeSearchService:
             except Exception as e:
                 logger.warning("tavily_init_failed", error=str(e))
 
-        # CSV DataFrame 캐시 (lazy loading)
-        self._csv_df: Optional[pd.DataFrame] = None
+        # 공유 RecipeStore (lazy loading, 조회마다 현재 버전 확인)
+        self._fixed_store = store
+        self._store: Optional[RecipeStore] = store
 
         # 검색 결과 캐시 {cache_key: (results, expiry_time)}
         self._cache: dict[str, tuple[list[dict], datetime]] = {}
@@ -59,6 +75,7 @@ class RecipeSearchService:
             mock_mode=mock_mode,
             enable_web_search=enable_web_search,
             csv_path=csv_path,
+            snapshot_path=snapshot_path,
         )
 
     async def search_recipes(
@@ -166,101 +183,172 @@ class RecipeSearchService:
 
         return results
 
-    async def _search_local_csv(self, query: str, filters: dict, limit: int) -> list[dict]:
-        """로컬 CSV에서 레시피 검색 (pandas)"""
-        # Lazy load CSV
-        if self._csv_df is None:
+    async def _ensure_store(self) -> RecipeStore:
+        """공유 RecipeStore lazy load (snapshot → CSV), 리로드 후에는 새 버전 반환"""
+        if self._fixed_store is not None:
+            return self._fixed_store
+
+        store = peek_recipe_store(self.csv_path, self.snapshot_path)
+        if store is None:
             loop = asyncio.get_event_loop()
             try:
-                self._csv_df = await loop.run_in_executor(
-                    None, lambda: pd.read_csv(self.csv_path, encoding="utf-8")
+                store = await loop.run_in_executor(
+                    None, lambda: get_recipe_store(self.csv_path, self.snapshot_path)
                 )
-                logger.info("csv_loaded", rows=len(self._csv_df), path=self.csv_path)
+                logger.info("csv_loaded", rows=len(store), source=store.source, path=store.path)
             except Exception as e:
                 logger.error("csv_load_failed", error=str(e), path=self.csv_path)
                 raise
+        self._store = store
+        return store
 
-        df = self._csv_df.copy()
-
-        # 필터 적용
-        max_cooking_time = filters.get("max_cooking_time")
-        if max_cooking_time:
-            df = df[df["cooking_time"] <= max_cooking_time]
+    async def search_similar_recipes(
+        self,
+        target_calories: float,
+        target_carb_g: Optional[float] = None,
+        target_protein_g: Optional[float] = None,
+        target_fat_g: Optional[float] = None,
+        exclude_ingredients: Optional[list[str]] = None,
+        max_cooking_time: Optional[int] = None,
+        calorie_tolerance: float = 0.3,
+        limit: int = RECIPE_SEARCH_LIMIT,
+    ) -> list[dict]:
+        """영양 목표와 가장 가까운 로컬 레시피 (영양 공간 k-NN, 대체 레시피와 같은 유사도 점수)
 
-        difficulty = filters.get("difficulty")
-        if difficulty:
-            # 난이도 매핑: 초급 → 아무나, 중급 → 초급, 고급 → 중급
-            difficulty_map = {"초급": ["아무나"], "중급": ["아무나", "초급"], "고급": ["아무나", "초급", "중급"]}
-            allowed_difficulties = difficulty_map.get(difficulty, ["아무나", "초급", "중급"])
-            df = df[df["difficulty"].isin(allowed_difficulties)]
+        Args:
+            target_calories: 목표 칼로리
+            target_carb_g / target_protein_g / target_fat_g: 목표 탄단지(g) - 선택사항
+            exclude_ingredients: 제외 재료 (알레르기/식이 선호 포함)
+            max_cooking_time: 최대 조리 시간 (분)
+            calorie_tolerance: 칼로리 허용 범위 (0.3 = ±30%)
+            limit: 최대 결과 수
 
-        target_calories = filters.get("target_calories")
-        calorie_tolerance = filters.get("calorie_tolerance", 0.3)
-        if target_calories:
-            min_cal = target_calories * (1 - calorie_tolerance)
-            max_cal = target_calories * (1 + calorie_tolerance)
-            df = df[(df["calories"] >= min_cal) & (df["calories"] <= max_cal)]
+        Returns:
+            레시피 리스트 (유사도 순, search_recipes와 같은 형식)
+        """
+        if self.mock_mode:
+            return self._get_mock_results("", {"max_cooking_time": max_cooking_time}, limit)
 
-        # 제외 재료 필터링
-        exclude_ingredients = filters.get("exclude_ingredients", [])
-        if exclude_ingredients:
-            for ingredient in exclude_ingredients:
-                # ingredients_raw에 해당 재료가 포함되지 않은 레시피만
-                df = df[~df["ingredients_raw"].str.contains(ingredient, case=False, na=False)]
+        try:
+            store = await self._ensure_store()
+        except Exception as e:
+            logger.warning("csv_search_failed", error=str(e), csv_path=self.csv_path)
+            return []
 
-        # 키워드 검색 (name, category, main_ingredient)
-        if query:
-            keywords = query.split()
-            mask = pd.Series([False] * len(df), index=df.index)
-            for keyword in keywords:
-                mask |= (
-                    df["name"].str.contains(keyword, case=False, na=False)
-                    | df["category"].str.contains(keyword, case=False, na=False)
-                    | df["main_ingredient"].str.contains(keyword, case=False, na=False)
+        exclude_ingredients = [e.lower() for e in exclude_ingredients or [] if e]
+
+        def nearest() -> list[dict]:
+            with store.lease():
+                positions = store.neighbor_index.nearest(
+                    k=limit,
+                    target_calories=target_calories,
+                    target_time=max_cooking_time or 30,
+                    target_carb_g=target_carb_g,
+                    target_protein_g=target_protein_g,
+                    target_fat_g=target_fat_g,
+                    calorie_range=(target_calories * (1 - calorie_tolerance), target_calories * (1 + calorie_tolerance)),
+                    max_cooking_time=max_cooking_time,
+                    excluded=(
+                        store.restriction_bitmaps.excluded_rows(exclude_ingredients, bidirectional=False)
+                        if exclude_ingredients else None
+                    ),
                 )
-            df = df[mask]
+                return self._format_rows(store, positions)
 
-        # 상위 N개 결과
-        df = df.head(limit)
+        return await get_search_executor().run(nearest)
 
-        # 결과 변환
+    def _format_rows(self, store: RecipeStore, positions: np.ndarray) -> list[dict]:
+        """레시피 위치 배열 → 검색 결과 dict 리스트 (컬럼 단위 조회)"""
         results = []
-        for _, row in df.iterrows():
+        for position, row in zip(np.asarray(positions).tolist(), store.records(positions, RESULT_COLUMNS)):
             try:
-                # ingredients_parsed 파싱 (JSON 형식 예상)
-                ingredients_list = []
-                if pd.notna(row["ingredients_parsed"]):
-                    try:
-                        parsed = json.loads(row["ingredients_parsed"])
-                        if isinstance(parsed, list):
-                            ingredients_list = [
-                                item["name"] if isinstance(item, dict) else str(item) for item in parsed
-                            ]
-                    except (json.JSONDecodeError, TypeError):
-                        # 파싱 실패 시 raw 사용
-                        if pd.notna(row["ingredients_raw"]):
-                            ingredients_list = [
-                                s.strip() for s in str(row["ingredients_raw"]).split(",")[:10]
-                            ]
-
-                recipe = {
+                results.append({
                     "name": row["name"],
-                    "cooking_time": int(row["cooking_time"]) if pd.notna(row["cooking_time"]) else None,
-                    "calories": float(row["calories"]) if pd.notna(row["calories"]) else None,
-                    "difficulty": row["difficulty"] if pd.notna(row["difficulty"]) else None,
-                    "ingredients": ingredients_list,
-                    "category": row["category"] if pd.notna(row["category"]) else "기타",
-                    "carb_g": float(row["carb_g"]) if pd.notna(row["carb_g"]) else None,
-                    "protein_g": float(row["protein_g"]) if pd.notna(row["protein_g"]) else None,
-                    "fat_g": float(row["fat_g"]) if pd.notna(row["fat_g"]) else None,
+                    "cooking_time": int(row["cooking_time"]) if row["cooking_time"] is not None else None,
+                    "calories": float(row["calories"]) if row["calories"] is not None else None,
+                    "difficulty": row["difficulty"],
+                    "ingredients": store.ingredient_names(position),
+                    "category": row["category"] if row["category"] is not None else "기타",
+                    "carb_g": float(row["carb_g"]) if row["carb_g"] is not None else None,
+                    "protein_g": float(row["protein_g"]) if row["protein_g"] is not None else None,
+                    "fat_g": float(row["fat_g"]) if row["fat_g"] is not None else None,
                     "source": "csv",
-                }
-                results.append(recipe)
+                })
             except Exception as e:
-                logger.warning("csv_row_parse_failed", error=str(e), row_index=row.name)
-
+                logger.warning("csv_row_parse_failed", error=str(e), row_index=position)
         return results
 
+    async def _search_local_csv(self, query: str, filters: dict, limit: int) -> list[dict]:
+        """로컬 CSV에서 레시피 검색 (조회 1건 동안 같은 데이터 버전 사용)"""
+        store = await self._ensure_store()
+        return await get_search_executor().run(self._query_leased, store, query, filters, limit)
+
+    def _query_leased(self, store: RecipeStore, query: str, filters: dict, limit: int) -> list[dict]:
+        """lease 구간 안에서 _query_store 실행 (검색 실행기 스레드에서 실행)"""
+        with store.lease():
+            return self._query_store(store, query, filters, limit)
+
+    def _query_store(self, store: RecipeStore, query: str, filters: dict, limit: int) -> list[dict]:
+        """RecipeStore 검색 (레시피 위치 배열 기반, 메모리 사용량은 후보 수에 비례)"""
+        df = store.df
+
+        # 필터 적용: 후보는 레시피 위치 배열로만 다룸 (DataFrame 부분 집합/복사 없음)
+        # positions = None → 아직 필터 없음 (전체), 필터마다 후보 위치만 추림
+        # 조리시간/칼로리 범위 + 난이도는 사전 계산된 후보 파티션(또는 더 좁으면 정렬 색인)에서 시작
+        calorie_range = None
+        target_calories = filters.get("target_calories")
+        calorie_tolerance = filters.get("calorie_tolerance", 0.3)
+        if target_calories:
+            calorie_range = (target_calories * (1 - calorie_tolerance), target_calories * (1 + calorie_tolerance))
+
+        allowed_difficulties = None
+        difficulty = filters.get("difficulty")
+        if difficulty:
+            # 난이도 매핑: 초급 → 아무나, 중급 → 초급, 고급 → 중급
+            allowed_difficulties = SKILL_LEVEL_DIFFICULTIES.get(difficulty, SKILL_LEVEL_DIFFICULTIES["고급"])
+
+        positions = store.candidate_positions(
+            calorie_range=calorie_range,
+            max_cooking_time=filters.get("max_cooking_time"),
+            difficulties=allowed_difficulties,
+        )
+
+        # 키워드 검색 (name, category, main_ingredient 부분 문자열, 대소문자 무시)
+        # 키워드 역색인 포스팅 합집합 → 컬럼 스캔 없음
+        if query:
+            matched = store.keyword_index.matching_rows(query.split())
+            positions = np.flatnonzero(matched) if positions is None else positions[matched[positions]]
+
+        # 제외 재료 필터링: ingredients_raw에 해당 재료가 포함되지 않은 레시피만
+        # 1) 재료명에 제외 재료가 들어간 레시피는 비트맵(알레르기/식이 선호) + n-gram 역색인으로 한 번에 제거
+        # 2) 나머지는 전체 컬럼을 스캔하지 않고 상위 N개를 채울 때까지 후보 순서대로 원문 확인
+        exclude_ingredients = [e.lower() for e in filters.get("exclude_ingredients", []) if e]
+        if exclude_ingredients:
+            excluded = store.restriction_bitmaps.excluded_rows(exclude_ingredients, bidirectional=False)
+            positions = np.flatnonzero(~excluded) if positions is None else positions[~excluded[positions]]
+
+            # 자유 입력 재료는 원문 부분 일치, 사전 항목은 비트맵과 같은 키워드 규칙 (짧은 키워드는 토큰 일치)
+            free_text = [normalize_ingredient_name(e) for e in exclude_ingredients if canonical_restriction(e) is None]
+            synonyms = synonym_keywords(exclude_ingredients)
+            # ingredients_raw는 지연 조회 컬럼 (확인하는 후보 배치만 읽고 배치 단위로 일괄 매칭)
+            selected = []
+            batch = max(limit * 4, RAW_CHECK_BATCH)
+            for start in range(0, len(positions), batch):
+                chunk = positions[start:start + batch]
+                raws = store.lazy_values("ingredients_raw", chunk)
+                hit = substring_mask(raws, free_text) | keyword_mask(raws, synonyms)
+                selected.extend(chunk[~hit][:limit - len(selected)].tolist())
+                if len(selected) >= limit:
+                    break
+        elif positions is None:
+            # 상위 N개 결과
+            selected = list(range(min(limit, len(df))))
+        else:
+            selected = positions[:limit].tolist()
+
+        # 결과 변환 (선택된 행만 조회)
+        return self._format_rows(store, np.asarray(selected, dtype=np.int64))
+
     def _get_mock_results(self, query: str, filters: dict, limit: int) -> list[dict]:
         """Mock 모드 레시피 데이터"""
         mock_recipes = [
@@ -315,9 +403,14 @@ class RecipeSearchService:
 
         return filtered[:limit]
 
+    def _store_version(self) -> Optional[int]:
+        """현재 RecipeStore 버전 (아직 로드 전이면 None)"""
+        store = self._fixed_store or peek_recipe_store(self.csv_path, self.snapshot_path)
+        return store.version if store is not None else None
+
     def _generate_cache_key(self, query: str, filters: dict, limit: int) -> str:
-        """캐시 키 생성 (MD5 hash)"""
-        cache_data = {"query": query, "filters": filters, "limit": limit}
+        """캐시 키 생성 (MD5 hash, 리로드로 레시피 버전이 바뀌면 다른 키)"""
+        cache_data = {"query": query, "filters": filters, "limit": limit, "store_version": self._store_version()}
         cache_str = json.dumps(cache_data, sort_keys=True)
         return hashlib.md5(cache_str.encode()).hexdigest()
 
@@ -349,6 +442,7 @@ def get_recipe_search_service() -> RecipeSearchService:
         mock_mode = os.getenv("MOCK_MODE", "false").lower() == "true"
         tavily_api_key = os.getenv("TAVILY_API_KEY")
         csv_path = os.getenv("RECIPES_CSV_PATH", "data/recipes_with_nutrition.csv")
+        snapshot_path = os.getenv("RECIPES_SNAPSHOT_PATH", "data/recipes_snapshot")
         enable_web_search = os.getenv("ENABLE_WEB_SEARCH", "true").lower() == "true"
 
         _recipe_search_service = RecipeSearchService(
@@ -356,5 +450,6 @@ def get_recipe_search_service() -> RecipeSearchService:
             tavily_api_key=tavily_api_key,
             csv_path=csv_path,
             enable_web_search=enable_web_search,
+            snapshot_path=snapshot_path,
         )
     return _recipe_search_service
@@ -0,0 +1,382 @@
+"""
+레시피 스냅샷 (컬럼형 바이너리 포맷)
+
+recipes_with_nutrition.csv를 오프라인에서 컴파일한 스냅샷을 memory-map으로 로드
+- 숫자 컬럼: 타입이 지정된 .npy 배열 (검색에 쓰지 않는 영양 컬럼은 float32)
+- 문자열 컬럼: 사전 인코딩 (int32 코드 + UTF-8 문자열 테이블)
+  → Categorical로 올리거나 행 단위 지연 조회 (LazyStringColumn)
+- ingredients_parsed: 사전 파싱된 재료 (CSR: offsets + 재료 ID + 재료 사전)
+- 색인 (선택): RecipeStore 색인 배열 (n-gram 포스팅, 비트맵, 정렬 순열, KD-tree)
+  → 여러 uvicorn 워커가 같은 파일을 memory-map으로 열어 페이지 캐시를 공유 (워커 수와 무관한 메모리)
+
+빌드: python scripts/build_recipe_snapshot.py
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.services.recipe_ingredients import IngredientTable
+from app.utils.logging import get_logger
+from app.utils.packed_arrays import StringTable, decode_string_table, encode_string_table
+
+logger = get_logger(__name__)
+
+# 스냅샷 기본 경로
+SNAPSHOT_DIR = Path(__file__).parent.parent.parent / "data" / "recipes_snapshot"
+
+# 포맷 버전 (레이아웃이 바뀌면 증가 → 이전 스냅샷은 무시되고 CSV 폴백)
+SNAPSHOT_FORMAT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+
+# 색인 빌더: 열린 스냅샷 → (색인 시그니처, {색인 이름: {배열 이름: 배열}})
+IndexBuilder = Callable[["RecipeSnapshot"], Tuple[str, Dict[str, Dict[str, np.ndarray]]]]
+
+# 문자열이 섞여 있어도 숫자로 강제 변환할 컬럼
+NUMERIC_COLUMNS = ["calories", "cooking_time", "carb_g", "protein_g", "fat_g"]
+
+# 검색에 쓰지 않는 영양 컬럼은 float32로 저장 (결과 표시용, 정밀도 충분)
+FLOAT32_COLUMNS = [
+    "sugar_g", "sodium_mg", "cholesterol_mg", "saturated_fat_g", "nutrition_match_rate",
+    # ETL 파생 컬럼 (scripts/etl_recipes.py)
+    "carb_ratio", "protein_ratio", "fat_ratio", "est_cost", "allergen_mask",
+]
+
+INGREDIENTS_COLUMN = "ingredients_parsed"
+
+
+def _dictionary_encode(series: pd.Series) -> tuple[np.ndarray, List[str]]:
+    """문자열 컬럼 사전 인코딩 (결측값 = -1)"""
+    codes, uniques = pd.factorize(series.astype("object"), use_na_sentinel=True)
+    return codes.astype(np.int32), [str(u) for u in uniques]
+
+
+def build_snapshot(
+    csv_path: Path,
+    snapshot_dir: Path = SNAPSHOT_DIR,
+    build_indexes: Optional[IndexBuilder] = None,
+    source_csv: Optional[Path] = None,
+    etl: Optional[Dict] = None,
+) -> Dict:
+    """
+    CSV를 컴파일하여 스냅샷 디렉토리 생성 (오프라인 빌드용)
+
+    임시 디렉토리에 먼저 기록한 뒤 교체하므로, 빌드 도중 실패해도
+    기존 스냅샷은 유지됨
+
+    Args:
+        csv_path: 원본 레시피 CSV 경로
+        snapshot_dir: 스냅샷 출력 디렉토리
+        build_indexes: 색인 빌더 (None이면 컬럼만 저장, 로드 시 색인 계산)
+        source_csv: 최신 여부 판정 기준 원본 CSV (None이면 csv_path)
+            ETL 정제 CSV로 빌드할 때 수작업 원본을 기록 → 원본이 바뀌면 stale
+        etl: ETL 설정 {clean_csv, dedup} (ETL 출력으로 빌드한 스냅샷 표시, 다시 빌드할 때 ETL도 다시 실행)
+
+    Returns:
+        생성된 manifest dict
+    """
+    csv_path = Path(csv_path)
+    snapshot_dir = Path(snapshot_dir)
+
+    df = pd.read_csv(csv_path, encoding="utf-8-sig")
+
+    # 프로세스별 임시 디렉토리 (여러 워커가 동시에 리로드해도 서로의 빌드를 덮어쓰지 않음)
+    tmp_dir = snapshot_dir.with_name(f"{snapshot_dir.name}.tmp-{os.getpid()}")
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+
+    columns = []
+    for col in df.columns:
+        if col == INGREDIENTS_COLUMN:
+            continue
+
+        if col in NUMERIC_COLUMNS or pd.api.types.is_numeric_dtype(df[col]):
+            dtype = np.float32 if col in FLOAT32_COLUMNS else np.float64
+            values = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=dtype)
+            np.save(tmp_dir / f"num__{col}.npy", values)
+            columns.append({"name": col, "kind": "numeric", "dtype": np.dtype(dtype).name})
+        else:
+            codes, dictionary = _dictionary_encode(df[col])
+            offsets, data = encode_string_table(dictionary)
+            np.save(tmp_dir / f"str__{col}.codes.npy", codes)
+            np.save(tmp_dir / f"str__{col}.dict_offsets.npy", offsets)
+            np.save(tmp_dir / f"str__{col}.dict_data.npy", data)
+            columns.append({"name": col, "kind": "string", "cardinality": len(dictionary)})
+
+    # 재료 사전 파싱 (CSR)
+    if INGREDIENTS_COLUMN in df.columns:
+        table = IngredientTable.from_columns(
+            df[INGREDIENTS_COLUMN],
+            df["ingredients_raw"] if "ingredients_raw" in df.columns else None,
+        )
+        vocab_offsets, vocab_data = encode_string_table(table.vocab)
+        np.save(tmp_dir / "ingredients.offsets.npy", table.offsets)
+        np.save(tmp_dir / "ingredients.ids.npy", table.ids)
+        np.save(tmp_dir / "ingredients.entry_rows.npy", table.entry_rows)
+        np.save(tmp_dir / "ingredients.vocab_offsets.npy", vocab_offsets)
+        np.save(tmp_dir / "ingredients.vocab_data.npy", vocab_data)
+        columns.append({"name": INGREDIENTS_COLUMN, "kind": "ingredients", "vocab_size": len(table.vocab)})
+
+    source_csv = Path(source_csv or csv_path)
+    stat = source_csv.stat()
+    manifest = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "row_count": len(df),
+        "columns": columns,
+        "source": {
+            "path": str(source_csv),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+        },
+        "built_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    if etl is not None:
+        manifest["etl"] = etl
+    if build_indexes is not None:
+        # 컬럼을 먼저 기록한 임시 스냅샷을 열어 색인 계산 (CSV 재파싱 없음)
+        signature, indexes = build_indexes(RecipeSnapshot(tmp_dir, manifest))
+        for index_name, arrays in indexes.items():
+            for key, values in arrays.items():
+                np.save(tmp_dir / f"idx__{index_name}.{key}.npy", np.asarray(values))
+        manifest["indexes"] = {
+            "signature": signature,
+            "arrays": {index_name: list(arrays) for index_name, arrays in indexes.items()},
+        }
+
+    with open(tmp_dir / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    # 기존 스냅샷은 먼저 옆으로 옮긴 뒤 교체 (열려 있는 memory-map은 삭제 후에도 유효)
+    old_dir = snapshot_dir.with_name(f"{snapshot_dir.name}.old-{os.getpid()}")
+    if old_dir.exists():
+        shutil.rmtree(old_dir)
+    if snapshot_dir.exists():
+        os.replace(snapshot_dir, old_dir)
+    os.replace(tmp_dir, snapshot_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+    logger.info(
+        "recipe_snapshot_built",
+        rows=len(df),
+        columns=len(columns),
+        path=str(snapshot_dir),
+    )
+    return manifest
+
+
+class LazyStringColumn:
+    """사전 인코딩 문자열 컬럼의 행 단위 조회 (memory-mapped, 조회한 행만 디코딩)"""
+
+    def __init__(self, codes: np.ndarray, offsets: np.ndarray, data: np.ndarray):
+        """
+        Args:
+            codes: 레시피별 사전 코드 (결측값 = -1)
+            offsets: 사전 문자열 시작 위치
+            data: 사전 UTF-8 바이트
+        """
+        self.codes = codes
+        self.dictionary = StringTable(offsets, data)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        code = int(self.codes[row])
+        return None if code < 0 else self.dictionary[code]
+
+    def take(self, rows: np.ndarray) -> np.ndarray:
+        """여러 행 조회 (사전 코드별 1회만 디코딩, 결측값 = None)"""
+        codes, inverse = np.unique(np.asarray(self.codes[rows]), return_inverse=True)
+        values = np.array([None if code < 0 else self.dictionary[int(code)] for code in codes.tolist()], dtype=object)
+        return values[inverse.reshape(-1)]
+
+
+class RecipeSnapshot:
+    """memory-map으로 열린 레시피 스냅샷 (읽기 전용)"""
+
+    def __init__(self, snapshot_dir: Path, manifest: Dict):
+        """
+        Args:
+            snapshot_dir: 스냅샷 디렉토리
+            manifest: manifest.json 내용
+        """
+        self.path = Path(snapshot_dir)
+        self.manifest = manifest
+        self.row_count: int = manifest["row_count"]
+        self.columns: List[Dict] = manifest["columns"]
+        # ETL 출력으로 빌드된 스냅샷이면 {clean_csv, dedup}
+        self.etl: Optional[Dict] = manifest.get("etl")
+
+    def _load(self, filename: str) -> np.ndarray:
+        return np.load(self.path / filename, mmap_mode="r")
+
+    def numeric(self, col: str) -> np.ndarray:
+        """숫자 컬럼 (memory-mapped, 읽기 전용)"""
+        return self._load(f"num__{col}.npy")
+
+    def strings(self, col: str) -> np.ndarray:
+        """문자열 컬럼 디코딩 (사전 문자열을 공유하는 object 배열, 결측값 = None)"""
+        codes = self._load(f"str__{col}.codes.npy")
+        dictionary = decode_string_table(
+            self._load(f"str__{col}.dict_offsets.npy"),
+            self._load(f"str__{col}.dict_data.npy"),
+        )
+        lookup = np.empty(len(dictionary) + 1, dtype=object)
+        lookup[:-1] = dictionary
+        lookup[-1] = None
+        return lookup[codes]  # -1 → 마지막 원소(None)
+
+    def categorical(self, col: str) -> pd.Categorical:
+        """문자열 컬럼을 Categorical로 (mmap 코드 + 사전, 행별 문자열 객체 없음)"""
+        codes = self._load(f"str__{col}.codes.npy")
+        dictionary = decode_string_table(
+            self._load(f"str__{col}.dict_offsets.npy"),
+            self._load(f"str__{col}.dict_data.npy"),
+        )
+        return pd.Categorical.from_codes(codes, categories=dictionary)
+
+    def lazy_column(self, col: str):
+        """
+        행 단위 조회 컬럼 (전체를 메모리에 올리지 않음)
+
+        Args:
+            col: 컬럼명
+
+        Returns:
+            숫자 컬럼은 memory-mapped 배열, 문자열 컬럼은 LazyStringColumn
+        """
+        column = next(c for c in self.columns if c["name"] == col)
+        if column["kind"] == "numeric":
+            return self.numeric(col)
+        return LazyStringColumn(
+            self._load(f"str__{col}.codes.npy"),
+            self._load(f"str__{col}.dict_offsets.npy"),
+            self._load(f"str__{col}.dict_data.npy"),
+        )
+
+    def has_ingredients(self) -> bool:
+        """사전 파싱된 재료 테이블 포함 여부"""
+        return any(column["kind"] == "ingredients" for column in self.columns)
+
+    def ingredient_table(self) -> IngredientTable:
+        """사전 파싱된 재료 테이블 (offsets/ids는 memory-mapped)"""
+        vocab = decode_string_table(
+            self._load("ingredients.vocab_offsets.npy"),
+            self._load("ingredients.vocab_data.npy"),
+        )
+        entry_rows_path = self.path / "ingredients.entry_rows.npy"
+        return IngredientTable(
+            vocab,
+            self._load("ingredients.offsets.npy"),
+            self._load("ingredients.ids.npy"),
+            entry_rows=self._load(entry_rows_path.name) if entry_rows_path.exists() else None,
+        )
+
+    def indexes(self, signature: str) -> Optional[Dict[str, Dict[str, np.ndarray]]]:
+        """
+        저장된 색인 배열 (memory-mapped, 읽기 전용)
+
+        Args:
+            signature: 현재 코드의 색인 시그니처 (색인 파라미터가 바뀌면 달라짐)
+
+        Returns:
+            {색인 이름: {배열 이름: 배열}} (색인이 없거나 시그니처가 다르면 None → 로드 시 계산)
+        """
+        section = self.manifest.get("indexes")
+        if section is None:
+            return None
+        if section.get("signature") != signature:
+            logger.warning(
+                "recipe_snapshot_index_signature_mismatch",
+                expected=signature,
+                found=section.get("signature"),
+                path=str(self.path),
+            )
+            return None
+
+        # np.memmap 서브클래스 대신 일반 ndarray 뷰 (슬라이스 비용이 작음, mmap은 base로 유지)
+        return {
+            index_name: {key: np.asarray(self._load(f"idx__{index_name}.{key}.npy")) for key in keys}
+            for index_name, keys in section["arrays"].items()
+        }
+
+    def is_stale(self, csv_path: Path) -> bool:
+        """원본 CSV가 스냅샷 빌드 이후 변경되었는지 확인"""
+        csv_path = Path(csv_path)
+        if not csv_path.exists():
+            return False
+        stat = csv_path.stat()
+        source = self.manifest.get("source", {})
+        return stat.st_size != source.get("size") or stat.st_mtime > source.get("mtime", 0)
+
+    def to_dataframe(
+        self,
+        columns: Optional[List[str]] = None,
+        categorical: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        DataFrame 구성 (숫자 컬럼은 복사 없이 mmap 배열을 그대로 사용)
+
+        재료는 DataFrame에 넣지 않음 → ingredient_table() 사용
+
+        Args:
+            columns: 올릴 컬럼 (None이면 전체, 스냅샷에 없는 컬럼은 무시)
+            categorical: Categorical로 올릴 문자열 컬럼
+
+        Returns:
+            레시피 DataFrame
+        """
+        categorical = categorical or []
+        data = {}
+        for column in self.columns:
+            name = column["name"]
+            if columns is not None and name not in columns:
+                continue
+            if column["kind"] == "numeric":
+                data[name] = self.numeric(name)
+            elif column["kind"] == "string":
+                data[name] = self.categorical(name) if name in categorical else self.strings(name)
+        return pd.DataFrame(data, copy=False)
+
+
+def load_snapshot(snapshot_dir: Path = SNAPSHOT_DIR) -> Optional[RecipeSnapshot]:
+    """
+    스냅샷 열기
+
+    Args:
+        snapshot_dir: 스냅샷 디렉토리
+
+    Returns:
+        RecipeSnapshot (없거나 포맷 버전이 다르면 None → CSV 폴백)
+    """
+    manifest_path = Path(snapshot_dir) / MANIFEST_FILE
+    if not manifest_path.exists():
+        logger.info("recipe_snapshot_not_found", path=str(snapshot_dir))
+        return None
+
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("recipe_snapshot_manifest_invalid", error=str(e), path=str(snapshot_dir))
+        return None
+
+    if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        logger.warning(
+            "recipe_snapshot_version_mismatch",
+            expected=SNAPSHOT_FORMAT_VERSION,
+            found=manifest.get("format_version"),
+            path=str(snapshot_dir),
+        )
+        return None
+
+    logger.info("recipe_snapshot_opened", rows=manifest["row_count"], path=str(snapshot_dir))
+    return RecipeSnapshot(snapshot_dir, manifest)
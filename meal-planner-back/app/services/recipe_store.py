@@ -0,0 +1,712 @@
+"""
+레시피 저장소 (RecipeStore)
+
+CSVRecipeSearchService(/api/alternative-recipes)와 RecipeSearchService(영양사/셰프 에이전트)가
+공유하는 단일 인메모리 레시피 데이터셋
+- 로드: 스냅샷(memory-map) 우선, 없으면 CSV 폴백
+- 정규화: 숫자 dtype, 결측값 기본값, 재료 파싱 규칙을 한 곳에서 정의
+- 스키마: 검색 컬럼만 DataFrame에 올림 (저카디널리티 문자열은 Categorical),
+  재료 원문 등 드물게 쓰는 컬럼은 행 단위 지연 조회 (스냅샷: mmap에서 해당 행만 디코딩)
+- 재료: 로드 시 1회 파싱한 CSR 재료 테이블 (요청 처리 중 json.loads 없음)
+- 색인: 재료명 n-gram 역색인 (제한 재료 → 제외 레시피 마스크)
+- 비트맵: 알레르기/식이 선호 항목별 레시피 비트셋 (동의어 포함)
+- 정렬 색인: 칼로리/조리시간/탄단지 정렬 순열 (범위 조건 → 이진 탐색)
+- 최근접 이웃: 영양 공간 KD-tree (대체 레시피 k-NN)
+- 키워드: 레시피명/카테고리/주재료 n-gram 역색인
+- 공유: 색인 배열을 스냅샷에 함께 저장 → 워커는 memory-map으로 연결만 (CSV 파싱/색인 계산 없음)
+- 리로드: 새 버전을 이벤트 루프 밖에서 구축 후 원자적 교체, 이전 버전은 진행 중 조회가 끝나면 해제
+"""
+
+import hashlib
+import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.services.recipe_etl import run_recipe_etl
+from app.services.recipe_ingredients import IngredientIndex, IngredientTable, parse_ingredient_names
+from app.services.recipe_keywords import KEYWORD_COLUMNS, KeywordIndex
+from app.services.recipe_neighbors import LEAF_SIZE, RecipeNeighborIndex
+from app.services.recipe_partitions import CALORIE_BUCKETS, COOKING_TIME_BUCKETS, CandidatePartitions
+from app.services.recipe_range_index import RecipeRangeIndex
+from app.services.recipe_scoring import difficulty_levels
+from app.services.recipe_snapshot import (
+    MANIFEST_FILE,
+    SNAPSHOT_DIR,
+    RecipeSnapshot,
+    build_snapshot,
+    load_snapshot,
+)
+from app.services.restriction_bitmaps import RESTRICTION_KEYWORDS, RestrictionBitmaps
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# CSV 파일 경로 (스냅샷이 없을 때 폴백)
+CSV_PATH = Path(__file__).parent.parent.parent / "data" / "recipes_with_nutrition.csv"
+
+# 필수 컬럼 (재료는 ingredients_parsed 컬럼 또는 스냅샷의 재료 테이블)
+REQUIRED_COLUMNS = ["name", "calories", "difficulty", "cooking_time"]
+INGREDIENTS_COLUMN = "ingredients_parsed"
+
+# 숫자 컬럼 (결측값은 NaN 유지 = 정보 없음)
+# float64 유지: 정렬 색인/KD-tree/점수 계산이 복사 없이 같은 배열을 사용
+NUMERIC_COLUMNS = ["calories", "cooking_time", "carb_g", "protein_g", "fat_g"]
+
+# 저카디널리티 문자열 컬럼 (Categorical: 레시피별 1바이트 코드 + 값 사전)
+CATEGORICAL_COLUMNS = ["difficulty", "category", "main_ingredient"]
+
+# DataFrame에 올리는 검색 컬럼 (나머지 컬럼은 프로젝션으로 제외)
+SEARCH_COLUMNS = ["name", *CATEGORICAL_COLUMNS, *NUMERIC_COLUMNS]
+
+# 행 단위로만 읽는 컬럼 (CSV 로드 시에도 유지, 스냅샷은 전체 비검색 컬럼을 지연 조회)
+LAZY_COLUMNS = ["ingredients_raw"]
+
+# CSV 폴백 로드 청크 크기 (재료 JSON은 청크마다 파싱 후 버림)
+CSV_CHUNK_ROWS = 50_000
+
+# 결측값 기본값
+DEFAULT_COOKING_TIME = 30
+DEFAULT_DIFFICULTY = "중급"
+
+# 색인 레이아웃 버전 (색인 배열 구성이 바뀌면 증가)
+INDEX_VERSION = 2
+
+# 스냅샷에 저장된 색인의 유효성 확인용 (색인 파라미터가 바뀌면 저장된 색인은 무시되고 로드 시 계산)
+INDEX_SIGNATURE = hashlib.sha1(
+    json.dumps(
+        {
+            "version": INDEX_VERSION,
+            "numeric_columns": NUMERIC_COLUMNS,
+            "keyword_columns": KEYWORD_COLUMNS,
+            "restriction_keywords": RESTRICTION_KEYWORDS,
+            "leaf_size": LEAF_SIZE,
+            "cooking_time_buckets": COOKING_TIME_BUCKETS,
+            "calorie_buckets": CALORIE_BUCKETS,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    ).encode("utf-8")
+).hexdigest()
+
+
+class RecipeStore:
+    """레시피 데이터 저장소 (읽기 전용, 여러 서비스가 공유)"""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        source: str,
+        path: str,
+        ingredients: Optional[IngredientTable] = None,
+        indexes: Optional[Dict[str, Dict[str, np.ndarray]]] = None,
+        lazy_columns: Optional[Dict[str, Sequence]] = None,
+    ):
+        """
+        Args:
+            df: 레시피 DataFrame (정규화 전, RangeIndex)
+            source: 데이터 출처 ("snapshot" | "csv")
+            path: 로드한 파일/디렉토리 경로
+            ingredients: 사전 파싱된 재료 테이블 (None이면 ingredients_parsed 컬럼을 파싱)
+            indexes: 스냅샷에 저장된 색인 배열 (index_arrays() 형식, None이면 계산)
+            lazy_columns: 행 단위 조회 컬럼 {컬럼명: 레시피 위치로 인덱싱 가능한 시퀀스}
+                (None이면 df의 LAZY_COLUMNS 사용)
+        """
+        self.source = source
+        self.path = path
+        # 데이터 버전 (공유 인스턴스 리로드마다 1씩 증가, reload_recipe_store에서 지정)
+        self.version = 1
+        self.loaded_at = datetime.now().isoformat(timespec="seconds")
+        # 로드 시점 원본 파일 상태 (파일 변경 감지용, load()에서 지정)
+        self.fingerprint: Tuple = ()
+        self._leases = 0
+        self._retired = False
+        self._lease_lock = threading.Lock()
+
+        required_cols = REQUIRED_COLUMNS + ([] if ingredients is not None else [INGREDIENTS_COLUMN])
+        missing_cols = [col for col in required_cols if col not in df.columns]
+        if missing_cols:
+            raise ValueError(f"Missing required columns: {missing_cols}")
+
+        if ingredients is None:
+            ingredients = IngredientTable.from_columns(
+                df[INGREDIENTS_COLUMN],
+                df["ingredients_raw"] if "ingredients_raw" in df.columns else None,
+            )
+        indexes = indexes or {}
+        self.shared_indexes = bool(indexes)
+
+        if lazy_columns is None:
+            # copy=True: 원본 DataFrame의 object 블록(JSON 재료 문자열 포함)을 참조로 붙잡지 않도록
+            lazy_columns = {
+                col: df[col].to_numpy(dtype=object, copy=True) for col in LAZY_COLUMNS if col in df.columns
+            }
+        self.lazy_columns = lazy_columns
+
+        # 파싱이 끝난 JSON 문자열과 검색에 쓰지 않는 컬럼은 보관하지 않음
+        self.ingredients = ingredients
+        self.ingredient_index = IngredientIndex(ingredients, indexes.get("ingredient_index"))
+        self.restriction_bitmaps = RestrictionBitmaps(
+            self.ingredient_index, arrays=indexes.get("restriction_bitmaps")
+        )
+        # 스냅샷은 이미 검색 컬럼만 올라오므로 선택(복사) 없이 mmap 배열을 그대로 사용
+        columns = [col for col in SEARCH_COLUMNS if col in df.columns]
+        extra = [col for col in df.columns if col not in columns]
+        df = df.drop(columns=extra) if extra else df.copy(deep=False)
+        self.df = self._normalize(df)
+        self.range_index = RecipeRangeIndex(self.df, NUMERIC_COLUMNS, indexes.get("range_index"))
+        self.difficulty_levels = difficulty_levels(self.df["difficulty"])
+        self.neighbor_index = RecipeNeighborIndex(self.df, self.difficulty_levels, indexes.get("neighbor_index"))
+        self.keyword_index = KeywordIndex(self.df, arrays=indexes.get("keyword_index"))
+        self.partitions = CandidatePartitions(self.df, indexes.get("candidate_partitions"))
+
+    @classmethod
+    def load(cls, csv_path: Path = CSV_PATH, snapshot_dir: Path = SNAPSHOT_DIR) -> "RecipeStore":
+        """
+        레시피 데이터 로드 (스냅샷 우선, 없으면 CSV 폴백)
+
+        Args:
+            csv_path: 원본 CSV 경로
+            snapshot_dir: 컴파일된 스냅샷 디렉토리
+
+        Returns:
+            RecipeStore 인스턴스
+
+        Raises:
+            FileNotFoundError: 스냅샷과 CSV가 모두 없을 때
+            ValueError: 필수 컬럼 누락 시
+        """
+        snapshot = load_snapshot(snapshot_dir)
+        if snapshot is not None:
+            if snapshot.is_stale(csv_path):
+                logger.warning("recipe_snapshot_stale", path=str(snapshot_dir), csv_path=str(csv_path))
+            store = cls.from_snapshot(snapshot)
+        else:
+            if not Path(csv_path).exists():
+                logger.error("csv_file_not_found", path=str(csv_path))
+                raise FileNotFoundError(f"Recipe CSV not found: {csv_path}")
+
+            df, ingredients = _read_csv(csv_path)
+            store = cls(df, source="csv", path=str(csv_path), ingredients=ingredients)
+        store.fingerprint = source_fingerprint(csv_path, snapshot_dir)
+
+        logger.info(
+            "recipe_store_loaded",
+            total_recipes=len(store),
+            source=store.source,
+            path=store.path,
+            shared_indexes=store.shared_indexes,
+        )
+        return store
+
+    @classmethod
+    def from_snapshot(cls, snapshot: RecipeSnapshot) -> "RecipeStore":
+        """
+        열린 스냅샷으로 RecipeStore 생성 (저장된 색인이 있으면 memory-map으로 연결)
+
+        Args:
+            snapshot: 레시피 스냅샷
+
+        Returns:
+            RecipeStore 인스턴스
+        """
+        lazy_columns = {
+            column["name"]: snapshot.lazy_column(column["name"])
+            for column in snapshot.columns
+            if column["kind"] in ("numeric", "string") and column["name"] not in SEARCH_COLUMNS
+        }
+        return cls(
+            snapshot.to_dataframe(columns=SEARCH_COLUMNS, categorical=CATEGORICAL_COLUMNS),
+            source="snapshot",
+            path=str(snapshot.path),
+            ingredients=snapshot.ingredient_table() if snapshot.has_ingredients() else None,
+            indexes=snapshot.indexes(INDEX_SIGNATURE),
+            lazy_columns=lazy_columns,
+        )
+
+    def index_arrays(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        색인 배열 (스냅샷 저장용, RecipeStore(indexes=...)로 복원)
+
+        Returns:
+            {색인 이름: {배열 이름: 배열}}
+        """
+        return {
+            "ingredient_index": self.ingredient_index.to_arrays(),
+            "restriction_bitmaps": self.restriction_bitmaps.to_arrays(),
+            "range_index": self.range_index.to_arrays(),
+            "neighbor_index": self.neighbor_index.to_arrays(),
+            "keyword_index": self.keyword_index.to_arrays(),
+            "candidate_partitions": self.partitions.to_arrays(),
+        }
+
+    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """dtype 및 결측값 정규화 (두 검색 서비스 공통 규칙)"""
+        for col in NUMERIC_COLUMNS:
+            if col in df.columns and df[col].dtype != np.float64:
+                df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype("category")
+
+        if df["cooking_time"].isna().any():
+            df["cooking_time"] = df["cooking_time"].fillna(DEFAULT_COOKING_TIME)
+        difficulty = df["difficulty"]
+        if DEFAULT_DIFFICULTY not in difficulty.cat.categories:
+            difficulty = difficulty.cat.add_categories([DEFAULT_DIFFICULTY])
+        df["difficulty"] = difficulty.fillna(DEFAULT_DIFFICULTY)
+        return df
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    @property
+    def active_queries(self) -> int:
+        """이 버전을 사용 중인 조회 수"""
+        return self._leases
+
+    @contextmanager
+    def lease(self) -> Iterator["RecipeStore"]:
+        """
+        조회 1건 동안 이 버전을 사용 중으로 표시
+
+        리로드로 교체된 이전 버전은 진행 중인 조회가 모두 끝나면 drain 완료
+        (조회는 시작할 때 잡은 버전을 끝까지 사용 → 중간에 데이터가 바뀌지 않음)
+        """
+        with self._lease_lock:
+            self._leases += 1
+        try:
+            yield self
+        finally:
+            with self._lease_lock:
+                self._leases -= 1
+                drained = self._retired and self._leases == 0
+            if drained:
+                logger.info("recipe_store_drained", version=self.version, path=self.path)
+
+    def retire(self) -> None:
+        """새 버전으로 교체됨 표시 (진행 중인 조회가 없으면 바로 drain 완료)"""
+        with self._lease_lock:
+            self._retired = True
+            active = self._leases
+        if active:
+            logger.info("recipe_store_draining", version=self.version, active_queries=active)
+        else:
+            logger.info("recipe_store_drained", version=self.version, path=self.path)
+
+    def difficulty_codes(self, difficulties: Sequence[str]) -> np.ndarray:
+        """난이도 문자열 → Categorical 코드 (데이터에 없는 난이도는 제외)"""
+        codes = self.df["difficulty"].cat.categories.get_indexer(list(difficulties))
+        return codes[codes >= 0]
+
+    def candidate_positions(
+        self,
+        calorie_range: Optional[Tuple[Optional[float], Optional[float]]] = None,
+        max_cooking_time: Optional[float] = None,
+        difficulties: Optional[Sequence[str]] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        칼로리 범위 + 최대 조리 시간 + 허용 난이도를 모두 만족하는 레시피 위치
+
+        후보 파티션 셀 크기와 정렬 색인 구간 크기를 비교해 더 작은 쪽에서 시작
+        (자주 쓰는 조건은 파티션 몇 개로 끝나고, 아주 좁은 칼로리 범위는 정렬 색인이 더 작음)
+
+        Args:
+            calorie_range: 칼로리 (하한, 상한) - 양 끝 포함
+            max_cooking_time: 최대 조리 시간 (분)
+            difficulties: 허용 난이도 목록
+
+        Returns:
+            레시피 위치 배열 (오름차순 = 원래 데이터 순서), 조건이 하나도 없으면 None (전체)
+        """
+        if calorie_range is None and not max_cooking_time and difficulties is None:
+            return None
+
+        codes = self.difficulty_codes(difficulties) if difficulties is not None else None
+        max_cooking_time = max_cooking_time or None
+        partition_size = self.partitions.count(codes, max_cooking_time, calorie_range)
+
+        ranges = {}
+        if calorie_range is not None:
+            ranges["calories"] = calorie_range
+        if max_cooking_time:
+            ranges["cooking_time"] = (None, max_cooking_time)
+        range_size = min(
+            (end - start for start, end in (
+                self.range_index.columns[col].bounds(*bounds) for col, bounds in ranges.items()
+            )),
+            default=len(self),
+        )
+
+        if partition_size <= range_size:
+            positions = self.partitions.query(codes, max_cooking_time, calorie_range)
+        else:
+            positions = self.range_index.query(ranges)
+            if codes is not None:
+                positions = positions[np.isin(self.df["difficulty"].cat.codes.to_numpy()[positions], codes)]
+        return positions
+
+    def lazy_value(self, col: str, row: int):
+        """
+        지연 조회 컬럼의 값 하나 (DataFrame에 올리지 않은 컬럼)
+
+        Args:
+            col: 컬럼명 (예: "ingredients_raw", 스냅샷의 "sodium_mg")
+            row: 레시피 위치
+
+        Returns:
+            값 (결측값/없는 컬럼 = None)
+        """
+        column = self.lazy_columns.get(col)
+        if column is None:
+            return None
+        value = column[row]
+        return None if pd.isna(value) else value
+
+    def lazy_values(self, col: str, rows: np.ndarray) -> np.ndarray:
+        """
+        지연 조회 컬럼의 여러 값 (lazy_value의 배치 버전)
+
+        Args:
+            col: 컬럼명
+            rows: 레시피 위치 배열
+
+        Returns:
+            object 배열 (결측값/없는 컬럼 = None)
+        """
+        column = self.lazy_columns.get(col)
+        if column is None:
+            return np.full(len(rows), None, dtype=object)
+        values = column.take(rows) if hasattr(column, "take") else np.asarray(column[rows], dtype=object)
+        values = values.astype(object, copy=True)
+        values[pd.isna(values)] = None
+        return values
+
+    def records(self, rows: np.ndarray, columns: Sequence[str]) -> List[Dict]:
+        """
+        선택한 레시피 행 → dict 리스트 (컬럼별 take 1회, 행마다 Series를 만들지 않음)
+
+        Args:
+            rows: 레시피 위치 배열
+            columns: 조회할 df 컬럼 (없는 컬럼은 결과에서 빠짐)
+
+        Returns:
+            [{컬럼명: 값}] (결측값 = None)
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        values = {}
+        for col in columns:
+            if col in self.df.columns:
+                column = self.df[col].take(rows)
+                values[col] = column.astype(object).where(column.notna(), None).tolist()
+        return [dict(zip(values, row)) for row in zip(*values.values())]
+
+    def ingredient_names(self, row: int) -> List[str]:
+        """
+        레시피의 재료명 리스트 (재료 테이블 조회, 파싱 없음)
+
+        Args:
+            row: 레시피 위치 (df의 index 값)
+
+        Returns:
+            재료명 리스트
+        """
+        return self.ingredients.names(row)
+
+
+def _read_csv(csv_path: Path) -> Tuple[pd.DataFrame, Optional[IngredientTable]]:
+    """
+    CSV 폴백 로드 (검색/지연 조회/재료 컬럼만, 청크 단위)
+
+    재료 JSON은 청크마다 재료 테이블로 파싱하고 버리므로
+    최대 메모리 ≈ 검색 컬럼 + 청크 1개 분량의 JSON 문자열
+
+    Returns:
+        (재료 JSON을 뺀 DataFrame, 재료 테이블) - 재료 컬럼이 없으면 (원본 DataFrame, None)
+    """
+    usecols = set(SEARCH_COLUMNS) | set(LAZY_COLUMNS) | {INGREDIENTS_COLUMN}
+    # utf-8-sig: BOM 유무와 관계없이 로드
+    chunks = pd.read_csv(
+        csv_path,
+        encoding="utf-8-sig",
+        usecols=lambda col: col in usecols,
+        chunksize=CSV_CHUNK_ROWS,
+    )
+    frames: List[pd.DataFrame] = []
+    has_ingredients = True
+
+    def ingredient_lists():
+        nonlocal has_ingredients
+        for chunk in chunks:
+            if INGREDIENTS_COLUMN not in chunk.columns:
+                has_ingredients = False
+                frames.append(chunk)
+                continue
+            raw = chunk["ingredients_raw"] if "ingredients_raw" in chunk.columns else [None] * len(chunk)
+            yield from map(parse_ingredient_names, chunk[INGREDIENTS_COLUMN], raw)
+            frames.append(chunk.drop(columns=[INGREDIENTS_COLUMN]))
+
+    ingredients = IngredientTable.from_lists(ingredient_lists())
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    return df, ingredients if has_ingredients else None
+
+
+def _build_indexes(snapshot: RecipeSnapshot) -> Tuple[str, Dict[str, Dict[str, np.ndarray]]]:
+    """스냅샷 빌드용 색인 빌더 (컬럼만 기록된 스냅샷으로 색인 계산)"""
+    return INDEX_SIGNATURE, RecipeStore.from_snapshot(snapshot).index_arrays()
+
+
+def build_recipe_snapshot(
+    csv_path: Path = CSV_PATH,
+    snapshot_dir: Path = SNAPSHOT_DIR,
+    source_csv: Optional[Path] = None,
+    etl: Optional[Dict] = None,
+) -> Dict:
+    """
+    CSV → 스냅샷 (컬럼 + 색인 배열)
+
+    Args:
+        csv_path: 레시피 CSV 경로 (원본 또는 ETL 정제 CSV)
+        snapshot_dir: 스냅샷 출력 디렉토리
+        source_csv: 최신 여부 판정 기준 원본 CSV (None이면 csv_path)
+        etl: ETL 설정 {clean_csv, dedup} (ETL 정제 CSV로 빌드할 때)
+
+    Returns:
+        생성된 manifest dict
+    """
+    return build_snapshot(csv_path, snapshot_dir, build_indexes=_build_indexes, source_csv=source_csv, etl=etl)
+
+
+def rebuild_recipe_snapshot(
+    csv_path: Path,
+    snapshot_dir: Path,
+    snapshot: Optional[RecipeSnapshot],
+    workers: Optional[int] = 1,
+) -> Dict:
+    """
+    스냅샷 다시 빌드 (원본 CSV 변경 또는 색인 시그니처 변경 시)
+
+    ETL 출력으로 빌드된 스냅샷은 같은 설정으로 ETL을 다시 거쳐 빌드
+    → 원본 CSV로 바로 빌드하면 중복 제거와 파생 컬럼(est_cost, allergen_mask)이 빠짐
+
+    Args:
+        csv_path: 원본 CSV 경로
+        snapshot_dir: 스냅샷 디렉토리
+        snapshot: 현재 스냅샷 (None이면 원본 CSV로 빌드)
+        workers: ETL 변환 프로세스 수 (None이면 CPU 수)
+
+    Returns:
+        생성된 manifest dict
+    """
+    etl = snapshot.etl if snapshot is not None else None
+    if etl is None:
+        return build_recipe_snapshot(csv_path, snapshot_dir)
+
+    clean_csv = Path(etl["clean_csv"])
+    # 색인 시그니처만 바뀌었으면 기존 정제 CSV 재사용
+    if snapshot.is_stale(csv_path) or not clean_csv.exists():
+        logger.info("recipe_snapshot_etl_rerun", csv_path=str(csv_path), clean_csv=str(clean_csv))
+        run_recipe_etl(csv_path, clean_csv, workers=workers, dedup=etl.get("dedup", True))
+    return build_recipe_snapshot(clean_csv, snapshot_dir, source_csv=csv_path, etl=etl)
+
+
+def ensure_recipe_snapshot(csv_path: Path = CSV_PATH, snapshot_dir: Path = SNAPSHOT_DIR) -> bool:
+    """
+    최신 스냅샷 보장 (없거나, CSV보다 오래되었거나, 색인이 없거나 맞지 않으면 다시 빌드)
+
+    ETL 출력으로 빌드된 스냅샷은 ETL을 다시 실행해 빌드 (rebuild_recipe_snapshot 참고)
+
+    여러 워커를 띄우기 전 부모 프로세스에서 1회 호출 → 워커는 스냅샷을 memory-map으로 열기만 함
+
+    Args:
+        csv_path: 원본 레시피 CSV 경로
+        snapshot_dir: 스냅샷 디렉토리
+
+    Returns:
+        True = 사용 가능한 스냅샷 있음 (False = CSV도 없음, 워커별 CSV 로드로 폴백)
+    """
+    snapshot = load_snapshot(snapshot_dir)
+    if snapshot is not None and not snapshot.is_stale(csv_path) and (
+        not Path(csv_path).exists() or snapshot.indexes(INDEX_SIGNATURE) is not None
+    ):
+        return True
+
+    if not Path(csv_path).exists():
+        logger.warning("recipe_snapshot_unavailable", csv_path=str(csv_path), path=str(snapshot_dir))
+        return snapshot is not None
+
+    # 워커를 띄우기 전이므로 ETL은 CPU 수만큼 프로세스 사용
+    rebuild_recipe_snapshot(csv_path, snapshot_dir, snapshot, workers=None)
+    return True
+
+
+def source_fingerprint(csv_path: Path = CSV_PATH, snapshot_dir: Path = SNAPSHOT_DIR) -> Tuple:
+    """
+    원본 파일 상태 (CSV와 스냅샷 manifest의 크기/수정 시각, 파일 변경 감지용)
+
+    Args:
+        csv_path: 원본 CSV 경로
+        snapshot_dir: 스냅샷 디렉토리
+
+    Returns:
+        비교 가능한 튜플 (없는 파일은 None)
+    """
+    def stat(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            result = path.stat()
+        except OSError:
+            return None
+        return result.st_size, result.st_mtime_ns
+
+    return stat(Path(csv_path)), stat(Path(snapshot_dir) / MANIFEST_FILE)
+
+
+class RecipeReloadInProgressError(RuntimeError):
+    """다른 리로드가 진행 중"""
+
+
+# 경로별 공유 인스턴스 {(csv_path, snapshot_dir): 현재 버전 RecipeStore}
+_stores: Dict[Tuple[str, str], RecipeStore] = {}
+_stores_lock = threading.Lock()
+# 리로드는 한 번에 하나만 (새 버전 구축 중에도 _stores 조회는 막지 않음)
+_reload_lock = threading.Lock()
+
+
+def _store_key(csv_path: Optional[Path], snapshot_dir: Optional[Path]) -> Tuple[str, str]:
+    """공유 인스턴스 키 (절대 경로)"""
+    return str(Path(csv_path or CSV_PATH).resolve()), str(Path(snapshot_dir or SNAPSHOT_DIR).resolve())
+
+
+def get_recipe_store(
+    csv_path: Optional[Path] = None,
+    snapshot_dir: Optional[Path] = None,
+) -> RecipeStore:
+    """
+    RecipeStore 공유 인스턴스 반환 (같은 경로면 프로세스 내 1회만 로드)
+
+    리로드 후에는 새 버전을 반환하므로, 조회 1건 동안은 반환값을 지역 변수로 잡아 사용
+
+    Args:
+        csv_path: 원본 CSV 경로 (None이면 기본 경로)
+        snapshot_dir: 스냅샷 디렉토리 (None이면 기본 경로)
+
+    Returns:
+        RecipeStore 인스턴스
+    """
+    key = _store_key(csv_path, snapshot_dir)
+
+    store = _stores.get(key)
+    if store is None:
+        # 서비스 생성자와 executor 스레드에서 동시에 호출될 수 있으므로 잠금 후 재확인
+        with _stores_lock:
+            store = _stores.get(key)
+            if store is None:
+                store = RecipeStore.load(Path(key[0]), Path(key[1]))
+                _stores[key] = store
+    return store
+
+
+def peek_recipe_store(
+    csv_path: Optional[Path] = None,
+    snapshot_dir: Optional[Path] = None,
+) -> Optional[RecipeStore]:
+    """
+    이미 로드된 공유 인스턴스 (로드하지 않음, 이벤트 루프에서 호출 가능)
+
+    Args:
+        csv_path: 원본 CSV 경로 (None이면 기본 경로)
+        snapshot_dir: 스냅샷 디렉토리 (None이면 기본 경로)
+
+    Returns:
+        현재 버전 RecipeStore (아직 로드 전이면 None)
+    """
+    return _stores.get(_store_key(csv_path, snapshot_dir))
+
+
+def reload_recipe_store(
+    csv_path: Optional[Path] = None,
+    snapshot_dir: Optional[Path] = None,
+) -> RecipeStore:
+    """
+    레시피 데이터 다시 로드 후 공유 인스턴스를 새 버전으로 원자적 교체 (블로킹, executor에서 호출)
+
+    - 스냅샷이 있고 CSV보다 오래되었으면 스냅샷을 다시 빌드한 뒤 로드 (ETL 스냅샷은 ETL부터 다시 실행)
+    - 새 버전 구축 중에는 이전 버전이 계속 조회를 처리
+    - 교체 후 이전 버전은 진행 중인 조회가 끝나면 drain (lease 참고)
+
+    Args:
+        csv_path: 원본 CSV 경로 (None이면 기본 경로)
+        snapshot_dir: 스냅샷 디렉토리 (None이면 기본 경로)
+
+    Returns:
+        새 버전 RecipeStore
+
+    Raises:
+        RecipeReloadInProgressError: 다른 리로드가 진행 중일 때
+        FileNotFoundError: 스냅샷과 CSV가 모두 없을 때 (이전 버전 유지)
+    """
+    key = _store_key(csv_path, snapshot_dir)
+    csv_path, snapshot_dir = Path(key[0]), Path(key[1])
+
+    if not _reload_lock.acquire(blocking=False):
+        raise RecipeReloadInProgressError("Recipe reload already in progress")
+    try:
+        previous = _stores.get(key)
+        logger.info(
+            "recipe_store_reload_started",
+            path=str(snapshot_dir),
+            current_version=previous.version if previous else None,
+        )
+
+        snapshot = load_snapshot(snapshot_dir)
+        if snapshot is not None and snapshot.is_stale(csv_path):
+            # 서버 프로세스 안의 executor 스레드 → ETL은 현재 프로세스에서 실행 (fork 없음)
+            rebuild_recipe_snapshot(csv_path, snapshot_dir, snapshot)
+        store = RecipeStore.load(csv_path, snapshot_dir)
+        store.version = previous.version + 1 if previous else 1
+
+        with _stores_lock:
+            _stores[key] = store
+        logger.info(
+            "recipe_store_swapped",
+            version=store.version,
+            previous_version=previous.version if previous else None,
+            total_recipes=len(store),
+            source=store.source,
+        )
+        if previous is not None:
+            previous.retire()
+        return store
+    finally:
+        _reload_lock.release()
+
+
+def reload_recipe_stores() -> List[RecipeStore]:
+    """
+    로드된 모든 공유 인스턴스 리로드 (블로킹, executor에서 호출)
+
+    Returns:
+        새 버전 RecipeStore 리스트 (로드된 인스턴스가 없으면 기본 경로 1개 로드)
+    """
+    keys = list(_stores) or [_store_key(None, None)]
+    return [reload_recipe_store(Path(csv_path), Path(snapshot_dir)) for csv_path, snapshot_dir in keys]
+
+
+def changed_recipe_stores() -> Dict[Tuple[str, str], Tuple]:
+    """
+    로드 이후 원본 파일(CSV/스냅샷 manifest)이 바뀐 공유 인스턴스
+
+    Returns:
+        {(csv_path, snapshot_dir): 현재 파일 상태}
+    """
+    changed = {}
+    for key, store in list(_stores.items()):
+        fingerprint = source_fingerprint(Path(key[0]), Path(key[1]))
+        if fingerprint != store.fingerprint:
+            changed[key] = fingerprint
+    return changed
@@ -0,0 +1,195 @@
+"""
+전문가 추천 캐시 (구간화된 목표값 기준)
+
+영양사/셰프/예산 프롬프트에는 목표 칼로리·단백질·예산이 그대로 들어가서
+체중이 1kg만 달라도 프롬프트가 달라짐 → 프롬프트 해시 기반 LLM 캐시는 적중하지 않음
+→ (전문가, 끼니, 목표, 요리 실력, 조리 시간, 칼로리/단백질/예산 구간, 제한 재료, 건강 상태) 키로
+  검증된 MealRecommendation을 저장해 비슷한 사용자끼리 재사용
+- 키마다 추천을 여러 개(풀) 모아두고 돌아가며 반환 → 같은 조건의 사용자도 다양한 메뉴를 받음
+- 풀이 최소 크기를 채우기 전에는 항상 LLM 호출 (처음 몇 명이 풀을 채움)
+- 이번 식단에서 이미 쓴 메뉴는 건너뜀 → 풀에 남은 메뉴가 없으면 LLM 호출 후 풀에 추가
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.config import settings
+from app.models.state import MacroTargets, MealRecommendation, UserProfile
+from app.services.alternative_cache import normalize_names
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _bucket(value: Optional[float], size: float) -> Optional[int]:
+    """값 → 구간 번호 (size 단위 반올림, None이면 None)"""
+    if value is None:
+        return None
+    return int(round(value / size)) if size > 0 else int(round(value))
+
+
+def recommendation_cache_key(
+    expert: str,
+    meal_type: str,
+    profile: UserProfile,
+    targets: MacroTargets,
+    budget: Optional[float] = None,
+    base_menu: Optional[str] = None,
+) -> Tuple:
+    """
+    전문가 추천 캐시 키
+
+    Args:
+        expert: 전문가 이름 (nutritionist, chef, budget)
+        meal_type: 끼니 타입
+        profile: 사용자 프로필
+        targets: 1끼니 영양 목표
+        budget: 1끼니 예산 (예산 에이전트만 사용, 나머지는 None)
+        base_menu: 추천의 기반이 된 메뉴 (예산 에이전트는 셰프 추천 재료로 가격을 조정하므로 셰프 메뉴명)
+
+    Returns:
+        해시 가능한 키 튜플
+    """
+    return (
+        expert,
+        meal_type,
+        profile.goal,
+        profile.skill_level,
+        profile.cooking_time,
+        _bucket(targets.calories, settings.RECOMMENDATION_CACHE_CALORIE_BUCKET),
+        _bucket(targets.protein_g, settings.RECOMMENDATION_CACHE_PROTEIN_BUCKET),
+        _bucket(budget, settings.RECOMMENDATION_CACHE_BUDGET_BUCKET),
+        normalize_names(profile.restrictions),
+        normalize_names(profile.health_conditions),
+        base_menu,
+    )
+
+
+class RecommendationPool:
+    """키 하나의 추천 풀 (메뉴명 기준 중복 없음, 순환 커서)"""
+
+    def __init__(self):
+        self.recommendations: List[MealRecommendation] = []
+        self.cursor = 0
+
+
+class ExpertRecommendationCache:
+    """전문가 추천 풀 LRU (스레드 안전, 적중/미스 통계)"""
+
+    def __init__(
+        self,
+        max_keys: Optional[int] = None,
+        pool_size: Optional[int] = None,
+        min_pool: Optional[int] = None,
+    ):
+        """
+        Args:
+            max_keys: 최대 키 수 (None이면 settings.RECOMMENDATION_CACHE_MAX_KEYS, 0이면 비활성화)
+            pool_size: 키당 최대 추천 수 (None이면 settings.RECOMMENDATION_CACHE_POOL_SIZE)
+            min_pool: 재사용을 시작하는 풀 크기 (None이면 settings.RECOMMENDATION_CACHE_MIN_POOL)
+        """
+        self.max_keys = settings.RECOMMENDATION_CACHE_MAX_KEYS if max_keys is None else max_keys
+        self.pool_size = settings.RECOMMENDATION_CACHE_POOL_SIZE if pool_size is None else pool_size
+        self.min_pool = settings.RECOMMENDATION_CACHE_MIN_POOL if min_pool is None else min_pool
+        self._pools: "OrderedDict[Tuple, RecommendationPool]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._pools)
+
+    def get(self, key: Tuple, exclude_menus: Iterable[str] = ()) -> Optional[MealRecommendation]:
+        """
+        풀에서 다음 추천 반환 (순환, 이미 쓴 메뉴는 건너뜀)
+
+        Args:
+            key: recommendation_cache_key 결과
+            exclude_menus: 이번 식단에서 이미 사용한 메뉴명
+
+        Returns:
+            추천 사본 또는 None (풀이 아직 작거나 남은 메뉴가 없으면 None → LLM 호출)
+        """
+        excluded = set(exclude_menus)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None or len(pool.recommendations) < max(self.min_pool, 1):
+                self.misses += 1
+                return None
+
+            self._pools.move_to_end(key)
+            size = len(pool.recommendations)
+            for step in range(size):
+                index = (pool.cursor + step) % size
+                recommendation = pool.recommendations[index]
+                if recommendation.menu_name not in excluded:
+                    pool.cursor = (index + 1) % size
+                    self.hits += 1
+                    return recommendation.model_copy(deep=True)
+
+            self.misses += 1
+            return None
+
+    def put(self, key: Tuple, recommendation: MealRecommendation):
+        """
+        추천을 풀에 추가 (같은 메뉴명은 교체, 풀이 가득 차면 가장 오래된 추천 제거)
+
+        Args:
+            key: recommendation_cache_key 결과
+            recommendation: 검증을 통과한 LLM 추천
+        """
+        if self.max_keys <= 0 or self.pool_size <= 0:
+            return
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = RecommendationPool()
+            self._pools.move_to_end(key)
+
+            stored = recommendation.model_copy(deep=True)
+            for index, existing in enumerate(pool.recommendations):
+                if existing.menu_name == stored.menu_name:
+                    pool.recommendations[index] = stored
+                    break
+            else:
+                pool.recommendations.append(stored)
+                if len(pool.recommendations) > self.pool_size:
+                    pool.recommendations.pop(0)
+                    pool.cursor = max(pool.cursor - 1, 0)
+
+            while len(self._pools) > self.max_keys:
+                self._pools.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._pools.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """적중/미스, 적중률, 키/추천 수"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "keys": len(self._pools),
+                "recommendations": sum(len(pool.recommendations) for pool in self._pools.values()),
+            }
+
+
+# 싱글톤 인스턴스
+_recommendation_cache: Optional[ExpertRecommendationCache] = None
+
+
+def get_recommendation_cache() -> Optional[ExpertRecommendationCache]:
+    """ExpertRecommendationCache 싱글톤 인스턴스 반환 (settings.RECOMMENDATION_CACHE_ENABLED가 False면 None)"""
+    global _recommendation_cache
+
+    if not settings.RECOMMENDATION_CACHE_ENABLED:
+        return None
+
+    if _recommendation_cache is None:
+        _recommendation_cache = ExpertRecommendationCache()
+
+    return _recommendation_cache
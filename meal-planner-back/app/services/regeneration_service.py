@@ -147,6 +147,7 @@ def build_regeneration_state(request: RegenerateMealRequest) -> MealPlanState:
         "nutritionist_recommendation": None,
         "chef_recommendation": None,
         "budget_recommendation": None,
+        "recommendation_cache_keys": {},
         "current_menu": None,
         "validation_results": [],
         "retry_count": 0,
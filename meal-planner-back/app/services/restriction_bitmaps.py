@@ -0,0 +1,252 @@
+"""
+알레르기/식이 선호 비트맵
+
+constants의 ALLERGENS(식약처 22종)와 DIETARY_PREFERENCES 항목별로
+"해당 항목에 걸리는 레시피" 비트셋을 로드 시 1회 계산 (np.packbits, 레시피 8개 = 1바이트)
+- 항목별 재료 키워드(동의어/가공품 포함)로 판정: 알류(계란) → 계란, 달걀, 마요네즈, ...
+  1글자 키워드와 TOKEN_MATCH_KEYWORDS는 재료명 토큰 일치, 나머지는 부분 문자열 (matches_keywords)
+- 요청 처리: 제한 항목 비트셋 OR → 제외 마스크 (재료 스캔 없음)
+- 사전에 없는 자유 입력 제한 재료는 재료 n-gram 역색인으로 기존 규칙(양방향 부분 문자열) 매칭
+- 사전에 있는 항목도 "재료명 ⊂ 제한 항목" 방향은 입력 문자열로 매칭 (반대 방향은 항목명이 키워드에 포함)
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+import numpy as np
+import pandas as pd
+
+from app.services.recipe_ingredients import IngredientIndex, normalize_ingredient_name
+from app.utils.constants import (
+    ALLERGEN_KEYWORDS,
+    DIETARY_PREFERENCE_KEYWORDS,
+    RESTRICTION_ALIASES,
+    TOKEN_MATCH_KEYWORDS,
+)
+
+# 제한 항목 → 재료 키워드
+RESTRICTION_KEYWORDS: Dict[str, List[str]] = {**ALLERGEN_KEYWORDS, **DIETARY_PREFERENCE_KEYWORDS}
+
+# 정규화된 항목명/별칭 → 정식 항목명
+_CANONICAL: Dict[str, str] = {
+    **{normalize_ingredient_name(name): name for name in RESTRICTION_KEYWORDS},
+    **{normalize_ingredient_name(alias): name for alias, name in RESTRICTION_ALIASES.items()},
+}
+
+
+# 재료명/재료 원문 토큰 구분자 (예: "양상추, 로메인", "굴 (생굴)", "밥 200g")
+_TOKEN_SEPARATOR = r"[\s,/()\[\]·]"
+_TOKEN_SEPARATORS = re.compile(_TOKEN_SEPARATOR + "+")
+
+
+def is_token_keyword(keyword: str) -> bool:
+    """재료명 토큰과 정확히 일치할 때만 매칭하는 키워드 (1글자 + TOKEN_MATCH_KEYWORDS)"""
+    return len(keyword) <= 1 or keyword in TOKEN_MATCH_KEYWORDS
+
+
+def ingredient_tokens(text: str) -> Set[str]:
+    """재료명/재료 원문 → 정규화 토큰 집합 (예: "굴 (생굴)" → {"굴", "생굴"})"""
+    return {normalize_ingredient_name(token) for token in _TOKEN_SEPARATORS.split(text) if token}
+
+
+def matches_keywords(text: str, keywords: Iterable[str]) -> bool:
+    """
+    동의어 키워드 매칭
+
+    짧은 키워드는 부분 문자열로 비교하면 "게" ⊂ "가게", "밀" ⊂ "밀키트", "콩" ⊂ "콩나물"처럼
+    다른 재료까지 걸림 → 토큰 일치, 나머지는 정규화 문자열 부분 일치 (예: "마요네즈" ⊂ "마요네즈소스")
+
+    Args:
+        text: 재료명 또는 재료 원문
+        keywords: 정규화된 재료 키워드
+
+    Returns:
+        키워드 중 하나라도 매칭되면 True
+    """
+    normalized = normalize_ingredient_name(text)
+    tokens = None
+    for keyword in keywords:
+        if not is_token_keyword(keyword):
+            if keyword in normalized:
+                return True
+            continue
+        if tokens is None:
+            tokens = ingredient_tokens(text)
+        if keyword in tokens:
+            return True
+    return False
+
+
+def substring_mask(texts: np.ndarray, keywords: Sequence[str]) -> np.ndarray:
+    """
+    정규화 문자열 부분 일치 마스크 (여러 재료 원문을 한 번에, 키워드는 정규식 1개로 묶음)
+
+    Args:
+        texts: 재료 원문 배열 (None = 매칭 없음)
+        keywords: 정규화된 키워드
+
+    Returns:
+        원문별 bool 배열
+    """
+    if not keywords or not len(texts):
+        return np.zeros(len(texts), dtype=bool)
+    normalized = pd.Series(texts, dtype=object).str.lower().str.replace(" ", "", regex=False)
+    pattern = "|".join(re.escape(keyword) for keyword in keywords)
+    return normalized.str.contains(pattern, regex=True, na=False).to_numpy(dtype=bool)
+
+
+def keyword_mask(texts: np.ndarray, keywords: Sequence[str]) -> np.ndarray:
+    """
+    matches_keywords의 배치 버전 (같은 규칙: 짧은 키워드는 토큰 일치, 나머지는 부분 일치)
+
+    Args:
+        texts: 재료 원문 배열 (None = 매칭 없음)
+        keywords: 정규화된 재료 키워드
+
+    Returns:
+        원문별 bool 배열
+    """
+    tokens = [keyword for keyword in keywords if is_token_keyword(keyword)]
+    mask = substring_mask(texts, [keyword for keyword in keywords if not is_token_keyword(keyword)])
+    if tokens and len(texts):
+        alternatives = "|".join(re.escape(token) for token in tokens)
+        pattern = f"(?:^|{_TOKEN_SEPARATOR})(?:{alternatives})(?={_TOKEN_SEPARATOR}|$)"
+        lowered = pd.Series(texts, dtype=object).str.lower()
+        mask |= lowered.str.contains(pattern, regex=True, na=False).to_numpy(dtype=bool)
+    return mask
+
+
+def canonical_restriction(restriction: str) -> Optional[str]:
+    """
+    제한 항목 정식 이름 조회
+
+    Args:
+        restriction: 사용자 입력 제한 항목 (예: "계란", "알류(계란)", "채식")
+
+    Returns:
+        정식 항목명 (사전에 없으면 None)
+    """
+    return _CANONICAL.get(normalize_ingredient_name(restriction))
+
+
+def synonym_keywords(restrictions: Iterable[str]) -> List[str]:
+    """
+    사전에 있는 제한 항목의 동의어 키워드 (정규화, matches_keywords 규칙으로 비교)
+
+    Args:
+        restrictions: 제한 항목 리스트
+
+    Returns:
+        키워드 리스트 (사전에 없는 자유 입력 항목은 제외 → 입력 문자열 그대로 부분 일치)
+    """
+    keywords = []
+    for restriction in restrictions:
+        name = canonical_restriction(restriction)
+        if name is not None:
+            keywords.extend(normalize_ingredient_name(k) for k in RESTRICTION_KEYWORDS[name])
+    return list(dict.fromkeys(keywords))
+
+
+def expand_restrictions(restrictions: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    제한 항목 → 매칭할 재료 키워드 (정규화)
+
+    Args:
+        restrictions: 제한 항목 리스트
+
+    Returns:
+        {입력 제한 항목: 재료 키워드 리스트} (사전에 없는 항목은 자기 자신만)
+    """
+    expanded = {}
+    for restriction in restrictions:
+        name = canonical_restriction(restriction)
+        if name is None:
+            expanded[restriction] = [normalize_ingredient_name(restriction)]
+        else:
+            expanded[restriction] = [normalize_ingredient_name(k) for k in RESTRICTION_KEYWORDS[name]]
+    return expanded
+
+
+class RestrictionBitmaps:
+    """제한 항목별 레시피 비트셋 (읽기 전용)"""
+
+    def __init__(
+        self,
+        index: IngredientIndex,
+        keywords: Dict[str, List[str]] = RESTRICTION_KEYWORDS,
+        arrays: Optional[Dict[str, np.ndarray]] = None,
+    ):
+        """
+        Args:
+            index: 재료 n-gram 역색인
+            keywords: 제한 항목 → 재료 키워드
+            arrays: to_arrays()로 저장한 비트셋 (스냅샷, None이면 계산)
+        """
+        self.index = index
+        self.row_count = len(index.table)
+        self.names = list(keywords)
+        self.positions = {name: i for i, name in enumerate(self.names)}
+
+        if arrays is not None:
+            self.bits = arrays["bits"]
+            return
+
+        # 토큰 일치 키워드용: 재료명 토큰 → 재료 ID
+        token_ids: Dict[str, List[int]] = {}
+        for vocab_id, ingredient in enumerate(index.table.vocab):
+            for token in ingredient_tokens(ingredient):
+                token_ids.setdefault(token, []).append(vocab_id)
+
+        # bits[i]: 항목 i의 키워드에 매칭되는 재료가 있는 레시피 (packed, matches_keywords와 같은 규칙)
+        self.bits = np.zeros((len(self.names), (self.row_count + 7) // 8), dtype=np.uint8)
+        for i, name in enumerate(self.names):
+            normalized = [normalize_ingredient_name(k) for k in keywords[name]]
+            substring = [k for k in normalized if not is_token_keyword(k)]
+            rows = index.excluded_rows(substring, bidirectional=False)
+            token_matches = [vocab_id for k in normalized if is_token_keyword(k) for vocab_id in token_ids.get(k, [])]
+            rows |= index.rows_with(np.array(token_matches, dtype=np.int64))
+            self.bits[i] = np.packbits(rows)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """비트셋 배열 (스냅샷 저장용)"""
+        return {"bits": self.bits}
+
+    def rows(self, name: str) -> np.ndarray:
+        """제한 항목 하나의 레시피 마스크"""
+        return np.unpackbits(self.bits[self.positions[name]], count=self.row_count).view(bool)
+
+    def excluded_rows(self, restrictions: List[str], bidirectional: bool = True) -> np.ndarray:
+        """
+        제한 항목에 걸리는 레시피 마스크
+
+        Args:
+            restrictions: 제한 항목 리스트 (알레르기/식이 선호/자유 입력 재료)
+            bidirectional: 입력 문자열의 매칭 방향 (IngredientIndex.excluded_rows 참고)
+
+        Returns:
+            레시피별 bool 배열 (True = 제외)
+        """
+        selected = set()
+        canonical = []
+        free_text = []
+        for restriction in restrictions:
+            name = canonical_restriction(restriction)
+            if name is not None and name in self.positions:
+                selected.add(self.positions[name])
+                canonical.append(restriction)
+            else:
+                free_text.append(restriction)
+
+        if selected:
+            packed = np.bitwise_or.reduce(self.bits[sorted(selected)], axis=0)
+            excluded = np.unpackbits(packed, count=self.row_count).view(bool)
+        else:
+            excluded = np.zeros(self.row_count, dtype=bool)
+
+        if free_text:
+            excluded |= self.index.excluded_rows(free_text, bidirectional)
+        # 사전 항목도 "재료명 ⊂ 제한 항목" 방향 유지 (예: 재료 "알" ⊂ 제한 "알류(계란)")
+        # 반대 방향은 비트셋이 처리 (항목명 "게"가 "가게"에 부분 일치하지 않도록 키워드 규칙 적용)
+        if canonical and bidirectional:
+            excluded |= self.index.contained_in_rows(canonical)
+        return excluded
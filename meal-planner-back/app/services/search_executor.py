@@ -0,0 +1,133 @@
+"""
+레시피 검색 실행기 (CPU 작업을 이벤트 루프 밖에서 실행)
+
+레시피 검색/점수 계산은 async 메서드 안에서 동기적으로 실행되어
+그동안 진행 중인 SSE 스트림과 LLM 콜백이 멈춤 → 전용 스레드 풀에서 실행
+- 검색은 NumPy 배열 연산 위주(정렬 색인, 비트셋, KD-tree)라 대부분 GIL을 풀고 실행됨
+- 대기/실행 중인 작업 수(queue depth)를 /api/health와 로그로 노출
+- SEARCH_EXECUTOR_WORKERS=0이면 이벤트 루프에서 바로 실행 (디버깅용)
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.config import settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SearchExecutor:
+    """레시피 검색 전용 스레드 풀 (대기/실행 작업 수 집계)"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: 작업 스레드 수 (None이면 settings.SEARCH_EXECUTOR_WORKERS, 0이면 인라인 실행)
+        """
+        self.max_workers = settings.SEARCH_EXECUTOR_WORKERS if max_workers is None else max_workers
+        self._pool = (
+            ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="recipe-search")
+            if self.max_workers > 0 else None
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """제출되었지만 아직 시작하지 않은 작업 수"""
+        return self._queued
+
+    @property
+    def active(self) -> int:
+        """실행 중인 작업 수"""
+        return self._active
+
+    def stats(self) -> Dict[str, int]:
+        """작업 스레드/대기/실행/완료 수"""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queued": self._queued,
+                "active": self._active,
+                "completed": self._completed,
+            }
+
+    def _track(self, fn: Callable[[], Any]) -> Any:
+        """작업 스레드에서 실행 (대기 → 실행 → 완료 집계)"""
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return fn()
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        동기 검색 함수를 스레드 풀에서 실행하고 결과를 기다림
+
+        호출 시점의 contextvars(structlog 요청 컨텍스트 등)를 작업 스레드로 전달
+
+        Args:
+            fn: CPU 위주 동기 함수
+            *args, **kwargs: fn 인자
+
+        Returns:
+            fn 반환값 (예외는 그대로 전파)
+        """
+        call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+        if self._pool is None:
+            return call()
+
+        with self._lock:
+            self._queued += 1
+            queued = self._queued
+        if queued > self.max_workers:
+            logger.info("search_executor_backlog", queued=queued, workers=self.max_workers)
+
+        future = self._pool.submit(self._track, call)
+        future.add_done_callback(self._release_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def _release_cancelled(self, future: Future):
+        """시작 전에 취소된 작업(요청 취소)은 대기 수에서 제외"""
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    def shutdown(self):
+        """스레드 풀 종료 (진행 중인 작업은 끝날 때까지 대기)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+
+
+# 싱글톤 인스턴스
+_search_executor: Optional[SearchExecutor] = None
+
+
+def get_search_executor() -> SearchExecutor:
+    """SearchExecutor 싱글톤 인스턴스 반환"""
+    global _search_executor
+
+    if _search_executor is None:
+        _search_executor = SearchExecutor()
+
+    return _search_executor
+
+
+def shutdown_search_executor():
+    """싱글톤 스레드 풀 종료 (서버 종료 시)"""
+    global _search_executor
+
+    if _search_executor is not None:
+        _search_executor.shutdown()
+        _search_executor = None
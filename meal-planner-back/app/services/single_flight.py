@@ -0,0 +1,143 @@
+"""
+단일 실행 (single-flight) - 같은 키의 동시 호출을 하나로 합침
+
+같은 프로필 요청이 동시에 여러 개 돌거나 재시도가 같은 프롬프트를 보내면
+LLM 캐시에 결과가 저장되기 전이라 같은 호출이 중복으로 나감
+→ 진행 중인 호출이 있으면 새 호출을 보내지 않고 그 결과를 함께 기다림
+- 공유 작업은 asyncio.shield로 감싸서 기다림 → 한 호출자가 취소(연결 종료)되어도 다른 호출자는 영향 없음
+- 기다리는 호출자가 모두 취소되면 공유 작업도 취소 (아무도 안 쓰는 LLM 호출을 끝까지 하지 않음)
+- 예외는 기다리던 모든 호출자에게 그대로 전파, 완료 후에는 키를 지워 다음 호출은 새로 실행
+- 진행 중 이벤트(do_with_events)는 지금 기다리는 모든 호출자에게 전달 → 먼저 시작한 호출자가 떠나도
+  나머지 호출자는 계속 받음, 늦게 합류한 호출자는 이미 나온 이벤트부터 다시 받음
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+Listener = Callable[..., None]
+
+
+class _Flight:
+    """진행 중인 공유 작업 + 기다리는 호출자 수 + 진행 중 이벤트 구독자"""
+
+    __slots__ = ("task", "waiters", "listeners", "history")
+
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+        self.waiters = 0
+        self.listeners: List[Listener] = []
+        self.history: List[Tuple[Any, ...]] = []
+
+    def emit(self, *event: Any):
+        """이벤트를 현재 구독자 모두에게 전달 (실패한 구독자는 제외, 작업에는 영향 없음)"""
+        self.history.append(event)
+        for listener in list(self.listeners):
+            try:
+                listener(*event)
+            except Exception as e:
+                logger.warning("single_flight_listener_failed", error=str(e))
+                self.unsubscribe(listener)
+
+    def subscribe(self, listener: Listener):
+        """구독 시작 (이미 나온 이벤트부터 전달)"""
+        self.listeners.append(listener)
+        for event in list(self.history):
+            if listener not in self.listeners:
+                break
+            try:
+                listener(*event)
+            except Exception as e:
+                logger.warning("single_flight_listener_failed", error=str(e))
+                self.unsubscribe(listener)
+
+    def unsubscribe(self, listener: Listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+
+class SingleFlight:
+    """키별 진행 중 작업 공유 (단일 이벤트 루프에서 사용)"""
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.started = 0
+        self.joined = 0
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def _forget(self, key: Hashable, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        같은 키의 작업이 진행 중이면 그 결과를 기다리고, 없으면 fn()을 새로 실행
+
+        Args:
+            key: 작업 키 (같은 키 = 같은 결과)
+            fn: 결과를 만드는 코루틴 함수 (진행 중인 작업이 없을 때만 호출)
+
+        Returns:
+            공유 작업 결과 (예외도 공유)
+
+        Raises:
+            asyncio.CancelledError: 이 호출자가 취소된 경우 (다른 호출자는 계속 기다림)
+        """
+        return await self.do_with_events(key, lambda emit: fn())
+
+    async def do_with_events(
+        self,
+        key: Hashable,
+        fn: Callable[[Callable[..., None]], Awaitable[T]],
+        listener: Optional[Listener] = None,
+    ) -> T:
+        """
+        do()와 같고, 공유 작업이 보내는 진행 중 이벤트를 기다리는 호출자 모두에게 전달
+
+        Args:
+            key: 작업 키 (같은 키 = 같은 결과)
+            fn: emit 함수를 받아 결과를 만드는 코루틴 함수 (emit(*event)로 이벤트 전송)
+            listener: 이 호출자가 받을 이벤트 콜백 (None이면 결과만 기다림, 호출자가 떠나면 구독 해제)
+
+        Returns:
+            공유 작업 결과 (예외도 공유)
+
+        Raises:
+            asyncio.CancelledError: 이 호출자가 취소된 경우 (다른 호출자는 계속 기다림)
+        """
+        flight = self._flights.get(key)
+        if flight is None or flight.task.get_loop() is not asyncio.get_running_loop():
+            flight = _Flight()
+            flight.task = asyncio.ensure_future(fn(flight.emit))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self.started += 1
+        else:
+            self.joined += 1
+            logger.info("single_flight_joined", waiters=flight.waiters + 1)
+
+        flight.waiters += 1
+        if listener is not None:
+            flight.subscribe(listener)
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if listener is not None:
+                flight.unsubscribe(listener)
+            if flight.waiters == 0 and not flight.task.done():
+                # 마지막 호출자까지 취소됨 → 공유 작업 취소, 새 호출자가 취소 중인 작업에 합류하지 않도록 바로 제거
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def stats(self) -> Dict[str, int]:
+        """새로 실행/합류한 호출 수, 진행 중인 작업 수"""
+        return {"started": self.started, "joined": self.joined, "in_flight": len(self._flights)}
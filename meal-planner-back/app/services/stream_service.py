@@ -7,15 +7,39 @@ Event-Driven 방식으로 LangGraph 이벤트를 SSE 형식으로 변환
 
 import asyncio
 import json
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Tuple
 from app.agents.graphs.main_graph import get_meal_planner_graph
 from app.models.state import MealPlanState, UserProfile
 from app.models.requests import MealPlanRequest
+from app.services.llm_streaming import partial_streaming_enabled
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+async def iterate_graph(graph, initial_state: MealPlanState, config: dict) -> AsyncGenerator[Tuple[str, Any], None]:
+    """
+    그래프 실행 결과를 ("updates", 노드별 상태 업데이트) / ("custom", 부분 진행 이벤트)로 전달
+
+    LLM 스트리밍이 켜져 있으면 노드 실행 중에 get_stream_writer로 보낸 부분 이벤트(메뉴명/재료)도 함께 받음
+
+    Args:
+        graph: 컴파일된 LangGraph 그래프
+        initial_state: 초기 상태
+        config: 실행 설정 (recursion_limit 등)
+
+    Yields:
+        (스트림 모드, 내용)
+    """
+    if not partial_streaming_enabled():
+        async for chunk in graph.astream(initial_state, config=config):
+            yield "updates", chunk
+        return
+
+    async for mode, chunk in graph.astream(initial_state, config=config, stream_mode=["updates", "custom"]):
+        yield mode, chunk
+
+
 async def stream_meal_plan(
     request: MealPlanRequest
 ) -> AsyncGenerator[str, None]:
@@ -64,6 +88,7 @@ async def stream_meal_plan(
             "nutritionist_recommendation": None,
             "chef_recommendation": None,
             "budget_recommendation": None,
+            "recommendation_cache_keys": {},
             "current_menu": None,
             "validation_results": [],
             "retry_count": 0,
@@ -96,7 +121,13 @@ async def stream_meal_plan(
         partial_events_sent = 0
         final_state = None  # Store final state from astream
 
-        async for chunk in graph.astream(initial_state, config=config):
+        async for mode, chunk in iterate_graph(graph, initial_state, config):
+            if mode == "custom":
+                # 노드 실행 중 부분 진행 이벤트 (LLM 응답 스트리밍 중 완성된 메뉴명/재료)
+                yield format_sse(transform_event(chunk, chunk.get("node", "")))
+                partial_events_sent += 1
+                continue
+
             event_count += 1
 
             # Save the last chunk as final state
@@ -356,7 +387,13 @@ async def stream_meal_regeneration(
         partial_events_sent = 0
         final_state = None
 
-        async for chunk in subgraph.astream(initial_state, config=config):
+        async for mode, chunk in iterate_graph(subgraph, initial_state, config):
+            if mode == "custom":
+                # 노드 실행 중 부분 진행 이벤트 (LLM 응답 스트리밍 중 완성된 메뉴명/재료)
+                yield format_sse(transform_regeneration_event(chunk, chunk.get("node", "")))
+                partial_events_sent += 1
+                continue
+
             event_count += 1
             final_state = chunk
 
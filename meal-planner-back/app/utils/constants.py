@@ -49,6 +49,13 @@ COOKING_TIME_LIMITS = {
     "제한 없음": 180,
 }
 
+# 조리 실력별 허용 레시피 난이도 (초급 → 아무나, 중급 → 초급, 고급 → 중급까지)
+SKILL_LEVEL_DIFFICULTIES = {
+    "초급": ["아무나"],
+    "중급": ["아무나", "초급"],
+    "고급": ["아무나", "초급", "중급"],
+}
+
 # 검증 허용 범위
 VALIDATION_TOLERANCE = 0.20  # ±20%
 
@@ -80,6 +87,81 @@ DIETARY_PREFERENCES = [
     "저염식", "저당식", "저지방", "글루텐프리",
 ]
 
+# 제한 항목별 재료 키워드 (재료명에 키워드가 포함되면 해당 제한에 걸림)
+# - 알레르기: 가공품/다른 이름까지 포함 (예: 알류(계란) → 달걀, 마요네즈)
+# - 식이 선호: 재료로 판단 가능한 항목만 (저염식/저당식/저지방은 영양소 기준 → 영양 검증에서 처리)
+# - 1글자 키워드와 TOKEN_MATCH_KEYWORDS는 재료명 토큰과 정확히 일치할 때만 매칭
+#   → 자주 쓰는 합성어는 따로 나열 (예: 닭 → 닭가슴살, 빵 → 식빵)
+_CHICKEN_KEYWORDS = ["닭", "닭고기", "닭가슴살", "닭다리", "닭안심", "닭날개", "닭봉", "닭갈비", "치킨"]
+_HAM_KEYWORDS = ["햄", "스팸", "슬라이스햄"]
+_CRAB_KEYWORDS = ["게", "게살", "게장", "꽃게", "대게", "킹크랩", "맛살"]
+_OYSTER_KEYWORDS = ["굴", "생굴", "굴소스"]
+_WHEAT_KEYWORDS = [
+    "밀", "통밀", "밀가루", "부침가루", "튀김가루", "빵가루", "국수", "라면", "우동", "소면", "수제비",
+    "빵", "식빵", "모닝빵", "바게트", "만두피", "파스타", "스파게티",
+]
+_MEAT_KEYWORDS = [
+    "돼지고기", "삼겹살", "목살", "항정살", "베이컨", *_HAM_KEYWORDS, "소시지", "쇠고기", "소고기",
+    "양지", "사태", "차돌", "갈비", "등심", "안심", *_CHICKEN_KEYWORDS, "오리고기", "양고기", "토끼고기",
+    "고기", "육수", "사골",
+]
+_SEAFOOD_KEYWORDS = [
+    "고등어", "생선", "연어", "참치", "멸치", "명태", "동태", "황태", "코다리", "대구",
+    "갈치", "꽁치", "삼치", "오징어", "낙지", "문어", "쭈꾸미", "주꾸미", "새우", *_CRAB_KEYWORDS,
+    "조개", "바지락", "홍합", *_OYSTER_KEYWORDS, "전복", "가리비", "어묵", "젓갈",
+    "액젓", "까나리",
+]
+_EGG_DAIRY_KEYWORDS = [
+    "계란", "달걀", "메추리알", "마요네즈", "우유", "치즈", "버터", "요거트", "요구르트",
+    "생크림", "크림", "연유",
+]
+
+ALLERGEN_KEYWORDS = {
+    "알류(계란)": ["계란", "달걀", "메추리알", "마요네즈", "에그"],
+    "우유": ["우유", "치즈", "버터", "요거트", "요구르트", "생크림", "연유", "분유", "크림"],
+    "메밀": ["메밀"],
+    "땅콩": ["땅콩", "피넛"],
+    "대두": ["대두", "콩", "검은콩", "서리태", "콩가루", "메주", "두부", "된장", "간장", "두유", "유부", "청국장", "고추장"],
+    "밀": _WHEAT_KEYWORDS,
+    "고등어": ["고등어"],
+    "게": _CRAB_KEYWORDS,
+    "새우": ["새우", "새우젓", "칵테일새우"],
+    "돼지고기": ["돼지고기", "돼지", "삼겹살", "목살", "항정살", "베이컨", *_HAM_KEYWORDS, "소시지", "족발"],
+    "복숭아": ["복숭아", "황도", "백도"],
+    "토마토": ["토마토", "케첩", "케찹"],
+    "아황산류": ["아황산", "와인", "건포도", "말린과일"],
+    "호두": ["호두"],
+    "닭고기": _CHICKEN_KEYWORDS,
+    "쇠고기": ["쇠고기", "소고기", "양지", "사태", "차돌", "우둔", "등심", "안심", "사골"],
+    "오징어": ["오징어"],
+    "조개류": ["조개", "바지락", "홍합", *_OYSTER_KEYWORDS, "전복", "가리비", "모시조개", "꼬막", "재첩"],
+    "잣": ["잣", "잣가루"],
+    "오리고기": ["오리고기", "훈제오리", "오리훈제", "오리주물럭"],
+    "토끼고기": ["토끼"],
+    "아몬드": ["아몬드"],
+}
+
+DIETARY_PREFERENCE_KEYWORDS = {
+    "채식(락토오보)": _MEAT_KEYWORDS + _SEAFOOD_KEYWORDS,
+    "비건": _MEAT_KEYWORDS + _SEAFOOD_KEYWORDS + _EGG_DAIRY_KEYWORDS + ["꿀", "벌꿀"],
+    "페스코": _MEAT_KEYWORDS,
+    "글루텐프리": _WHEAT_KEYWORDS + ["보리", "호밀"],
+}
+
+# 부분 문자열로 비교하면 다른 재료까지 걸리는 2글자 이상 키워드 (1글자 키워드는 항상 토큰 일치)
+# 예: "크림" ⊂ "코코넛크림" (1글자: "게" ⊂ "가게", "밀" ⊂ "밀키트", "콩" ⊂ "콩나물", "굴" ⊂ "굴비")
+TOKEN_MATCH_KEYWORDS = {"크림"}
+
+# 제한 항목 별칭 (프론트엔드 표기 → 정식 항목명)
+RESTRICTION_ALIASES = {
+    "계란": "알류(계란)",
+    "달걀": "알류(계란)",
+    "알류": "알류(계란)",
+    "소고기": "쇠고기",
+    "채식": "채식(락토오보)",
+    "락토오보": "채식(락토오보)",
+}
+
 # 재시도 매핑: 실패한 검증기 → 재실행할 전문가
 RETRY_MAPPING = {
     "nutrition_checker": "nutritionist",
@@ -93,3 +175,4 @@ RETRY_MAPPING = {
 RECIPE_SEARCH_LIMIT = 5
 RECIPE_CACHE_TTL_SECONDS = 300  # 5분
 ENABLE_RECIPE_SEARCH = True
+ALTERNATIVE_BATCH_MAX_MEALS = 28  # 7일 × 4끼
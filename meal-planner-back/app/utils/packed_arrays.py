@@ -0,0 +1,54 @@
+"""
+배열 묶음 직렬화 유틸리티
+
+색인 객체를 이름 붙은 NumPy 배열 묶음({이름: 배열})으로 저장/복원할 때 사용
+(스냅샷 .npy 파일로 저장 → memory-map으로 열어 워커 간 공유)
+- 문자열 리스트: (offsets, UTF-8 바이트) 두 배열
+- 중첩 객체: "접두사.이름" 키로 평탄화
+"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+def encode_string_table(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """문자열 리스트 → (offsets[int64, n+1], UTF-8 바이트[uint8])"""
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        offsets[1:] = np.cumsum([len(b) for b in encoded])
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return offsets, data
+
+
+def decode_string_table(offsets: np.ndarray, data: np.ndarray) -> List[str]:
+    """(offsets, UTF-8 바이트) → 문자열 리스트"""
+    raw = data.tobytes()
+    bounds = offsets.tolist()
+    return [raw[bounds[i]:bounds[i + 1]].decode("utf-8") for i in range(len(bounds) - 1)]
+
+
+class StringTable:
+    """(offsets, UTF-8 바이트) 문자열 리스트의 지연 디코딩 뷰 (조회한 원소만 디코딩)"""
+
+    def __init__(self, offsets: np.ndarray, data: np.ndarray):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self.data[self.offsets[i]:self.offsets[i + 1]].tobytes().decode("utf-8")
+
+
+def prefix_arrays(prefix: str, arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """배열 묶음 키에 접두사 추가 ("prefix.key")"""
+    return {f"{prefix}.{key}": value for key, value in arrays.items()}
+
+
+def sub_arrays(arrays: Dict[str, np.ndarray], prefix: str) -> Dict[str, np.ndarray]:
+    """prefix_arrays로 추가한 접두사의 배열만 꺼냄 (접두사 제거)"""
+    start = len(prefix) + 1
+    return {key[start:]: value for key, value in arrays.items() if key.startswith(prefix + ".")}
@@ -2,19 +2,40 @@
 FastAPI 서버 실행기
 
 uvicorn으로 서버 실행
+- WORKERS ≥ 2: 부모 프로세스에서 레시피 스냅샷(컬럼 + 색인)을 1회 준비한 뒤 워커 실행
+  → 각 워커는 스냅샷을 memory-map으로 읽기 전용 연결 (CSV 재파싱/색인 재계산 없음, 페이지 캐시 공유)
 """
 
 import uvicorn
 from app.config import settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def prepare_recipe_snapshot() -> None:
+    """워커 실행 전 레시피 스냅샷 준비 (실패해도 워커별 CSV 로드로 폴백)"""
+    from app.services.recipe_store import ensure_recipe_snapshot
+
+    try:
+        ensure_recipe_snapshot()
+    except Exception as e:
+        logger.warning("recipe_snapshot_prepare_failed", error=str(e))
 
 
 def main():
     """서버 실행"""
+    # reload 모드는 워커를 1개만 사용
+    workers = 1 if settings.DEBUG else max(settings.WORKERS, 1)
+    if workers > 1:
+        prepare_recipe_snapshot()
+
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
+        workers=workers,
         log_level="info" if not settings.DEBUG else "debug",
     )
 
@@ -0,0 +1,428 @@
+"""
+Scaling benchmark for the local recipe search paths.
+
+Generates synthetic recipe datasets (realistic Korean recipe names, Zipf-like
+ingredient popularity, correlated nutrition), then measures for each size:
+load time, RSS, and p50/p99 latency of
+    - CSVRecipeSearchService.search_alternative_recipes   (/api/alternative-recipes)
+    - RecipeSearchService._search_local_csv               (agent keyword search)
+under several restriction mixes. Each size is measured in a fresh subprocess
+so RSS is not polluted by the previous dataset. The JSON report records the
+git commit and library versions; pass --compare to diff against an older report.
+
+Usage:
+    python scripts/benchmark_recipe_search.py
+    python scripts/benchmark_recipe_search.py --sizes 10k,100k,1m,10m --source snapshot
+    python scripts/benchmark_recipe_search.py --out bench.json --compare bench_main.json
+
+Output:
+    - data/benchmark/recipes_<size>.csv (generated once per size and seed, reused)
+    - benchmark_report.json (or --out)
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+DATA_DIR = project_root / "data" / "benchmark"
+
+GENERATE_CHUNK_ROWS = 200_000
+
+# 요리 종류 → 카테고리
+DISHES = {
+    "김치찌개": "국/찌개", "된장찌개": "국/찌개", "순두부찌개": "국/찌개", "미역국": "국/찌개", "국": "국/찌개",
+    "볶음": "반찬", "조림": "반찬", "무침": "반찬", "장조림": "반찬", "나물": "반찬",
+    "구이": "구이", "스테이크": "구이", "전": "전/부침", "부침개": "전/부침",
+    "볶음밥": "밥", "덮밥": "밥", "비빔밥": "밥", "김밥": "밥", "주먹밥": "밥",
+    "국수": "면", "파스타": "면", "라면": "면", "우동": "면",
+    "샐러드": "샐러드", "찜": "찜", "샌드위치": "빵", "토스트": "빵",
+}
+
+# 주재료 분류 → 대표 재료
+MAIN_INGREDIENTS = {
+    "돼지고기": ["돼지고기", "삼겹살", "목살", "앞다리살"],
+    "소고기": ["소고기", "차돌박이", "다진 소고기"],
+    "닭고기": ["닭가슴살", "닭다리살", "닭봉"],
+    "해물": ["새우", "오징어", "조개", "꽃게"],
+    "생선": ["고등어", "연어", "갈치", "참치"],
+    "채소": ["애호박", "감자", "양배추", "버섯", "시금치", "콩나물"],
+    "달걀": ["계란", "메추리알"],
+    "두부": ["두부", "순두부"],
+    "가공식품": ["햄", "스팸", "어묵", "소시지"],
+    "곡류": ["밥", "떡", "밀가루", "국수"],
+}
+
+MODIFIERS = ["", "", "", "매콤한 ", "초간단 ", "엄마표 ", "다이어트 ", "황금레시피 ", "자취생 ", "캠핑 ", "10분 완성 "]
+
+# 양념/부재료 (앞쪽일수록 자주 쓰임)
+COMMON_INGREDIENTS = [
+    "대파", "마늘", "간장", "양파", "참기름", "소금", "설탕", "고춧가루", "후추", "식용유",
+    "깨", "고추장", "된장", "물엿", "청양고추", "당근", "다진마늘", "올리고당", "맛술", "생강",
+    "우유", "버터", "치즈", "밀가루", "부침가루", "김치", "케첩", "마요네즈", "굴소스", "식초",
+    "새우젓", "멸치액젓", "땅콩", "호두", "잣", "토마토", "오이", "깻잎", "부추", "쪽파",
+    "파프리카", "브로콜리", "표고버섯", "팽이버섯", "무", "배추", "고구마", "단호박", "옥수수", "레몬",
+]
+
+# 긴 꼬리 재료 (접두어 × 기본 재료)
+_PREFIXES = ["", "냉동 ", "국산 ", "유기농 ", "다진 ", "손질 ", "건 ", "생 "]
+
+DIFFICULTIES = (["아무나", "초급", "중급", "고급"], [0.2, 0.5, 0.25, 0.05])
+COOKING_TIMES = ([5, 10, 15, 20, 30, 40, 60, 90, 120], [0.03, 0.15, 0.17, 0.2, 0.2, 0.1, 0.1, 0.03, 0.02])
+
+# 측정 시나리오: 제한 재료 조합
+RESTRICTION_MIXES = {
+    "none": [],
+    "allergy": ["알류(계란)", "우유"],
+    "free_text": ["청양고추", "버섯"],
+    "mixed": ["땅콩", "새우", "마늘"],
+}
+
+KEYWORDS = ["찌개", "볶음", "샐러드", "닭가슴살", "두부", "밥", "국수", "매콤", "초간단", "구이"]
+
+
+def parse_size(text: str) -> int:
+    """'10k' → 10000, '1m' → 1000000"""
+    text = text.strip().lower()
+    scale = {"k": 1_000, "m": 1_000_000}.get(text[-1], 1)
+    return int(float(text.rstrip("km")) * scale)
+
+
+def format_size(rows: int) -> str:
+    """10000 → '10k'"""
+    if rows >= 1_000_000 and rows % 1_000_000 == 0:
+        return f"{rows // 1_000_000}m"
+    if rows >= 1_000 and rows % 1_000 == 0:
+        return f"{rows // 1_000}k"
+    return str(rows)
+
+
+def _ingredient_vocab():
+    """재료 사전과 인기도 가중치 (Zipf)"""
+    bases = COMMON_INGREDIENTS + [name for names in MAIN_INGREDIENTS.values() for name in names]
+    vocab = COMMON_INGREDIENTS + [p + b for p in _PREFIXES[1:] for b in bases]
+    weights = 1.0 / np.arange(1, len(vocab) + 1) ** 1.1
+    return np.array(vocab, dtype=object), weights / weights.sum()
+
+
+def generate_chunk(rows: int, start_id: int, rng: np.random.Generator) -> pd.DataFrame:
+    """
+    합성 레시피 청크 (recipes_with_nutrition.csv와 같은 컬럼)
+
+    Args:
+        rows: 행 수
+        start_id: 첫 rcp_id
+        rng: 난수 생성기
+
+    Returns:
+        레시피 DataFrame
+    """
+    vocab, weights = _ingredient_vocab()
+    dishes = list(DISHES)
+    mains = list(MAIN_INGREDIENTS)
+
+    dish = rng.choice(dishes, rows)
+    main_group = rng.choice(mains, rows)
+    modifier = rng.choice(MODIFIERS, rows)
+    main = [rng.choice(MAIN_INGREDIENTS[group]) for group in main_group]
+    names = [f"{m}{ing} {d}" for m, ing, d in zip(modifier, main, dish)]
+
+    counts = np.clip(rng.poisson(6, rows), 2, 15)
+    picks = rng.choice(len(vocab), counts.sum(), p=weights)
+    grams = rng.integers(5, 300, counts.sum())
+    ingredients_parsed, ingredients_raw = [], []
+    offset = 0
+    for i, count in enumerate(counts):
+        items = [(main[i], int(rng.integers(100, 400)))]
+        items += [(vocab[j], int(g)) for j, g in zip(picks[offset:offset + count], grams[offset:offset + count])]
+        offset += count
+        ingredients_parsed.append(
+            json.dumps([{"name": n, "amount": f"{g}g"} for n, g in items], ensure_ascii=False)
+        )
+        ingredients_raw.append("|".join(f"{n} {g}g" for n, g in items))
+
+    calories = np.clip(rng.lognormal(np.log(420), 0.45, rows), 30, 2000).round()
+    ratios = rng.dirichlet([5, 2, 2], rows)
+    return pd.DataFrame({
+        "rcp_id": np.arange(start_id, start_id + rows),
+        "name": names,
+        "category": [DISHES[d] for d in dish],
+        "main_ingredient": main_group,
+        "servings": rng.choice(["1인분", "2인분", "3인분", "4인분"], rows, p=[0.35, 0.35, 0.1, 0.2]),
+        "difficulty": rng.choice(DIFFICULTIES[0], rows, p=DIFFICULTIES[1]),
+        "cooking_time": rng.choice(COOKING_TIMES[0], rows, p=COOKING_TIMES[1]).astype(float),
+        "ingredients_raw": ingredients_raw,
+        "ingredients_parsed": ingredients_parsed,
+        "calories": calories,
+        "carb_g": (calories * ratios[:, 0] / 4).round(1),
+        "protein_g": (calories * ratios[:, 1] / 4).round(1),
+        "fat_g": (calories * ratios[:, 2] / 9).round(1),
+        "sugar_g": rng.uniform(0, 30, rows).round(1),
+        "sodium_mg": rng.uniform(50, 3000, rows).round(),
+        "cholesterol_mg": rng.uniform(0, 300, rows).round(),
+        "saturated_fat_g": rng.uniform(0, 15, rows).round(1),
+        "nutrition_match_rate": rng.uniform(0.3, 1, rows).round(2),
+        "year": rng.choice([2022, 2023, 2024], rows),
+    })
+
+
+def generate_dataset(rows: int, seed: int, data_dir: Path = DATA_DIR) -> Path:
+    """
+    합성 CSV 생성 (청크 단위 기록, 같은 크기/시드면 재사용)
+
+    Returns:
+        CSV 경로
+    """
+    path = data_dir / f"recipes_{format_size(rows)}_seed{seed}.csv"
+    if path.exists():
+        return path
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".csv.tmp")
+    rng = np.random.default_rng(seed)
+    for start in range(0, rows, GENERATE_CHUNK_ROWS):
+        chunk = generate_chunk(min(GENERATE_CHUNK_ROWS, rows - start), 1_000_000 + start, rng)
+        chunk.to_csv(tmp, mode="a" if start else "w", header=start == 0, index=False, encoding="utf-8")
+    tmp.replace(path)
+    return path
+
+
+def _memory_mb() -> dict:
+    """현재/최대 RSS (MB)"""
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+    current_mb = None
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    current_mb = int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return {"rss_mb": round(current_mb, 1) if current_mb else None, "peak_rss_mb": round(peak_mb, 1)}
+
+
+def _percentiles(samples: list) -> dict:
+    """지연 시간 요약 (ms)"""
+    values = np.array(samples) * 1000
+    return {
+        "p50_ms": round(float(np.percentile(values, 50)), 3),
+        "p99_ms": round(float(np.percentile(values, 99)), 3),
+        "mean_ms": round(float(values.mean()), 3),
+        "count": len(values),
+    }
+
+
+async def _run_queries(store, queries: int, seed: int) -> dict:
+    """대체 레시피/키워드 검색 지연 시간 측정 (제한 재료 조합별)"""
+    from app.services.csv_recipe_search_service import CSVRecipeSearchService
+    from app.services.recipe_search import RecipeSearchService
+
+    alternatives = CSVRecipeSearchService(store=store)
+    search = RecipeSearchService(enable_web_search=False, store=store)
+    names = store.df["name"].to_numpy()
+    rng = np.random.default_rng(seed)
+    latency = {"alternatives": {}, "keyword": {}}
+
+    for mix, restrictions in RESTRICTION_MIXES.items():
+        samples = []
+        for i in range(queries + queries // 10):
+            calories = int(rng.integers(200, 900))
+            started = time.perf_counter()
+            await alternatives.search_alternative_recipes(
+                current_menu_name=str(names[rng.integers(len(names))]),
+                target_calories=calories,
+                calorie_tolerance=100,
+                restrictions=restrictions,
+                target_carb_g=calories * 0.5 / 4,
+                target_protein_g=calories * 0.25 / 4,
+                target_fat_g=calories * 0.25 / 9,
+            )
+            if i >= queries // 10:  # 처음 10%는 워밍업
+                samples.append(time.perf_counter() - started)
+        latency["alternatives"][mix] = _percentiles(samples)
+
+        samples = []
+        for i in range(queries + queries // 10):
+            filters = {"exclude_ingredients": restrictions}
+            if i % 2:
+                filters["max_cooking_time"] = 30
+            if i % 3 == 0:
+                filters["target_calories"] = float(rng.integers(200, 900))
+            started = time.perf_counter()
+            await search._search_local_csv(str(rng.choice(KEYWORDS)), filters, limit=5)
+            if i >= queries // 10:
+                samples.append(time.perf_counter() - started)
+        latency["keyword"][mix] = _percentiles(samples)
+
+    return latency
+
+
+def measure(csv_path: Path, snapshot_dir: Path, queries: int, seed: int) -> dict:
+    """
+    한 데이터셋 측정 (새 프로세스에서 호출, 결과는 JSON으로 stdout 출력)
+
+    Returns:
+        {rows, load_seconds, rss_mb, peak_rss_mb, latency}
+    """
+    from app.utils.logging import setup_logging
+
+    setup_logging("WARNING")
+    from app.services.recipe_store import RecipeStore
+
+    baseline = _memory_mb()
+    started = time.perf_counter()
+    store = RecipeStore.load(csv_path, snapshot_dir)
+    load_seconds = time.perf_counter() - started
+    loaded = _memory_mb()
+
+    latency = asyncio.run(_run_queries(store, queries, seed))
+    after = _memory_mb()
+    return {
+        "rows": len(store),
+        "source": store.source,
+        "load_seconds": round(load_seconds, 3),
+        "rss_mb": loaded["rss_mb"],
+        "store_rss_mb": round(loaded["rss_mb"] - baseline["rss_mb"], 1) if loaded["rss_mb"] else None,
+        "peak_rss_mb": after["peak_rss_mb"],
+        "latency": latency,
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(report: dict, baseline: dict) -> list:
+    """
+    두 리포트 비교 (크기/검색/제한 조합별 p50, p99 비율 = 현재 / 기준)
+
+    Returns:
+        비교 행 리스트
+    """
+    base = {(r["rows"], r["source"]): r for r in baseline["results"]}
+    rows = []
+    for result in report["results"]:
+        old = base.get((result["rows"], result["source"]))
+        if old is None:
+            continue
+        rows.append({
+            "rows": result["rows"], "metric": "load_seconds",
+            "before": old["load_seconds"], "after": result["load_seconds"],
+        })
+        rows.append({
+            "rows": result["rows"], "metric": "store_rss_mb",
+            "before": old.get("store_rss_mb"), "after": result.get("store_rss_mb"),
+        })
+        for kind, mixes in result["latency"].items():
+            for mix, stats in mixes.items():
+                previous = old["latency"].get(kind, {}).get(mix)
+                if previous:
+                    for key in ("p50_ms", "p99_ms"):
+                        rows.append({
+                            "rows": result["rows"], "metric": f"{kind}.{mix}.{key}",
+                            "before": previous[key], "after": stats[key],
+                        })
+    for row in rows:
+        before, after = row["before"], row["after"]
+        row["ratio"] = round(after / before, 3) if before and after is not None else None
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark local recipe search scaling")
+    parser.add_argument("--sizes", default="10k,100k,1m", help="comma-separated dataset sizes (e.g. 10k,1m,10m)")
+    parser.add_argument("--source", choices=["snapshot", "csv"], default="snapshot", help="how the store is loaded")
+    parser.add_argument("--queries", type=int, default=200, help="measured queries per search and mix")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR, help="generated dataset directory")
+    parser.add_argument("--out", type=Path, default=Path("benchmark_report.json"), help="JSON report path")
+    parser.add_argument("--compare", type=Path, default=None, help="baseline report to compare against")
+    parser.add_argument("--measure", nargs=2, metavar=("CSV", "SNAPSHOT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(Path(args.measure[0]), Path(args.measure[1]), args.queries, args.seed)))
+        return
+
+    from app.services.recipe_store import build_recipe_snapshot
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "source": args.source,
+            "queries": args.queries,
+            "seed": args.seed,
+            "restriction_mixes": RESTRICTION_MIXES,
+        },
+        "results": [],
+    }
+
+    for rows in [parse_size(size) for size in args.sizes.split(",")]:
+        print(f"📊 {format_size(rows)} recipes")
+        started = time.perf_counter()
+        csv_path = generate_dataset(rows, args.seed, args.data_dir)
+        print(f"   dataset ready ({time.perf_counter() - started:.1f}s): {csv_path}")
+
+        snapshot_dir = csv_path.with_suffix(".snapshot")
+        build_seconds = None
+        if args.source == "snapshot":
+            started = time.perf_counter()
+            build_recipe_snapshot(csv_path, snapshot_dir)
+            build_seconds = round(time.perf_counter() - started, 3)
+        else:
+            snapshot_dir = csv_path.with_suffix(".no_snapshot")
+
+        # 크기별 새 프로세스에서 측정 (RSS가 이전 데이터셋에 영향받지 않도록)
+        completed = subprocess.run(
+            [sys.executable, __file__, "--measure", str(csv_path), str(snapshot_dir),
+             "--queries", str(args.queries), "--seed", str(args.seed)],
+            capture_output=True, text=True, check=True,
+        )
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        result["snapshot_build_seconds"] = build_seconds
+        report["results"].append(result)
+
+        print(f"   load {result['load_seconds']:.2f}s, store RSS {result['store_rss_mb']} MB")
+        for kind, mixes in result["latency"].items():
+            summary = ", ".join(f"{mix} {s['p50_ms']:.2f}/{s['p99_ms']:.2f}" for mix, s in mixes.items())
+            print(f"   {kind:12s} p50/p99 ms: {summary}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        report["comparison"] = {"baseline_commit": baseline["meta"].get("commit"), "rows": compare(report, baseline)}
+        print(f"🔍 vs {report['comparison']['baseline_commit']}")
+        for row in report["comparison"]["rows"]:
+            print(f"   {format_size(row['rows']):>5s} {row['metric']:40s} {row['before']} → {row['after']} (x{row['ratio']})")
+
+    args.out.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"✅ report → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
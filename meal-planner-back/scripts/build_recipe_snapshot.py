@@ -0,0 +1,52 @@
+"""
+Compile recipes_with_nutrition.csv into the memory-mapped recipe snapshot.
+
+The snapshot stores typed numeric columns, dictionary-encoded string columns,
+pre-parsed ingredient lists and the RecipeStore search index arrays, so the
+search services (and every uvicorn worker) can open it with mmap at startup
+instead of running pd.read_csv and rebuilding indexes on every boot. The CSV
+stays the fallback source when no snapshot is present.
+
+Usage:
+    python scripts/build_recipe_snapshot.py
+    python scripts/build_recipe_snapshot.py --csv data/recipes_with_nutrition.csv --out data/recipes_snapshot
+
+Output:
+    - data/recipes_snapshot/manifest.json (format version, row count, source CSV stat)
+    - data/recipes_snapshot/*.npy (column and index arrays)
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.recipe_snapshot import SNAPSHOT_DIR
+from app.services.recipe_store import CSV_PATH, build_recipe_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the recipe search snapshot")
+    parser.add_argument("--csv", type=Path, default=CSV_PATH, help="source recipe CSV")
+    parser.add_argument("--out", type=Path, default=SNAPSHOT_DIR, help="snapshot output directory")
+    args = parser.parse_args()
+
+    if not args.csv.exists():
+        print(f"❌ CSV not found: {args.csv}")
+        sys.exit(1)
+
+    print(f"📦 Building snapshot from {args.csv}")
+    started = time.perf_counter()
+    manifest = build_recipe_snapshot(args.csv, args.out)
+    elapsed = time.perf_counter() - started
+
+    print(f"✅ {manifest['row_count']} recipes, {len(manifest['columns'])} columns → {args.out}")
+    print(f"   took {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Clean and deduplicate recipes_with_nutrition.csv, then build the runtime snapshot.
+
+The raw CSV is maintained by hand. This command streams it in chunks across
+worker processes (bounded memory), normalizes ingredient names, validates the
+nutrition columns, drops near-duplicate recipe names (MinHash + LSH candidates
+confirmed by exact bigram Jaccard) and adds
+derived columns (macro energy ratios, estimated ingredient cost, allergen
+bitmask). The cleaned CSV is compiled into the same memory-mapped snapshot
+the search services load at startup. The snapshot records the raw CSV as its
+source and the ETL settings, so when the raw file is edited (or the index
+format changes) the server rebuilds it through the same ETL instead of
+compiling the raw CSV directly.
+
+Usage:
+    python scripts/etl_recipes.py
+    python scripts/etl_recipes.py --csv data/recipes_with_nutrition.csv --workers 8
+    python scripts/etl_recipes.py --no-snapshot --out data/recipes_clean.csv
+
+Output:
+    - data/recipes_clean.csv (cleaned rows + carb_ratio, protein_ratio, fat_ratio, est_cost, allergen_mask)
+    - data/recipes_snapshot/ (manifest.json + column and index arrays)
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.recipe_etl import CLEAN_CSV_PATH, ETL_CHUNK_ROWS, run_recipe_etl
+from app.services.recipe_snapshot import SNAPSHOT_DIR
+from app.services.recipe_store import CSV_PATH, build_recipe_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clean, deduplicate and compile the recipe dataset")
+    parser.add_argument("--csv", type=Path, default=CSV_PATH, help="raw recipe CSV")
+    parser.add_argument("--out", type=Path, default=CLEAN_CSV_PATH, help="cleaned CSV output")
+    parser.add_argument("--snapshot", type=Path, default=SNAPSHOT_DIR, help="snapshot output directory")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-rows", type=int, default=ETL_CHUNK_ROWS, help="rows per chunk")
+    parser.add_argument("--keep-duplicates", action="store_true", help="skip near-duplicate name removal")
+    parser.add_argument("--no-snapshot", action="store_true", help="only write the cleaned CSV")
+    parser.add_argument("--report", type=Path, default=None, help="write ETL statistics as JSON")
+    args = parser.parse_args()
+
+    if not args.csv.exists():
+        print(f"❌ CSV not found: {args.csv}")
+        sys.exit(1)
+
+    print(f"🧹 Cleaning {args.csv}")
+    started = time.perf_counter()
+    stats = run_recipe_etl(
+        args.csv,
+        args.out,
+        workers=args.workers,
+        chunk_rows=args.chunk_rows,
+        dedup=not args.keep_duplicates,
+    )
+    stats["etl_seconds"] = round(time.perf_counter() - started, 1)
+    print(
+        f"✅ {stats['rows_in']} → {stats['rows_out']} recipes "
+        f"({stats['duplicates']} near-duplicates, {stats['missing_name']} without name, "
+        f"{stats['invalid_values']} invalid nutrition values) → {args.out}"
+    )
+    print(f"   took {stats['etl_seconds']:.1f}s")
+
+    if not args.no_snapshot:
+        print(f"📦 Building snapshot → {args.snapshot}")
+        started = time.perf_counter()
+        manifest = build_recipe_snapshot(
+            args.out,
+            args.snapshot,
+            source_csv=args.csv,
+            etl={"clean_csv": str(args.out.resolve()), "dedup": not args.keep_duplicates},
+        )
+        stats["snapshot_seconds"] = round(time.perf_counter() - started, 1)
+        print(f"✅ {manifest['row_count']} recipes, {len(manifest['columns'])} columns")
+        print(f"   took {stats['snapshot_seconds']:.1f}s")
+
+    if args.report:
+        args.report.write_text(json.dumps(stats, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
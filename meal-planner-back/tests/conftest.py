@@ -21,3 +21,37 @@ def setup_test_environment():
 
     # 테스트 종료 후 정리 (필요시)
     pass
+
+
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(monkeypatch):
+    """테스트마다 빈 메모리 LLM 응답 캐시 (테스트 간 응답 재사용 방지, 디스크 계층 없음)"""
+    from app.services.llm_cache import LLMResponseCache
+
+    cache = LLMResponseCache(disk_path="")
+    monkeypatch.setattr("app.services.llm_service.get_llm_cache", lambda: cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_llm_governor(monkeypatch):
+    """테스트마다 새 LLM 동시 호출 조절기 (이전 테스트의 429 감소/토큰 소모가 이어지지 않음)"""
+    from app.services.llm_governor import LLMConcurrencyGovernor
+
+    governor = LLMConcurrencyGovernor()
+    monkeypatch.setattr("app.services.llm_service.get_llm_governor", lambda: governor)
+    monkeypatch.setattr("app.controllers.meal_plan.get_llm_governor", lambda: governor)
+    return governor
+
+
+@pytest.fixture(autouse=True)
+def isolated_recommendation_cache(monkeypatch):
+    """테스트마다 빈 전문가 추천 캐시 (테스트 간 추천 재사용 방지)"""
+    from app.services.recommendation_cache import ExpertRecommendationCache
+
+    cache = ExpertRecommendationCache()
+    for module in ("nutritionist", "chef", "budget"):
+        monkeypatch.setattr(f"app.agents.nodes.meal_planning.{module}.get_recommendation_cache", lambda: cache)
+    monkeypatch.setattr("app.agents.nodes.validation_aggregator.get_recommendation_cache", lambda: cache)
+    monkeypatch.setattr("app.controllers.admin.get_recommendation_cache", lambda: cache)
+    return cache
@@ -200,3 +200,21 @@ def validation_results_extractor():
                 results[validator] = passed
         return results
     return extract
+
+
+@pytest.fixture
+def recipe_store_paths(tmp_path, monkeypatch):
+    """기본 경로를 작은 합성 CSV로 교체 (빈 공유 인스턴스 레지스트리)"""
+    import pandas as pd
+
+    csv_path = tmp_path / "recipes.csv"
+    pd.DataFrame([
+        {"name": "두부조림", "calories": 250, "difficulty": "초급", "cooking_time": 20,
+         "ingredients_parsed": '[{"name": "두부"}]'},
+        {"name": "미역국", "calories": 300, "difficulty": "중급", "cooking_time": 40,
+         "ingredients_parsed": '[{"name": "미역"}]'},
+    ]).to_csv(csv_path, index=False)
+    monkeypatch.setattr("app.services.recipe_store._stores", {})
+    monkeypatch.setattr("app.services.recipe_store.CSV_PATH", csv_path)
+    monkeypatch.setattr("app.services.recipe_store.SNAPSHOT_DIR", tmp_path / "no_snapshot")
+    return csv_path
@@ -0,0 +1,63 @@
+"""
+API Admin Tests
+
+Recipe data reload endpoint:
+- API-ADMIN-001: ADMIN_TOKEN 미설정 시 비활성화
+- API-ADMIN-002: 토큰 불일치 거부
+- API-ADMIN-003: 리로드 후 /api/health에 새 데이터 버전 표시
+- API-ADMIN-004: 캐시 통계
+"""
+
+import pytest
+
+from app.config import settings
+from app.services.recipe_store import get_recipe_store
+
+
+class TestReloadRecipes:
+    """POST /api/admin/reload-recipes"""
+
+    @pytest.mark.asyncio
+    async def test_admin001_disabled_without_token(self, api_client, monkeypatch):
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", None)
+        response = await api_client.post("/api/admin/reload-recipes", headers={"X-Admin-Token": "x"})
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_admin002_invalid_token(self, api_client, monkeypatch):
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+        response = await api_client.post("/api/admin/reload-recipes", headers={"X-Admin-Token": "wrong"})
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_admin003_reload_reports_version(self, api_client, monkeypatch, recipe_store_paths):
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+        get_recipe_store()
+
+        health = (await api_client.get("/api/health")).json()
+        assert health["recipe_data_version"] == 1
+        assert health["recipe_count"] == 2
+
+        response = await api_client.post("/api/admin/reload-recipes", headers={"X-Admin-Token": "secret"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["recipe_data_version"] == 2
+        assert data["previous_version"] == 1
+
+        health = (await api_client.get("/api/health")).json()
+        assert health["recipe_data_version"] == 2
+
+
+class TestCacheStats:
+    """GET /api/admin/cache-stats"""
+
+    @pytest.mark.asyncio
+    async def test_admin004_cache_stats(self, api_client, monkeypatch):
+        monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+        response = await api_client.get("/api/admin/cache-stats", headers={"X-Admin-Token": "secret"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert {"memory_hits", "disk_hits", "misses", "hit_rate"} <= set(data["llm"])
+        assert {"hits", "misses", "entries"} <= set(data["alternative_recipes"])
+        assert {"hits", "misses", "hit_rate", "keys"} <= set(data["recommendations"])
@@ -5,6 +5,8 @@ API 레벨 기본 동작만 테스트:
 - API-HP-001: Health check 정상 동작
 - API-HP-002: 유효한 요청 수락 (202 accepted)
 - API-HP-003: 잘못된 엔드포인트 (404)
+- API-HP-004: 대체 레시피 ETag 재검증 (304)
+- API-HP-005: 제약 조건 충족 가능성 사전 점검
 
 Note: 전체 워크플로우 테스트는 test_edge_cases/test_e2e_edges.py에서 수행
 """
@@ -46,3 +48,40 @@ class TestHappyPaths:
         response = await api_client.get("/api/invalid_endpoint")
 
         assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_hp004_alternative_recipes_etag(self, api_client, recipe_store_paths, monkeypatch):
+        """API-HP-004: 같은 조건 재요청은 ETag로 304 (제한 재료 순서 무관)"""
+        from app.services.alternative_cache import AlternativeRecipeCache
+
+        monkeypatch.setattr("app.services.alternative_cache._alternative_cache", AlternativeRecipeCache())
+        params = {"current_menu": "미역국", "target_calories": 260, "target_cost": 0, "restrictions": "우유,견과류"}
+
+        first = await api_client.get("/api/alternative-recipes", params=params)
+        assert first.status_code == 200
+        assert [r["name"] for r in first.json()["alternatives"]] == ["두부조림"]
+        etag = first.headers["etag"]
+
+        reordered = {**params, "restrictions": "견과류, 우유,우유"}
+        second = await api_client.get("/api/alternative-recipes", params=reordered, headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+
+        changed = await api_client.get(
+            "/api/alternative-recipes", params={**params, "target_calories": 300}, headers={"If-None-Match": etag}
+        )
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_hp005_feasibility_check(self, api_client, recipe_store_paths, standard_request):
+        """API-HP-005: 조건별 만족 레시피 수 반환 (LLM 호출 없음)"""
+        response = await api_client.post("/api/feasibility", json={**standard_request, "restrictions": ["두부"]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_recipes"] == 2
+        names = [c["name"] for c in data["constraints"]]
+        assert {"calories", "cooking_time", "difficulty", "restrictions"} <= set(names)
+        restrictions = next(c for c in data["constraints"] if c["name"] == "restrictions")
+        assert restrictions["matching"] == 1
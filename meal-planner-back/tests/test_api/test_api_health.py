@@ -34,6 +34,10 @@ class TestHealthCheck:
         assert isinstance(data["version"], str), "Version should be string"
         assert len(data["version"]) > 0, "Version should not be empty"
 
+        # Assert: LLM governor state
+        assert data["llm_in_flight"] == 0 and data["llm_queue_depth"] == 0
+        assert data["llm_concurrency_limit"] >= 1
+
     @pytest.mark.asyncio
     async def test_health002_performance(self, api_client):
         """API-HEALTH-002: Health check 성능 - 빠른 응답 (<100ms)"""
@@ -7,6 +7,7 @@ API Request Validation Tests
 - API-RV-003: 예산 현실성 검증
 - API-RV-004: Enum Field 검증
 - API-RV-005: Prompt Injection 방지
+- API-RV-006: 대체 레시피 일괄 검색 끼니 수 제한
 """
 
 import pytest
@@ -247,3 +248,29 @@ class TestRequestValidation:
                 "character",
                 "검증",
             ]), f"Error should mention sanitization: {error_str}"
+
+
+class TestAlternativeBatchValidation:
+    """POST /api/alternative-recipes/batch 요청 검증"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("meal_count", [0, 29])
+    async def test_rv006_batch_meal_count_limits(self, api_client, meal_count):
+        """API-RV-006: 끼니는 1~28개만 허용"""
+        payload = {
+            "meals": [
+                {"current_menu": f"메뉴 {i}", "target_calories": 500}
+                for i in range(meal_count)
+            ]
+        }
+        response = await api_client.post("/api/alternative-recipes/batch", json=payload)
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_rv007_batch_schema_has_no_cost_fields(self, api_client):
+        """API-RV-007: 레시피 데이터에 비용이 없으므로 일괄 검색 스키마에 비용 조건이 없음"""
+        response = await api_client.get("/openapi.json")
+        schemas = response.json()["components"]["schemas"]
+
+        assert "target_cost" not in schemas["AlternativeMealQuery"]["properties"]
+        assert "cost_tolerance" not in schemas["AlternativeRecipesBatchRequest"]["properties"]
@@ -0,0 +1,4 @@
+"""Service Tests
+
+Recipe data layer tests (snapshot, search services) using small synthetic CSVs
+"""
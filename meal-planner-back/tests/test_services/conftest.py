@@ -0,0 +1,46 @@
+"""Shared fixtures for recipe service testing"""
+import json
+
+import pandas as pd
+import pytest
+
+
+def _ingredients(*names):
+    return json.dumps([{"name": n, "amount": "100g"} for n in names], ensure_ascii=False)
+
+
+SAMPLE_RECIPES = [
+    # name, category, main_ingredient, difficulty, cooking_time, calories, carb, protein, fat, ingredients
+    ("닭가슴살 샐러드", "샐러드", "닭고기", "아무나", 15, 350, 15, 40, 12, ["닭가슴살", "양상추", "방울토마토"]),
+    ("계란김치볶음밥", "밥", "달걀", "초급", 10, 420, 65, 15, 12, ["밥", "계란", "김치", "참기름"]),
+    ("토마토 계란볶음", "볶음", "채소", "초급", 12, 280, 18, 14, 16, ["토마토", "계란", "대파"]),
+    ("두부조림", "반찬", "두부", "초급", 20, 250, 12, 18, 14, ["두부", "간장", "대파"]),
+    ("소고기 미역국", "국", "소고기", "중급", 40, 300, 8, 25, 18, ["소고기", "미역", "국간장"]),
+    ("새우볶음밥", "밥", "해물", "중급", 25, 520, 70, 22, 15, ["밥", "새우", "양파", "계란"]),
+    ("고등어구이", "구이", "생선", "초급", 25, 380, 2, 35, 25, ["고등어", "소금"]),
+    ("땅콩버터 토스트", "빵", "가공식품", "아무나", 5, 450, 40, 15, 25, ["식빵", "땅콩버터"]),
+]
+
+
+@pytest.fixture
+def recipe_csv(tmp_path):
+    """합성 레시피 CSV (recipes_with_nutrition.csv와 동일한 컬럼 구성)"""
+    rows = [
+        {
+            "name": name,
+            "category": category,
+            "main_ingredient": main,
+            "difficulty": difficulty,
+            "cooking_time": time,
+            "calories": calories,
+            "carb_g": carb,
+            "protein_g": protein,
+            "fat_g": fat,
+            "ingredients_raw": ",".join(ings),
+            "ingredients_parsed": _ingredients(*ings),
+        }
+        for name, category, main, difficulty, time, calories, carb, protein, fat, ings in SAMPLE_RECIPES
+    ]
+    path = tmp_path / "recipes.csv"
+    pd.DataFrame(rows).to_csv(path, index=False, encoding="utf-8-sig")
+    return path
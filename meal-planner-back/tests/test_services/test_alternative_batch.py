@@ -0,0 +1,81 @@
+"""Batch alternative recipe search tests (shared candidate scan across meals)"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.csv_recipe_search_service import CSVRecipeSearchService
+from app.services.recipe_store import RecipeStore
+
+
+@pytest.fixture
+def service():
+    rng = np.random.default_rng(16)
+    n = 3000
+    df = pd.DataFrame({
+        "name": [f"레시피 {i}" for i in range(n)],
+        "category": rng.choice(["밥", "국", "반찬"], n),
+        "main_ingredient": rng.choice(["두부", "계란", "채소"], n),
+        "difficulty": rng.choice(["아무나", "초급", "중급", "고급"], n),
+        "cooking_time": rng.choice([10.0, 30.0, 60.0], n),
+        "calories": rng.integers(100, 900, n).astype(float),
+        "carb_g": rng.uniform(0, 80, n),
+        "protein_g": rng.uniform(0, 40, n),
+        "fat_g": rng.uniform(0, 30, n),
+        "ingredients_raw": np.where(rng.random(n) < 0.3, "계란,대파", "두부,대파"),
+        "ingredients_parsed": np.where(
+            rng.random(n) < 0.3,
+            '[{"name": "계란"}, {"name": "대파"}]',
+            '[{"name": "두부"}, {"name": "대파"}]',
+        ),
+    })
+    return CSVRecipeSearchService(store=RecipeStore(df, source="csv", path="memory"))
+
+
+MEALS = [
+    {"current_menu": "레시피 1", "target_calories": 450, "target_protein_g": 30},
+    {"current_menu": "레시피 2", "target_calories": 460},
+    {"current_menu": "레시피 3", "target_calories": 450, "target_protein_g": 30},
+    {"current_menu": "레시피 4", "target_calories": 800},
+]
+
+
+class TestAlternativeBatch:
+    """search_alternative_recipes_batch"""
+
+    @pytest.mark.asyncio
+    async def test_first_meal_matches_single_search(self, service):
+        """첫 끼니 결과는 단건 검색과 동일 (식단의 다른 메뉴는 제외)"""
+        batch = await service.search_alternative_recipes_batch(
+            MEALS, calorie_tolerance=50, restrictions=["계란"]
+        )
+        single = await service.search_alternative_recipes(
+            current_menu_name="레시피 1",
+            target_calories=450,
+            calorie_tolerance=50,
+            restrictions=["계란"],
+            exclude_recipes=[meal["current_menu"] for meal in MEALS[1:]],
+            target_protein_g=30,
+        )
+        assert [r["name"] for r in batch[0]] == [r["name"] for r in single]
+
+    @pytest.mark.asyncio
+    async def test_no_alternative_recommended_twice(self, service):
+        """같은 목표의 끼니가 있어도 대체 레시피는 중복되지 않음"""
+        batch = await service.search_alternative_recipes_batch(MEALS, calorie_tolerance=50, limit=5)
+        names = [r["name"] for alternatives in batch for r in alternatives]
+
+        assert len(batch) == len(MEALS)
+        assert all(len(alternatives) == 5 for alternatives in batch)
+        assert len(names) == len(set(names))
+        assert not {meal["current_menu"] for meal in MEALS} & set(names)
+
+    @pytest.mark.asyncio
+    async def test_calorie_window_and_restrictions_per_meal(self, service):
+        """끼니별 칼로리 창과 공통 제한 재료 적용"""
+        batch = await service.search_alternative_recipes_batch(
+            MEALS, calorie_tolerance=20, restrictions=["계란"], limit=3
+        )
+        for meal, alternatives in zip(MEALS, batch):
+            for recipe in alternatives:
+                assert abs(recipe["calories"] - meal["target_calories"]) <= 20
+                assert "계란" not in recipe["ingredients"]
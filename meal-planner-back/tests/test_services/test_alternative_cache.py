@@ -0,0 +1,71 @@
+"""Alternative recipe result cache tests (LRU, key normalization, ETag)"""
+import pandas as pd
+
+from app.services.alternative_cache import (
+    AlternativeRecipeCache,
+    alternative_cache_key,
+    etag_for,
+    etag_matches,
+    normalize_names,
+)
+from app.services.recipe_store import RecipeStore
+
+
+def _store():
+    df = pd.DataFrame([
+        {"name": "두부조림", "calories": 250, "difficulty": "초급", "cooking_time": 20,
+         "ingredients_parsed": '[{"name": "두부"}]'},
+    ])
+    return RecipeStore(df, source="csv", path="memory")
+
+
+def _key(store, restrictions=(), exclude=()):
+    return alternative_cache_key(
+        store, "두부조림", 500, 50, normalize_names(list(restrictions)), normalize_names(list(exclude)),
+        None, None, None
+    )
+
+
+class TestCacheKey:
+    """정규화된 키 + 데이터 버전"""
+
+    def test_order_and_duplicates_do_not_matter(self):
+        store = _store()
+        assert _key(store, [" 우유", "견과류", "우유"], ["b", "a"]) == _key(store, ["견과류", "우유"], ["a", "b", ""])
+
+    def test_dataset_version_changes_key_and_etag(self):
+        store = _store()
+        before = _key(store)
+        store.version += 1
+        after = _key(store)
+        assert before != after
+        assert etag_for(before) != etag_for(after)
+
+    def test_if_none_match_parsing(self):
+        etag = etag_for(("k",))
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches('"other"', etag)
+
+
+class TestAlternativeRecipeCache:
+    """LRU 동작"""
+
+    def test_evicts_least_recently_used(self):
+        cache = AlternativeRecipeCache(max_entries=2)
+        cache.put("a", [{"name": "a"}])
+        cache.put("b", [{"name": "b"}])
+        assert cache.get("a") == [{"name": "a"}]  # a를 최근 사용으로
+        cache.put("c", [{"name": "c"}])
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.stats() == {"hits": 3, "misses": 1, "entries": 2}
+
+    def test_zero_size_disables_storage(self):
+        cache = AlternativeRecipeCache(max_entries=0)
+        cache.put("a", [])
+        assert cache.get("a") is None
+        assert len(cache) == 0
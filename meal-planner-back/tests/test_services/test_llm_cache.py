@@ -0,0 +1,145 @@
+"""LLM response cache tests (memory LRU, SQLite tier, TTL, size eviction, validated storage, retry bypass)"""
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from app.services.llm_cache import LLMResponseCache, SQLiteResponseStore, llm_cache_key
+from app.models.state import MealRecommendation
+from app.services.llm_service import LLMService, response_validator
+
+
+class TestCacheKey:
+    def test_key_covers_model_settings_and_prompt(self):
+        base = llm_cache_key("m", 0.7, 2000, "프롬프트")
+        assert base == llm_cache_key("m", 0.7, 2000, "프롬프트")
+        assert base != llm_cache_key("m", 0.0, 2000, "프롬프트")
+        assert base != llm_cache_key("m", 0.7, 1000, "프롬프트")
+        assert base != llm_cache_key("other", 0.7, 2000, "프롬프트")
+        assert base != llm_cache_key("m", 0.7, 2000, "프롬프트 ")
+
+
+class TestLLMResponseCache:
+    @pytest.mark.asyncio
+    async def test_memory_lru_and_stats(self):
+        cache = LLMResponseCache(max_entries=2, ttl_seconds=60, disk_path="")
+        await cache.put("a", "A")
+        await cache.put("b", "B")
+        assert await cache.get("a") == "A"
+        await cache.put("c", "C")
+
+        assert await cache.get("b") is None
+        stats = cache.stats()
+        assert stats["memory_hits"] == 1 and stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_new_instance(self, tmp_path):
+        path = str(tmp_path / "llm_cache.sqlite")
+        await LLMResponseCache(ttl_seconds=60, disk_path=path).put("k", "응답")
+
+        fresh = LLMResponseCache(ttl_seconds=60, disk_path=path)
+        assert await fresh.get("k") == "응답"
+        assert await fresh.get("k") == "응답"  # 두 번째는 메모리로 올라와 있음
+        assert fresh.stats()["disk_hits"] == 1
+        assert fresh.stats()["memory_hits"] == 1
+
+    def test_disk_ttl_and_size_eviction(self, tmp_path):
+        store = SQLiteResponseStore(str(tmp_path / "c.sqlite"), max_bytes=25)
+        store.put("old", "x" * 10, ttl_seconds=60)
+        time.sleep(0.01)
+        store.put("mid", "y" * 10, ttl_seconds=60)
+        store.get("old", ttl_seconds=60)  # old를 최근 사용으로
+        time.sleep(0.01)
+        store.put("new", "z" * 10, ttl_seconds=60)
+
+        assert store.get("mid", ttl_seconds=60) is None  # 가장 오래 사용하지 않은 항목 제거
+        assert store.get("old", ttl_seconds=60) is not None
+        assert store.get("new", ttl_seconds=0) is None  # TTL 지남
+
+
+class TestLLMServiceCaching:
+    @pytest.mark.asyncio
+    async def test_identical_prompt_calls_upstream_once(self, isolated_llm_cache):
+        calls = []
+
+        async def upstream(messages):
+            calls.append(messages)
+            return AIMessage(content='{"menu_name": "두부조림"}')
+
+        service = LLMService(mock_mode=False)
+        service.llm = MagicMock(model="m", temperature=0.7, max_tokens=2000)
+        service.llm.ainvoke = upstream
+
+        first = await service.ainvoke("같은 프롬프트")
+        second = await service.ainvoke("같은 프롬프트")
+
+        assert first == second
+        assert len(calls) == 1
+        assert isolated_llm_cache.stats()["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        calls = 0
+
+        async def upstream(messages):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ValueError("bad request")
+            return AIMessage(content="ok")
+
+        service = LLMService(mock_mode=False)
+        service.llm = MagicMock(model="m", temperature=0.7, max_tokens=2000)
+        service.llm.ainvoke = upstream
+
+        with pytest.raises(ValueError):
+            await service.ainvoke("p")
+        assert await service.ainvoke("p") == "ok"
+        assert calls == 2
+
+
+VALID = (
+    '{"menu_name": "두부조림", "ingredients": [], "estimated_calories": 300, "estimated_cost": 3000,'
+    ' "cooking_time_minutes": 20, "reasoning": "테스트"}'
+)
+
+
+def _sequenced_service(*responses):
+    """응답을 순서대로 돌려주는 서비스 + 호출 기록"""
+    calls = []
+
+    async def upstream(messages):
+        calls.append(messages)
+        return AIMessage(content=responses[min(len(calls), len(responses)) - 1])
+
+    service = LLMService(mock_mode=False)
+    service.llm = MagicMock(model="m", temperature=0.7, max_tokens=2000)
+    service.llm.ainvoke = upstream
+    return service, calls
+
+
+class TestValidatedCaching:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("invalid", ["설명만 있고 JSON 없음", '{"menu_name": "두부조림"}'])
+    async def test_unusable_responses_are_not_cached(self, isolated_llm_cache, invalid):
+        service, calls = _sequenced_service(invalid, VALID)
+        validate = response_validator(MealRecommendation)
+
+        assert await service.ainvoke("p", validate=validate) == invalid
+        assert await service.ainvoke("p", validate=validate) == VALID
+        assert await service.ainvoke("p", validate=validate) == VALID
+        assert len(calls) == 2
+        assert isolated_llm_cache.stats()["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_bypasses_cache(self, isolated_llm_cache):
+        """재시도(use_cache=False)는 캐시된 응답을 다시 받지 않고, 새 응답으로 캐시를 덮어쓰지도 않음"""
+        service, calls = _sequenced_service(VALID, "재시도 응답")
+
+        assert await service.ainvoke("p") == VALID
+        assert await service.ainvoke("p", use_cache=False) == "재시도 응답"
+        assert len(calls) == 2
+        assert await service.ainvoke("p") == VALID
+        assert len(calls) == 2
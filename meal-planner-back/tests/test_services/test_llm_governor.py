@@ -0,0 +1,177 @@
+"""LLM concurrency governor tests (slots, AIMD, token buckets, 429 pause, LLMService integration)"""
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from app.services.llm_governor import LLMConcurrencyGovernor, TokenBucket
+from app.services.llm_service import LLMService
+
+
+def _governor(**overrides):
+    options = dict(
+        max_concurrency=4, min_concurrency=1, initial_concurrency=2,
+        requests_per_minute=0, tokens_per_minute=0, latency_target_seconds=10,
+    )
+    options.update(overrides)
+    return LLMConcurrencyGovernor(**options)
+
+
+class TestTokenBucket:
+    def test_delay_refill_and_refund(self):
+        bucket = TokenBucket(per_minute=60)
+        now = time.monotonic()
+        bucket.consume(60, now)
+        assert bucket.delay_for(1, now) == pytest.approx(1.0, abs=0.01)
+        assert bucket.delay_for(1, now + 1.0) == pytest.approx(0.0, abs=0.01)
+
+        bucket.refund(30)
+        assert bucket.delay_for(30, now + 0.0) == pytest.approx(0.0, abs=0.02)
+
+    def test_zero_means_unlimited(self):
+        bucket = TokenBucket(per_minute=0)
+        bucket.consume(10 ** 9, time.monotonic())
+        assert bucket.delay_for(10 ** 9, time.monotonic()) == 0.0
+
+
+class TestGovernor:
+    @pytest.mark.asyncio
+    async def test_limits_concurrency_in_fifo_order(self):
+        governor = _governor(initial_concurrency=2)
+        first = await governor.acquire()
+        second = await governor.acquire()
+
+        started = []
+
+        async def waiter(name):
+            permit = await governor.acquire()
+            started.append(name)
+            return permit
+
+        tasks = [asyncio.create_task(waiter(name)) for name in ["a", "b"]]
+        await asyncio.sleep(0.01)
+        assert governor.in_flight == 2 and governor.queue_depth == 2 and started == []
+
+        governor.release(first)
+        await asyncio.sleep(0.01)
+        assert started == ["a"]
+
+        governor.release(second)
+        permits = await asyncio.gather(*tasks)
+        assert started == ["a", "b"]
+        assert all(permit.queue_wait_seconds > 0 for permit in permits)
+        assert governor.stats()["max_queue_wait_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_aimd_increase_and_decrease(self):
+        governor = _governor(initial_concurrency=2, max_concurrency=3)
+        for _ in range(4):
+            governor.release(await governor.acquire())
+        assert 2.5 < governor.limit <= 3
+
+        governor.release(await governor.acquire(), rate_limited=True)
+        assert governor.limit == pytest.approx(governor.stats()["concurrency_limit"], abs=0.01)
+        assert governor.limit < 2
+        assert governor.rate_limited == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_congestion_signals_decrease_once(self):
+        governor = _governor(initial_concurrency=4)
+        permits = [await governor.acquire() for _ in range(4)]
+        for permit in permits:
+            governor.release(permit, rate_limited=True)
+
+        assert governor.limit == 2
+        assert governor.rate_limited == 4
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_pauses_new_calls(self):
+        governor = _governor()
+        governor.release(await governor.acquire(), rate_limited=True, backoff_seconds=0.2)
+
+        started = time.monotonic()
+        permit = await governor.acquire()
+        assert time.monotonic() - started >= 0.18
+        assert permit.queue_wait_seconds >= 0.18
+
+    @pytest.mark.asyncio
+    async def test_requests_per_minute_bucket(self):
+        governor = _governor(requests_per_minute=600)  # 초당 10건, 최대 600건 연속
+        governor.requests.tokens = 1
+        governor.release(await governor.acquire())
+
+        started = time.monotonic()
+        governor.release(await governor.acquire())
+        assert time.monotonic() - started >= 0.08
+
+    @pytest.mark.asyncio
+    async def test_token_reservation_settled_with_actual_usage(self):
+        governor = _governor(tokens_per_minute=1000)
+        permit = await governor.acquire(reserved_tokens=800)
+        assert governor.tokens.tokens == pytest.approx(200, abs=1)
+
+        governor.release(permit, used_tokens=100)
+        assert governor.tokens.tokens == pytest.approx(900, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        governor = _governor(initial_concurrency=1)
+        permit = await governor.acquire()
+        task = asyncio.create_task(governor.acquire())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert governor.queue_depth == 0
+        governor.release(permit)
+        governor.release(await asyncio.wait_for(governor.acquire(), timeout=1))
+
+
+class TestLLMServiceIntegration:
+    @pytest.mark.asyncio
+    async def test_calls_go_through_governor(self):
+        governor = _governor(initial_concurrency=1, max_concurrency=1)
+        active = 0
+        peak = 0
+
+        async def slow_response(messages):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return AIMessage(content="ok")
+
+        service = LLMService(mock_mode=False, governor=governor)
+        service.cache = None
+        service.llm = MagicMock()
+        service.llm.ainvoke = slow_response
+
+        await asyncio.gather(*(service.ainvoke(f"프롬프트 {i}") for i in range(3)))
+        assert peak == 1
+        assert governor.admitted == 3 and governor.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_attempt_releases_slot(self):
+        governor = _governor(initial_concurrency=2)
+        calls = 0
+
+        async def limited_once(messages):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise Exception("429 rate_limit exceeded")
+            return AIMessage(content="ok")
+
+        service = LLMService(mock_mode=False, governor=governor)
+        service.cache = None
+        service.llm = MagicMock()
+        service.llm.ainvoke = limited_once
+
+        assert await service.ainvoke("테스트") == "ok"
+        assert governor.rate_limited == 1 and governor.in_flight == 0
+        # 429로 2 → 1, 재시도 성공으로 1 → 2
+        assert governor.limit == pytest.approx(2)
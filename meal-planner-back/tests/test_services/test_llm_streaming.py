@@ -0,0 +1,130 @@
+"""LLM streaming tests (incremental JSON parser, LLMService astream path, partial SSE progress events)"""
+from typing import TypedDict
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+from langgraph.graph import END, START, StateGraph
+
+from app.config import settings
+from app.services.llm_service import LLMService
+from app.services.llm_streaming import STREAMED_FIELDS, IncrementalJSONParser, partial_progress_writer
+from app.services.stream_service import iterate_graph
+
+RESPONSE = """추천 메뉴입니다.
+```json
+{
+    "menu_name": "닭가슴살 \\"특제\\" 샐러드",
+    "ingredients": [{"name": "닭가슴살", "amount": "150g"}, {"name": "양상추, 로메인", "amount": "100g"}],
+    "estimated_calories": 350,
+    "estimated_cost": 7,200,
+    "cooking_time_minutes": 15,
+    "reasoning": "단백질 {풍부}"
+}
+```
+{"menu_name": "무시"}"""
+
+EXPECTED = [
+    ("menu_name", '닭가슴살 "특제" 샐러드'),
+    ("ingredients", {"name": "닭가슴살", "amount": "150g"}),
+    ("ingredients", {"name": "양상추, 로메인", "amount": "100g"}),
+]
+
+
+def _feed(parser, text, size):
+    fields = []
+    for start in range(0, len(text), size):
+        fields.extend(parser.feed(text[start:start + size]))
+    return fields
+
+
+class TestIncrementalJSONParser:
+    @pytest.mark.parametrize("size", [1, 2, 5, 17, len(RESPONSE)])
+    def test_emits_tracked_fields_for_any_chunking(self, size):
+        assert _feed(IncrementalJSONParser(STREAMED_FIELDS), RESPONSE, size) == EXPECTED
+
+    def test_fields_are_emitted_as_soon_as_complete(self):
+        parser = IncrementalJSONParser(STREAMED_FIELDS)
+        assert parser.feed('{"menu_name": "비빔') == []
+        assert parser.feed('밥", "ingredients": [{"name": "밥"') == [("menu_name", "비빔밥")]
+        assert parser.feed(', "amount": "200g"}, {"name": "나물"') == [
+            ("ingredients", {"name": "밥", "amount": "200g"})
+        ]
+
+    def test_all_fields_when_untracked(self):
+        fields = dict(_feed(IncrementalJSONParser(), '{"a": 1, "b": {"c": [1, 2]}, "d": "x"}', 3))
+        assert fields == {"a": 1, "b": {"c": [1, 2]}, "d": "x"}
+
+
+def _service(chunks):
+    async def astream(messages):
+        for text in chunks:
+            yield AIMessageChunk(content=text)
+        yield AIMessageChunk(content="", usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15})
+
+    service = LLMService(mock_mode=False)
+    service.llm = MagicMock()
+    service.llm.astream = astream
+    return service
+
+
+class TestLLMServiceStreaming:
+    @pytest.mark.asyncio
+    async def test_streams_fields_and_returns_full_text(self, isolated_llm_governor):
+        chunks = [RESPONSE[i:i + 9] for i in range(0, len(RESPONSE), 9)]
+        service = _service(chunks)
+        received = []
+
+        response = await service.ainvoke("프롬프트", on_partial=lambda field, value: received.append((field, value)))
+
+        assert response == RESPONSE
+        assert received == EXPECTED
+        assert isolated_llm_governor.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_failing_callback_does_not_break_response(self):
+        service = _service([RESPONSE])
+
+        def broken(field, value):
+            raise RuntimeError("stream closed")
+
+        assert await service.ainvoke("프롬프트", on_partial=broken) == RESPONSE
+
+
+class _State(TypedDict, total=False):
+    current_day: int
+    current_meal_type: str
+    menu: str
+
+
+class TestPartialProgressEvents:
+    def test_disabled_in_mock_mode_and_outside_graph(self, monkeypatch):
+        assert partial_progress_writer("chef", {}) is None  # MOCK_MODE=true
+        monkeypatch.setattr(settings, "MOCK_MODE", False)
+        assert partial_progress_writer("chef", {}) is None  # 그래프 밖
+
+    @pytest.mark.asyncio
+    async def test_partial_events_precede_node_update(self, monkeypatch):
+        monkeypatch.setattr(settings, "MOCK_MODE", False)
+
+        async def chef(state):
+            on_partial = partial_progress_writer("chef", state)
+            for field, value in IncrementalJSONParser(STREAMED_FIELDS).feed(RESPONSE):
+                on_partial(field, value)
+            return {"menu": "done"}
+
+        graph = StateGraph(_State)
+        graph.add_node("chef", chef)
+        graph.add_edge(START, "chef")
+        graph.add_edge("chef", END)
+
+        state = {"current_day": 2, "current_meal_type": "점심"}
+        items = [item async for item in iterate_graph(graph.compile(), state, {})]
+
+        modes = [mode for mode, _ in items]
+        assert modes == ["custom", "custom", "custom", "updates"]
+        last_partial = items[2][1]
+        assert last_partial["node"] == "chef" and last_partial["status"] == "streaming"
+        assert last_partial["data"]["menu"] == '닭가슴살 "특제" 샐러드'
+        assert len(last_partial["data"]["ingredients"]) == 2
+        assert last_partial["data"]["day"] == 2 and last_partial["data"]["meal_type"] == "점심"
@@ -0,0 +1,212 @@
+"""
+Recipe ETL Tests
+
+Offline cleaning, near-duplicate removal and derived columns
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.recipe_etl import (
+    ALLERGEN_MASK_NAMES,
+    DERIVED_COLUMNS,
+    NEAR_DUPLICATE_JACCARD,
+    NearDuplicateFilter,
+    band_keys,
+    bigram_jaccard,
+    clean_ingredient_name,
+    minhash_signatures,
+    normalize_recipe_name,
+    parse_amount_grams,
+    run_recipe_etl,
+)
+from app.services.recipe_snapshot import load_snapshot
+from app.services.recipe_store import (
+    RecipeStore,
+    build_recipe_snapshot,
+    ensure_recipe_snapshot,
+    reload_recipe_store,
+)
+
+
+@pytest.fixture
+def dirty_csv(recipe_csv):
+    """합성 CSV + 근사 중복 이름, 이름 없는 행, 범위 밖 영양값"""
+    df = pd.read_csv(recipe_csv, encoding="utf-8-sig")
+    extra = df.iloc[[0, 3, 4]].copy()
+    extra["name"] = ["[초간단] 닭가슴살 샐러드!!", None, "소고기 미역국"]
+    extra.loc[extra.index[2], "calories"] = -100
+    df = pd.concat([df, extra], ignore_index=True)
+    df.loc[3, "ingredients_parsed"] = json.dumps(
+        [{"name": "두부(부침용)", "amount": "300g"}, {"name": "*간장", "amount": "2큰술"}, {"name": "두부", "amount": "1모"}],
+        ensure_ascii=False,
+    )
+    df.loc[1, "calories"] = 99999
+    df.to_csv(recipe_csv, index=False, encoding="utf-8-sig")
+    return recipe_csv
+
+
+class TestNormalization:
+    """이름/재료/수량 정규화"""
+
+    def test_recipe_name(self):
+        assert normalize_recipe_name("[초간단] 김치 찌개!!") == "김치찌개"
+        assert normalize_recipe_name("(비건)") == "비건"
+
+    def test_ingredient_name(self):
+        assert clean_ingredient_name("대파(흰 부분)") == "대파"
+        assert clean_ingredient_name(" *간장 ") == "간장"
+
+    def test_amount_grams(self):
+        assert parse_amount_grams("150g") == 150
+        assert parse_amount_grams("1/2컵") == 100
+        assert parse_amount_grams("2큰술") == 30
+        assert parse_amount_grams("약간") is None
+
+
+def _keep(dedup, names):
+    normalized = [normalize_recipe_name(n) for n in names]
+    return dedup.keep_mask(band_keys(minhash_signatures(normalized)), normalized).tolist()
+
+
+class TestNearDuplicates:
+    """MinHash + LSH 후보 + 실제 bigram Jaccard 근사 중복 제거"""
+
+    def test_first_occurrence_kept(self):
+        keep = _keep(NearDuplicateFilter(), ["김치찌개", "김치 찌개", "된장찌개", "돼지고기 김치찌개"])
+        assert keep == [True, False, True, True]
+
+    def test_duplicates_across_chunks(self):
+        dedup = NearDuplicateFilter()
+        _keep(dedup, ["김치찌개"])
+        assert _keep(dedup, ["김치찌개", "순두부찌개"]) == [False, True]
+
+    @pytest.mark.parametrize("first, second", [
+        ("콩나물국", "콩나물국수"),
+        ("메추리알볶음", "메추리알볶음밥"),
+        ("앞다리살덮밥", "닭다리살덮밥"),
+        ("차돌박이된장찌개", "차돌박이장조림"),
+        ("다이어트다진소고기국", "다이어트다진소고기국수"),
+        ("두부순두부찌개", "순두부순두부찌개"),
+    ])
+    def test_similar_names_are_different_dishes(self, first, second):
+        assert _keep(NearDuplicateFilter(), [first, second]) == [True, True]
+
+    def test_long_name_variant_dropped(self):
+        base = "돼지고기김치찌개와계란말이그리고시금치나물정식"
+        names = [base, "[초간단] 돼지고기 김치찌개와 계란말이 그리고 시금치나물 정식!", base + "2"]
+        assert bigram_jaccard(base, base + "2") >= NEAR_DUPLICATE_JACCARD
+        assert _keep(NearDuplicateFilter(), names) == [True, False, False]
+
+    def test_dropped_rows_do_not_chain(self):
+        """제외된 레시피와만 비슷한 레시피는 유지 (유지된 레시피 기준으로만 판정)"""
+        dedup = NearDuplicateFilter(threshold=0.7)
+        assert _keep(dedup, ["콩나물국", "콩나물국수", "나물국수"]) == [True, False, True]
+
+
+class TestRunEtl:
+    """원본 CSV → 정제 CSV → 스냅샷"""
+
+    def test_clean_output(self, dirty_csv, tmp_path):
+        out = tmp_path / "clean.csv"
+        stats = run_recipe_etl(dirty_csv, out, workers=1, chunk_rows=4)
+
+        df = pd.read_csv(out)
+        assert stats["rows_in"] == 11
+        assert stats["missing_name"] == 1
+        assert stats["duplicates"] == 2
+        assert stats["rows_out"] == len(df) == 8
+        assert stats["invalid_values"] == 2
+        assert all(col in df.columns for col in DERIVED_COLUMNS)
+
+        row = df.set_index("name").loc["두부조림"]
+        assert [i["name"] for i in json.loads(row["ingredients_parsed"])] == ["두부", "간장"]
+        # 탄단지 에너지 비율 합 = 1, 재료비는 원 단위
+        assert row["carb_ratio"] + row["protein_ratio"] + row["fat_ratio"] == pytest.approx(1, abs=1e-3)
+        assert row["est_cost"] > 0
+        # 범위 밖 칼로리는 결측 → 탄단지로 다시 계산
+        assert df.set_index("name").loc["계란김치볶음밥", "calories"] == 65 * 4 + 15 * 4 + 12 * 9
+
+        egg_bit = 1 << ALLERGEN_MASK_NAMES.index("알류(계란)")
+        masks = df.set_index("name")["allergen_mask"]
+        assert masks["계란김치볶음밥"] & egg_bit
+        assert not masks["두부조림"] & egg_bit
+
+    def test_worker_processes_match_inline(self, dirty_csv, tmp_path):
+        """멀티 프로세스 결과는 단일 프로세스와 같음 (CSV 순서 유지)"""
+        run_recipe_etl(dirty_csv, tmp_path / "inline.csv", workers=1, chunk_rows=3)
+        run_recipe_etl(dirty_csv, tmp_path / "pool.csv", workers=2, chunk_rows=3)
+        pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "inline.csv"), pd.read_csv(tmp_path / "pool.csv"))
+
+    def test_snapshot_tracks_raw_csv(self, dirty_csv, tmp_path):
+        """정제 CSV로 빌드한 스냅샷은 원본 CSV 기준으로 최신 여부 판정"""
+        out = tmp_path / "clean.csv"
+        run_recipe_etl(dirty_csv, out, workers=1)
+        snapshot_dir = tmp_path / "snapshot"
+        build_recipe_snapshot(out, snapshot_dir, source_csv=dirty_csv)
+
+        assert not load_snapshot(snapshot_dir).is_stale(dirty_csv)
+        store = RecipeStore.load(dirty_csv, snapshot_dir)
+        assert store.source == "snapshot" and len(store) == 8
+        assert np.isfinite(store.lazy_value("est_cost", 0))
+
+
+def _etl_snapshot(raw_csv, tmp_path):
+    """scripts/etl_recipes.py와 같은 순서로 정제 CSV + ETL 스냅샷 생성"""
+    out = tmp_path / "clean.csv"
+    run_recipe_etl(raw_csv, out, workers=1)
+    snapshot_dir = tmp_path / "snapshot"
+    build_recipe_snapshot(out, snapshot_dir, source_csv=raw_csv, etl={"clean_csv": str(out), "dedup": True})
+    return snapshot_dir
+
+
+def _append_duplicate(csv_path):
+    """원본 CSV에 기존 레시피의 근사 중복 1개 추가 (mtime 증가)"""
+    df = pd.read_csv(csv_path, encoding="utf-8-sig")
+    row = df.iloc[0].copy()
+    row["name"] = f"[간편] {row['name']}!"
+    pd.concat([df, row.to_frame().T]).to_csv(csv_path, index=False, encoding="utf-8-sig")
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+
+class TestEtlSnapshotRebuild:
+    """ETL 스냅샷은 다시 빌드할 때도 ETL을 거침 (중복 제거 + 파생 컬럼 유지)"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_stores(self, monkeypatch):
+        monkeypatch.setattr("app.services.recipe_store._stores", {})
+
+    def _assert_etl_snapshot(self, snapshot_dir, raw_csv):
+        snapshot = load_snapshot(snapshot_dir)
+        assert snapshot.etl is not None and not snapshot.is_stale(raw_csv)
+        store = RecipeStore.load(raw_csv, snapshot_dir)
+        assert len(store) == 8
+        assert np.isfinite(store.lazy_value("est_cost", 0))
+
+    def test_reload_reruns_etl_for_edited_raw_csv(self, dirty_csv, tmp_path):
+        snapshot_dir = _etl_snapshot(dirty_csv, tmp_path)
+        _append_duplicate(dirty_csv)
+
+        store = reload_recipe_store(dirty_csv, snapshot_dir)
+        assert store.source == "snapshot"
+        self._assert_etl_snapshot(snapshot_dir, dirty_csv)
+
+    def test_ensure_reruns_etl_for_edited_raw_csv(self, dirty_csv, tmp_path):
+        snapshot_dir = _etl_snapshot(dirty_csv, tmp_path)
+        _append_duplicate(dirty_csv)
+
+        assert ensure_recipe_snapshot(dirty_csv, snapshot_dir)
+        self._assert_etl_snapshot(snapshot_dir, dirty_csv)
+
+    def test_index_signature_change_keeps_etl_output(self, dirty_csv, tmp_path, monkeypatch):
+        snapshot_dir = _etl_snapshot(dirty_csv, tmp_path)
+        monkeypatch.setattr("app.services.recipe_store.INDEX_SIGNATURE", "changed")
+
+        assert ensure_recipe_snapshot(dirty_csv, snapshot_dir)
+        assert load_snapshot(snapshot_dir).indexes("changed") is not None
+        self._assert_etl_snapshot(snapshot_dir, dirty_csv)
@@ -0,0 +1,98 @@
+"""Constraint feasibility pre-check tests (per-constraint and combined recipe counts)"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.agents.nodes.validation.nutrition_checker import nutrition_checker
+from app.models.state import MacroTargets, Menu
+from app.services.recipe_feasibility import estimate_feasibility
+from app.services.recipe_store import RecipeStore
+
+
+def _targets(calories=400, carb_g=40, protein_g=25, fat_g=15):
+    return MacroTargets(
+        calories=calories, carb_g=carb_g, protein_g=protein_g, fat_g=fat_g,
+        carb_ratio=40, protein_ratio=30, fat_ratio=30,
+    )
+
+
+@pytest.fixture
+def store(recipe_csv, tmp_path):
+    return RecipeStore.load(recipe_csv, tmp_path / "no_snapshot")
+
+
+class TestEstimateFeasibility:
+    def test_counts_match_masks(self, store):
+        report = estimate_feasibility(
+            store, _targets(), max_cooking_time=20, skill_level="중급", restrictions=["계란"], min_recipes=1
+        )
+        by_name = {c.name: c for c in report.constraints}
+        df = store.df
+
+        assert report.total_recipes == len(df)
+        assert by_name["calories"].matching == int(df["calories"].between(320, 480).sum())
+        assert by_name["cooking_time"].matching == int((df["cooking_time"] <= 20).sum())
+        assert by_name["difficulty"].matching == int(df["difficulty"].isin(["아무나", "초급"]).sum())
+        assert report.constraints[-1].cumulative == report.matching_all
+        assert "budget" not in by_name  # 예상 비용 컬럼 없음
+
+    def test_bottleneck_and_relaxed_validators(self, store):
+        """조건이 좁으면 병목 조건과 완화할 검증기를 알려줌"""
+        report = estimate_feasibility(store, _targets(calories=900), max_cooking_time=15, min_recipes=3)
+
+        assert not report.feasible
+        assert report.matching_all == 0
+        assert report.bottleneck == "calories"
+        assert report.relaxed_validators == ["nutrition_checker"]
+        assert report.warnings
+
+    def test_budget_uses_estimated_cost_column(self, recipe_csv, tmp_path):
+        df = pd.read_csv(recipe_csv)
+        store = RecipeStore(df, source="csv", path="memory")
+        store.lazy_columns["est_cost"] = np.linspace(1000, 8000, len(df))
+
+        report = estimate_feasibility(store, _targets(), per_meal_budget=4000, min_recipes=1)
+        budget = next(c for c in report.constraints if c.name == "budget")
+        assert budget.matching == int(np.count_nonzero(np.linspace(1000, 8000, len(df)) <= 4400))
+
+
+class TestPreRelaxedValidation:
+    @pytest.mark.asyncio
+    async def test_nutrition_checker_relaxed_from_first_attempt(self):
+        """사전 점검에서 완화된 검증기는 재시도 전에도 완화된 허용 범위(±25%) 사용"""
+        menu = Menu(
+            meal_type="점심", menu_name="테스트", ingredients=[], calories=490, carb_g=50, protein_g=30,
+            fat_g=18, sodium_mg=0, sugar_g=0, cooking_time_minutes=10, estimated_cost=3000, recipe_steps=[],
+        )
+        state = {"current_menu": menu, "per_meal_targets": _targets(calories=400, carb_g=40, protein_g=25, fat_g=15),
+                 "retry_count": 0}
+
+        strict = await nutrition_checker(state)
+        relaxed = await nutrition_checker({**state, "relaxed_validators": ["nutrition_checker"]})
+        assert strict["validation_results"][0].passed is False
+        assert relaxed["validation_results"][0].passed is True
+
+
+class TestHealthConditions:
+    def test_health_condition_makes_plan_infeasible(self, store):
+        """고지혈증(지방 × 0.3 ≤ 7g)으로 고지방 레시피가 빠지면 충족 불가"""
+        targets = _targets(calories=380, carb_g=2, protein_g=35, fat_g=25)  # 고등어구이만 해당
+        assert estimate_feasibility(store, targets, min_recipes=1).feasible
+
+        report = estimate_feasibility(store, targets, health_conditions=["고지혈증"], min_recipes=1)
+        health = next(c for c in report.constraints if c.name == "health")
+
+        assert not report.feasible and report.matching_all == 0
+        assert health.matching == int((store.df["fat_g"] * 0.3 <= 7).sum())
+        assert "health_checker" not in report.relaxed_validators
+
+    def test_sodium_checked_only_when_column_exists(self, recipe_csv):
+        df = pd.read_csv(recipe_csv)
+        store = RecipeStore(df, source="csv", path="memory")
+        report = estimate_feasibility(store, _targets(), health_conditions=["고혈압"], min_recipes=1)
+        assert "health" not in {c.name for c in report.constraints}
+
+        store.lazy_columns["sodium_mg"] = np.linspace(500, 3000, len(df))
+        report = estimate_feasibility(store, _targets(), health_conditions=["고혈압"], min_recipes=1)
+        health = next(c for c in report.constraints if c.name == "health")
+        assert health.matching == int(np.count_nonzero(np.linspace(500, 3000, len(df)) <= 2000))
@@ -0,0 +1,94 @@
+"""
+Ingredient Table Tests
+
+CSR ingredient table and restriction matching semantics
+"""
+
+import json
+import random
+
+import numpy as np
+
+from app.services.recipe_ingredients import (
+    IngredientIndex,
+    IngredientTable,
+    matches_restriction,
+    normalize_ingredient_name,
+    parse_ingredient_names,
+)
+
+
+def _reference_has_restricted(ingredients, restrictions):
+    """기존 CSVRecipeSearchService._has_restricted_ingredients 동작 (기준 구현)"""
+    normalized_ingredients = [i.lower().replace(" ", "") for i in ingredients]
+    normalized_restrictions = [r.lower().replace(" ", "") for r in restrictions]
+    return any(
+        r in i or i in r
+        for r in normalized_restrictions
+        for i in normalized_ingredients
+    )
+
+
+LISTS = [
+    ["닭가슴살", "양상추"],
+    ["밥", "계란", "김치"],
+    [],
+    ["대파", "Soy Sauce"],
+    ["계란말이", "밥"],
+]
+
+
+class TestIngredientTable:
+    """CSR 재료 테이블"""
+
+    def test_from_lists_interns_names(self):
+        """재료명은 사전에 1회만 저장되고 행별로 복원됨"""
+        table = IngredientTable.from_lists(LISTS)
+        assert len(table) == 5
+        assert table.vocab.count("밥") == 1
+        assert [table.names(i) for i in range(5)] == LISTS
+        assert table.offsets.dtype == np.int64
+        assert table.ids.dtype == np.int32
+
+    def test_from_columns_parses_json_once(self):
+        """JSON 컬럼 파싱, 실패 시 raw 폴백"""
+        parsed = [json.dumps([{"name": "두부"}, {"name": ""}], ensure_ascii=False), "broken"]
+        table = IngredientTable.from_columns(parsed, ["두부", "간장, 설탕"])
+        assert table.names(0) == ["두부"]
+        assert table.names(1) == ["간장", "설탕"]
+
+    def test_parse_ingredient_names_edge_cases(self):
+        """빈 값/비정상 값 처리"""
+        assert parse_ingredient_names(None, None) == []
+        assert parse_ingredient_names('["밥", "김"]') == ["밥", "김"]
+        assert matches_restriction(normalize_ingredient_name("Soy Sauce"), "soy")
+
+
+class TestIngredientIndex:
+    """n-gram 역색인 (기존 행 단위 검사와 동일한 결과)"""
+
+    def test_excluded_rows_matches_reference_semantics(self):
+        """양방향 부분 매칭 결과가 기준 구현과 일치"""
+        index = IngredientIndex(IngredientTable.from_lists(LISTS))
+        for restrictions in (["계란"], ["파"], ["soy"], ["대파볶음"], ["우유", "밥"], ["Soy sauce"], []):
+            expected = [_reference_has_restricted(lst, restrictions) for lst in LISTS]
+            assert index.excluded_rows(restrictions).tolist() == expected, restrictions
+
+    def test_randomized_against_reference(self):
+        """무작위 재료/제한 조합에서도 기준 구현과 일치"""
+        rng = random.Random(7)
+        syllables = list("계란우유밥김치대파두부콩땅새우게고등어닭")
+        vocab = ["".join(rng.choices(syllables, k=rng.randint(1, 4))) for _ in range(60)]
+        lists = [rng.sample(vocab, rng.randint(0, 6)) for _ in range(200)]
+        index = IngredientIndex(IngredientTable.from_lists(lists))
+
+        for _ in range(100):
+            restrictions = ["".join(rng.choices(syllables, k=rng.randint(1, 5))) for _ in range(rng.randint(1, 5))]
+            expected = [_reference_has_restricted(lst, restrictions) for lst in lists]
+            assert index.excluded_rows(restrictions).tolist() == expected, restrictions
+
+    def test_one_directional_matching(self):
+        """bidirectional=False면 재료명이 제한 재료를 포함하는 경우만"""
+        index = IngredientIndex(IngredientTable.from_lists(LISTS))
+        assert index.excluded_rows(["대파볶음"], bidirectional=False).tolist() == [False] * 5
+        assert index.excluded_rows(["계란"], bidirectional=False).tolist() == [False, True, False, False, True]
@@ -0,0 +1,53 @@
+"""
+Recipe Keyword Index Tests
+
+Keyword index must match the str.contains scan over name/category/main_ingredient
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+
+from app.services.recipe_keywords import KeywordIndex
+from app.services.recipe_search import RecipeSearchService
+
+
+def _reference(df, keywords):
+    mask = pd.Series(False, index=df.index)
+    for keyword in keywords:
+        for col in ["name", "category", "main_ingredient"]:
+            mask |= df[col].str.contains(keyword, case=False, na=False, regex=False)
+    return mask.to_numpy()
+
+
+class TestKeywordIndex:
+    def test_matches_str_contains(self):
+        rng = random.Random(2)
+        syllables = ["닭", "가슴", "살", "볶음", "밥", "계란", "국", "찌개", "Kimchi", "Soup", " "]
+        df = pd.DataFrame({
+            "name": ["".join(rng.choices(syllables, k=rng.randint(1, 4))) for _ in range(400)],
+            "category": [rng.choice(["밥", "국", "반찬", None]) for _ in range(400)],
+            "main_ingredient": [rng.choice(["닭고기", "계란", "채소", "kimchi", None]) for _ in range(400)],
+        })
+        index = KeywordIndex(df)
+
+        queries = ["닭", "볶음밥", "kimchi", "SOUP", "계란 국", "없는키워드", "밥 닭가슴살", "i"]
+        for query in queries:
+            keywords = query.split()
+            assert np.array_equal(index.matching_rows(keywords), _reference(df, keywords)), query
+
+    def test_missing_columns_are_skipped(self):
+        index = KeywordIndex(pd.DataFrame({"name": ["두부조림", "계란말이"]}))
+        assert index.matching_rows(["계란"]).tolist() == [False, True]
+
+
+class TestLocalKeywordSearch:
+    async def test_query_filters_local_recipes(self, recipe_csv, tmp_path):
+        service = RecipeSearchService(
+            csv_path=str(recipe_csv),
+            snapshot_path=str(tmp_path / "no_snapshot"),
+            enable_web_search=False,
+        )
+        results = await service._search_local_csv("볶음밥", {}, limit=5)
+        assert [r["name"] for r in results] == ["계란김치볶음밥", "새우볶음밥"]
@@ -0,0 +1,154 @@
+"""
+Recipe Neighbor Index Tests
+
+KD-tree k-NN must return the same top-k as filtering and scoring every recipe
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.recipe_neighbors import RecipeNeighborIndex
+from app.services.recipe_scoring import difficulty_levels, similarity_scores, top_k
+from app.services.recipe_search import RecipeSearchService
+
+
+def _frame(n=3000, seed=11):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "name": [f"recipe{i % 2500}" for i in range(n)],
+        "difficulty": rng.choice(["아무나", "초급", "중급", "고급"], n),
+        "calories": rng.integers(50, 1200, n).astype(float),
+        "cooking_time": rng.choice([5, 10, 20, 30, 60, 240], n).astype(float),
+        "carb_g": rng.integers(0, 80, n).astype(float),
+        "protein_g": rng.integers(0, 50, n).astype(float),
+        "fat_g": rng.integers(0, 30, n).astype(float),
+    })
+    df.loc[:20, ["carb_g", "protein_g", "fat_g"]] = 0.0
+    df.loc[rng.random(n) < 0.03, "protein_g"] = np.nan
+    return df
+
+
+def _brute_force(df, levels, k, targets, calorie_range, max_time, excluded, names):
+    keep = (df["calories"] >= calorie_range[0]) & (df["calories"] <= calorie_range[1])
+    if max_time:
+        keep &= df["cooking_time"] <= max_time
+    keep &= ~excluded & ~df["name"].isin(names)
+    candidates = np.flatnonzero(keep.to_numpy())
+    use_macro = targets.get("target_carb_g") is not None
+    scores = similarity_scores(
+        calories=df["calories"].to_numpy()[candidates],
+        cooking_time=df["cooking_time"].to_numpy()[candidates],
+        difficulty_level=levels[candidates],
+        carb_g=df["carb_g"].to_numpy()[candidates] if use_macro else None,
+        protein_g=df["protein_g"].to_numpy()[candidates] if use_macro else None,
+        fat_g=df["fat_g"].to_numpy()[candidates] if use_macro else None,
+        **targets,
+    )
+    return candidates[top_k(scores, k)]
+
+
+class TestRecipeNeighborIndex:
+    def test_matches_brute_force(self):
+        df = _frame()
+        levels = difficulty_levels(df["difficulty"])
+        index = RecipeNeighborIndex(df, levels)
+        rng = np.random.default_rng(5)
+
+        for _ in range(150):
+            target = float(rng.integers(100, 1000))
+            tolerance = float(rng.choice([50, 150, 400]))
+            max_time = [None, 20, 60][rng.integers(0, 3)]
+            targets = {
+                "target_calories": target,
+                "target_time": max_time or 30,
+                "target_difficulty": [None, "초급", "중급"][rng.integers(0, 3)],
+            }
+            if rng.random() < 0.7:
+                targets.update(
+                    target_carb_g=float(rng.integers(0, 80)),
+                    target_protein_g=float(rng.integers(0, 40)),
+                    target_fat_g=float(rng.integers(0, 30)),
+                )
+            excluded = rng.random(len(df)) < rng.choice([0.0, 0.3, 0.9])
+            names = {f"recipe{rng.integers(0, 2500)}" for _ in range(3)}
+            k = int(rng.integers(1, 6))
+
+            expected = _brute_force(df, levels, k, targets, (target - tolerance, target + tolerance), max_time, excluded, names)
+            actual = index.nearest(
+                k=k,
+                calorie_range=(target - tolerance, target + tolerance),
+                max_cooking_time=max_time,
+                excluded=excluded,
+                exclude_names=names,
+                **targets,
+            )
+            assert actual.tolist() == expected.tolist()
+
+    def test_max_visits_gives_up(self):
+        df = _frame(1000)
+        index = RecipeNeighborIndex(df, difficulty_levels(df["difficulty"]))
+        excluded = np.ones(len(df), dtype=bool)
+        assert index.nearest(k=3, target_calories=500, target_time=30, excluded=excluded, max_visits=200) is None
+        assert len(index.nearest(k=3, target_calories=500, target_time=30, excluded=excluded)) == 0
+
+
+class TestSearchSimilarRecipes:
+    async def test_nearest_local_recipes(self, recipe_csv, tmp_path):
+        service = RecipeSearchService(
+            csv_path=str(recipe_csv),
+            snapshot_path=str(tmp_path / "no_snapshot"),
+            enable_web_search=False,
+        )
+        results = await service.search_similar_recipes(
+            target_calories=400,
+            target_carb_g=60,
+            target_protein_g=15,
+            target_fat_g=12,
+            exclude_ingredients=["계란"],
+            limit=2,
+        )
+        assert [r["name"] for r in results] == ["땅콩버터 토스트", "닭가슴살 샐러드"]
+        assert all(r["source"] == "csv" for r in results)
+
+    async def test_nutritionist_prompt_uses_nearest_recipes(self, recipe_csv, tmp_path, monkeypatch):
+        """영양사 에이전트는 끼니 영양 목표의 k-NN 레시피를 참고 레시피로 사용"""
+        from app.agents.nodes.meal_planning import nutritionist
+        from app.models.state import MacroTargets, MealRecommendation, UserProfile
+
+        service = RecipeSearchService(
+            csv_path=str(recipe_csv),
+            snapshot_path=str(tmp_path / "no_snapshot"),
+            enable_web_search=False,
+        )
+        response = MealRecommendation(
+            menu_name="땅콩버터 토스트", ingredients=[{"name": "식빵", "amount": "2장"}],
+            estimated_calories=400, estimated_cost=3000, cooking_time_minutes=5, reasoning="테스트",
+        ).model_dump_json()
+        llm_service = MagicMock(mock_mode=False)
+        llm_service.ainvoke = AsyncMock(return_value=response)
+        monkeypatch.setattr(nutritionist, "get_recipe_search_service", lambda: service)
+        monkeypatch.setattr(nutritionist, "get_llm_service", lambda: llm_service)
+
+        profile = UserProfile(
+            goal="다이어트", weight=70, height=175, age=30, gender="male", activity_level="moderate",
+            restrictions=["계란"], health_conditions=[], budget=100000, budget_type="weekly",
+            cooking_time="30분 이내", skill_level="초급", meals_per_day=3, days=1,
+        )
+        targets = MacroTargets(
+            calories=400, carb_g=60, protein_g=15, fat_g=12, carb_ratio=60, protein_ratio=15, fat_ratio=25,
+        )
+        await nutritionist.nutritionist_agent({
+            "profile": profile,
+            "per_meal_targets": targets,
+            "current_meal_type": "아침",
+            "current_day": 1,
+            "retry_count": 0,
+            "completed_meals": [],
+        })
+
+        prompt = llm_service.ainvoke.call_args.args[0]
+        assert "### 레시피 1: 땅콩버터 토스트" in prompt
+        assert "### 레시피 2: 닭가슴살 샐러드" in prompt
@@ -0,0 +1,88 @@
+"""
+Recipe Candidate Partition Tests
+
+(difficulty, cooking-time bucket, calorie decile) cells and exact boundary filtering
+"""
+
+import numpy as np
+import pandas as pd
+
+from app.services.recipe_partitions import CandidatePartitions
+from app.services.recipe_store import RecipeStore
+
+
+def _frame(n=600, seed=19):
+    rng = np.random.default_rng(seed)
+    calories = rng.integers(50, 1200, n).astype(float)
+    calories[rng.random(n) < 0.05] = np.nan
+    return pd.DataFrame({
+        "name": [f"레시피 {i}" for i in range(n)],
+        "calories": calories,
+        "cooking_time": rng.choice([5, 10, 15, 20, 30, 60, 90, 240], n).astype(float),
+        "difficulty": pd.Categorical(rng.choice(["아무나", "초급", "중급", "고급"], n)),
+        "ingredients_parsed": "[]",
+    })
+
+
+def _expected(df, calorie_range, max_time, difficulties):
+    mask = np.ones(len(df), dtype=bool)
+    if calorie_range is not None:
+        mask &= ((df["calories"] >= calorie_range[0]) & (df["calories"] <= calorie_range[1])).to_numpy()
+    if max_time is not None:
+        mask &= (df["cooking_time"] <= max_time).to_numpy()
+    if difficulties is not None:
+        mask &= df["difficulty"].isin(difficulties).to_numpy()
+    return np.flatnonzero(mask)
+
+
+class TestCandidatePartitions:
+    def test_matches_boolean_masks(self):
+        df = _frame()
+        partitions = CandidatePartitions(df)
+        rng = np.random.default_rng(3)
+        categories = list(df["difficulty"].cat.categories)
+
+        for _ in range(60):
+            low = float(rng.integers(0, 1000))
+            calorie_range = (low, low + float(rng.integers(0, 500))) if rng.random() < 0.8 else None
+            max_time = float(rng.choice([10, 15, 25, 30, 180, 300])) if rng.random() < 0.7 else None
+            difficulties = list(rng.choice(categories, int(rng.integers(1, 4)), replace=False)) \
+                if rng.random() < 0.5 else None
+            codes = None if difficulties is None else df["difficulty"].cat.categories.get_indexer(difficulties)
+
+            expected = _expected(df, calorie_range, max_time, difficulties)
+            actual = partitions.query(codes, max_time, calorie_range)
+            assert np.array_equal(actual, expected)
+            assert partitions.count(codes, max_time, calorie_range) >= len(expected)
+
+    def test_every_row_in_exactly_one_cell(self):
+        df = _frame()
+        partitions = CandidatePartitions(df)
+        assert np.array_equal(np.sort(partitions.order), np.arange(len(df)))
+        assert partitions.offsets[-1] == len(df)
+
+    def test_restored_from_arrays(self):
+        df = _frame()
+        built = CandidatePartitions(df)
+        restored = CandidatePartitions(df, built.to_arrays())
+        assert np.array_equal(restored.query(None, 30, (200, 600)), built.query(None, 30, (200, 600)))
+
+
+class TestStoreCandidatePositions:
+    def test_same_result_from_partitions_or_range_index(self):
+        """넓은 조건(파티션)과 좁은 칼로리 범위(정렬 색인) 모두 같은 결과"""
+        df = _frame()
+        store = RecipeStore(df.copy(), source="csv", path="memory")
+        for calorie_range, max_time, difficulties in [
+            ((300, 900), 30, ["아무나", "초급"]),
+            ((500, 505), None, None),
+            (None, 15, None),
+            (None, None, ["고급"]),
+        ]:
+            expected = _expected(store.df, calorie_range, max_time, difficulties)
+            actual = store.candidate_positions(calorie_range, max_time, difficulties)
+            assert np.array_equal(actual, expected)
+
+    def test_no_conditions_means_all_rows(self):
+        store = RecipeStore(_frame(20), source="csv", path="memory")
+        assert store.candidate_positions() is None
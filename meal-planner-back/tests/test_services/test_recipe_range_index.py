@@ -0,0 +1,63 @@
+"""
+Recipe Range Index Tests
+
+Sorted column permutations and binary-search range queries
+"""
+
+import numpy as np
+import pandas as pd
+
+from app.services.recipe_range_index import RecipeRangeIndex, SortedColumn
+
+
+def _frame(n=500, seed=7):
+    rng = np.random.default_rng(seed)
+    calories = rng.integers(50, 1200, n).astype(float)
+    calories[rng.random(n) < 0.05] = np.nan
+    return pd.DataFrame({
+        "calories": calories,
+        "cooking_time": rng.choice([5, 10, 15, 20, 30, 60, 90], n).astype(float),
+        "protein_g": rng.uniform(0, 60, n),
+    })
+
+
+class TestSortedColumn:
+    def test_nan_never_in_range(self):
+        column = SortedColumn(np.array([300.0, np.nan, 100.0, 200.0]))
+        assert sorted(column.positions(None, None).tolist()) == [0, 2, 3]
+        assert column.positions(150, 300).tolist() == [3, 0]
+
+    def test_empty_range(self):
+        column = SortedColumn(np.array([1.0, 2.0, 3.0]))
+        assert len(column.positions(5, 1)) == 0
+
+
+class TestRecipeRangeIndex:
+    def test_matches_boolean_masks(self):
+        df = _frame()
+        index = RecipeRangeIndex(df, ["calories", "cooking_time", "protein_g"])
+        rng = np.random.default_rng(1)
+
+        for _ in range(50):
+            low = float(rng.integers(0, 1000))
+            high = low + float(rng.integers(0, 400))
+            max_time = float(rng.choice([10, 30, 60]))
+            min_protein = float(rng.uniform(0, 30))
+
+            expected = df.index[
+                (df["calories"] >= low) & (df["calories"] <= high)
+                & (df["cooking_time"] <= max_time)
+                & (df["protein_g"] >= min_protein)
+            ].to_numpy()
+            actual = index.query({
+                "calories": (low, high),
+                "cooking_time": (None, max_time),
+                "protein_g": (min_protein, None),
+            })
+            assert np.array_equal(actual, expected)
+
+    def test_no_ranges_returns_all_rows(self):
+        df = _frame(20)
+        index = RecipeRangeIndex(df, ["calories"])
+        assert index.query({}).tolist() == list(range(20))
+        assert index.query({"calories": (None, None)}).tolist() == list(range(20))
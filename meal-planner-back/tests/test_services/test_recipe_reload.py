@@ -0,0 +1,200 @@
+"""
+Recipe Reload Tests
+
+Versioned atomic swap of the shared RecipeStore
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from app.services.csv_recipe_search_service import CSVRecipeSearchService
+from app.services.recipe_search import RecipeSearchService
+from app.services.recipe_store import (
+    RecipeReloadInProgressError,
+    build_recipe_snapshot,
+    changed_recipe_stores,
+    get_recipe_store,
+    peek_recipe_store,
+    reload_recipe_store,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_stores(monkeypatch):
+    """테스트마다 빈 공유 인스턴스 레지스트리"""
+    monkeypatch.setattr("app.services.recipe_store._stores", {})
+
+
+def _append_recipe(csv_path, name):
+    """CSV에 레시피 1개 추가 (수정 시각이 확실히 바뀌도록 mtime 증가)"""
+    df = pd.read_csv(csv_path, encoding="utf-8-sig")
+    row = df.iloc[0].copy()
+    row["name"] = name
+    pd.concat([df, row.to_frame().T]).to_csv(csv_path, index=False, encoding="utf-8-sig")
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+
+class TestReloadSwap:
+    """새 버전 구축 후 원자적 교체"""
+
+    def test_reload_increments_version(self, recipe_csv, tmp_path):
+        """리로드하면 새 데이터가 다음 버전으로 교체됨"""
+        snapshot_dir = tmp_path / "no_snapshot"
+        store = get_recipe_store(recipe_csv, snapshot_dir)
+        assert store.version == 1
+
+        _append_recipe(recipe_csv, "새 레시피")
+        reloaded = reload_recipe_store(recipe_csv, snapshot_dir)
+
+        assert reloaded.version == 2
+        assert len(reloaded) == len(store) + 1
+        assert get_recipe_store(recipe_csv, snapshot_dir) is reloaded
+        assert peek_recipe_store(recipe_csv, snapshot_dir) is reloaded
+
+    def test_reload_rebuilds_stale_snapshot(self, recipe_csv, tmp_path):
+        """스냅샷이 CSV보다 오래되었으면 다시 빌드한 뒤 로드"""
+        snapshot_dir = tmp_path / "snapshot"
+        build_recipe_snapshot(recipe_csv, snapshot_dir)
+        store = get_recipe_store(recipe_csv, snapshot_dir)
+
+        _append_recipe(recipe_csv, "새 레시피")
+        reloaded = reload_recipe_store(recipe_csv, snapshot_dir)
+
+        assert reloaded.source == "snapshot"
+        assert reloaded.shared_indexes
+        assert len(reloaded) == len(store) + 1
+        # 교체 전 버전은 옮겨진 스냅샷 파일의 memory-map으로 계속 조회 가능
+        assert store.df["name"].iloc[0] == reloaded.df["name"].iloc[0]
+        assert not list(tmp_path.glob("snapshot.tmp-*")) and not list(tmp_path.glob("snapshot.old-*"))
+
+    def test_concurrent_reload_rejected(self, recipe_csv, tmp_path, monkeypatch):
+        """리로드 진행 중 다른 리로드는 거부"""
+        import app.services.recipe_store as recipe_store
+
+        assert recipe_store._reload_lock.acquire(blocking=False)
+        try:
+            with pytest.raises(RecipeReloadInProgressError):
+                reload_recipe_store(recipe_csv, tmp_path / "no_snapshot")
+        finally:
+            recipe_store._reload_lock.release()
+
+    def test_changed_files_detected(self, recipe_csv, tmp_path):
+        """CSV가 바뀌면 변경 감지, 리로드 후에는 감지 안 됨"""
+        snapshot_dir = tmp_path / "no_snapshot"
+        get_recipe_store(recipe_csv, snapshot_dir)
+        assert changed_recipe_stores() == {}
+
+        _append_recipe(recipe_csv, "새 레시피")
+        assert len(changed_recipe_stores()) == 1
+
+        reload_recipe_store(recipe_csv, snapshot_dir)
+        assert changed_recipe_stores() == {}
+
+
+class TestDrain:
+    """진행 중인 조회는 시작할 때의 버전으로 끝까지 처리"""
+
+    def test_old_version_drains_after_active_queries(self, recipe_csv, tmp_path):
+        snapshot_dir = tmp_path / "no_snapshot"
+        store = get_recipe_store(recipe_csv, snapshot_dir)
+
+        with store.lease() as leased:
+            reloaded = reload_recipe_store(recipe_csv, snapshot_dir)
+            # 교체 후에도 진행 중인 조회는 이전 버전 사용
+            assert leased is store and leased.active_queries == 1
+            assert leased._retired
+        assert store.active_queries == 0
+        assert reloaded.active_queries == 0 and not reloaded._retired
+
+    @pytest.mark.asyncio
+    async def test_services_follow_current_version(self, recipe_csv, tmp_path, monkeypatch):
+        """공유 인스턴스를 쓰는 서비스는 리로드 후 다음 조회부터 새 버전 사용"""
+        snapshot_dir = tmp_path / "no_snapshot"
+        monkeypatch.setattr("app.services.recipe_store.CSV_PATH", recipe_csv)
+        monkeypatch.setattr("app.services.recipe_store.SNAPSHOT_DIR", snapshot_dir)
+
+        csv_service = CSVRecipeSearchService()
+        search_service = RecipeSearchService(
+            enable_web_search=False,
+            csv_path=str(recipe_csv),
+            snapshot_path=str(snapshot_dir),
+        )
+        await search_service.search_recipes("밥")
+        before = search_service._store
+
+        _append_recipe(recipe_csv, "리로드 비빔밥")
+        reloaded = reload_recipe_store()
+
+        assert csv_service.store is reloaded
+        results = await search_service.search_recipes("리로드")
+        assert search_service._store is reloaded and reloaded is not before
+        assert [r["name"] for r in results] == ["리로드 비빔밥"]
+
+    @pytest.mark.asyncio
+    async def test_search_cache_is_per_version(self, recipe_csv, tmp_path):
+        """같은 쿼리도 리로드 후에는 캐시가 아닌 새 버전에서 검색"""
+        snapshot_dir = tmp_path / "no_snapshot"
+        get_recipe_store(recipe_csv, snapshot_dir)
+        service = RecipeSearchService(
+            enable_web_search=False,
+            csv_path=str(recipe_csv),
+            snapshot_path=str(snapshot_dir),
+        )
+        assert await service.search_recipes("리로드") == []
+
+        _append_recipe(recipe_csv, "리로드 비빔밥")
+        reload_recipe_store(recipe_csv, snapshot_dir)
+
+        results = await service.search_recipes("리로드")
+        assert [r["name"] for r in results] == ["리로드 비빔밥"]
+
+    @pytest.mark.asyncio
+    async def test_alternative_search_uses_pinned_version(self, recipe_csv, tmp_path, monkeypatch):
+        """캐시 키를 만든 버전을 넘기면 그 사이 리로드되어도 같은 버전에서 검색"""
+        snapshot_dir = tmp_path / "no_snapshot"
+        monkeypatch.setattr("app.services.recipe_store.CSV_PATH", recipe_csv)
+        monkeypatch.setattr("app.services.recipe_store.SNAPSHOT_DIR", snapshot_dir)
+
+        service = CSVRecipeSearchService()
+        pinned = service.store
+        _append_recipe(recipe_csv, "리로드 샐러드")
+        reloaded = reload_recipe_store()
+        assert service.store is reloaded
+
+        pinned_names = [r["name"] for r in await service.search_alternative_recipes(
+            current_menu_name="두부조림", target_calories=350, store=pinned
+        )]
+        current_names = [r["name"] for r in await service.search_alternative_recipes(
+            current_menu_name="두부조림", target_calories=350
+        )]
+        assert "리로드 샐러드" not in pinned_names
+        assert "리로드 샐러드" in current_names
+
+
+class TestWatch:
+    """파일 변경 감시 자동 리로드"""
+
+    @pytest.mark.asyncio
+    async def test_watch_reloads_changed_csv(self, recipe_csv, tmp_path):
+        import asyncio
+
+        from app.services.recipe_reload import watch_recipe_files
+
+        snapshot_dir = tmp_path / "no_snapshot"
+        get_recipe_store(recipe_csv, snapshot_dir)
+        _append_recipe(recipe_csv, "새 레시피")
+
+        task = asyncio.create_task(watch_recipe_files(0.01))
+        try:
+            for _ in range(200):
+                await asyncio.sleep(0.01)
+                if peek_recipe_store(recipe_csv, snapshot_dir).version == 2:
+                    break
+        finally:
+            task.cancel()
+
+        assert peek_recipe_store(recipe_csv, snapshot_dir).version == 2
+        assert changed_recipe_stores() == {}
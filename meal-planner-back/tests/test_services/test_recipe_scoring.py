@@ -0,0 +1,135 @@
+"""
+Recipe Scoring Tests
+
+Vectorized similarity scores must match the per-row reference scoring
+(the original CSVRecipeSearchService row-by-row formula, kept here only as a test oracle)
+"""
+
+import numpy as np
+import pytest
+
+from app.services.csv_recipe_search_service import CSVRecipeSearchService
+from app.services.recipe_scoring import difficulty_levels, similarity_scores, top_k
+from app.services.recipe_store import RecipeStore
+
+
+@pytest.fixture
+def service(recipe_csv, tmp_path):
+    return CSVRecipeSearchService(RecipeStore.load(recipe_csv, tmp_path / "no_snapshot"))
+
+
+def _reference_macro_ratio_score(recipe_carb_g, recipe_protein_g, recipe_fat_g,
+                                 target_carb_g, target_protein_g, target_fat_g):
+    """탄단지 비율 차이 (0-100, 낮을수록 유사)"""
+    recipe_total = recipe_carb_g + recipe_protein_g + recipe_fat_g
+    if recipe_total == 0:
+        return 100.0
+    target_total = target_carb_g + target_protein_g + target_fat_g
+    if target_total == 0:
+        return 0.0
+
+    recipe = [recipe_carb_g, recipe_protein_g, recipe_fat_g]
+    target = [target_carb_g, target_protein_g, target_fat_g]
+    total_diff = sum(
+        abs(r / recipe_total * 100 - t / target_total * 100) for r, t in zip(recipe, target)
+    )
+    return min(total_diff, 100.0)
+
+
+def _reference_similarity_score(recipe_calories, target_calories, recipe_difficulty, target_difficulty,
+                                recipe_time, target_time, recipe_carb_g=None, recipe_protein_g=None,
+                                recipe_fat_g=None, target_carb_g=None, target_protein_g=None,
+                                target_fat_g=None):
+    """행 단위 유사도 점수 (낮을수록 유사)"""
+    calorie_score = min(abs(recipe_calories - target_calories) / 10, 100)
+
+    time_score = 0
+    if target_time:
+        time_score = min(abs(recipe_time - target_time) / 2, 100)
+
+    difficulty_penalty = 0
+    difficulty_map = {"초급": 0, "중급": 10, "고급": 20}
+    if target_difficulty:
+        if difficulty_map.get(recipe_difficulty, 10) > difficulty_map.get(target_difficulty, 10):
+            difficulty_penalty = 50
+
+    macros = [recipe_carb_g, recipe_protein_g, recipe_fat_g, target_carb_g, target_protein_g, target_fat_g]
+    if all(value is not None for value in macros):
+        macro_score = _reference_macro_ratio_score(*macros)
+        return (calorie_score * 0.4) + (macro_score * 0.5) + (time_score * 0.1) + difficulty_penalty
+    return calorie_score + (time_score * 0.5) + difficulty_penalty
+
+
+def _random_recipes(n=300, seed=3):
+    rng = np.random.default_rng(seed)
+    carb = rng.uniform(0, 80, n)
+    protein = rng.uniform(0, 50, n)
+    fat = rng.uniform(0, 30, n)
+    carb[:5] = protein[:5] = fat[:5] = 0  # 영양정보 0
+    protein[5:10] = np.nan  # 결측
+    return {
+        "calories": rng.integers(50, 1200, n).astype(float),
+        "cooking_time": rng.choice([5, 10, 30, 60, 120], n).astype(float),
+        "difficulty": rng.choice(["아무나", "초급", "중급", "고급"], n).astype(object),
+        "carb_g": carb,
+        "protein_g": protein,
+        "fat_g": fat,
+    }
+
+
+class TestSimilarityScores:
+    @pytest.mark.parametrize("targets", [
+        {},
+        {"target_carb_g": 60.0, "target_protein_g": 30.0, "target_fat_g": 15.0},
+        {"target_carb_g": 0.0, "target_protein_g": 0.0, "target_fat_g": 0.0},
+    ])
+    @pytest.mark.parametrize("target_difficulty", [None, "초급", "중급"])
+    def test_matches_row_function(self, targets, target_difficulty):
+        recipes = _random_recipes()
+        difficulties = recipes.pop("difficulty")
+        expected = np.array([
+            _reference_similarity_score(
+                recipe_calories=recipes["calories"][i],
+                target_calories=450,
+                recipe_difficulty=difficulties[i],
+                target_difficulty=target_difficulty,
+                recipe_time=recipes["cooking_time"][i],
+                target_time=30,
+                recipe_carb_g=recipes["carb_g"][i],
+                recipe_protein_g=recipes["protein_g"][i],
+                recipe_fat_g=recipes["fat_g"][i],
+                **targets,
+            )
+            for i in range(len(recipes["calories"]))
+        ])
+
+        actual = similarity_scores(
+            target_calories=450,
+            target_time=30,
+            target_difficulty=target_difficulty,
+            difficulty_level=difficulty_levels(difficulties),
+            **recipes,
+            **targets,
+        )
+        np.testing.assert_array_equal(actual, expected)
+
+
+class TestTopK:
+    def test_ascending_with_stable_ties_and_nan_last(self):
+        scores = np.array([5.0, np.nan, 1.0, 3.0, 1.0, 3.0])
+        assert top_k(scores, 4).tolist() == [2, 4, 3, 5]
+        assert top_k(scores, 10).tolist() == [2, 4, 3, 5, 0, 1]
+
+    def test_empty(self):
+        assert len(top_k(np.array([]), 3)) == 0
+        assert len(top_k(np.array([1.0]), 0)) == 0
+
+
+class TestSearchAlternatives:
+    async def test_returns_closest_recipes(self, service):
+        results = await service.search_alternative_recipes(
+            current_menu_name="계란김치볶음밥",
+            target_calories=400,
+            calorie_tolerance=100,
+        )
+        assert [r["name"] for r in results] == ["고등어구이", "닭가슴살 샐러드", "땅콩버터 토스트"]
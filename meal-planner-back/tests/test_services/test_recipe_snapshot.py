@@ -0,0 +1,168 @@
+"""
+Recipe Snapshot Tests
+
+Compiled snapshot round-trip and service loading
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.csv_recipe_search_service import CSVRecipeSearchService
+from app.services.recipe_search import RecipeSearchService
+from app.services.recipe_store import (
+    INDEX_SIGNATURE,
+    RecipeStore,
+    build_recipe_snapshot,
+    ensure_recipe_snapshot,
+    get_recipe_store,
+)
+from app.services.recipe_snapshot import build_snapshot, load_snapshot
+
+
+class TestSnapshotFormat:
+    """스냅샷 빌드/로드"""
+
+    def test_round_trip_matches_csv(self, recipe_csv, tmp_path):
+        """스냅샷 DataFrame이 CSV와 같은 값을 가짐"""
+        snapshot_dir = tmp_path / "snapshot"
+        manifest = build_snapshot(recipe_csv, snapshot_dir)
+
+        snapshot = load_snapshot(snapshot_dir)
+        assert snapshot is not None
+        assert snapshot.row_count == manifest["row_count"] == 8
+
+        df = snapshot.to_dataframe()
+        csv_df = pd.read_csv(recipe_csv, encoding="utf-8-sig")
+
+        assert list(df["name"]) == list(csv_df["name"])
+        assert list(df["difficulty"]) == list(csv_df["difficulty"])
+        np.testing.assert_allclose(df["calories"], csv_df["calories"])
+        assert "ingredients_parsed" not in df.columns
+        assert snapshot.ingredient_table().names(1) == ["밥", "계란", "김치", "참기름"]
+
+    def test_numeric_columns_are_memory_mapped(self, recipe_csv, tmp_path):
+        """숫자 컬럼은 복사 없이 mmap 배열 사용"""
+        snapshot_dir = tmp_path / "snapshot"
+        build_snapshot(recipe_csv, snapshot_dir)
+        snapshot = load_snapshot(snapshot_dir)
+
+        assert isinstance(snapshot.numeric("calories"), np.memmap)
+        column = snapshot.to_dataframe()["calories"].to_numpy()
+        assert isinstance(column.base, np.memmap)
+        assert not column.flags.writeable
+
+    def test_missing_snapshot_returns_none(self, tmp_path):
+        """스냅샷이 없으면 None (CSV 폴백)"""
+        assert load_snapshot(tmp_path / "nope") is None
+
+    def test_format_version_mismatch_returns_none(self, recipe_csv, tmp_path):
+        """포맷 버전이 다르면 무시"""
+        snapshot_dir = tmp_path / "snapshot"
+        build_snapshot(recipe_csv, snapshot_dir)
+        manifest_path = snapshot_dir / "manifest.json"
+        manifest_path.write_text(
+            manifest_path.read_text(encoding="utf-8").replace('"format_version": 1', '"format_version": 999'),
+            encoding="utf-8",
+        )
+        assert load_snapshot(snapshot_dir) is None
+
+
+class TestServicesUseSnapshot:
+    """검색 서비스의 스냅샷 로드"""
+
+    @pytest.mark.asyncio
+    async def test_csv_service_loads_snapshot(self, recipe_csv, tmp_path):
+        """CSVRecipeSearchService가 스냅샷으로 검색"""
+        snapshot_dir = tmp_path / "snapshot"
+        build_snapshot(recipe_csv, snapshot_dir)
+
+        service = CSVRecipeSearchService(store=get_recipe_store(tmp_path / "missing.csv", snapshot_dir))
+        assert service.store.source == "snapshot"
+        results = await service.search_alternative_recipes(
+            current_menu_name="닭가슴살 샐러드",
+            target_calories=400,
+            calorie_tolerance=100,
+            restrictions=["계란"],
+        )
+
+        names = [r["name"] for r in results]
+        assert names
+        assert "닭가슴살 샐러드" not in names
+        assert "계란김치볶음밥" not in names
+        assert "토마토 계란볶음" not in names
+
+    @pytest.mark.asyncio
+    async def test_recipe_search_service_loads_snapshot(self, recipe_csv, tmp_path):
+        """RecipeSearchService가 스냅샷을 사용하고 사전 파싱된 재료를 반환"""
+        snapshot_dir = tmp_path / "snapshot"
+        build_snapshot(recipe_csv, snapshot_dir)
+
+        service = RecipeSearchService(
+            enable_web_search=False,
+            csv_path=str(tmp_path / "missing.csv"),
+            snapshot_path=str(snapshot_dir),
+        )
+        results = await service.search_recipes("밥", filters={"exclude_ingredients": ["새우"]})
+
+        assert [r["name"] for r in results] == ["계란김치볶음밥"]
+        assert results[0]["ingredients"] == ["밥", "계란", "김치", "참기름"]
+
+
+class TestSharedIndexes:
+    """스냅샷에 저장된 색인 (워커 간 mmap 공유)"""
+
+    def test_store_attaches_saved_indexes(self, recipe_csv, tmp_path):
+        """저장된 색인은 계산 없이 memory-map으로 연결되고 CSV 로드와 같은 결과"""
+        snapshot_dir = tmp_path / "snapshot"
+        manifest = build_recipe_snapshot(recipe_csv, snapshot_dir)
+        assert manifest["indexes"]["signature"] == INDEX_SIGNATURE
+
+        store = RecipeStore.load(recipe_csv, snapshot_dir)
+        csv_store = RecipeStore.load(recipe_csv, tmp_path / "no_snapshot")
+        assert store.shared_indexes and not csv_store.shared_indexes
+
+        order = store.range_index.columns["calories"].order
+        assert isinstance(order.base, np.memmap)
+        assert not order.flags.writeable
+
+        np.testing.assert_array_equal(store.restriction_bitmaps.bits, csv_store.restriction_bitmaps.bits)
+        np.testing.assert_array_equal(store.neighbor_index.rows, csv_store.neighbor_index.rows)
+        for restrictions in (["계란"], ["파"], ["갑각류"]):
+            np.testing.assert_array_equal(
+                store.restriction_bitmaps.excluded_rows(restrictions),
+                csv_store.restriction_bitmaps.excluded_rows(restrictions),
+            )
+        for keyword in ("밥", "계란", "구이"):
+            np.testing.assert_array_equal(
+                store.keyword_index.matching_rows([keyword]),
+                csv_store.keyword_index.matching_rows([keyword]),
+            )
+
+    def test_signature_mismatch_recomputes_indexes(self, recipe_csv, tmp_path, monkeypatch):
+        """색인 파라미터가 바뀌면 저장된 색인을 무시하고 로드 시 계산"""
+        snapshot_dir = tmp_path / "snapshot"
+        build_recipe_snapshot(recipe_csv, snapshot_dir)
+        monkeypatch.setattr("app.services.recipe_store.INDEX_SIGNATURE", "changed")
+
+        store = RecipeStore.load(recipe_csv, snapshot_dir)
+        assert store.source == "snapshot"
+        assert not store.shared_indexes
+
+    def test_ensure_builds_missing_and_stale_snapshot(self, recipe_csv, tmp_path):
+        """워커 실행 전 준비: 없거나 오래된 스냅샷만 다시 빌드"""
+        snapshot_dir = tmp_path / "snapshot"
+        assert ensure_recipe_snapshot(recipe_csv, snapshot_dir)
+        built_at = (snapshot_dir / "manifest.json").stat().st_mtime_ns
+
+        assert ensure_recipe_snapshot(recipe_csv, snapshot_dir)
+        assert (snapshot_dir / "manifest.json").stat().st_mtime_ns == built_at
+
+        # 컬럼만 있는 스냅샷 → 색인 포함으로 다시 빌드
+        build_snapshot(recipe_csv, snapshot_dir)
+        assert ensure_recipe_snapshot(recipe_csv, snapshot_dir)
+        assert load_snapshot(snapshot_dir).indexes(INDEX_SIGNATURE) is not None
+
+    def test_ensure_without_csv_or_snapshot(self, tmp_path):
+        """CSV와 스냅샷이 모두 없으면 False"""
+        assert not ensure_recipe_snapshot(tmp_path / "missing.csv", tmp_path / "snapshot")
@@ -0,0 +1,187 @@
+"""
+RecipeStore Tests
+
+Shared dataset between CSVRecipeSearchService and RecipeSearchService
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.csv_recipe_search_service import CSVRecipeSearchService
+from app.services.recipe_search import RecipeSearchService
+from app.services.recipe_store import (
+    CATEGORICAL_COLUMNS,
+    DEFAULT_COOKING_TIME,
+    DEFAULT_DIFFICULTY,
+    SEARCH_COLUMNS,
+    RecipeStore,
+    build_recipe_snapshot,
+    get_recipe_store,
+)
+
+
+class TestRecipeStoreLoading:
+    """로드 및 정규화"""
+
+    def test_csv_fallback_without_snapshot(self, recipe_csv, tmp_path):
+        """스냅샷이 없으면 CSV에서 로드"""
+        store = RecipeStore.load(recipe_csv, tmp_path / "no_snapshot")
+        assert store.source == "csv"
+        assert len(store) == 8
+
+    def test_missing_values_use_shared_defaults(self, tmp_path):
+        """결측값 규칙: 조리시간/난이도는 기본값, 영양 정보는 NaN 유지"""
+        path = tmp_path / "dirty.csv"
+        pd.DataFrame([{
+            "name": "메뉴",
+            "calories": "N/A",
+            "difficulty": None,
+            "cooking_time": None,
+            "ingredients_parsed": "[]",
+        }]).to_csv(path, index=False)
+
+        store = RecipeStore.load(path, tmp_path / "no_snapshot")
+        row = store.df.iloc[0]
+        assert row["cooking_time"] == DEFAULT_COOKING_TIME
+        assert row["difficulty"] == DEFAULT_DIFFICULTY
+        assert np.isnan(row["calories"])
+        assert store.df["calories"].dtype == np.float64
+
+    def test_missing_required_columns_raises(self, tmp_path):
+        """필수 컬럼 누락 시 ValueError"""
+        path = tmp_path / "bad.csv"
+        pd.DataFrame([{"name": "메뉴"}]).to_csv(path, index=False)
+        with pytest.raises(ValueError, match="Missing required columns"):
+            RecipeStore.load(path, tmp_path / "no_snapshot")
+
+    def test_missing_csv_raises(self, tmp_path):
+        """스냅샷과 CSV가 모두 없으면 FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            RecipeStore.load(tmp_path / "missing.csv", tmp_path / "no_snapshot")
+
+
+class TestSchema:
+    """컬럼 스키마 (프로젝션, Categorical, 지연 조회)"""
+
+    @pytest.fixture
+    def wide_csv(self, recipe_csv):
+        """검색에 쓰지 않는 컬럼이 추가된 CSV"""
+        df = pd.read_csv(recipe_csv, encoding="utf-8-sig")
+        df["sodium_mg"] = np.arange(len(df)) * 100.5
+        df["servings"] = "2인분"
+        df.to_csv(recipe_csv, index=False, encoding="utf-8-sig")
+        return recipe_csv
+
+    def test_csv_loads_search_columns_only(self, wide_csv, tmp_path):
+        """CSV 폴백: 검색 컬럼만 DataFrame에, 재료 원문은 지연 조회"""
+        store = RecipeStore.load(wide_csv, tmp_path / "no_snapshot")
+
+        assert set(store.df.columns) == set(SEARCH_COLUMNS)
+        for col in CATEGORICAL_COLUMNS:
+            assert isinstance(store.df[col].dtype, pd.CategoricalDtype)
+        assert store.lazy_value("ingredients_raw", 1) == "밥,계란,김치,참기름"
+        assert store.lazy_value("sodium_mg", 1) is None
+
+    def test_snapshot_columns_are_lazy(self, wide_csv, tmp_path):
+        """스냅샷: 비검색 컬럼은 mmap에서 행 단위로 조회"""
+        snapshot_dir = tmp_path / "snapshot"
+        build_recipe_snapshot(wide_csv, snapshot_dir)
+        store = RecipeStore.load(wide_csv, snapshot_dir)
+
+        assert "ingredients_raw" not in store.df.columns
+        assert isinstance(store.df["category"].dtype, pd.CategoricalDtype)
+        assert store.lazy_value("ingredients_raw", 1) == "밥,계란,김치,참기름"
+        assert store.lazy_value("servings", 3) == "2인분"
+        assert store.lazy_value("sodium_mg", 2) == pytest.approx(201.0)
+        assert store.lazy_columns["sodium_mg"].dtype == np.float32
+
+    @pytest.mark.parametrize("snapshot", [False, True])
+    def test_batch_row_access_matches_single_rows(self, wide_csv, tmp_path, snapshot):
+        """배치 조회(lazy_values/records)는 행 단위 조회와 같은 값"""
+        snapshot_dir = tmp_path / "snapshot"
+        if snapshot:
+            build_recipe_snapshot(wide_csv, snapshot_dir)
+        store = RecipeStore.load(wide_csv, snapshot_dir)
+        rows = np.array([3, 1, 1, 0])
+
+        for col in ["ingredients_raw", "sodium_mg", "missing"]:
+            assert store.lazy_values(col, rows).tolist() == [store.lazy_value(col, row) for row in rows]
+        records = store.records(rows, ["name", "calories", "difficulty", "missing"])
+        assert [r["name"] for r in records] == store.df["name"].iloc[rows].tolist()
+        assert all(set(r) == {"name", "calories", "difficulty"} for r in records)
+
+    def test_difficulty_default_added_to_categories(self, tmp_path):
+        """기본 난이도가 Categorical 값에 없어도 결측값을 채움"""
+        path = tmp_path / "recipes.csv"
+        pd.DataFrame([
+            {"name": "a", "calories": 100, "difficulty": "초급", "cooking_time": 10, "ingredients_parsed": "[]"},
+            {"name": "b", "calories": 200, "difficulty": None, "cooking_time": 10, "ingredients_parsed": "[]"},
+        ]).to_csv(path, index=False)
+
+        store = RecipeStore.load(path, tmp_path / "no_snapshot")
+        assert list(store.df["difficulty"]) == ["초급", DEFAULT_DIFFICULTY]
+
+
+class TestSharedStore:
+    """두 검색 서비스의 데이터 공유"""
+
+    @pytest.mark.asyncio
+    async def test_services_share_one_dataframe(self, recipe_csv, tmp_path):
+        """같은 경로를 쓰는 두 서비스는 하나의 DataFrame을 공유"""
+        snapshot_dir = tmp_path / "no_snapshot"
+        store = get_recipe_store(recipe_csv, snapshot_dir)
+        assert get_recipe_store(recipe_csv, snapshot_dir) is store
+
+        csv_service = CSVRecipeSearchService(store=store)
+        search_service = RecipeSearchService(
+            enable_web_search=False,
+            csv_path=str(recipe_csv),
+            snapshot_path=str(snapshot_dir),
+        )
+        await search_service.search_recipes("밥")
+
+        assert csv_service.recipes_df is search_service._store.df
+
+
+class TestCopyFreeQueries:
+    """검색 요청은 후보 수에 비례하는 메모리만 사용 (DataFrame 복사 없음)"""
+
+    @pytest.fixture
+    def large_service(self):
+        rng = np.random.default_rng(7)
+        n = 20000
+        df = pd.DataFrame({
+            "name": [f"레시피 {i}" for i in range(n)],
+            "category": rng.choice(["밥", "국", "반찬"], n),
+            "main_ingredient": rng.choice(["두부", "계란", "채소"], n),
+            "difficulty": rng.choice(["아무나", "초급", "중급", "고급"], n),
+            "cooking_time": rng.choice([10.0, 30.0, 60.0], n),
+            "calories": rng.uniform(100, 900, n),
+            "carb_g": rng.uniform(0, 80, n),
+            "protein_g": rng.uniform(0, 40, n),
+            "fat_g": rng.uniform(0, 30, n),
+            "ingredients_raw": "두부,대파",
+            "ingredients_parsed": '[{"name": "두부"}, {"name": "대파"}]',
+        })
+        return RecipeSearchService(enable_web_search=False, store=RecipeStore(df, source="csv", path="memory"))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query, filters", [
+        ("", {"difficulty": "고급"}),
+        ("밥", {"max_cooking_time": 60}),
+        ("", {"exclude_ingredients": ["계란"], "target_calories": 500, "calorie_tolerance": 0.1}),
+    ])
+    async def test_peak_allocation_is_small(self, large_service, query, filters):
+        import tracemalloc
+
+        frame_bytes = large_service._store.df.memory_usage(deep=True).sum()
+        tracemalloc.start()
+        try:
+            results = await large_service._search_local_csv(query, filters, limit=5)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(results) == 5
+        assert peak < frame_bytes / 5
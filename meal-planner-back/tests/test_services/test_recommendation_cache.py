@@ -0,0 +1,175 @@
+"""Expert recommendation cache tests (bucketed keys, pool rotation, agent integration)"""
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models.state import MacroTargets, MealRecommendation, UserProfile, ValidationResult
+from app.services.recommendation_cache import ExpertRecommendationCache, recommendation_cache_key
+
+
+def _profile(**overrides):
+    data = dict(
+        goal="다이어트", weight=70, height=175, age=30, gender="male", activity_level="moderate",
+        restrictions=["땅콩", "우유"], health_conditions=[], budget=100000, budget_type="weekly",
+        cooking_time="30분 이내", skill_level="초급", meals_per_day=3, days=1,
+    )
+    data.update(overrides)
+    return UserProfile(**data)
+
+
+def _targets(calories=600.0, protein_g=40.0):
+    return MacroTargets(
+        calories=calories, carb_g=60, protein_g=protein_g, fat_g=20,
+        carb_ratio=40, protein_ratio=30, fat_ratio=30,
+    )
+
+
+def _recommendation(menu):
+    return MealRecommendation(
+        menu_name=menu, ingredients=[{"name": "닭가슴살", "amount": "150g"}],
+        estimated_calories=550, estimated_cost=5000, cooking_time_minutes=20, reasoning="테스트",
+    )
+
+
+class TestCacheKey:
+    def test_nearby_targets_share_key(self):
+        base = recommendation_cache_key("chef", "점심", _profile(), _targets(600.4, 40.2))
+        assert base == recommendation_cache_key("chef", "점심", _profile(), _targets(612.0, 41.0))
+        # 제한 재료는 순서/공백 무관
+        assert base == recommendation_cache_key(
+            "chef", "점심", _profile(restrictions=[" 우유", "땅콩", "땅콩"]), _targets(600, 40)
+        )
+
+    def test_meaningful_differences_change_key(self):
+        base = recommendation_cache_key("chef", "점심", _profile(), _targets())
+        assert base != recommendation_cache_key("nutritionist", "점심", _profile(), _targets())
+        assert base != recommendation_cache_key("chef", "저녁", _profile(), _targets())
+        assert base != recommendation_cache_key("chef", "점심", _profile(skill_level="고급"), _targets())
+        assert base != recommendation_cache_key("chef", "점심", _profile(), _targets(calories=700))
+        assert base != recommendation_cache_key("chef", "점심", _profile(health_conditions=["당뇨"]), _targets())
+        assert recommendation_cache_key("budget", "점심", _profile(), _targets(), budget=5000) != \
+            recommendation_cache_key("budget", "점심", _profile(), _targets(), budget=8000)
+
+
+class TestExpertRecommendationCache:
+    def test_reuse_starts_after_min_pool_and_rotates(self):
+        cache = ExpertRecommendationCache(max_keys=10, pool_size=4, min_pool=2)
+        cache.put("k", _recommendation("A"))
+        assert cache.get("k") is None
+
+        cache.put("k", _recommendation("B"))
+        assert [cache.get("k").menu_name for _ in range(3)] == ["A", "B", "A"]
+
+    def test_skips_used_menus(self):
+        cache = ExpertRecommendationCache(max_keys=10, pool_size=4, min_pool=2)
+        cache.put("k", _recommendation("A"))
+        cache.put("k", _recommendation("B"))
+
+        assert cache.get("k", exclude_menus=["A"]).menu_name == "B"
+        assert cache.get("k", exclude_menus=["A", "B"]) is None
+
+    def test_pool_and_key_limits(self):
+        cache = ExpertRecommendationCache(max_keys=2, pool_size=2, min_pool=1)
+        for menu in ["A", "B", "C"]:
+            cache.put("k", _recommendation(menu))
+        assert {cache.get("k").menu_name for _ in range(4)} == {"B", "C"}
+
+        cache.put("k2", _recommendation("X"))
+        cache.put("k3", _recommendation("Y"))
+        assert len(cache) == 2
+        assert cache.get("k") is None
+
+    def test_returns_copies(self):
+        cache = ExpertRecommendationCache(max_keys=10, pool_size=2, min_pool=1)
+        cache.put("k", _recommendation("A"))
+        cache.get("k").ingredients.append({"name": "추가", "amount": "1g"})
+
+        assert len(cache.get("k").ingredients) == 1
+        assert cache.stats()["hits"] == 2
+
+
+async def _finish_meal(state, node_result, passed=True):
+    """전문가 결과로 끼니 검증을 마침 (validation_aggregator가 통과한 추천만 풀에 추가)"""
+    from app.agents.nodes.validation_aggregator import validation_aggregator
+
+    return await validation_aggregator({
+        **state,
+        **node_result,
+        "validation_results": [ValidationResult(validator="allergy_checker", passed=passed)],
+        "current_menu": None,
+        "current_meal_index": 0,
+    })
+
+
+class TestNutritionistIntegration:
+    @pytest.fixture
+    def agent(self, monkeypatch):
+        """응답 메뉴를 순서대로 돌려주는 LLM을 쓰는 영양사 에이전트"""
+        from app.agents.nodes.meal_planning import nutritionist
+
+        def use_menus(*menus):
+            responses = iter([
+                json.dumps(_recommendation(menu).model_dump(), ensure_ascii=False) for menu in menus
+            ])
+            llm_service = MagicMock(mock_mode=False)
+            llm_service.ainvoke = AsyncMock(side_effect=lambda prompt, **kwargs: next(responses))
+            monkeypatch.setattr(nutritionist, "get_llm_service", lambda: llm_service)
+            monkeypatch.setattr(nutritionist, "ENABLE_RECIPE_SEARCH", False)
+            return nutritionist.nutritionist_agent, llm_service
+
+        return use_menus
+
+    @staticmethod
+    def _state(weight, retry_count=0):
+        return {
+            "profile": _profile(weight=weight),
+            "per_meal_targets": _targets(600 + weight - 70),
+            "current_meal_type": "점심",
+            "current_day": 1,
+            "retry_count": retry_count,
+            "completed_meals": [],
+        }
+
+    @pytest.mark.asyncio
+    async def test_skips_llm_once_pool_filled(self, agent, isolated_recommendation_cache):
+        isolated_recommendation_cache.min_pool = 2
+        nutritionist_agent, llm_service = agent("A", "B", "C")
+
+        menus = []
+        for weight in [70, 71, 72]:
+            state = self._state(weight)
+            result = await nutritionist_agent(state)
+            await _finish_meal(state, result)
+            menus.append(result["nutritionist_recommendation"].menu_name)
+        assert menus == ["A", "B", "A"]
+        assert llm_service.ainvoke.await_count == 2
+
+        result = await nutritionist_agent(self._state(73))
+        assert result["events"][0]["data"]["cached"] is True
+        assert result["nutritionist_recommendation"].menu_name == "B"
+
+        # 재시도는 캐시를 쓰지 않음
+        result = await nutritionist_agent(self._state(70, retry_count=1))
+        assert result["nutritionist_recommendation"].menu_name == "C"
+        assert llm_service.ainvoke.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_rejected_recommendation_is_never_pooled(self, agent, isolated_recommendation_cache):
+        isolated_recommendation_cache.min_pool = 1
+        nutritionist_agent, llm_service = agent("거부된 메뉴", "통과한 메뉴")
+
+        state = self._state(70)
+        rejected = await nutritionist_agent(state)
+        assert isolated_recommendation_cache.stats()["recommendations"] == 0  # 검증 전에는 풀에 없음
+        await _finish_meal(state, rejected, passed=False)
+        assert isolated_recommendation_cache.stats()["recommendations"] == 0
+
+        accepted = await nutritionist_agent(state)
+        assert accepted["nutritionist_recommendation"].menu_name == "통과한 메뉴"
+        await _finish_meal(state, accepted)
+
+        key = accepted["recommendation_cache_keys"]["nutritionist"]
+        returned = {isolated_recommendation_cache.get(key).menu_name for _ in range(4)}
+        assert returned == {"통과한 메뉴"}
+        assert llm_service.ainvoke.await_count == 2
@@ -0,0 +1,176 @@
+"""
+Restriction Bitmap Tests
+
+Allergen / dietary preference bitsets and synonym expansion
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.agents.nodes.validation.allergy_checker import allergy_checker
+
+from app.services.recipe_ingredients import IngredientIndex, IngredientTable
+from app.services.restriction_bitmaps import (
+    RestrictionBitmaps,
+    canonical_restriction,
+    expand_restrictions,
+    keyword_mask,
+    matches_keywords,
+    substring_mask,
+)
+from app.utils.constants import ALLERGENS
+
+
+LISTS = [
+    ["닭가슴살", "양상추"],
+    ["밥", "달걀", "김치"],
+    ["식빵", "마요네즈"],
+    ["두부", "대파"],
+    ["소고기", "미역"],
+    ["새우", "양파"],
+]
+
+
+@pytest.fixture
+def bitmaps():
+    return RestrictionBitmaps(IngredientIndex(IngredientTable.from_lists(LISTS)))
+
+
+class TestSynonyms:
+    def test_aliases_resolve_to_canonical_name(self):
+        assert canonical_restriction("계란") == "알류(계란)"
+        assert canonical_restriction("알류(계란)") == "알류(계란)"
+        assert canonical_restriction("채식") == "채식(락토오보)"
+        assert canonical_restriction("대파") is None
+
+    def test_every_allergen_has_keywords(self):
+        for allergen in ALLERGENS:
+            assert canonical_restriction(allergen) == allergen
+
+    def test_expand_keeps_free_text(self):
+        expanded = expand_restrictions(["계란", "Soy Sauce"])
+        assert "마요네즈" in expanded["계란"]
+        assert expanded["Soy Sauce"] == ["soysauce"]
+
+
+class TestRestrictionBitmaps:
+    def test_bitsets_are_packed(self, bitmaps):
+        assert bitmaps.bits.dtype == np.uint8
+        assert bitmaps.bits.shape == (len(bitmaps.names), 1)
+
+    def test_egg_covers_synonyms(self, bitmaps):
+        excluded = bitmaps.excluded_rows(["계란"])
+        assert excluded.tolist() == [False, True, True, False, False, False]
+
+    def test_or_of_allergens_and_free_text(self, bitmaps):
+        excluded = bitmaps.excluded_rows(["새우", "닭고기", "대파"])
+        assert excluded.tolist() == [True, False, False, True, False, True]
+
+    def test_dietary_preference(self, bitmaps):
+        excluded = bitmaps.excluded_rows(["채식"])
+        assert excluded.tolist() == [True, False, False, False, True, True]
+
+    def test_matches_per_item_masks(self, bitmaps):
+        expected = bitmaps.rows("우유") | bitmaps.rows("밀")
+        assert np.array_equal(bitmaps.excluded_rows(["우유", "밀"]), expected)
+
+    def test_no_restrictions(self, bitmaps):
+        assert not bitmaps.excluded_rows([]).any()
+
+    def test_canonical_restriction_keeps_both_directions(self):
+        """정식 항목도 입력 문자열 기준 양방향 매칭 유지 (재료명 ⊂ 제한 항목), 동의어는 비트셋으로 추가"""
+        bitmaps = RestrictionBitmaps(IngredientIndex(IngredientTable.from_lists([["알"], ["계란말이"], ["두부"], ["마요네즈"]])))
+        assert bitmaps.excluded_rows(["알류(계란)"]).tolist() == [True, True, False, True]
+        assert bitmaps.excluded_rows(["알류(계란)"], bidirectional=False).tolist() == [False, True, False, True]
+
+
+class TestShortKeywords:
+    """1글자/토큰 키워드는 재료명 토큰 일치 (프리필터 과다 제외 방지)"""
+
+    @pytest.mark.parametrize("text,keywords,expected", [
+        ("굴 (생굴)", ["굴"], True),
+        ("굴비", ["굴"], False),
+        ("밀키트", ["밀"], False),
+        ("콩나물", ["콩"], False),
+        ("코코넛크림", ["크림"], False),
+        ("생크림", ["생크림"], True),
+        ("마요네즈소스", ["마요네즈"], True),
+    ])
+    def test_matches_keywords(self, text, keywords, expected):
+        assert matches_keywords(text, keywords) is expected
+
+    @pytest.mark.parametrize("restriction,ingredient", [
+        ("밀", "밀키트"),
+        ("글루텐프리", "밀감"),
+        ("대두", "콩나물"),
+        ("게", "가게"),
+        ("조개류", "굴비"),
+        ("우유", "코코넛크림"),
+        ("돼지고기", "햄버그"),
+    ])
+    def test_bitmap_keeps_substring_lookalikes(self, restriction, ingredient):
+        bitmaps = RestrictionBitmaps(IngredientIndex(IngredientTable.from_lists([[ingredient]])))
+        assert not bitmaps.excluded_rows([restriction]).any()
+
+    @pytest.mark.parametrize("restriction,ingredient", [
+        ("밀", "식빵"),
+        ("밀", "통밀"),
+        ("대두", "검은콩"),
+        ("게", "게살"),
+        ("조개류", "굴 (생굴)"),
+        ("닭고기", "닭가슴살"),
+        ("우유", "생크림"),
+    ])
+    def test_bitmap_excludes_compounds(self, restriction, ingredient):
+        bitmaps = RestrictionBitmaps(IngredientIndex(IngredientTable.from_lists([[ingredient]])))
+        assert bitmaps.excluded_rows([restriction]).all()
+
+    def test_batch_masks_match_per_text_rule(self):
+        """keyword_mask/substring_mask는 matches_keywords/부분 일치와 같은 결과"""
+        texts = np.array(
+            ["굴 (생굴), 무", "굴비,소금", "밀키트", "통밀/식빵", "코코넛크림", "생크림", "Soy Sauce", None, ""],
+            dtype=object,
+        )
+        keywords = ["굴", "밀", "크림", "생크림", "soysauce"]
+        assert keyword_mask(texts, keywords).tolist() == [
+            isinstance(t, str) and matches_keywords(t, keywords) for t in texts
+        ]
+        assert substring_mask(texts, ["밀", "굴"]).tolist() == [True, True, True, True, False, False, False, False, False]
+
+    def test_free_text_keeps_substring_rule(self):
+        """사전에 없는 입력은 기존 규칙 그대로 부분 일치"""
+        bitmaps = RestrictionBitmaps(IngredientIndex(IngredientTable.from_lists([["밀키트"], ["두부"]])))
+        assert bitmaps.excluded_rows(["밀키"]).tolist() == [True, False]
+
+
+async def _check(restriction, ingredient):
+    state = {
+        "current_menu": SimpleNamespace(menu_name="테스트", ingredients=[{"name": ingredient, "amount": "100g"}]),
+        "profile": SimpleNamespace(restrictions=[restriction]),
+    }
+    return (await allergy_checker(state))["validation_results"][0].passed
+
+
+class TestAllergyCheckerSynonyms:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("restriction,ingredient", [
+        ("계란", "마요네즈"),
+        ("우유", "생크림"),
+        ("조개류", "굴 (생굴)"),
+        ("글루텐프리", "밀가루"),
+        ("닭고기", "닭"),
+    ])
+    async def test_synonyms_are_rejected(self, restriction, ingredient):
+        assert await _check(restriction, ingredient) is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("restriction,ingredient", [
+        ("글루텐프리", "밀감"),
+        ("우유", "코코넛크림"),
+        ("조개류", "굴비"),
+        ("비건", "굴비"),
+    ])
+    async def test_short_synonyms_do_not_match_substrings(self, restriction, ingredient):
+        assert await _check(restriction, ingredient) is True
@@ -0,0 +1,69 @@
+"""Recipe search executor tests (off-loop execution, queue depth)"""
+import asyncio
+import threading
+
+import pytest
+import structlog
+
+from app.services.search_executor import SearchExecutor
+
+
+class TestSearchExecutor:
+    """SearchExecutor"""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_event_loop_thread(self):
+        executor = SearchExecutor(max_workers=1)
+        try:
+            thread = await executor.run(lambda: threading.current_thread().name)
+        finally:
+            executor.shutdown()
+        assert thread.startswith("recipe-search")
+        assert executor.stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_event_loop_keeps_running_while_search_blocks(self):
+        """검색이 막혀 있어도 이벤트 루프(SSE 등)는 계속 진행"""
+        executor = SearchExecutor(max_workers=1)
+        release = threading.Event()
+        try:
+            first = asyncio.create_task(executor.run(release.wait, 5))
+            second = asyncio.create_task(executor.run(lambda: "done"))
+            ticks = 0
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+            assert ticks == 5
+            assert executor.active == 1
+            assert executor.queue_depth == 1
+
+            release.set()
+            assert await first is True
+            assert await second == "done"
+            assert executor.stats() == {"workers": 1, "queued": 0, "active": 0, "completed": 2}
+        finally:
+            release.set()
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_exceptions_and_context_propagate(self):
+        executor = SearchExecutor(max_workers=1)
+        structlog.contextvars.bind_contextvars(request_id="r-1")
+
+        def failing():
+            assert structlog.contextvars.get_contextvars()["request_id"] == "r-1"
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError, match="boom"):
+                await executor.run(failing)
+        finally:
+            structlog.contextvars.unbind_contextvars("request_id")
+            executor.shutdown()
+        assert executor.stats()["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_zero_workers_runs_inline(self):
+        executor = SearchExecutor(max_workers=0)
+        assert await executor.run(threading.get_ident) == threading.get_ident()
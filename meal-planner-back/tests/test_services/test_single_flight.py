@@ -0,0 +1,222 @@
+"""Single-flight coalescing tests (shared results, cancellation safety, LLMService integration)"""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from app.services.llm_service import LLMService
+from app.services.single_flight import SingleFlight
+
+
+class _Upstream:
+    """호출 수를 세고 release될 때까지 기다리는 가짜 업스트림"""
+
+    def __init__(self, result="결과", error=None):
+        self.calls = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+        self.result = result
+        self.error = error
+
+    async def __call__(self):
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self):
+        flights = SingleFlight()
+        upstream = _Upstream()
+        tasks = [asyncio.create_task(flights.do("k", upstream)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        upstream.release.set()
+
+        assert await asyncio.gather(*tasks) == ["결과"] * 3
+        assert upstream.calls == 1
+        assert flights.stats() == {"started": 1, "joined": 2, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_and_later_calls_run_separately(self):
+        flights = SingleFlight()
+        upstream = _Upstream()
+        upstream.release.set()
+
+        await asyncio.gather(flights.do("a", upstream), flights.do("b", upstream))
+        await flights.do("a", upstream)
+        assert upstream.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_affect_others(self):
+        flights = SingleFlight()
+        upstream = _Upstream()
+        leader = asyncio.create_task(flights.do("k", upstream))
+        follower = asyncio.create_task(flights.do("k", upstream))
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+        await asyncio.sleep(0.01)
+        upstream.release.set()
+
+        assert await follower == "결과"
+        assert leader.cancelled()
+        assert upstream.calls == 1 and upstream.cancelled == 0
+
+    @pytest.mark.asyncio
+    async def test_all_waiters_cancelled_cancels_shared_call(self):
+        flights = SingleFlight()
+        upstream = _Upstream()
+        tasks = [asyncio.create_task(flights.do("k", upstream)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert upstream.cancelled == 1
+        assert len(flights) == 0
+
+        # 취소 직후의 새 호출은 취소된 작업에 합류하지 않고 새로 실행
+        upstream.release.set()
+        assert await flights.do("k", upstream) == "결과"
+        assert upstream.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared_and_not_cached(self):
+        flights = SingleFlight()
+        upstream = _Upstream(error=ValueError("실패"))
+        tasks = [asyncio.create_task(flights.do("k", upstream)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        upstream.release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(flights) == 0
+
+    @pytest.mark.asyncio
+    async def test_events_fan_out_to_current_waiters(self):
+        flights = SingleFlight()
+        step = asyncio.Event()
+
+        async def upstream(emit):
+            emit("a")
+            await step.wait()
+            step.clear()
+            emit("b")
+            await step.wait()
+            emit("c")
+            return "결과"
+
+        leader_events, follower_events = [], []
+        leader = asyncio.create_task(flights.do_with_events("k", upstream, listener=leader_events.append))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(flights.do_with_events("k", upstream, listener=follower_events.append))
+        await asyncio.sleep(0.01)
+        step.set()
+        await asyncio.sleep(0.01)
+
+        # 먼저 시작한 호출자가 떠나도 나머지 호출자는 계속 받음, 떠난 호출자에게는 더 이상 보내지 않음
+        leader.cancel()
+        await asyncio.sleep(0.01)
+        step.set()
+
+        assert await follower == "결과"
+        assert leader.cancelled()
+        assert leader_events == ["a", "b"]
+        assert follower_events == ["a", "b", "c"]  # 합류 전 이벤트는 다시 받음
+
+    @pytest.mark.asyncio
+    async def test_failing_listener_is_dropped(self):
+        flights = SingleFlight()
+        received = []
+
+        def broken(event):
+            raise RuntimeError("stream closed")
+
+        async def upstream(emit):
+            emit(1)
+            await asyncio.sleep(0.01)
+            emit(2)
+            return "결과"
+
+        results = await asyncio.gather(
+            flights.do_with_events("k", upstream, listener=broken),
+            flights.do_with_events("k", upstream, listener=received.append),
+        )
+        assert results == ["결과", "결과"]
+        assert received == [1, 2]
+
+
+class TestLLMServiceIntegration:
+    @pytest.mark.asyncio
+    async def test_identical_prompts_share_upstream_call(self, isolated_llm_cache):
+        calls = 0
+
+        async def slow_response(messages):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return AIMessage(content=f"응답 {messages[0].content}")
+
+        service = LLMService(mock_mode=False)
+        service.llm = MagicMock()
+        service.llm.ainvoke = slow_response
+
+        results = await asyncio.gather(
+            service.ainvoke("같은 프롬프트"),
+            service.ainvoke("같은 프롬프트"),
+            service.ainvoke("다른 프롬프트"),
+        )
+        assert results == ["응답 같은 프롬프트", "응답 같은 프롬프트", "응답 다른 프롬프트"]
+        assert calls == 2
+        assert service.flights.stats()["joined"] == 1
+
+        # 완료 후에는 캐시에서 반환
+        assert await service.ainvoke("같은 프롬프트") == "응답 같은 프롬프트"
+        assert calls == 2 and isolated_llm_cache.stats()["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_joined_caller_keeps_streaming_after_first_caller_leaves(self):
+        step = asyncio.Event()
+        chunks = ['{"menu_name": "비빔밥", "ingredients": [{"name": "밥"}', ', {"name": "나물"}', "]}"]
+
+        async def astream(messages):
+            for text in chunks:
+                yield AIMessageChunk(content=text)
+                await step.wait()
+                step.clear()
+
+        service = LLMService(mock_mode=False)
+        service.llm = MagicMock()
+        service.llm.astream = astream
+
+        first, second = [], []
+        leader = asyncio.create_task(
+            service.ainvoke("같은 프롬프트", on_partial=lambda field, value: first.append((field, value)))
+        )
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(
+            service.ainvoke("같은 프롬프트", on_partial=lambda field, value: second.append((field, value)))
+        )
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        await asyncio.sleep(0.01)
+        for _ in chunks:
+            step.set()
+            await asyncio.sleep(0.01)
+
+        assert await follower == "".join(chunks)
+        assert first == [("menu_name", "비빔밥")]
+        assert second == [
+            ("menu_name", "비빔밥"),
+            ("ingredients", {"name": "밥"}),
+            ("ingredients", {"name": "나물"}),
+        ]